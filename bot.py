@@ -1,6 +1,8 @@
 # bot.py
+import asyncio
 import os
 import discord
+from discord import app_commands
 from discord.app_commands import CommandSignatureMismatch
 from discord.ext import commands, tasks
 from dotenv import load_dotenv
@@ -8,10 +10,11 @@ from tortoise import Tortoise
 
 import logging
 
-from models.repos.static_cache import load_static_data
+from models.repos.static_cache import load_static_data, is_static_data_ready
 from resources.item_emoji import ItemEmoji  # 이모지 매니저 임포트
 from service.event import EventBus
 from service.achievement import AchievementProgressTracker
+from service.leaderboard import leaderboards
 from service.tower.tower_season_service import start_season_reset_task
 
 # 로그 기본 설정
@@ -46,6 +49,18 @@ if not TOKEN or not APPLICATION_ID or not GUILD_ID:
 if not DATABASE_URL or not DATABASE_USER or not DATABASE_PASSWORD or not DATABASE_PORT or not DATABASE_TABLE:
     raise RuntimeError("데이터 베이스 설정에 필요한 정보가 부족합니다 .env를 확인해주세요")
 
+class WarmupGatedCommandTree(app_commands.CommandTree):
+    """정적 데이터 워밍업이 끝나기 전에는 슬래시 명령어를 처리하지 않는 커맨드 트리"""
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if is_static_data_ready():
+            return True
+        await interaction.response.send_message(
+            "⏳ 봇이 시작 준비 중입니다. 잠시 후 다시 시도해주세요.", ephemeral=True
+        )
+        return False
+
+
 class MyBot(commands.Bot):
     def __init__(self):
         intents = discord.Intents.default()
@@ -55,14 +70,21 @@ class MyBot(commands.Bot):
         super().__init__(
             command_prefix="!",
             intents=intents,
-            application_id=APPLICATION_ID
+            application_id=APPLICATION_ID,
+            tree_cls=WarmupGatedCommandTree
         )
 
         # 이벤트 시스템 (싱글톤)
         self.event_bus = None
         self.achievement_tracker = None
 
+        # DB 연결 + 정적 데이터 워밍업 (게이트웨이 접속과 병렬 진행)
+        self.warmup_task = None
+
     async def setup_hook(self):
+        # 워밍업은 게이트웨이 접속과 병렬로 진행하고, 완료 전 명령어는 커맨드 트리에서 차단
+        self.warmup_task = asyncio.create_task(self.init_db())
+
         should_sync = is_dev == "TRUE" or FORCE_SYNC
 
         if should_sync:
@@ -116,7 +138,12 @@ class MyBot(commands.Bot):
         # 모든 테이블은 마이그레이션 스크립트로 생성됨
         # generate_schemas()는 기존 테이블을 재생성하여 수동 추가한 컬럼을 날림
 
-        await load_static_data()
+        timings = await load_static_data()
+        logging.info(f"정적 데이터 워밍업 완료 ({timings['total']:.2f}초)")
+
+        # 비정상 종료로 남은 던전 세션 체크포인트 로드 (재입장 시 진행 상황 복구)
+        from service.session_persistence import session_persistence
+        await session_persistence.load_recoverable()
 
     @tasks.loop(minutes=5)
     async def process_auction_expirations(self):
@@ -139,14 +166,42 @@ class MyBot(commands.Bot):
         except Exception as e:
             logging.error(f"경매 만료 처리 중 오류: {e}", exc_info=True)
 
+    async def close(self):
+        """봇 종료 시 진행 중인 세션, 누적된 골드/경험치, 대기 중인 이벤트, 업적 진행도를 반영한 뒤 종료"""
+        try:
+            from service.session_persistence import session_persistence
+            await session_persistence.checkpoint()
+        except Exception as e:
+            logging.error(f"종료 전 세션 체크포인트 실패: {e}", exc_info=True)
+
+        try:
+            from service.economy.currency_ledger import currency_ledger
+            await currency_ledger.flush()
+        except Exception as e:
+            logging.error(f"종료 전 재화 반영 실패: {e}", exc_info=True)
+
+        try:
+            await EventBus().drain()
+        except Exception as e:
+            logging.error(f"종료 전 이벤트 큐 처리 실패: {e}", exc_info=True)
+
+        try:
+            from service.achievement.progress_buffer import achievement_progress_buffer
+            await achievement_progress_buffer.flush()
+        except Exception as e:
+            logging.error(f"종료 전 업적 진행도 반영 실패: {e}", exc_info=True)
+
+        await super().close()
+
     @process_auction_expirations.before_loop
     async def before_auction_expiration_loop(self):
         """루프 시작 전 봇이 준비될 때까지 대기"""
         await self.wait_until_ready()
 
     async def on_ready(self):
-        logging.info("데이터 베이스 연결 시작")
-        await self.init_db()
+        # 재접속 시에도 워밍업은 한 번만 수행됨 (완료된 태스크는 즉시 반환)
+        logging.info("데이터 베이스 연결 및 정적 데이터 워밍업 대기")
+        await self.warmup_task
         logging.info("데이터 베이스 연결 완료")
 
         # 이모지 초기화
@@ -160,6 +215,9 @@ class MyBot(commands.Bot):
         try:
             self.event_bus = EventBus()
             self.achievement_tracker = AchievementProgressTracker(self.event_bus)
+            leaderboards.register(self.event_bus)
+            # 구독자 처리가 발행자(던전 루프 등)를 막지 않도록 큐 디스패치 사용
+            self.event_bus.start_workers()
             logging.info("이벤트 시스템 및 업적 추적기 초기화 완료")
         except Exception as e:
             logging.error(f"이벤트 시스템 초기화 실패: {e}")
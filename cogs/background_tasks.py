@@ -2,6 +2,8 @@
 import logging
 from discord.ext import commands, tasks
 
+from config import ACHIEVEMENT, CURRENCY_LEDGER, LEADERBOARD, SESSION_CHECKPOINT
+
 logger = logging.getLogger(__name__)
 
 
@@ -11,11 +13,19 @@ class BackgroundTasksCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.cleanup_combat_history.start()
+        self.flush_achievement_progress.start()
+        self.flush_currency_ledger.start()
+        self.checkpoint_sessions.start()
+        self.reconcile_leaderboards.start()
         logger.info("BackgroundTasksCog initialized")
 
     def cog_unload(self):
         """Cog 언로드 시 작업 정지"""
         self.cleanup_combat_history.cancel()
+        self.flush_achievement_progress.cancel()
+        self.flush_currency_ledger.cancel()
+        self.checkpoint_sessions.cancel()
+        self.reconcile_leaderboards.cancel()
         logger.info("BackgroundTasksCog unloaded")
 
     @tasks.loop(hours=6)
@@ -40,6 +50,78 @@ class BackgroundTasksCog(commands.Cog):
         await self.bot.wait_until_ready()
         logger.info("Background cleanup task ready")
 
+    @tasks.loop(seconds=ACHIEVEMENT.PROGRESS_FLUSH_INTERVAL)
+    async def flush_achievement_progress(self):
+        """누적된 업적 진행도 일괄 반영"""
+        try:
+            from service.achievement.progress_buffer import achievement_progress_buffer
+
+            flushed = await achievement_progress_buffer.flush()
+            if flushed > 0:
+                logger.debug(f"Flushed {flushed} achievement progress entries")
+
+        except Exception as e:
+            logger.error(f"Failed to flush achievement progress: {e}", exc_info=True)
+
+    @flush_achievement_progress.before_loop
+    async def before_flush_achievement_progress(self):
+        """봇 준비 대기"""
+        await self.bot.wait_until_ready()
+
+    @tasks.loop(seconds=CURRENCY_LEDGER.FLUSH_INTERVAL)
+    async def flush_currency_ledger(self):
+        """던전 진행 중 누적된 골드/경험치 일괄 반영 (중도 이탈한 난입자 등)"""
+        try:
+            from service.economy.currency_ledger import currency_ledger
+
+            await currency_ledger.flush()
+
+        except Exception as e:
+            logger.error(f"Failed to flush currency ledger: {e}", exc_info=True)
+
+    @flush_currency_ledger.before_loop
+    async def before_flush_currency_ledger(self):
+        """봇 준비 대기"""
+        await self.bot.wait_until_ready()
+
+    @tasks.loop(seconds=SESSION_CHECKPOINT.INTERVAL)
+    async def checkpoint_sessions(self):
+        """진행 중인 세션의 HP/진행 상황 일괄 저장 (크래시 복구용)"""
+        try:
+            from service.session_persistence import session_persistence
+
+            await session_persistence.checkpoint()
+
+        except Exception as e:
+            logger.error(f"Failed to checkpoint sessions: {e}", exc_info=True)
+
+    @checkpoint_sessions.before_loop
+    async def before_checkpoint_sessions(self):
+        """봇 준비 + 정적 데이터 워밍업(DB 연결) 대기"""
+        from models.repos.static_cache import wait_until_static_data_ready
+
+        await self.bot.wait_until_ready()
+        await wait_until_static_data_ready()
+
+    @tasks.loop(seconds=LEADERBOARD.RECONCILE_INTERVAL)
+    async def reconcile_leaderboards(self):
+        """메모리 리더보드를 DB 기준으로 재동기화 (첫 실행이 시작 시 적재)"""
+        try:
+            from service.leaderboard import leaderboards
+
+            await leaderboards.reconcile()
+
+        except Exception as e:
+            logger.error(f"Failed to reconcile leaderboards: {e}", exc_info=True)
+
+    @reconcile_leaderboards.before_loop
+    async def before_reconcile_leaderboards(self):
+        """봇 준비 + 정적 데이터 워밍업(DB 연결) 대기"""
+        from models.repos.static_cache import wait_until_static_data_ready
+
+        await self.bot.wait_until_ready()
+        await wait_until_static_data_ready()
+
 
 async def setup(bot):
     """Cog 로드"""
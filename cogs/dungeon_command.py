@@ -13,7 +13,7 @@ from config import DUNGEON, SKILL_ID
 from decorator.account import requires_account
 from models.repos import find_account_by_discordid
 from models.repos.dungeon_repo import find_all_dungeon
-from models.repos.static_cache import skill_cache_by_id
+from models.repos import static_cache
 from models.user_equipment import UserEquipment
 from models.user_inventory import UserInventory
 from service.dungeon.dungeon_service import start_dungeon
@@ -22,12 +22,12 @@ from service.dungeon.item_service import get_item_info, ItemNotFoundException
 from service.player.healing_service import HealingService
 from service.item.inventory_service import InventoryService
 from service.session import is_in_combat, create_session, end_session
+from service.session_persistence import session_persistence
 from service.skill.skill_deck_service import SkillDeckService
-from service.item.equipment_service import EquipmentService
 from service.skill.skill_ownership_service import SkillOwnershipService
 from service.temp_admin_service import is_admin_or_temp
+from service.player.player_loadout import load_player_loadout
 from models import User, UserStatEnum
-from models.repos.static_cache import monster_cache_by_id
 from service.dungeon.combat_context import CombatContext
 from service.dungeon.combat_executor import execute_combat_context
 
@@ -50,18 +50,11 @@ class DungeonCommand(commands.Cog):
             return
 
         try:
-            user: User = await find_account_by_discordid(session.user_id)
+            # 계정 + 스킬 덱 + 장비 스탯 로드 후 자연 회복 적용 (전투에서 사용)
+            loadout = await load_player_loadout(session.user_id)
+            user: User = loadout.user
             session.user = user
 
-            # 스킬 덱 로드 (전투에서 사용)
-            await SkillDeckService.load_deck_to_user(user)
-
-            # 장비 스탯 로드 (전투에서 사용)
-            await EquipmentService.apply_equipment_stats(user)
-
-            # 자연 회복 적용
-            await HealingService.apply_natural_regen(user)
-
             # HP 체크 - 너무 낮으면 경고
             max_hp = user.get_stat()[UserStatEnum.HP]
             hp_percent = (user.now_hp / max_hp) * 100 if max_hp > 0 else 0
@@ -109,6 +102,15 @@ class DungeonCommand(commands.Cog):
             await interaction.followup.send(f"{view.selected_dungeon.name} 던전에 입장합니다!")
 
             session.dungeon = view.selected_dungeon
+
+            # 비정상 종료 전 같은 던전 진행 상황이 남아 있으면 이어서 진행
+            checkpoint = session_persistence.restore(session)
+            if checkpoint is not None:
+                await interaction.followup.send(
+                    f"💾 이전 탐험 진행 상황을 복구했습니다. "
+                    f"({checkpoint.exploration_step}/{checkpoint.max_steps} 스텝)"
+                )
+
             await start_dungeon(session, interaction)
 
         finally:
@@ -175,37 +177,28 @@ class DungeonCommand(commands.Cog):
     @app_commands.guilds(*GUILD_IDS)
     async def my_info(self, interaction: discord.Interaction):
         """내 정보 조회"""
-        user: User = await find_account_by_discordid(interaction.user.id)
-        if not user:
+        # 계정 + 스킬 덱 + 장비 스탯 로드 후 자연 회복 적용 (HP 정보 표시 전)
+        loadout = await load_player_loadout(interaction.user.id)
+        if not loadout:
             await interaction.response.send_message(
                 "등록된 계정이 없습니다. `/등록`을 먼저 해주세요.",
                 ephemeral=True
             )
             return
+        user: User = loadout.user
 
-        # 자연 회복 적용 (HP 정보 표시 전 자동 적용)
-        await HealingService.apply_natural_regen(user)
-
-        # 장비 정보 로드
+        # 장비 정보 로드 (아이템 이름 표시용)
         equipment = await UserEquipment.filter(user=user).prefetch_related(
             "inventory_item__item"
         )
-        await EquipmentService.apply_equipment_stats(user)
-
-        # 스킬 덱 로드
-        skill_deck = await SkillDeckService.get_deck_as_list(user)
-
-        # 세트 효과 요약 로드
-        from service.item.set_detection_service import SetDetectionService
-        set_summary = await SetDetectionService.get_set_summary(user)
 
         # View 생성
         view = UserInfoView(
             discord_user=interaction.user,
             user=user,
             equipment=list(equipment),
-            skill_deck=skill_deck,
-            set_summary=set_summary
+            skill_deck=list(loadout.deck),
+            set_summary=loadout.set_summary
         )
 
         embed = view.create_embed()
@@ -249,9 +242,9 @@ class DungeonCommand(commands.Cog):
         # 보유 스킬 목록 (소유한 스킬만)
         owned_skills = await SkillOwnershipService.get_all_owned_skills(user)
         available_skills = [
-            skill_cache_by_id[owned.skill_id]
+            static_cache.skill_cache_by_id[owned.skill_id]
             for owned in owned_skills
-            if owned.skill_id in skill_cache_by_id
+            if owned.skill_id in static_cache.skill_cache_by_id
         ]
 
         # 스킬별 보유 수량 정보
@@ -262,8 +255,8 @@ class DungeonCommand(commands.Cog):
 
         # 강타는 항상 사용 가능하도록 추가
         BASIC_ATTACK_SKILL_ID = SKILL_ID.BASIC_ATTACK_ID
-        if BASIC_ATTACK_SKILL_ID in skill_cache_by_id:
-            basic_skill = skill_cache_by_id[BASIC_ATTACK_SKILL_ID]
+        if BASIC_ATTACK_SKILL_ID in static_cache.skill_cache_by_id:
+            basic_skill = static_cache.skill_cache_by_id[BASIC_ATTACK_SKILL_ID]
             if basic_skill not in available_skills:
                 available_skills.insert(0, basic_skill)  # 맨 앞에 추가
             # skill_quantities에 없으면 무제한으로 추가
@@ -4,7 +4,7 @@ from discord import app_commands
 
 from bot import GUILD_IDS
 from models import Item, Skill_Model, UserStatEnum
-from models.repos.static_cache import load_static_data
+from models.repos.static_cache import load_static_data, load_achievement_index
 from models.repos.users_repo import find_account_by_discordid
 from service.item.inventory_service import InventoryService
 from service.skill.skill_ownership_service import SkillOwnershipService
@@ -149,8 +149,17 @@ class ServerAdminCammand(commands.Cog):
     )
     @commands.has_permissions(administrator=True)
     async def re_cache(self, interaction: discord.Interaction):
-        await load_static_data()
-        await interaction.response.send_message("데이터베이스 재캐시 완료")
+        timings = await load_static_data()
+        await interaction.response.send_message(f"데이터베이스 재캐시 완료 ({timings['total']:.2f}초)")
+
+    @app_commands.command(
+        name="업적재캐시",
+        description="업적 시딩 후 업적 인덱스를 다시 캐시합니다"
+    )
+    @commands.has_permissions(administrator=True)
+    async def re_cache_achievements(self, interaction: discord.Interaction):
+        await load_achievement_index()
+        await interaction.response.send_message("업적 인덱스 재캐시 완료")
 
     @app_commands.command(
         name="아이템지급",
@@ -4,11 +4,8 @@ from discord.ext import commands
 
 from bot import GUILD_IDS
 from decorator.account import requires_account
-from models.repos.users_repo import find_account_by_discordid
+from service.player.player_loadout import load_player_loadout
 from service.session import create_session, end_session
-from service.skill.skill_deck_service import SkillDeckService
-from service.item.equipment_service import EquipmentService
-from service.player.healing_service import HealingService
 from service.tower.tower_service import initialize_tower_session, run_tower
 from service.tower.tower_season_service import get_current_season
 from views.tower_view import TowerEntryView
@@ -30,18 +27,15 @@ class TowerCommand(commands.Cog):
             await interaction.response.send_message("이미 던전 탐험중입니다.", ephemeral=True)
             return
 
-        user = await find_account_by_discordid(interaction.user.id)
-        if not user:
+        loadout = await load_player_loadout(interaction.user.id)
+        if not loadout:
             await interaction.response.send_message(
                 "등록된 계정이 없습니다. `/등록`을 먼저 해주세요.",
                 ephemeral=True
             )
             await end_session(interaction.user.id)
             return
-
-        await HealingService.apply_natural_regen(user)
-        await SkillDeckService.load_deck_to_user(user)
-        await EquipmentService.apply_equipment_stats(user)
+        user = loadout.user
 
         try:
             progress = await initialize_tower_session(user, session)
@@ -4,7 +4,7 @@ CUHABot 게임 설정 상수
 모든 매직 넘버와 게임 밸런스 관련 상수를 여기서 관리합니다.
 각 도메인별 설정은 config/ 하위 모듈에 정의되어 있습니다.
 """
-from config.combat import CombatConfig, COMBAT
+from config.combat import CombatConfig, COMBAT, CombatSimulationConfig, COMBAT_SIMULATION
 from config.damage import DamageConfig, DAMAGE
 from config.attributes import (
     AttributeType, AttributeConfig, ATTRIBUTE,
@@ -13,17 +13,20 @@ from config.attributes import (
 )
 from config.status_effects import StatusEffectConfig, STATUS_EFFECT
 from config.user_stats import UserStatsConfig, USER_STATS, StatConversionConfig, STAT_CONVERSION
-from config.dungeon import DungeonConfig, DUNGEON
+from config.dungeon import DungeonConfig, DUNGEON, SessionCheckpointConfig, SESSION_CHECKPOINT
 from config.drops import (
     DropConfig, DROP,
     BoxRewardType, BoxRewardConfig, BoxConfig, BOX_CONFIGS,
 )
-from config.ui import EmbedColor, UIConfig, UI
+from config.ui import EmbedColor, UIConfig, UI, EmbedUpdateConfig, EMBED_UPDATE
 from config.encounter import EncounterConfig, ENCOUNTER
-from config.enhancement import EnhancementConfig, ENHANCEMENT
+from config.enhancement import (
+    EnhancementConfig, ENHANCEMENT,
+    ENHANCEMENT_SUCCESS_RATES, ENHANCEMENT_COST_GRADE_MULTIPLIERS,
+)
 from config.skills import SKILL_DECK_SIZE, DEFAULT_SKILL_SLOT, SkillIdConfig, SKILL_ID
 from config.shop import ShopConfig, SHOP, InventoryConfig, INVENTORY
-from config.leveling import LEVELING_EXP_TABLE, LEVELING_EXP_DEFAULT
+from config.leveling import LEVELING_EXP_TABLE, LEVELING_EXP_DEFAULT, LEVELING_MAX_LEVEL
 from config.synergies import SynergyTier, ATTRIBUTE_SYNERGIES, ComboSynergy, COMBO_SYNERGIES
 from config.grade import (
     InstanceGrade, GradeInfo, GRADE_TABLE,
@@ -38,10 +41,15 @@ from config.multiplayer import (
 )
 from config.social_encounter import SocialEncounterConfig, SOCIAL_ENCOUNTER
 from config.notification import NotificationConfig, NOTIFICATION
+from config.achievement import AchievementConfig, ACHIEVEMENT
+from config.event import EventBusConfig, EVENT_BUS
+from config.ranking import LeaderboardConfig, LEADERBOARD
+from config.loadout import LoadoutConfig, LOADOUT
+from config.economy import CurrencyLedgerConfig, CURRENCY_LEDGER
 
 __all__ = [
     # combat
-    "CombatConfig", "COMBAT",
+    "CombatConfig", "COMBAT", "CombatSimulationConfig", "COMBAT_SIMULATION",
     # damage
     "DamageConfig", "DAMAGE",
     # attributes
@@ -54,22 +62,23 @@ __all__ = [
     "UserStatsConfig", "USER_STATS",
     "StatConversionConfig", "STAT_CONVERSION",
     # dungeon
-    "DungeonConfig", "DUNGEON",
+    "DungeonConfig", "DUNGEON", "SessionCheckpointConfig", "SESSION_CHECKPOINT",
     # drops & boxes
     "DropConfig", "DROP",
     "BoxRewardType", "BoxRewardConfig", "BoxConfig", "BOX_CONFIGS",
     # ui
-    "EmbedColor", "UIConfig", "UI",
+    "EmbedColor", "UIConfig", "UI", "EmbedUpdateConfig", "EMBED_UPDATE",
     # encounter
     "EncounterConfig", "ENCOUNTER",
     # enhancement
     "EnhancementConfig", "ENHANCEMENT",
+    "ENHANCEMENT_SUCCESS_RATES", "ENHANCEMENT_COST_GRADE_MULTIPLIERS",
     # skills
     "SKILL_DECK_SIZE", "DEFAULT_SKILL_SLOT", "SkillIdConfig", "SKILL_ID",
     # shop & inventory
     "ShopConfig", "SHOP", "InventoryConfig", "INVENTORY",
     # leveling
-    "LEVELING_EXP_TABLE", "LEVELING_EXP_DEFAULT",
+    "LEVELING_EXP_TABLE", "LEVELING_EXP_DEFAULT", "LEVELING_MAX_LEVEL",
     # synergies
     "SynergyTier", "ATTRIBUTE_SYNERGIES", "ComboSynergy", "COMBO_SYNERGIES",
     # multiplayer
@@ -80,6 +89,16 @@ __all__ = [
     # social encounter (Phase 3)
     "SocialEncounterConfig", "SOCIAL_ENCOUNTER",
     "NotificationConfig", "NOTIFICATION",
+    # achievement
+    "AchievementConfig", "ACHIEVEMENT",
+    # event bus
+    "EventBusConfig", "EVENT_BUS",
+    # ranking
+    "LeaderboardConfig", "LEADERBOARD",
+    # loadout
+    "LoadoutConfig", "LOADOUT",
+    # economy
+    "CurrencyLedgerConfig", "CURRENCY_LEDGER",
     # grade
     "InstanceGrade", "GradeInfo", "GRADE_TABLE",
     "GRADE_DROP_WEIGHTS", "SpecialEffectDef", "SPECIAL_EFFECT_POOL",
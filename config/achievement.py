@@ -0,0 +1,19 @@
+"""
+업적 시스템 설정
+"""
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class AchievementConfig:
+    """업적 진행도 기록 설정"""
+
+    PROGRESS_FLUSH_INTERVAL: int = 30
+    """누적된 업적 진행도를 DB에 반영하는 주기 (초)"""
+
+    PROGRESS_FLUSH_MAX_PENDING: int = 500
+    """대기 중인 (유저, 업적) 항목이 이 수를 넘으면 즉시 반영"""
+
+
+# 싱글톤 설정 객체
+ACHIEVEMENT = AchievementConfig()
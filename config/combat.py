@@ -63,3 +63,20 @@ class CombatConfig:
 
 
 COMBAT = CombatConfig()
+
+
+@dataclass(frozen=True)
+class CombatSimulationConfig:
+    """헤드리스 전투 시뮬레이션 설정 (밸런스/회귀 검증용)"""
+
+    DEFAULT_FIGHTS: int = 1000
+    """배치 기본 전투 수"""
+
+    CHUNK_SIZE: int = 50
+    """워커 프로세스 하나가 한 번에 처리할 전투 수"""
+
+    DEFAULT_PROGRESS: float = 0.5
+    """스폰 테이블 조회 시 기본 던전 진행도 (0.0~1.0)"""
+
+
+COMBAT_SIMULATION = CombatSimulationConfig()
@@ -93,3 +93,14 @@ class DungeonConfig:
 
 
 DUNGEON = DungeonConfig()
+
+
+@dataclass(frozen=True)
+class SessionCheckpointConfig:
+    """세션 체크포인트 설정"""
+
+    INTERVAL: int = 15
+    """HP/세션 진행 상황 일괄 저장 주기 (초)"""
+
+
+SESSION_CHECKPOINT = SessionCheckpointConfig()
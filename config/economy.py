@@ -0,0 +1,16 @@
+"""
+재화(골드/경험치) 반영 설정
+"""
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CurrencyLedgerConfig:
+    """재화 원장 설정"""
+
+    FLUSH_INTERVAL: int = 30
+    """던전 진행 중 누적된 재화 변화량을 DB에 반영하는 주기 (초)"""
+
+
+# 싱글톤 설정 객체
+CURRENCY_LEDGER = CurrencyLedgerConfig()
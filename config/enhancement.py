@@ -20,3 +20,26 @@ class EnhancementConfig:
 
 
 ENHANCEMENT = EnhancementConfig()
+
+# 강화 성공률 (레벨 범위별)
+ENHANCEMENT_SUCCESS_RATES: dict[tuple[int, int], float] = {
+    (0, 3): 1.0,    # +0~3: 100%
+    (4, 6): 0.8,    # +4~6: 80%
+    (7, 9): 0.6,    # +7~9: 60%
+    (10, 12): 0.4,  # +10~12: 40%
+    (13, 15): 0.2,  # +13~15: 20%
+}
+"""(최소 레벨, 최대 레벨) -> 성공률"""
+
+# 등급별 강화 비용 배율
+ENHANCEMENT_COST_GRADE_MULTIPLIERS: dict[int, float] = {
+    1: 0.5,   # D등급
+    2: 0.8,   # C등급
+    3: 1.0,   # B등급
+    4: 1.5,   # A등급
+    5: 2.0,   # S등급
+    6: 3.0,   # SS등급
+    7: 5.0,   # SSS등급
+    8: 10.0,  # 신화등급
+}
+"""등급 ID -> 비용 배율 (없으면 1.0)"""
@@ -0,0 +1,25 @@
+"""
+이벤트 버스 설정
+"""
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class EventBusConfig:
+    """이벤트 비동기 디스패치 설정"""
+
+    QUEUE_MAX_SIZE: int = 1000
+    """구독자 큐(샤드)당 최대 대기 이벤트 수"""
+
+    WORKERS_PER_SUBSCRIBER: int = 4
+    """구독자당 워커(샤드) 수 - 같은 user_id의 이벤트는 항상 같은 샤드로 전달됨"""
+
+    BACKPRESSURE_POLICY: str = "block"
+    """큐가 가득 찼을 때 정책: block(발행자 대기) / drop_newest / drop_oldest"""
+
+    DRAIN_TIMEOUT: float = 10.0
+    """종료 시 큐를 비우기 위해 기다리는 최대 시간 (초)"""
+
+
+# 싱글톤 설정 객체
+EVENT_BUS = EventBusConfig()
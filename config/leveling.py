@@ -16,3 +16,6 @@ LEVELING_EXP_TABLE: list[tuple[int, int]] = [
 
 LEVELING_EXP_DEFAULT: int = 8000
 """91레벨 이상 기본 필요 경험치"""
+
+LEVELING_MAX_LEVEL: int = 100
+"""누적 경험치로 도달 가능한 최대 레벨"""
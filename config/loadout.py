@@ -0,0 +1,16 @@
+"""
+플레이어 로드아웃 설정
+"""
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class LoadoutConfig:
+    """전투 준비(로드아웃) 캐시 설정"""
+
+    CACHE_TTL: float = 60.0
+    """discord_id별 스킬 덱 캐시 유지 시간 (초) - 덱 변경 시에는 즉시 무효화"""
+
+
+# 싱글톤 설정 객체
+LOADOUT = LoadoutConfig()
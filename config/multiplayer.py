@@ -79,6 +79,9 @@ class AuctionConfig:
     MAX_LISTING_DURATION_HOURS: int = 72
     """최대 등록 기간 (72시간)"""
 
+    SETTLEMENT_CHUNK_SIZE: int = 100
+    """만료 정산 시 트랜잭션 하나에 묶는 리스팅 수"""
+
 
 AUCTION = AuctionConfig()
 
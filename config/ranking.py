@@ -0,0 +1,19 @@
+"""
+랭킹 설정
+"""
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class LeaderboardConfig:
+    """메모리 리더보드 설정"""
+
+    RECONCILE_INTERVAL: int = 600
+    """DB와 리더보드를 다시 맞추는 주기 (초) - 이벤트가 없는 변경(관리자 수정 등) 보정"""
+
+    TOP_LIMIT: int = 100
+    """랭킹 화면에 표시하는 최대 순위"""
+
+
+# 싱글톤 설정 객체
+LEADERBOARD = LeaderboardConfig()
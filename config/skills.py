@@ -8,6 +8,12 @@ SKILL_DECK_SIZE = 10
 DEFAULT_SKILL_SLOT = 0
 """빈 스킬 슬롯 값"""
 
+PASSIVE_PROFILE_CACHE_SIZE = 512
+"""덱별 패시브 프로필 LRU 캐시 크기"""
+
+DECK_SYNERGY_CACHE_SIZE = 512
+"""덱별 키워드 시너지 프로필 LRU 캐시 크기"""
+
 
 @dataclass(frozen=True)
 class SkillIdConfig:
@@ -11,6 +11,10 @@ from dataclasses import dataclass
 class SocialEncounterConfig:
     """멀티유저 만남 이벤트 설정"""
 
+    # 근접 세션 인덱스
+    PROXIMITY_BUCKET_SIZE: int = 5
+    """세션 위치 인덱스의 스텝 구간 크기 (근접 조회 시 ±거리를 덮는 구간만 확인)"""
+
     # 교차로 만남
     CROSSROADS_PROBABILITY: float = 0.20
     """교차로 만남 발생 확률 (20%)"""
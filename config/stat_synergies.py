@@ -14,6 +14,10 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List
 
 
+STAT_SYNERGY_CACHE_SIZE = 1024
+"""능력치 조합별 시너지 프로필 LRU 캐시 크기"""
+
+
 @dataclass(frozen=True)
 class SynergyCondition:
     """시너지 발동 조건"""
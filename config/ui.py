@@ -55,4 +55,19 @@ class UIConfig:
     """임베드 필드 값 최대 길이"""
 
 
+@dataclass(frozen=True)
+class EmbedUpdateConfig:
+    """전투/관전 Embed 편집 스케줄러 설정"""
+
+    MAX_CONCURRENT_EDITS: int = 5
+    """동시에 진행하는 메시지 편집 요청 수"""
+
+    ROUTE_EDIT_INTERVAL: float = 1.0
+    """같은 채널(라우트 버킷) 메시지 편집 최소 간격 (초) - Discord 기준 5회/5초"""
+
+    RATE_LIMIT_FALLBACK_DELAY: float = 2.0
+    """429 응답에 retry_after가 없을 때 버킷 대기 시간 (초)"""
+
+
 UI = UIConfig()
+EMBED_UPDATE = EmbedUpdateConfig()
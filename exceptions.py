@@ -281,6 +281,13 @@ class InsufficientMPError(InsufficientResourceError):
         super().__init__("MP", required, current)
 
 
+class InsufficientStatPointsError(InsufficientResourceError):
+    """스탯 포인트 부족"""
+
+    def __init__(self, required: int, current: int):
+        super().__init__("스탯 포인트", required, current)
+
+
 # =============================================================================
 # 상태 관련 예외
 # =============================================================================
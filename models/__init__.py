@@ -19,8 +19,10 @@ from .item import *
 from .item_grade_probability import *
 from .mail import *
 from .monster import *
+from .session_checkpoint import *
 from .set_item import *
 from .skill import *
+from .stat_cache import *
 from .user_achievement import *
 from .user_collection import *
 from .user_deck_preset import *
@@ -10,6 +10,8 @@ from typing import TYPE_CHECKING, Any, Optional
 
 from tortoise import models, fields
 
+from models.stat_cache import StatCacheMixin
+
 if TYPE_CHECKING:
     from service.dungeon.status import Buff
     from service.dungeon.skill import Skill
@@ -22,14 +24,20 @@ class MonsterTypeEnum(str, Enum):
     RAID = "RadeMob"
 
 
-class Monster(models.Model):
+class Monster(StatCacheMixin, models.Model):
     """
     몬스터 모델
 
     DB 필드와 런타임 필드를 분리하여 관리합니다.
     런타임 필드는 __init__에서 인스턴스별로 초기화됩니다.
+    get_stat() 결과는 스탯 관련 필드가 바뀔 때까지 캐시됩니다.
     """
 
+    STAT_DEPENDENCY_FIELDS = frozenset({
+        "hp", "attack", "defense", "speed", "ap_attack", "ap_defense",
+        "evasion", "use_skill", "status",
+    })
+
     # ==========================================================================
     # DB 필드
     # ==========================================================================
@@ -182,9 +190,15 @@ class Monster(models.Model):
         """
         현재 스탯 반환 (패시브 + 버프 적용 포함)
 
+        스탯 관련 필드/버프가 바뀌지 않았으면 캐시된 결과의 사본을 반환합니다.
+
         Returns:
             스탯 열거형을 키로 하는 스탯 딕셔너리
         """
+        return self._get_cached_stat(self._compute_stat)
+
+    def _compute_stat(self) -> dict:
+        """스탯 계산 (캐시 미스 시)"""
         from config import DAMAGE
         from models import UserStatEnum
         from service.dungeon.skill import get_passive_stat_bonuses
@@ -1,90 +1,393 @@
+"""
+정적 게임 데이터 캐시
+
+DB/CSV의 정적 데이터(던전, 몬스터, 스킬, 장비, 드롭 등)를 읽기 전용 스냅샷(StaticDataSnapshot)으로 만들고,
+재로드 시 새 스냅샷을 만든 뒤 한 번에 교체합니다.
+
+- 모듈 속성(static_cache.skill_cache_by_id 등)은 현재 스냅샷의 테이블을 가리킵니다.
+- 던전 세션은 생성 시점의 스냅샷을 고정(pin)하므로, 진행 중인 전투는 재로드와 무관하게
+  같은 버전을 계속 보고 새 세션부터 새 버전을 봅니다.
+- 재로드는 테이블 그룹별 지문(fingerprint)을 비교해 바뀐 그룹만 다시 만듭니다.
+"""
+import asyncio
+import hashlib
 import logging
-
-from models import Dungeon, Monster, DungeonSpawn, Item, Skill_Model
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, fields, replace
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Iterable, Iterator, Mapping, Optional
+
+from models import Dungeon, Monster, DungeonSpawn, Droptable, Item, Skill_Model
 from service.dungeon.skill import Skill
 from service.dungeon.components import get_component_by_tag, skill_component_register
 from service.economy.shop_service import ShopService
 
 logger = logging.getLogger(__name__)
 
-dungeon_cache = {}
-monster_cache_by_id = {}
-item_cache = {}
-spawn_info = {}
-skill_cache_by_id = {}
-box_drop_table = {}  # {"normal": [(box_id, weight), ...], ...}
-_dungeon_levels_sorted: list[int] = []  # 던전 require_level 정렬 리스트
-equipment_cache = {}  # item_id -> EquipmentItem
-set_name_by_item_id = {}  # item_id -> set_name (e.g. "🔥 화염")
-equipment_by_source = {}  # acquisition_source -> [item_id, ...]
+
+@dataclass(frozen=True)
+class StaticDataSnapshot:
+    """
+    정적 데이터 스냅샷 (한 버전의 모든 테이블)
+
+    로드된 스냅샷의 테이블은 읽기 전용(MappingProxyType)입니다.
+    """
+
+    version: int = 0
+    fingerprints: Mapping[str, str] = field(default_factory=dict)
+    """테이블 그룹별 지문 (재로드 시 변경 감지용)"""
+
+    dungeon_cache: Mapping = field(default_factory=dict)
+    dungeon_levels: tuple = ()  # 던전 require_level 정렬 목록
+    monster_cache_by_id: Mapping = field(default_factory=dict)
+    spawn_info: Mapping = field(default_factory=dict)  # dungeon_id -> [DungeonSpawn, ...]
+    item_cache: Mapping = field(default_factory=dict)
+    skill_cache_by_id: Mapping = field(default_factory=dict)
+    skills_by_source: Mapping = field(default_factory=dict)  # acquisition_source -> (Skill_Model, ...) (player_obtainable만)
+    box_drop_table: Mapping = field(default_factory=dict)  # {"normal": [(box_id, weight), ...], ...}
+    droptable_by_monster: Mapping = field(default_factory=dict)  # monster_id -> [Droptable, ...]
+    equipment_cache: Mapping = field(default_factory=dict)  # item_id -> EquipmentItem
+    set_name_by_item_id: Mapping = field(default_factory=dict)  # item_id -> set_name (e.g. "🔥 화염")
+    set_item_cache: Mapping = field(default_factory=dict)  # set_item_id -> SetItem
+    set_ids_by_item_id: Mapping = field(default_factory=dict)  # item_id -> [set_item_id, ...]
+    set_effects_by_set_id: Mapping = field(default_factory=dict)  # set_item_id -> [SetEffect, ...]
+    equipment_by_source: Mapping = field(default_factory=dict)  # acquisition_source -> [item_id, ...]
+    achievements_by_type: Mapping = field(default_factory=dict)  # objective type -> [Achievement, ...]
+    achievements_by_filter: Mapping = field(default_factory=dict)  # (type, key, value) -> [Achievement, ...]
+
+
+# 모듈 속성으로 노출되는 테이블 이름
+_TABLE_NAMES = frozenset(f.name for f in fields(StaticDataSnapshot)) - {"version", "fingerprints"}
+
+_snapshot = StaticDataSnapshot()
+_pinned_snapshot: ContextVar[Optional[StaticDataSnapshot]] = ContextVar("static_data_snapshot", default=None)
+
+_static_data_ready = asyncio.Event()  # 첫 로드 완료 시 set (명령어 처리 게이트)
+
+# objective_config에서 인덱스 대상이 아닌 키 (진행 목표치)
+_ACHIEVEMENT_NON_FILTER_KEYS = ("type", "count")
+
+
+def __getattr__(name: str):
+    """static_cache.skill_cache_by_id 등 테이블 접근을 현재 스냅샷으로 위임"""
+    if name in _TABLE_NAMES:
+        return getattr(current_snapshot(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-async def load_static_data():
-    """정적 데이터 로드 (봇 시작 시 호출)"""
-    global dungeon_cache, monster_cache_by_id, item_cache, spawn_info, skill_cache_by_id, box_drop_table, _dungeon_levels_sorted
-    logger.info("Loading static data...")
+def current_snapshot() -> StaticDataSnapshot:
+    """현재 작업(던전 세션 등)이 보는 스냅샷 - 고정된 스냅샷이 없으면 최신 스냅샷"""
+    pinned = _pinned_snapshot.get()
+    return pinned if pinned is not None else _snapshot
 
-    # 던전 로딩
+
+def latest_snapshot() -> StaticDataSnapshot:
+    """가장 최근에 로드된 스냅샷"""
+    return _snapshot
+
+
+def pin_static_snapshot(snapshot: StaticDataSnapshot = None) -> StaticDataSnapshot:
+    """
+    현재 작업(및 이후 생성되는 하위 태스크)이 볼 스냅샷 고정
+
+    Args:
+        snapshot: 고정할 스냅샷 (기본: 최신 스냅샷)
+
+    Returns:
+        고정된 스냅샷
+    """
+    snapshot = snapshot if snapshot is not None else _snapshot
+    _pinned_snapshot.set(snapshot)
+    return snapshot
+
+
+@contextmanager
+def use_snapshot(snapshot: Optional[StaticDataSnapshot]) -> Iterator[StaticDataSnapshot]:
+    """
+    블록 안에서만 스냅샷 고정 (세션을 만든 작업이 아닌 콜백/핸들러용)
+
+    Args:
+        snapshot: 고정할 스냅샷 (None이면 현재 스냅샷 그대로 사용)
+    """
+    if snapshot is None:
+        yield current_snapshot()
+        return
+
+    token = _pinned_snapshot.set(snapshot)
+    try:
+        yield snapshot
+    finally:
+        _pinned_snapshot.reset(token)
+
+
+def install_static_snapshot(snapshot: StaticDataSnapshot) -> StaticDataSnapshot:
+    """
+    최신 스냅샷 교체 (테스트/재로드용)
+
+    Returns:
+        교체 전 스냅샷
+    """
+    global _snapshot
+
+    previous = _snapshot
+    _snapshot = snapshot
+    return previous
+
+
+@dataclass(frozen=True)
+class _GroupResult:
+    """테이블 그룹 로드 결과 (변경 없으면 tables=None)"""
+
+    fingerprint: str
+    tables: Optional[dict[str, Any]] = None
+
+
+async def load_static_data(groups: Iterable[str] = None) -> dict[str, float]:
+    """
+    정적 데이터 로드 (봇 시작 시, /데베재캐시)
+
+    서로 독립적인 테이블/파일 로딩 단계를 동시에 실행해 새 스냅샷을 만든 뒤 한 번에 교체합니다.
+    지문이 이전 스냅샷과 같은 그룹은 기존 테이블을 재사용하고,
+    스폰/상자/드롭 관련 그룹이 바뀐 경우에만 추첨기를 다시 만듭니다.
+    첫 전체 로드가 끝나면 준비 완료로 표시되어 명령어 처리 게이트가 열립니다.
+
+    Args:
+        groups: 다시 읽을 그룹 이름 (기본: 전체 + 등급 캐시)
+
+    Returns:
+        단계별 소요 시간 (초, "total" 포함)
+    """
+    full_load = groups is None
+    names = list(_GROUP_LOADERS) if full_load else list(groups)
+    logger.info(f"Loading static data ({'all' if full_load else ', '.join(names)})...")
+    started = time.perf_counter()
+    timings: dict[str, float] = {}
+    previous = _snapshot
+
+    phases = [
+        _timed_phase(name, _bind_loader(name, previous.fingerprints.get(name)), timings)
+        for name in names
+    ]
+    if full_load:
+        phases.append(_timed_phase("grades", ShopService.load_grade_cache, timings))
+    loaded = await asyncio.gather(*phases)
+    results: dict[str, _GroupResult] = dict(zip(names, loaded))
+
+    changed = [name for name, result in results.items() if result.tables is not None]
+    snapshot = previous
+    if changed:
+        tables: dict[str, Any] = {}
+        for name in changed:
+            tables.update(results[name].tables)
+        fingerprints = dict(previous.fingerprints)
+        fingerprints.update({name: results[name].fingerprint for name in changed})
+        snapshot = replace(
+            previous,
+            version=previous.version + 1,
+            fingerprints=MappingProxyType(fingerprints),
+            **tables
+        )
+        install_static_snapshot(snapshot)
+
+    # 파생 캐시는 (호출 작업에 고정된 스냅샷이 있더라도) 새 스냅샷 기준으로 갱신
+    token = _pinned_snapshot.set(snapshot)
+    try:
+        await _timed_phase("samplers", lambda: _after_swap(changed), timings)
+    finally:
+        _pinned_snapshot.reset(token)
+
+    timings["total"] = time.perf_counter() - started
+    if full_load:
+        _static_data_ready.set()
+
+    phase_text = ", ".join(
+        f"{name}={elapsed * 1000:.0f}ms" for name, elapsed in timings.items() if name != "total"
+    )
+    logger.info(
+        f"Static data v{snapshot.version} loaded in {timings['total'] * 1000:.0f}ms "
+        f"(changed: {', '.join(changed) or 'none'}; {phase_text})"
+    )
+    return timings
+
+
+def is_static_data_ready() -> bool:
+    """첫 정적 데이터 로드 완료 여부"""
+    return _static_data_ready.is_set()
+
+
+async def wait_until_static_data_ready() -> None:
+    """첫 정적 데이터 로드가 끝날 때까지 대기"""
+    await _static_data_ready.wait()
+
+
+async def _timed_phase(name: str, loader: Callable[[], Awaitable], timings: dict[str, float]):
+    """로딩 단계 실행 및 소요 시간 기록"""
+    started = time.perf_counter()
+    result = await loader()
+    timings[name] = time.perf_counter() - started
+    return result
+
+
+def _bind_loader(name: str, previous_fingerprint: Optional[str]) -> Callable[[], Awaitable[_GroupResult]]:
+    loader = _GROUP_LOADERS.get(name)
+    if loader is None:
+        raise ValueError(f"Unknown static data group: {name}")
+    return lambda: loader(previous_fingerprint)
+
+
+def _fingerprint(*row_sets) -> str:
+    """모델 행 목록들의 컬럼 값 지문"""
+    digest = hashlib.blake2b(digest_size=16)
+    for rows in row_sets:
+        for row in rows:
+            values = tuple(getattr(row, name) for name in row._meta.fields_db_projection)
+            digest.update(repr(values).encode())
+        digest.update(b"|")
+    return digest.hexdigest()
+
+
+def _freeze(table: dict) -> Mapping:
+    return MappingProxyType(table)
+
+
+async def _after_swap(changed: list[str]) -> None:
+    """스냅샷 교체 후 파생 캐시 갱신 (바뀐 그룹만)"""
+    if "skills" in changed:
+        # 스킬 정의가 바뀌었을 수 있으므로 덱별 패시브/시너지 프로필 초기화
+        from service.dungeon.passive_profile import invalidate_passive_profile
+        from service.skill.deck_synergy_profile import invalidate_deck_synergy_profile
+        invalidate_passive_profile()
+        invalidate_deck_synergy_profile()
+
+    if "equipment" in changed:
+        # 장비/세트 정의가 바뀌었을 수 있으므로 유저별 장비 스냅샷 초기화
+        from service.item.equipment_snapshot import invalidate_all_equipment_snapshots
+        invalidate_all_equipment_snapshots()
+
+    if _SAMPLER_GROUPS.intersection(changed):
+        # 스폰/상자/보스 드롭 추첨기 재생성
+        from service.dungeon.alias_sampler import rebuild_samplers
+
+        built = rebuild_samplers()
+        logger.info(f"Built {built} alias samplers")
+
+
+async def _load_dungeons(previous_fingerprint: Optional[str]) -> _GroupResult:
+    """던전 로딩"""
     dungeons = await Dungeon.all()
-    dungeon_cache = {d.id: d for d in dungeons}
-    _dungeon_levels_sorted = sorted(set(d.require_level for d in dungeons))
-    logger.info(f"Loaded {len(dungeon_cache)} dungeons")
+    fingerprint = _fingerprint(dungeons)
+    if fingerprint == previous_fingerprint:
+        return _GroupResult(fingerprint)
+
+    logger.info(f"Loaded {len(dungeons)} dungeons")
+    return _GroupResult(fingerprint, {
+        "dungeon_cache": _freeze({d.id: d for d in dungeons}),
+        "dungeon_levels": tuple(sorted(set(d.require_level for d in dungeons))),
+    })
 
-    # 몬스터 로딩
+
+async def _load_monsters(previous_fingerprint: Optional[str]) -> _GroupResult:
+    """몬스터 로딩"""
     monsters = await Monster.all()
-    monster_cache_by_id = {m.id: m for m in monsters}
-    logger.info(f"Loaded {len(monster_cache_by_id)} monsters")
+    fingerprint = _fingerprint(monsters)
+    if fingerprint == previous_fingerprint:
+        return _GroupResult(fingerprint)
+
+    logger.info(f"Loaded {len(monsters)} monsters")
+    return _GroupResult(fingerprint, {"monster_cache_by_id": _freeze({m.id: m for m in monsters})})
+
 
-    # 스폰 정보 로딩
+async def _load_spawns(previous_fingerprint: Optional[str]) -> _GroupResult:
+    """스폰 정보 로딩"""
     all_spawns = await DungeonSpawn.all()
-    for spawn in all_spawns:
-        spawn_info.setdefault(spawn.dungeon_id, []).append(spawn)
-    logger.info(f"Loaded spawn info for {len(spawn_info)} dungeons")
+    fingerprint = _fingerprint(all_spawns)
+    if fingerprint == previous_fingerprint:
+        return _GroupResult(fingerprint)
 
-    # 아이템 로딩
-    items = await Item.all()
-    item_cache = {i.id: i for i in items}
-    logger.info(f"Loaded {len(item_cache)} items")
+    spawns = {}
+    for spawn in all_spawns:
+        spawns.setdefault(spawn.dungeon_id, []).append(spawn)
+    logger.info(f"Loaded spawn info for {len(spawns)} dungeons")
+    return _GroupResult(fingerprint, {"spawn_info": _freeze(spawns)})
 
-    # 스킬 로딩
-    logger.info(f"Registered skill component tags: {list(skill_component_register.keys())}")
-    skills = await Skill_Model.all()
-    for skill in skills:
-        components = []
-        # config 구조: {"components": [{"tag": "attack", ...}, ...]}
-        component_configs = _resolve_skill_components(skill.config)
 
-        if not component_configs:
-            logger.warning(f"Skill {skill.id} ({skill.name}) has no components! Config: {skill.config}")
+async def _load_droptable(previous_fingerprint: Optional[str]) -> _GroupResult:
+    """몬스터별 Droptable 인덱스 로딩 (드롭 처리 시 DB 조회 대신 사용)"""
+    rows = await Droptable.all()
+    fingerprint = _fingerprint(rows)
+    if fingerprint == previous_fingerprint:
+        return _GroupResult(fingerprint)
 
-        for comp_config in component_configs:
-            tag = comp_config.get("tag")
-            if not tag:
-                logger.warning(f"Skill {skill.id} has component without tag: {comp_config}")
-                continue
-            try:
-                component = get_component_by_tag(tag)
-                component._tag = tag
-                component.apply_config(comp_config, skill.name)
-                component.skill_attribute = getattr(skill, 'attribute', '무속성')
-                components.append(component)
-                logger.info(f"Skill {skill.id} ({skill.name}): loaded component '{tag}'")
-            except KeyError:
-                logger.warning(f"Unknown component tag '{tag}' in skill {skill.id}")
+    by_monster = {}
+    for row in rows:
+        if row.drop_monster is not None:
+            by_monster.setdefault(row.drop_monster, []).append(row)
+    logger.info(f"Loaded droptable index for {len(by_monster)} monsters")
+    return _GroupResult(fingerprint, {"droptable_by_monster": _freeze(by_monster)})
 
-        skill_cache_by_id[skill.id] = Skill(skill, components)
-        logger.info(f"Skill {skill.id} ({skill.name}): {len(components)} components loaded")
 
-    logger.info(f"Loaded {len(skill_cache_by_id)} skills")
+async def _load_items(previous_fingerprint: Optional[str]) -> _GroupResult:
+    """아이템 로딩"""
+    items = await Item.all()
+    fingerprint = _fingerprint(items)
+    if fingerprint == previous_fingerprint:
+        return _GroupResult(fingerprint)
 
-    # 장비 캐시 로딩
-    await _load_equipment_cache()
+    logger.info(f"Loaded {len(items)} items")
+    return _GroupResult(fingerprint, {"item_cache": _freeze({i.id: i for i in items})})
 
-    # Grade 캐시 로딩 (상점 가격 등)
-    await ShopService.load_grade_cache()
 
-    # 상자 드랍 테이블 로딩
-    await load_box_drop_table()
+async def _load_skills(previous_fingerprint: Optional[str]) -> _GroupResult:
+    """스킬 로딩 (컴포넌트 생성은 개별 로그 없이 요약만 기록)"""
+    skills = await Skill_Model.all()
+    fingerprint = _fingerprint(skills)
+    if fingerprint == previous_fingerprint:
+        return _GroupResult(fingerprint)
+
+    logger.debug(f"Registered skill component tags: {list(skill_component_register.keys())}")
+    skill_cache = {}
+    by_source: dict[str, list] = {}
+    component_count = 0
+    for skill in skills:
+        components = _build_skill_components(skill)
+        component_count += len(components)
+        skill_cache[skill.id] = Skill(skill, components)
+        if skill.player_obtainable and skill.acquisition_source:
+            by_source.setdefault(skill.acquisition_source, []).append(skill)
+
+    logger.info(f"Loaded {len(skill_cache)} skills ({component_count} components)")
+    return _GroupResult(fingerprint, {
+        "skill_cache_by_id": _freeze(skill_cache),
+        "skills_by_source": _freeze({source: tuple(s) for source, s in by_source.items()}),
+    })
+
+
+def _build_skill_components(skill) -> list:
+    """스킬 config로부터 컴포넌트 인스턴스 생성"""
+    components = []
+    # config 구조: {"components": [{"tag": "attack", ...}, ...]}
+    component_configs = _resolve_skill_components(skill.config)
+
+    if not component_configs:
+        logger.warning(f"Skill {skill.id} ({skill.name}) has no components! Config: {skill.config}")
+
+    for comp_config in component_configs:
+        tag = comp_config.get("tag")
+        if not tag:
+            logger.warning(f"Skill {skill.id} has component without tag: {comp_config}")
+            continue
+        try:
+            component = get_component_by_tag(tag)
+            component._tag = tag
+            component.apply_config(comp_config, skill.name)
+            component.skill_attribute = getattr(skill, 'attribute', '무속성')
+            components.append(component)
+        except KeyError:
+            logger.warning(f"Unknown component tag '{tag}' in skill {skill.id}")
+
+    return components
 
 
 EQUIP_POS_NAMES = {
@@ -93,51 +396,94 @@ EQUIP_POS_NAMES = {
 }
 
 
-async def _load_equipment_cache():
+async def _load_equipment(previous_fingerprint: Optional[str]) -> _GroupResult:
     """장비 및 세트 캐시 로드"""
-    global equipment_cache, set_name_by_item_id, equipment_by_source
-
     from models.equipment_item import EquipmentItem
-    from models.set_item import SetItem, SetItemMember
+    from models.set_item import SetEffect, SetItem, SetItemMember
+
+    all_equip, all_sets, all_members, all_effects = await asyncio.gather(
+        EquipmentItem.all(),
+        SetItem.all(),
+        SetItemMember.all(),
+        SetEffect.all().order_by("pieces_required", "id"),
+    )
+    fingerprint = _fingerprint(all_equip, all_sets, all_members, all_effects)
+    if fingerprint == previous_fingerprint:
+        return _GroupResult(fingerprint)
 
     # EquipmentItem: item_id -> EquipmentItem
-    all_equip = await EquipmentItem.all()
-    equipment_cache = {eq.item_id: eq for eq in all_equip}
-    logger.info(f"Loaded {len(equipment_cache)} equipment items into cache")
+    equipment = {eq.item_id: eq for eq in all_equip}
+    logger.info(f"Loaded {len(equipment)} equipment items into cache")
 
     # 획득처별 장비 캐시 (acquisition_source -> [item_id, ...])
-    equipment_by_source = {}
+    by_source = {}
     for eq in all_equip:
         source = getattr(eq, 'acquisition_source', None)
         if source:
-            equipment_by_source.setdefault(source, []).append(eq.item_id)
-    logger.info(f"Loaded equipment_by_source: {len(equipment_by_source)} sources")
-
-    # SetItemMember -> SetItem: item_id -> set_name
-    all_sets = await SetItem.all()
-    set_name_map = {s.id: s.name for s in all_sets}
+            by_source.setdefault(source, []).append(eq.item_id)
+    logger.info(f"Loaded equipment_by_source: {len(by_source)} sources")
 
-    all_members = await SetItemMember.all()
+    # 세트 카탈로그: set_item_id -> SetItem, item_id -> [set_item_id], item_id -> set_name
+    sets = {s.id: s for s in all_sets}
     # equipment_item_id(PK) -> item_id 역매핑
     equip_pk_to_item_id = {eq.id: eq.item_id for eq in all_equip}
 
+    set_ids = {}
+    set_names = {}
     for member in all_members:
         item_id = equip_pk_to_item_id.get(member.equipment_item_id)
-        set_name = set_name_map.get(member.set_item_id)
-        if item_id and set_name:
-            set_name_by_item_id[item_id] = set_name
-
-    logger.info(f"Loaded {len(set_name_by_item_id)} set memberships into cache")
+        set_item = sets.get(member.set_item_id)
+        if item_id and set_item:
+            set_names[item_id] = set_item.name
+            set_ids.setdefault(item_id, []).append(set_item.id)
+
+    set_effects = {}
+    for effect in all_effects:
+        set_effects.setdefault(effect.set_item_id, []).append(effect)
+
+    logger.info(
+        f"Loaded {len(sets)} sets, {len(set_names)} set memberships, "
+        f"{len(all_effects)} set effects into cache"
+    )
+    return _GroupResult(fingerprint, {
+        "equipment_cache": _freeze(equipment),
+        "equipment_by_source": _freeze(by_source),
+        "set_item_cache": _freeze(sets),
+        "set_ids_by_item_id": _freeze(set_ids),
+        "set_name_by_item_id": _freeze(set_names),
+        "set_effects_by_set_id": _freeze(set_effects),
+    })
 
 
 def get_equipment_ids_by_source(source: str) -> list[int]:
     """획득처 이름으로 장비 아이템 ID 리스트 조회"""
-    return equipment_by_source.get(source, [])
+    return current_snapshot().equipment_by_source.get(source, [])
+
+
+def get_obtainable_skills_by_source(source: str) -> tuple:
+    """획득처 이름으로 플레이어 획득 가능 스킬(Skill_Model) 목록 조회"""
+    return current_snapshot().skills_by_source.get(source, ())
+
+
+def get_set_ids_by_item(item_id: int) -> list[int]:
+    """아이템이 속한 세트 ID 목록 조회"""
+    return current_snapshot().set_ids_by_item_id.get(item_id, [])
+
+
+def get_set_item(set_id: int):
+    """세트 ID로 SetItem 조회"""
+    return current_snapshot().set_item_cache.get(set_id)
+
+
+def get_set_effects(set_id: int) -> list:
+    """세트 효과 목록 조회 (pieces_required 오름차순)"""
+    return current_snapshot().set_effects_by_set_id.get(set_id, [])
 
 
 def get_equipment_info(item_id: int) -> dict:
     """장비 아이템 캐시 정보 조회"""
-    eq = equipment_cache.get(item_id)
+    snapshot = current_snapshot()
+    eq = snapshot.equipment_cache.get(item_id)
     if not eq:
         return {}
     return {
@@ -149,7 +495,7 @@ def get_equipment_info(item_id: int) -> dict:
         "ad_defense": eq.ad_defense,
         "ap_defense": eq.ap_defense,
         "speed": eq.speed,
-        "set_name": set_name_by_item_id.get(item_id, ""),
+        "set_name": snapshot.set_name_by_item_id.get(item_id, ""),
         "require_str": eq.require_str or 0,
         "require_int": eq.require_int or 0,
         "require_dex": eq.require_dex or 0,
@@ -159,33 +505,129 @@ def get_equipment_info(item_id: int) -> dict:
     }
 
 
-async def load_box_drop_table():
-    """상자 드랍 테이블 CSV 로드"""
+BOX_DROP_TABLE_PATH = "data/box_drop_table.csv"
+
+
+async def _load_box_drops(previous_fingerprint: Optional[str]) -> _GroupResult:
+    """상자 드랍 테이블 CSV 로드 (매번 새 테이블을 만들어 가중치가 중복 누적되지 않음)"""
     import csv
-    global box_drop_table
+    import io
 
-    csv_path = "data/box_drop_table.csv"
     try:
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                monster_type = row['monster_type']
-                box_id = int(row['box_id'])
-                weight = float(row['weight'])
-
-                if monster_type not in box_drop_table:
-                    box_drop_table[monster_type] = []
-                box_drop_table[monster_type].append((box_id, weight))
-
-        logger.info(f"Loaded box drop table: {len(box_drop_table)} monster types")
+        with open(BOX_DROP_TABLE_PATH, 'rb') as f:
+            raw = f.read()
     except FileNotFoundError:
-        logger.warning(f"Box drop table not found: {csv_path}")
-        box_drop_table = {}
+        logger.warning(f"Box drop table not found: {BOX_DROP_TABLE_PATH}")
+        raw = b""
+
+    fingerprint = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    if fingerprint == previous_fingerprint:
+        return _GroupResult(fingerprint)
+
+    table = {}
+    for row in csv.DictReader(io.StringIO(raw.decode('utf-8'))):
+        table.setdefault(row['monster_type'], []).append((int(row['box_id']), float(row['weight'])))
+
+    logger.info(f"Loaded box drop table: {len(table)} monster types")
+    return _GroupResult(fingerprint, {"box_drop_table": _freeze(table)})
+
+
+async def _load_achievements(previous_fingerprint: Optional[str]) -> _GroupResult:
+    """
+    업적 인덱스 로드
+
+    objective_config의 type과 필터 필드(monster_id, attribute 등)로 인덱싱하여
+    진행도 갱신 시 DB 조회 없이 대상 업적을 찾을 수 있게 합니다.
+    """
+    from models.achievement import Achievement
+
+    achievements = await Achievement.all().order_by("id")
+    fingerprint = _fingerprint(achievements)
+    if fingerprint == previous_fingerprint:
+        return _GroupResult(fingerprint)
+
+    by_type = {}
+    by_filter = {}
+    for achievement in achievements:
+        config = achievement.objective_config
+        if not isinstance(config, dict) or not config.get("type"):
+            continue
+
+        objective_type = config["type"]
+        by_type.setdefault(objective_type, []).append(achievement)
+
+        for key, value in config.items():
+            if key in _ACHIEVEMENT_NON_FILTER_KEYS or isinstance(value, (dict, list)):
+                continue
+            by_filter.setdefault((objective_type, key, value), []).append(achievement)
+
+    logger.info(
+        f"Loaded achievement index: {sum(len(v) for v in by_type.values())} achievements, "
+        f"{len(by_type)} objective types"
+    )
+    return _GroupResult(fingerprint, {
+        "achievements_by_type": _freeze(by_type),
+        "achievements_by_filter": _freeze(by_filter),
+    })
+
+
+async def load_achievement_index() -> None:
+    """업적 인덱스만 다시 로드 (업적 시딩 후 호출 - /데베재캐시)"""
+    await load_static_data(groups=("achievements",))
+
+
+_GROUP_LOADERS: dict[str, Callable[[Optional[str]], Awaitable[_GroupResult]]] = {
+    "dungeons": _load_dungeons,
+    "monsters": _load_monsters,
+    "spawns": _load_spawns,
+    "items": _load_items,
+    "skills": _load_skills,
+    "equipment": _load_equipment,
+    "box_drops": _load_box_drops,
+    "droptable": _load_droptable,
+    "achievements": _load_achievements,
+}
+
+# 추첨기 재생성이 필요한 그룹 (스폰 추첨기는 몬스터의 보스 여부도 참조)
+_SAMPLER_GROUPS = frozenset({"monsters", "spawns", "box_drops", "droptable"})
+
+
+def get_achievements_by_objective(objective_type: str, filters: dict = None) -> list:
+    """
+    목표 타입 + 필터 필드로 업적 조회
+
+    Args:
+        objective_type: objective_config의 type
+        filters: objective_config의 필드 값 조건 (모두 일치해야 함)
+
+    Returns:
+        조건에 맞는 Achievement 목록
+    """
+    snapshot = current_snapshot()
+    if not filters:
+        return snapshot.achievements_by_type.get(objective_type, [])
+
+    candidates = None
+    for key, value in filters.items():
+        matched = snapshot.achievements_by_filter.get((objective_type, key, value), [])
+        if candidates is None:
+            candidates = matched
+        else:
+            matched_ids = {a.id for a in matched}
+            candidates = [a for a in candidates if a.id in matched_ids]
+        if not candidates:
+            return []
+    return candidates
 
 
 def get_box_pool_by_monster_type(monster_type: str) -> list[tuple[int, float]]:
     """몬스터 타입별 상자 풀 조회"""
-    return box_drop_table.get(monster_type, [])
+    return current_snapshot().box_drop_table.get(monster_type, [])
+
+
+def get_droptable_rows(monster_id: int) -> list:
+    """몬스터의 Droptable 행 조회"""
+    return current_snapshot().droptable_by_monster.get(monster_id, [])
 
 
 def _resolve_skill_components(skill_config):
@@ -210,12 +652,13 @@ def _resolve_skill_components(skill_config):
 
 
 def get_dungeons():
-    return dungeon_cache
+    return current_snapshot().dungeon_cache
 
 
 def get_previous_dungeon_level(current_level: int) -> int:
     """현재 던전 렙제의 바로 이전 단계 던전 렙제 반환"""
-    for i, lvl in enumerate(_dungeon_levels_sorted):
+    levels = current_snapshot().dungeon_levels
+    for i, lvl in enumerate(levels):
         if lvl >= current_level:
-            return _dungeon_levels_sorted[i - 1] if i > 0 else 0
-    return _dungeon_levels_sorted[-1] if _dungeon_levels_sorted else 0
+            return levels[i - 1] if i > 0 else 0
+    return levels[-1] if levels else 0
@@ -46,6 +46,9 @@ async def find_account_by_discordid(discord_id: int) -> Optional[User]:
             if eq.pos is not None and 0 <= eq.pos < SKILL_DECK_SIZE:
                 user.equipped_skill[eq.pos] = eq.skill.id
 
+    # 덱을 제자리에서 채웠으므로 스탯 캐시 무효화
+    user.invalidate_stat_cache()
+
     return user
 
 
@@ -0,0 +1,31 @@
+"""
+SessionCheckpoint 모델 정의
+
+진행 중인 던전 세션의 진행 상황을 주기적으로 저장합니다 (봇 재시작 후 복구용).
+"""
+from tortoise import fields, models
+
+
+class SessionCheckpoint(models.Model):
+    """던전 세션 체크포인트 (유저당 1행)"""
+
+    id = fields.IntField(pk=True)
+    user = fields.OneToOneField(
+        "models.User",
+        related_name="session_checkpoint",
+        on_delete=fields.CASCADE,
+    )
+    discord_id = fields.BigIntField()
+    dungeon_id = fields.IntField()
+    content_type = fields.IntField(default=1)
+    exploration_step = fields.IntField(default=0)
+    max_steps = fields.IntField(default=0)
+    total_exp = fields.IntField(default=0)
+    total_gold = fields.IntField(default=0)
+    monsters_defeated = fields.IntField(default=0)
+    items_found = fields.JSONField(default=list)
+    explore_buffs = fields.JSONField(default=dict)
+    updated_at = fields.DatetimeField(auto_now=True)
+
+    class Meta:
+        table = "session_checkpoint"
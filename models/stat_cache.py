@@ -0,0 +1,73 @@
+"""
+전투 스탯 메모이제이션
+
+User/Monster의 get_stat() 결과를 캐시하고, 스탯에 영향을 주는 필드가
+바뀔 때만 다시 계산하도록 버전 카운터로 무효화를 추적합니다.
+"""
+from typing import Any, Callable, Optional
+
+_global_generation = 0
+"""전역 세대 (정적 데이터 재로드 시 모든 엔티티 캐시 무효화)"""
+
+
+def invalidate_all_stat_caches() -> None:
+    """모든 엔티티의 스탯 캐시 무효화 (스킬 등 정적 데이터 재로드 시)"""
+    global _global_generation
+    _global_generation += 1
+
+
+def _buff_signature(status: Optional[list]) -> tuple:
+    """
+    버프 목록의 스탯 관련 상태 서명
+
+    상태이상은 여러 곳에서 리스트에 직접 추가/제거되고 스택도 제자리에서 갱신되므로,
+    세터 추적 대신 (객체, 수치, 스택) 서명으로 변경을 감지합니다.
+    """
+    if not status:
+        return ()
+    return tuple(
+        (id(buff), getattr(buff, "amount", 0), getattr(buff, "stacks", 1))
+        for buff in status
+    )
+
+
+class StatCacheMixin:
+    """
+    get_stat() 결과 캐시 믹스인
+
+    서브클래스는 STAT_DEPENDENCY_FIELDS에 스탯 계산에 쓰이는 필드명을 선언합니다.
+    해당 필드에 대입하면 버전이 올라가 다음 조회 시 재계산됩니다.
+    리스트/딕셔너리를 제자리에서 수정한 경우 invalidate_stat_cache()를 호출해야 합니다.
+    """
+
+    STAT_DEPENDENCY_FIELDS: frozenset = frozenset()
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        if key in self.STAT_DEPENDENCY_FIELDS:
+            self.__dict__["_stat_version"] = self.__dict__.get("_stat_version", 0) + 1
+        super().__setattr__(key, value)
+
+    def invalidate_stat_cache(self) -> None:
+        """스탯 캐시 무효화 (제자리 수정 후 호출)"""
+        self.__dict__["_stat_version"] = self.__dict__.get("_stat_version", 0) + 1
+
+    def _get_cached_stat(self, compute: Callable[[], dict]) -> dict:
+        """
+        캐시된 스탯 반환 (버전 또는 버프 서명이 바뀌었으면 재계산)
+
+        Args:
+            compute: 스탯 계산 함수
+
+        Returns:
+            스탯 딕셔너리 사본 (호출자가 수정해도 캐시에 영향 없음)
+        """
+        key = (
+            _global_generation,
+            self.__dict__.get("_stat_version", 0),
+            _buff_signature(getattr(self, "status", None)),
+        )
+        cached = self.__dict__.get("_stat_cache")
+        if cached is None or cached[0] != key:
+            cached = (key, compute())
+            self.__dict__["_stat_cache"] = cached
+        return dict(cached[1])
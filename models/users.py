@@ -9,6 +9,8 @@ from typing import TYPE_CHECKING, Any, Optional
 
 from tortoise import models, fields
 
+from models.stat_cache import StatCacheMixin
+
 if TYPE_CHECKING:
     from service.dungeon.status import Buff
     from service.dungeon.skill import Skill
@@ -28,14 +30,22 @@ class UserStatEnum(str, Enum):
     CRITICAL_DAMAGE = "CRITICAL_DAMAGE"
 
 
-class User(models.Model):
+class User(StatCacheMixin, models.Model):
     """
     사용자 모델
 
     DB 필드와 런타임 필드를 분리하여 관리합니다.
     런타임 필드는 __init__에서 인스턴스별로 초기화됩니다.
+    get_stat() 결과는 스탯 관련 필드가 바뀔 때까지 캐시됩니다.
     """
 
+    STAT_DEPENDENCY_FIELDS = frozenset({
+        "hp", "attack", "defense", "speed", "ap_attack", "ap_defense",
+        "accuracy", "evasion", "critical_rate", "critical_damage",
+        "bonus_str", "bonus_int", "bonus_dex", "bonus_vit", "bonus_luk",
+        "equipment_stats", "equipped_skill", "status",
+    })
+
     # ==========================================================================
     # DB 필드
     # ==========================================================================
@@ -151,9 +161,15 @@ class User(models.Model):
         """
         현재 스탯 반환 (능력치 변환 + 장비 + 버프 적용)
 
+        스탯 관련 필드/버프가 바뀌지 않았으면 캐시된 결과의 사본을 반환합니다.
+
         Returns:
             스탯 열거형을 키로 하는 스탯 딕셔너리
         """
+        return self._get_cached_stat(self._compute_stat)
+
+    def _compute_stat(self) -> dict[UserStatEnum, int]:
+        """스탯 계산 (캐시 미스 시)"""
         from service.player.stat_conversion import convert_abilities_to_combat_stats
         from service.dungeon.skill import get_passive_stat_bonuses
 
@@ -0,0 +1,142 @@
+"""
+성장 수치 테이블 벤치마크
+
+progression_tables의 사전 계산 조회가 기존 반복 계산과 같은 결과를 내는지 검증하고,
+호출당 소요 시간을 비교합니다.
+
+사용법: python scripts/benchmark_progression_tables.py [반복 횟수]
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from config import (
+    ENHANCEMENT,
+    ENHANCEMENT_COST_GRADE_MULTIPLIERS,
+    ENHANCEMENT_SUCCESS_RATES,
+    LEVELING_EXP_DEFAULT,
+    LEVELING_EXP_TABLE,
+    get_grade_info,
+)
+from service.economy.progression_tables import (
+    CUMULATIVE_EXP,
+    cumulative_exp_for_level,
+    enhancement_cost,
+    enhancement_success_rate,
+    grade_stat_multiplier,
+    level_from_exp,
+)
+
+
+# =============================================================================
+# 기존 구현 (비교 기준)
+# =============================================================================
+
+
+def legacy_exp_multiplier(level: int) -> int:
+    for max_level, exp_required in LEVELING_EXP_TABLE:
+        if level <= max_level:
+            return exp_required
+    return LEVELING_EXP_DEFAULT
+
+
+def legacy_exp_for_level(level: int) -> int:
+    total_exp = 0
+    for lv in range(1, level):
+        total_exp += legacy_exp_multiplier(lv) * lv
+    return total_exp
+
+
+def legacy_level_from_exp(total_exp: int) -> int:
+    level = 1
+    cumulative = 0
+    while level < 100:
+        exp_needed = legacy_exp_multiplier(level) * level
+        if cumulative + exp_needed > total_exp:
+            break
+        cumulative += exp_needed
+        level += 1
+    return level
+
+
+def legacy_success_rate(current_level: int) -> float:
+    for (min_lvl, max_lvl), rate in ENHANCEMENT_SUCCESS_RATES.items():
+        if min_lvl <= current_level <= max_lvl:
+            return rate
+    return 0.0
+
+
+def legacy_enhancement_cost(grade_id: int, current_level: int) -> int:
+    grade_mult = ENHANCEMENT_COST_GRADE_MULTIPLIERS.get(grade_id, 1.0)
+    level_mult = 1.0 + (current_level * ENHANCEMENT.COST_PER_LEVEL_MULTIPLIER)
+    return int(ENHANCEMENT.BASE_COST * grade_mult * level_mult)
+
+
+def legacy_stat_multiplier(grade_id: int) -> float:
+    if grade_id <= 0:
+        return 1.0
+    grade_info = get_grade_info(grade_id)
+    if not grade_info:
+        return 1.0
+    return grade_info.stat_multiplier
+
+
+# =============================================================================
+# 검증 / 측정
+# =============================================================================
+
+
+def _exp_samples() -> list[int]:
+    """레벨 경계 전후 + 범위 밖 값"""
+    samples = [-1, 0]
+    for threshold in CUMULATIVE_EXP[1:]:
+        samples.extend((threshold - 1, threshold, threshold + 1))
+    samples.append(CUMULATIVE_EXP[-1] * 2)
+    return samples
+
+
+CASES = [
+    ("level_from_exp", legacy_level_from_exp, level_from_exp, [(exp,) for exp in _exp_samples()]),
+    ("exp_for_level", legacy_exp_for_level, cumulative_exp_for_level, [(lv,) for lv in range(-1, 120)]),
+    ("success_rate", legacy_success_rate, enhancement_success_rate, [(lv,) for lv in range(-2, 20)]),
+    ("enhancement_cost", legacy_enhancement_cost, enhancement_cost,
+     [(grade, lv) for grade in range(-1, 11) for lv in range(-1, 18)]),
+    ("stat_multiplier", legacy_stat_multiplier, grade_stat_multiplier, [(grade,) for grade in range(-2, 12)]),
+]
+
+
+def verify() -> None:
+    """모든 샘플에서 기존 구현과 결과가 같은지 확인"""
+    for name, legacy, compiled, samples in CASES:
+        for args in samples:
+            expected, actual = legacy(*args), compiled(*args)
+            if expected != actual:
+                raise AssertionError(f"{name}{args}: legacy={expected}, compiled={actual}")
+        print(f"✅ {name}: {len(samples)}개 샘플 일치")
+
+
+def benchmark(number: int) -> None:
+    """샘플 전체를 number번 호출한 호출당 평균 시간 비교"""
+    print()
+    print(f"{'함수':<20} {'기존(ns)':>12} {'테이블(ns)':>12} {'배속':>8}")
+    print("-" * 56)
+    for name, legacy, compiled, samples in CASES:
+        calls = number * len(samples)
+        legacy_time = timeit.timeit(lambda: [legacy(*args) for args in samples], number=number)
+        compiled_time = timeit.timeit(lambda: [compiled(*args) for args in samples], number=number)
+        print(
+            f"{name:<20} {legacy_time / calls * 1e9:>12.0f} {compiled_time / calls * 1e9:>12.0f} "
+            f"{legacy_time / compiled_time:>7.1f}x"
+        )
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    verify()
+    benchmark(number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+던전 세션 체크포인트 테이블 생성
+
+실행: python scripts/migrate_session_checkpoint.py
+"""
+import asyncio
+import os
+import sys
+
+# 프로젝트 루트를 path에 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from dotenv import load_dotenv
+from tortoise import Tortoise
+
+load_dotenv()
+
+
+async def init_db():
+    db_url = (
+        f"postgres://{os.getenv('DATABASE_USER')}:"
+        f"{os.getenv('DATABASE_PASSWORD')}@{os.getenv('DATABASE_URL')}"
+        f":{os.getenv('DATABASE_PORT')}/{os.getenv('DATABASE_TABLE')}"
+    )
+    print(f"📡 데이터베이스 연결 중: {os.getenv('DATABASE_URL')}:{os.getenv('DATABASE_PORT')}/{os.getenv('DATABASE_TABLE')}")
+
+    await Tortoise.init(
+        db_url=db_url,
+        modules={"models": ["models"]}
+    )
+
+
+async def migrate_session_checkpoint():
+    conn = Tortoise.get_connection("default")
+
+    table_check_sql = """
+    SELECT table_name
+    FROM information_schema.tables
+    WHERE table_schema = 'public' AND table_name IN ('user', 'users');
+    """
+    table_rows = await conn.execute_query_dict(table_check_sql)
+    table_names = {row["table_name"] for row in table_rows}
+    if "user" in table_names:
+        user_table = "user"
+    elif "users" in table_names:
+        user_table = "users"
+    else:
+        raise RuntimeError("User 테이블을 찾을 수 없습니다. 먼저 DB 초기화를 진행하세요.")
+
+    create_table_sql = f"""
+    CREATE TABLE IF NOT EXISTS session_checkpoint (
+        id SERIAL PRIMARY KEY,
+        user_id INT NOT NULL UNIQUE REFERENCES "{user_table}"(id) ON DELETE CASCADE,
+        discord_id BIGINT NOT NULL,
+        dungeon_id INT NOT NULL,
+        content_type INT NOT NULL DEFAULT 1,
+        exploration_step INT NOT NULL DEFAULT 0,
+        max_steps INT NOT NULL DEFAULT 0,
+        total_exp INT NOT NULL DEFAULT 0,
+        total_gold INT NOT NULL DEFAULT 0,
+        monsters_defeated INT NOT NULL DEFAULT 0,
+        items_found JSONB NOT NULL DEFAULT '[]'::jsonb,
+        explore_buffs JSONB NOT NULL DEFAULT '{{}}'::jsonb,
+        updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+    );
+    """
+
+    print("\n📋 세션 체크포인트 테이블 생성 중...")
+    await conn.execute_script(create_table_sql)
+    print("✅ session_checkpoint 테이블 확인/생성 완료")
+
+
+async def main():
+    try:
+        print("=" * 60)
+        print("💾 세션 체크포인트 마이그레이션 시작")
+        print("=" * 60)
+
+        await init_db()
+        await migrate_session_checkpoint()
+
+        print("\n✨ 세션 체크포인트 마이그레이션 완료")
+    finally:
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -130,6 +130,7 @@ async def seed_achievements():
             logger.info(f"선행 업적 매핑 완료: {len(to_update)}개")
 
     logger.info(f"업적 데이터 시딩 완료! 총 {len(achievements_data)}개 업적 생성")
+    logger.info("봇이 실행 중이면 /업적재캐시 로 업적 인덱스를 다시 로드하세요")
 
     await Tortoise.close_connections()
 
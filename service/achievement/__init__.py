@@ -1,5 +1,10 @@
 """업적 시스템"""
 
 from .achievement_tracker import AchievementProgressTracker
+from .progress_buffer import AchievementProgressBuffer, achievement_progress_buffer
 
-__all__ = ["AchievementProgressTracker"]
+__all__ = [
+    "AchievementProgressTracker",
+    "AchievementProgressBuffer",
+    "achievement_progress_buffer",
+]
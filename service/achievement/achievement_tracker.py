@@ -6,14 +6,13 @@
 """
 
 import logging
-from datetime import datetime
 from typing import Any, Dict
 
+from config import ACHIEVEMENT
 from service.event import EventBus, GameEvent, GameEventType
 from service.mail import MailService
-from models.achievement import Achievement
-from models.user_achievement import UserAchievement
-from models.mail import MailType
+from service.achievement.progress_buffer import AchievementProgressBuffer, achievement_progress_buffer
+from models.repos import static_cache
 
 logger = logging.getLogger(__name__)
 
@@ -22,18 +21,27 @@ class AchievementProgressTracker:
     """
     업적 진행 추적기 (옵저버)
 
-    게임 이벤트를 구독하고, 해당 이벤트와 관련된 업적의 진행도를 자동으로 업데이트합니다.
+    게임 이벤트를 구독하고, 해당 이벤트와 관련된 업적의 진행도를 누적합니다.
+    누적된 진행도는 AchievementProgressBuffer가 주기적으로/세션 종료 시 일괄 반영하며,
     업적 완료 시 우편으로 보상을 발송합니다.
     """
 
-    def __init__(self, event_bus: EventBus, mail_service: MailService = None):
+    def __init__(
+        self,
+        event_bus: EventBus,
+        mail_service: MailService = None,
+        progress_buffer: AchievementProgressBuffer = None
+    ):
         """
         Args:
             event_bus: 이벤트 버스
             mail_service: 우편 서비스 (없으면 자동 생성)
+            progress_buffer: 진행도 버퍼 (없으면 전역 인스턴스 사용)
         """
         self.event_bus = event_bus
         self.mail_service = mail_service or MailService()
+        self.progress_buffer = progress_buffer or achievement_progress_buffer
+        self.progress_buffer.mail_service = self.mail_service
         self._register_listeners()
         logger.info("AchievementProgressTracker initialized")
 
@@ -228,131 +236,17 @@ class AchievementProgressTracker:
             set_value: 설정값 (절대값형 - 레벨, 보유 골드 등)
             filters: 추가 필터 (objective_config의 필드)
         """
-        if filters is None:
-            filters = {}
-
-        # 모든 업적 조회 (Tortoise ORM은 JSONField 중첩 필터를 지원하지 않음)
-        all_achievements = await Achievement.all()
-
-        # Python에서 필터링
-        achievements = []
-        for achievement in all_achievements:
-            if not achievement.objective_config:
-                continue
-
-            # 타입 확인
-            if achievement.objective_config.get("type") != achievement_type:
-                continue
-
-            # 추가 필터 확인
-            match = True
-            for key, value in filters.items():
-                if achievement.objective_config.get(key) != value:
-                    match = False
-                    break
-
-            if match:
-                achievements.append(achievement)
+        # 시작 시 로드된 인덱스에서 조회 (DB 조회 없음)
+        achievements = static_cache.get_achievements_by_objective(achievement_type, filters)
 
         for achievement in achievements:
-            await self._process_achievement_progress(
+            self.progress_buffer.add(
                 user_id=user_id,
                 achievement=achievement,
                 increment=increment,
                 set_value=set_value
             )
 
-    async def _process_achievement_progress(
-        self,
-        user_id: int,
-        achievement: Achievement,
-        increment: int = 0,
-        set_value: int = None
-    ) -> None:
-        """
-        개별 업적 진행도 처리
-
-        Args:
-            user_id: 유저 ID
-            achievement: 업적
-            increment: 증가량
-            set_value: 설정값
-        """
-        # 선행 업적 확인 (티어 II/III는 이전 티어 완료 필요)
-        if achievement.prerequisite_achievement_id:
-            prerequisite = await UserAchievement.get_or_none(
-                user_id=user_id,
-                achievement_id=achievement.prerequisite_achievement_id,
-                is_completed=True
-            )
-            if not prerequisite:
-                # 선행 업적 미완료
-                return
-
-        # 유저 업적 조회 또는 생성
-        user_achievement, created = await UserAchievement.get_or_create(
-            user_id=user_id,
-            achievement=achievement,
-            defaults={
-                "progress_required": achievement.objective_config.get("count", 1)
-            }
-        )
-
-        if user_achievement.is_completed:
-            # 이미 완료된 업적
-            return
-
-        # 진행도 업데이트
-        if set_value is not None:
-            # 절대값 설정 (레벨, 보유 골드 등)
-            user_achievement.progress_current = set_value
-        else:
-            # 증가량 추가 (누적형)
-            user_achievement.progress_current += increment
-
-        # 완료 체크
-        if user_achievement.progress_current >= user_achievement.progress_required:
-            user_achievement.is_completed = True
-            user_achievement.completed_at = datetime.now()
-
-            # 우편 발송
-            await self._send_achievement_mail(user_id, achievement)
-
-            logger.info(
-                f"Achievement completed: user_id={user_id}, "
-                f"achievement_id={achievement.id}, name={achievement.name}"
-            )
-
-        await user_achievement.save()
-
-    async def _send_achievement_mail(self, user_id: int, achievement: Achievement) -> None:
-        """
-        업적 달성 시 우편 발송
-
-        Args:
-            user_id: 유저 ID
-            achievement: 달성한 업적
-        """
-        title = f"🏆 업적 달성: {achievement.full_name}"
-
-        content = f"""축하합니다! 업적을 달성하셨습니다.
-
-⚔️ {achievement.full_name}
-{achievement.description}
-
-보상을 수령해주세요!"""
-
-        # 칭호 획득 메시지 추가 (티어 III)
-        if achievement.title_name:
-            content += f"\n\n🏆 칭호 획득: {achievement.title_name}"
-
-        await self.mail_service.send_mail(
-            user_id=user_id,
-            mail_type=MailType.ACHIEVEMENT,
-            sender="시스템",
-            title=title,
-            content=content,
-            reward_config=achievement.reward_config
-        )
-
-        logger.debug(f"Achievement mail sent: user_id={user_id}, achievement_id={achievement.id}")
+        # 대기 항목이 너무 많으면 주기를 기다리지 않고 반영
+        if self.progress_buffer.pending_count >= ACHIEVEMENT.PROGRESS_FLUSH_MAX_PENDING:
+            await self.progress_buffer.flush()
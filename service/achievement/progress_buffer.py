@@ -0,0 +1,249 @@
+"""
+업적 진행도 버퍼 (Write-behind)
+
+이벤트마다 UserAchievement를 읽고 쓰는 대신 (유저, 업적)별 진행도 변화를
+메모리에 누적하고, 주기적으로 또는 세션 종료 시 일괄 반영합니다.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, Optional
+
+from tortoise.transactions import in_transaction
+
+from models.achievement import Achievement
+from models.mail import MailType
+from models.user_achievement import UserAchievement
+from service.mail import MailService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PendingProgress:
+    """반영 대기 중인 진행도 변화"""
+
+    achievement: Achievement
+    increment: int = 0
+    set_value: Optional[int] = None
+
+
+class AchievementProgressBuffer:
+    """
+    업적 진행도 누적기
+
+    같은 (유저, 업적)에 대한 증가량은 합산하고, 절대값(레벨, 보유 골드 등)은 마지막 값만 유지합니다.
+    flush()는 대상 행을 한 번에 조회한 뒤 bulk_create / bulk_update로 반영하며,
+    완료 판정과 우편 발송은 flush 시점에 한 번만 수행됩니다.
+    """
+
+    def __init__(self, mail_service: MailService = None):
+        self.mail_service = mail_service or MailService()
+        self._pending: dict[tuple[int, int], PendingProgress] = {}
+        self._flush_lock = asyncio.Lock()
+
+    @property
+    def pending_count(self) -> int:
+        """반영 대기 중인 (유저, 업적) 항목 수"""
+        return len(self._pending)
+
+    def add(
+        self,
+        user_id: int,
+        achievement: Achievement,
+        increment: int = 0,
+        set_value: int = None
+    ) -> None:
+        """
+        진행도 변화 누적
+
+        Args:
+            user_id: 유저 ID
+            achievement: 업적
+            increment: 증가량 (누적형)
+            set_value: 설정값 (절대값형)
+        """
+        key = (user_id, achievement.id)
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = PendingProgress(achievement=achievement)
+            self._pending[key] = pending
+
+        if set_value is not None:
+            pending.set_value = set_value
+        else:
+            pending.increment += increment
+
+    async def flush(self, user_ids: Iterable[int] = None) -> int:
+        """
+        누적된 진행도를 DB에 일괄 반영
+
+        Args:
+            user_ids: 반영할 유저 ID 목록 (None이면 전체)
+
+        Returns:
+            반영한 (유저, 업적) 항목 수
+        """
+        async with self._flush_lock:
+            if user_ids is None:
+                batch = self._pending
+                self._pending = {}
+            else:
+                targets = set(user_ids)
+                batch = {k: v for k, v in self._pending.items() if k[0] in targets}
+                for key in batch:
+                    del self._pending[key]
+
+            if not batch:
+                return 0
+
+            try:
+                completed = await self._apply_batch(batch)
+            except Exception:
+                # 실패한 배치는 다음 flush에서 다시 시도
+                for key, pending in batch.items():
+                    self._merge_back(key, pending)
+                raise
+
+        for user_id, achievement in completed:
+            try:
+                await self._send_achievement_mail(user_id, achievement)
+            except Exception as e:
+                logger.error(
+                    f"Failed to send achievement mail: user_id={user_id}, "
+                    f"achievement_id={achievement.id}: {e}",
+                    exc_info=True
+                )
+
+        logger.debug(f"Achievement progress flushed: {len(batch)} entries, {len(completed)} completed")
+        return len(batch)
+
+    def _merge_back(self, key: tuple[int, int], pending: PendingProgress) -> None:
+        """반영 실패한 항목을 대기열에 되돌림 (그 사이 누적된 값과 병합)"""
+        newer = self._pending.get(key)
+        if newer is None:
+            self._pending[key] = pending
+            return
+        if newer.set_value is None:
+            newer.set_value = pending.set_value
+        newer.increment += pending.increment
+
+    async def _apply_batch(
+        self,
+        batch: dict[tuple[int, int], PendingProgress]
+    ) -> list[tuple[int, Achievement]]:
+        """
+        배치 반영
+
+        Returns:
+            이번 반영으로 새로 완료된 (유저 ID, 업적) 목록
+        """
+        user_ids = {user_id for user_id, _ in batch}
+        achievement_ids = {achievement_id for _, achievement_id in batch}
+        achievement_ids.update(
+            p.achievement.prerequisite_achievement_id
+            for p in batch.values()
+            if p.achievement.prerequisite_achievement_id
+        )
+
+        rows = await UserAchievement.filter(
+            user_id__in=user_ids,
+            achievement_id__in=achievement_ids
+        )
+        rows_by_key = {(row.user_id, row.achievement_id): row for row in rows}
+        completed_keys = {key for key, row in rows_by_key.items() if row.is_completed}
+
+        to_create: list[UserAchievement] = []
+        to_update: list[UserAchievement] = []
+        newly_completed: list[tuple[int, Achievement]] = []
+
+        # 업적 ID 순서로 처리하여 같은 배치에서 완료된 선행 티어가 다음 티어에 반영되도록 함
+        for key in sorted(batch):
+            user_id, achievement_id = key
+            pending = batch[key]
+            achievement = pending.achievement
+
+            # 선행 업적 확인 (티어 II/III는 이전 티어 완료 필요)
+            prerequisite_id = achievement.prerequisite_achievement_id
+            if prerequisite_id and (user_id, prerequisite_id) not in completed_keys:
+                continue
+
+            row = rows_by_key.get(key)
+            if row is None:
+                row = UserAchievement(
+                    user_id=user_id,
+                    achievement_id=achievement_id,
+                    progress_current=0,
+                    progress_required=achievement.objective_config.get("count", 1),
+                )
+                to_create.append(row)
+            elif row.is_completed:
+                continue
+            else:
+                to_update.append(row)
+
+            if pending.set_value is not None:
+                row.progress_current = pending.set_value
+            else:
+                row.progress_current += pending.increment
+
+            if row.progress_current >= row.progress_required:
+                row.is_completed = True
+                row.completed_at = datetime.now()
+                completed_keys.add(key)
+                newly_completed.append((user_id, achievement))
+
+        async with in_transaction():
+            if to_create:
+                await UserAchievement.bulk_create(to_create)
+            if to_update:
+                await UserAchievement.bulk_update(
+                    to_update,
+                    fields=["progress_current", "is_completed", "completed_at"]
+                )
+
+        for user_id, achievement in newly_completed:
+            logger.info(
+                f"Achievement completed: user_id={user_id}, "
+                f"achievement_id={achievement.id}, name={achievement.name}"
+            )
+
+        return newly_completed
+
+    async def _send_achievement_mail(self, user_id: int, achievement: Achievement) -> None:
+        """
+        업적 달성 시 우편 발송
+
+        Args:
+            user_id: 유저 ID
+            achievement: 달성한 업적
+        """
+        title = f"🏆 업적 달성: {achievement.full_name}"
+
+        content = f"""축하합니다! 업적을 달성하셨습니다.
+
+⚔️ {achievement.full_name}
+{achievement.description}
+
+보상을 수령해주세요!"""
+
+        # 칭호 획득 메시지 추가 (티어 III)
+        if achievement.title_name:
+            content += f"\n\n🏆 칭호 획득: {achievement.title_name}"
+
+        await self.mail_service.send_mail(
+            user_id=user_id,
+            mail_type=MailType.ACHIEVEMENT,
+            sender="시스템",
+            title=title,
+            content=content,
+            reward_config=achievement.reward_config
+        )
+
+        logger.debug(f"Achievement mail sent: user_id={user_id}, achievement_id={achievement.id}")
+
+
+# 전역 인스턴스 (세션 종료/배경 작업에서 flush)
+achievement_progress_buffer = AchievementProgressBuffer()
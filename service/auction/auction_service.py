@@ -28,6 +28,7 @@ from models.buy_order import BuyOrder, BuyOrderStatus
 from models.item import ItemType
 from models.user_inventory import UserInventory
 from models.users import User
+from service.economy.currency_ledger import apply_currency_delta, publish_gold_changed
 from service.item.inventory_service import InventoryService
 from service.mail.mail_service import MailService
 from service.session import get_session
@@ -120,8 +121,7 @@ class AuctionService:
             raise InsufficientGoldError(listing_fee, user.gold)
 
         async with in_transaction() as conn:
-            user.gold -= listing_fee
-            await user.save(using_db=conn)
+            fee_result = await apply_currency_delta(user, gold=-listing_fee, using_db=conn, publish=False)
 
             inventory_item.is_locked = True
             await inventory_item.save(using_db=conn)
@@ -146,6 +146,8 @@ class AuctionService:
                 using_db=conn
             )
 
+        await publish_gold_changed(fee_result)
+
         logger.info(
             f"User {user.id} created listing {listing.id} "
             f"({auction_type}, {starting_price}G, {duration_hours}h)"
@@ -265,19 +267,20 @@ class AuctionService:
                 auction=listing
             ).order_by("-bid_amount").first()
 
+            gold_results = []
             if prev_highest_bid:
-                prev_bidder = await User.get(id=prev_highest_bid.bidder_id)
-                prev_bidder.gold += prev_highest_bid.bid_amount
+                gold_results.append(await apply_currency_delta(
+                    prev_highest_bid.bidder_id, gold=prev_highest_bid.bid_amount,
+                    using_db=conn, publish=False
+                ))
                 prev_highest_bid.is_refunded = True
-                await prev_bidder.save(using_db=conn)
                 await prev_highest_bid.save(using_db=conn)
                 logger.info(
-                    f"Refunded {prev_highest_bid.bid_amount}G to user {prev_bidder.id}"
+                    f"Refunded {prev_highest_bid.bid_amount}G to user {prev_highest_bid.bidder_id}"
                 )
 
             # 현재 입찰자 골드 차감
-            user.gold -= bid_amount
-            await user.save(using_db=conn)
+            gold_results.append(await apply_currency_delta(user, gold=-bid_amount, using_db=conn, publish=False))
 
             # 입찰 생성
             bid = await AuctionBid.create(
@@ -291,6 +294,8 @@ class AuctionService:
             listing.current_price = bid_amount
             await listing.save(using_db=conn)
 
+        await publish_gold_changed(*gold_results)
+
         logger.info(
             f"User {user.id} bid {bid_amount}G on listing {listing_id}"
         )
@@ -415,8 +420,7 @@ class AuctionService:
 
         # Transaction: 골드 차감 (에스크로) + 주문 생성
         async with in_transaction() as conn:
-            user.gold -= max_price
-            await user.save(using_db=conn)
+            escrow_result = await apply_currency_delta(user, gold=-max_price, using_db=conn, publish=False)
 
             expires_at = datetime.now(timezone.utc) + timedelta(hours=duration_hours)
 
@@ -433,6 +437,8 @@ class AuctionService:
                 using_db=conn
             )
 
+        await publish_gold_changed(escrow_result)
+
         logger.info(
             f"User {user.id} created buy order {buy_order.id} "
             f"(item {item_id}, max {max_price}G)"
@@ -473,12 +479,15 @@ class AuctionService:
 
         # Transaction: 에스크로 골드 반환 + 상태 변경
         async with in_transaction() as conn:
-            user.gold += buy_order.escrowed_gold
-            await user.save(using_db=conn)
+            refund_result = await apply_currency_delta(
+                user, gold=buy_order.escrowed_gold, using_db=conn, publish=False
+            )
 
             buy_order.status = BuyOrderStatus.CANCELLED
             await buy_order.save(using_db=conn)
 
+        await publish_gold_changed(refund_result)
+
         logger.info(f"User {user.id} cancelled buy order {order_id}")
 
     # =========================================================================
@@ -490,53 +499,16 @@ class AuctionService:
         """
         만료된 리스팅 처리 (크론잡용)
 
+        최고 입찰 선택, 잠금 해제/소유권 이전, 골드 이동, 우편 발송을
+        묶음 트랜잭션으로 일괄 정산합니다 (service.auction.settlement).
+
         Returns:
             처리된 리스팅 수
         """
-        now = datetime.now(timezone.utc)
-        expired_listings = await AuctionListing.filter(
-            status=AuctionStatus.ACTIVE,
-            expires_at__lt=now
-        ).prefetch_related("inventory_item", "seller")
+        from service.auction.settlement import settle_expired_listings
 
-        count = 0
-        for listing in expired_listings:
-            # 입찰자 있으면 낙찰 처리
-            if listing.auction_type == AuctionType.BID:
-                highest_bid = await AuctionBid.filter(
-                    auction=listing
-                ).order_by("-bid_amount").first()
-
-                if highest_bid:
-                    await AuctionService._finalize_auction(listing, highest_bid)
-                    count += 1
-                    continue
-
-            # 입찰자 없으면 만료 처리
-            async with in_transaction() as conn:
-                if listing.inventory_item:
-                    listing.inventory_item.is_locked = False
-                    await listing.inventory_item.save(using_db=conn)
-
-                listing.status = AuctionStatus.EXPIRED
-                await listing.save(using_db=conn)
-
-            # 판매자에게 우편 발송
-            await MailService.send_mail(
-                user_id=listing.seller_id,
-                mail_type="system",
-                sender="경매장",
-                title="경매 만료",
-                content=f"**{listing.item_name}**의 경매가 입찰자 없이 만료되었습니다.",
-                reward_config=None
-            )
-
-            count += 1
-
-        if count > 0:
-            logger.info(f"Processed {count} expired listings")
-
-        return count
+        report = await settle_expired_listings()
+        return report.settled
 
     @staticmethod
     async def process_expired_buy_orders() -> int:
@@ -556,13 +528,15 @@ class AuctionService:
         for order in expired_orders:
             async with in_transaction() as conn:
                 # 에스크로 골드 반환
-                buyer = order.buyer
-                buyer.gold += order.escrowed_gold
-                await buyer.save(using_db=conn)
+                refund_result = await apply_currency_delta(
+                    order.buyer, gold=order.escrowed_gold, using_db=conn, publish=False
+                )
 
                 order.status = BuyOrderStatus.EXPIRED
                 await order.save(using_db=conn)
 
+            await publish_gold_changed(refund_result)
+
             count += 1
 
         if count > 0:
@@ -670,45 +644,6 @@ class AuctionService:
     # 내부 헬퍼
     # =========================================================================
 
-    @staticmethod
-    async def _finalize_auction(
-        listing: AuctionListing,
-        highest_bid: AuctionBid
-    ) -> None:
-        """
-        경매 낙찰 처리 (내부용)
-
-        Args:
-            listing: 경매 리스팅
-            highest_bid: 최고 입찰
-        """
-        winner = await User.get(id=highest_bid.bidder_id)
-        seller = listing.seller
-
-        await AuctionService._execute_sale(
-            listing, winner, highest_bid.bid_amount, AuctionSaleType.AUCTION
-        )
-
-        # 낙찰자 외 입찰자들 환불
-        other_bids = await AuctionBid.filter(
-            auction=listing,
-            is_refunded=False
-        ).exclude(id=highest_bid.id)
-
-        if other_bids:
-            async with in_transaction() as conn:
-                for bid in other_bids:
-                    bidder = await User.get(id=bid.bidder_id)
-                    bidder.gold += bid.bid_amount
-                    bid.is_refunded = True
-                    await bidder.save(using_db=conn)
-                    await bid.save(using_db=conn)
-
-        logger.info(
-            f"Finalized auction {listing.id}: winner={winner.id}, "
-            f"price={highest_bid.bid_amount}G"
-        )
-
     @staticmethod
     async def _execute_sale(
         listing: AuctionListing,
@@ -733,12 +668,15 @@ class AuctionService:
 
         async with in_transaction() as conn:
             # 골드 이동 (즉시구매는 여기서 차감, 입찰은 이미 차감됨)
+            gold_results = []
             if sale_type == AuctionSaleType.BUYNOW:
-                buyer.gold -= sale_price
-                await buyer.save(using_db=conn)
+                gold_results.append(await apply_currency_delta(
+                    buyer, gold=-sale_price, using_db=conn, publish=False
+                ))
 
-            seller.gold += seller_receives
-            await seller.save(using_db=conn)
+            gold_results.append(await apply_currency_delta(
+                seller, gold=seller_receives, using_db=conn, publish=False
+            ))
 
             # 아이템 이동 (소유권 이전)
             if listing.inventory_item:
@@ -766,6 +704,8 @@ class AuctionService:
                 using_db=conn
             )
 
+        await publish_gold_changed(*gold_results)
+
         # 히스토리 정리 (10건 초과 시 오래된 것 삭제)
         await AuctionService._cleanup_price_history(
             listing.item_id,
@@ -881,14 +821,17 @@ class AuctionService:
         refund = buy_order.escrowed_gold - final_price
 
         async with in_transaction() as conn:
+            gold_results = []
             # 차액 환불
             if refund > 0:
-                buyer.gold += refund
+                gold_results.append(await apply_currency_delta(
+                    buyer, gold=refund, using_db=conn, publish=False
+                ))
 
             # 판매자 골드 증가
-            seller.gold += seller_receives
-            await buyer.save(using_db=conn)
-            await seller.save(using_db=conn)
+            gold_results.append(await apply_currency_delta(
+                seller, gold=seller_receives, using_db=conn, publish=False
+            ))
 
             # 아이템 이동 (소유권 이전)
             if listing.inventory_item:
@@ -922,6 +865,8 @@ class AuctionService:
                 using_db=conn
             )
 
+        await publish_gold_changed(*gold_results)
+
         # 히스토리 정리
         await AuctionService._cleanup_price_history(
             listing.item_id,
@@ -0,0 +1,296 @@
+"""
+경매 만료 정산
+
+만료된 리스팅을 리스팅 단위 트랜잭션 대신 묶음 단위로 정산합니다.
+
+- 만료 리스팅 전체의 최고 입찰을 윈도 함수 쿼리 1회로 선택
+- 인벤토리 잠금 해제/소유권 이전, 골드 이동, 리스팅 상태 갱신을
+  SETTLEMENT_CHUNK_SIZE개씩 하나의 트랜잭션에서 집합 단위로 반영
+- 판매/구매/만료 우편은 묶음마다 bulk insert
+- 실행마다 처리량(리스팅/초)을 기록
+"""
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from pypika_tortoise import Order, Table
+from pypika_tortoise.analytics import RowNumber
+from tortoise.transactions import in_transaction
+
+from config.multiplayer import AUCTION
+from models.auction_bid import AuctionBid
+from models.auction_history import AuctionHistory, AuctionSaleType
+from models.auction_listing import AuctionListing, AuctionStatus, AuctionType
+from models.mail import Mail, MailType
+from models.user_inventory import UserInventory
+from service.economy.currency_ledger import apply_currency_delta, publish_gold_changed
+
+logger = logging.getLogger(__name__)
+
+MAIL_SENDER = "경매장"
+MAIL_EXPIRE_DAYS = 30
+
+
+@dataclass(frozen=True)
+class TopBid:
+    """리스팅별 최고 입찰"""
+
+    id: int
+    auction_id: int
+    bidder_id: int
+    bid_amount: int
+
+
+@dataclass
+class SettlementReport:
+    """정산 1회 결과"""
+
+    sold: int = 0
+    """낙찰 처리된 리스팅 수"""
+
+    expired: int = 0
+    """입찰 없이 만료 처리된 리스팅 수"""
+
+    refunded_bids: int = 0
+    """환불된 (낙찰되지 않은) 입찰 수"""
+
+    mails: int = 0
+    """발송된 우편 수"""
+
+    chunks: int = 0
+    """실행한 트랜잭션 수"""
+
+    elapsed: float = 0.0
+    """소요 시간 (초)"""
+
+    @property
+    def settled(self) -> int:
+        """정산된 리스팅 수"""
+        return self.sold + self.expired
+
+    @property
+    def throughput(self) -> float:
+        """처리량 (리스팅/초)"""
+        return self.settled / self.elapsed if self.elapsed > 0 else 0.0
+
+
+# 마지막 정산 결과 (모니터링용)
+last_report: Optional[SettlementReport] = None
+
+
+async def settle_expired_listings(
+    now: Optional[datetime] = None,
+    chunk_size: int = AUCTION.SETTLEMENT_CHUNK_SIZE,
+) -> SettlementReport:
+    """
+    만료된 리스팅 일괄 정산
+
+    Args:
+        now: 기준 시각 (기본: 현재 UTC)
+        chunk_size: 트랜잭션 하나에 묶는 리스팅 수
+
+    Returns:
+        SettlementReport
+    """
+    global last_report
+
+    started = time.perf_counter()
+    now = now or datetime.now(timezone.utc)
+    report = SettlementReport()
+
+    expired_ids = await AuctionListing.filter(
+        status=AuctionStatus.ACTIVE,
+        expires_at__lt=now
+    ).order_by("id").values_list("id", flat=True)
+
+    for offset in range(0, len(expired_ids), chunk_size):
+        await _settle_chunk(expired_ids[offset:offset + chunk_size], now, report)
+        report.chunks += 1
+
+    report.elapsed = time.perf_counter() - started
+    last_report = report
+
+    if report.settled:
+        logger.info(
+            f"Settled {report.settled} expired listings (sold={report.sold}, expired={report.expired}, "
+            f"refunds={report.refunded_bids}, mails={report.mails}) in {report.chunks} chunks, "
+            f"{report.elapsed * 1000:.0f}ms ({report.throughput:.1f} listings/s)"
+        )
+    return report
+
+
+async def fetch_top_bids(listing_ids: List[int], using_db=None) -> Dict[int, TopBid]:
+    """
+    리스팅별 최고 입찰 조회 (ROW_NUMBER 윈도 쿼리 1회)
+
+    Args:
+        listing_ids: 리스팅 ID 목록
+        using_db: 사용할 연결 (트랜잭션 내부 호출 시)
+
+    Returns:
+        {리스팅 ID: TopBid}
+    """
+    if not listing_ids:
+        return {}
+
+    db = using_db or AuctionBid._meta.db
+    bids = Table(AuctionBid._meta.db_table)
+    rank = (
+        RowNumber()
+        .over(bids.auction_id)
+        .orderby(bids.bid_amount, order=Order.desc)
+        .orderby(bids.id)
+    )
+    ranked = (
+        db.query_class.from_(bids)
+        .select(bids.id, bids.auction_id, bids.bidder_id, bids.bid_amount, rank.as_("bid_rank"))
+        .where(bids.auction_id.isin([int(listing_id) for listing_id in listing_ids]))
+    )
+    query = (
+        db.query_class.from_(ranked)
+        .select(ranked.id, ranked.auction_id, ranked.bidder_id, ranked.bid_amount)
+        .where(ranked.bid_rank == 1)
+    )
+    rows = await db.execute_query_dict(query.get_sql())
+    return {
+        row["auction_id"]: TopBid(row["id"], row["auction_id"], row["bidder_id"], row["bid_amount"])
+        for row in rows
+    }
+
+
+async def _settle_chunk(listing_ids: List[int], now: datetime, report: SettlementReport) -> None:
+    """리스팅 묶음 하나를 트랜잭션 하나로 정산"""
+    async with in_transaction() as conn:
+        # 정산 사이 즉시구매/취소된 리스팅 제외
+        listings = await AuctionListing.filter(
+            id__in=listing_ids,
+            status=AuctionStatus.ACTIVE
+        ).using_db(conn).select_for_update()
+        if not listings:
+            return
+
+        top_bids = await fetch_top_bids(
+            [listing.id for listing in listings if listing.auction_type == AuctionType.BID],
+            using_db=conn,
+        )
+
+        sold = [listing for listing in listings if listing.id in top_bids]
+        expired = [listing for listing in listings if listing.id not in top_bids]
+
+        mails: List[Mail] = []
+        gold_deltas: Dict[int, int] = defaultdict(int)
+
+        # 입찰 없음 → 만료 (잠금 해제 + 상태 변경)
+        if expired:
+            expired_inventory_ids = [l.inventory_item_id for l in expired if l.inventory_item_id]
+            if expired_inventory_ids:
+                await UserInventory.filter(id__in=expired_inventory_ids).using_db(conn).update(is_locked=False)
+            await AuctionListing.filter(id__in=[l.id for l in expired]).using_db(conn).update(
+                status=AuctionStatus.EXPIRED
+            )
+            for listing in expired:
+                mails.append(_mail(
+                    listing.seller_id, "경매 만료",
+                    f"**{listing.item_name}**의 경매가 입찰자 없이 만료되었습니다.",
+                ))
+
+        # 최고 입찰자 낙찰 (입찰 금액은 입찰 시 이미 차감됨)
+        if sold:
+            inventory_by_buyer: Dict[int, List[int]] = defaultdict(list)
+            histories = []
+            for listing in sold:
+                bid = top_bids[listing.id]
+                sale_fee = int(bid.bid_amount * AUCTION.SALE_FEE_PERCENT)
+                seller_receives = bid.bid_amount - sale_fee
+                gold_deltas[listing.seller_id] += seller_receives
+
+                if listing.inventory_item_id:
+                    inventory_by_buyer[bid.bidder_id].append(listing.inventory_item_id)
+
+                listing.status = AuctionStatus.SOLD
+                listing.buyer_id = bid.bidder_id
+                listing.sold_at = now
+                listing.final_price = bid.bid_amount
+                listing.inventory_item_id = None
+
+                histories.append(AuctionHistory(
+                    item_id=listing.item_id,
+                    enhancement_level=listing.enhancement_level,
+                    instance_grade=listing.instance_grade,
+                    sale_price=bid.bid_amount,
+                    sale_type=AuctionSaleType.AUCTION,
+                    seller_id=listing.seller_id,
+                    buyer_id=bid.bidder_id,
+                ))
+                mails.append(_mail(
+                    listing.seller_id, "경매 판매 완료",
+                    f"**{listing.item_name}**이(가) {bid.bid_amount}G에 판매되었습니다.\n"
+                    f"수수료 {sale_fee}G를 제외한 {seller_receives}G를 받았습니다.",
+                ))
+                mails.append(_mail(
+                    bid.bidder_id, "경매 구매 완료",
+                    f"**{listing.item_name}**을(를) {bid.bid_amount}G에 구매했습니다.\n"
+                    f"인벤토리를 확인해주세요.",
+                ))
+
+            for buyer_id, inventory_ids in inventory_by_buyer.items():
+                await UserInventory.filter(id__in=inventory_ids).using_db(conn).update(
+                    user_id=buyer_id, is_locked=False
+                )
+            await AuctionListing.bulk_update(
+                sold,
+                fields=["status", "buyer_id", "sold_at", "final_price", "inventory_item_id"],
+                using_db=conn,
+            )
+            await AuctionHistory.bulk_create(histories, using_db=conn)
+
+            # 낙찰되지 않았는데 환불되지 않은 입찰 환불
+            losing_bids = await AuctionBid.filter(
+                auction_id__in=[listing.id for listing in sold],
+                is_refunded=False
+            ).exclude(
+                id__in=[top_bids[listing.id].id for listing in sold]
+            ).using_db(conn).values_list("id", "bidder_id", "bid_amount")
+            if losing_bids:
+                for _, bidder_id, bid_amount in losing_bids:
+                    gold_deltas[bidder_id] += bid_amount
+                await AuctionBid.filter(id__in=[bid_id for bid_id, _, _ in losing_bids]).using_db(conn).update(
+                    is_refunded=True
+                )
+                report.refunded_bids += len(losing_bids)
+
+        # 유저별 골드 합산 반영 (GOLD_CHANGED는 커밋 후 발행)
+        gold_results = [
+            await apply_currency_delta(user_id, gold=delta, using_db=conn, publish=False)
+            for user_id, delta in gold_deltas.items()
+        ]
+
+        await Mail.bulk_create(mails, using_db=conn)
+
+    await publish_gold_changed(*gold_results)
+
+    report.sold += len(sold)
+    report.expired += len(expired)
+    report.mails += len(mails)
+
+    # 가격 히스토리 정리 (10건 초과분 삭제) - 아이템 조건별 1회
+    from service.auction.auction_service import AuctionService
+
+    for key in {(l.item_id, l.enhancement_level, l.instance_grade) for l in sold}:
+        await AuctionService._cleanup_price_history(*key)
+
+
+def _mail(user_id: int, title: str, content: str) -> Mail:
+    """경매장 시스템 우편 생성 (미저장)"""
+    return Mail(
+        user_id=user_id,
+        mail_type=MailType.SYSTEM,
+        sender=MAIL_SENDER,
+        title=title,
+        content=content,
+        reward_config=None,
+        expires_at=datetime.now() + timedelta(days=MAIL_EXPIRE_DAYS),
+    )
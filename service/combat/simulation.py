@@ -0,0 +1,288 @@
+"""
+헤드리스 전투 시뮬레이션
+
+Discord 없이 CombatEngine을 동기적으로 반복 실행하여
+밸런스 조정/회귀 검증용 통계(승률, 라운드 분포, 라운드당 피해량)를 계산합니다.
+
+배치 실행은 프로세스 풀을 사용하며, 워커는 부모 프로세스에 로드된 정적 데이터를
+fork로 상속받습니다. 호출 전에 load_static_data()가 완료되어 있어야 합니다.
+"""
+import logging
+import multiprocessing
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional
+
+from config import COMBAT_SIMULATION
+from models import Monster, User, UserStatEnum
+from service.dungeon.combat_context import (
+    CombatContext, activate_combat_context, deactivate_combat_context,
+)
+from service.dungeon.combat_engine import CombatEngine
+
+logger = logging.getLogger(__name__)
+
+_BUILD_STAT_FIELDS = (
+    "level", "hp", "attack", "defense", "speed", "ap_attack", "ap_defense",
+    "accuracy", "evasion", "critical_rate", "critical_damage",
+    "bonus_str", "bonus_int", "bonus_dex", "bonus_vit", "bonus_luk",
+)
+
+
+@dataclass(frozen=True)
+class SimulationBuild:
+    """
+    시뮬레이션용 유저 빌드 (프로세스 간 전달 가능한 값 객체)
+
+    DB 연결 없이 워커에서 User 엔티티를 재구성하는 데 필요한 값만 담습니다.
+    """
+
+    stats: dict = field(default_factory=dict)
+    """User 기본 스탯/능력치 필드 (_BUILD_STAT_FIELDS)"""
+
+    equipment_stats: dict = field(default_factory=dict)
+    """장비 합산 스탯"""
+
+    equipped_skill: tuple[int, ...] = ()
+    """스킬 덱 (10슬롯)"""
+
+    equipment_configs: tuple[dict, ...] = ()
+    """장비 컴포넌트 config 목록 (EquipmentItem.config)"""
+
+    @classmethod
+    def from_user(cls, user: User, equipment_configs: tuple[dict, ...] = ()) -> "SimulationBuild":
+        """
+        현재 유저 상태에서 빌드 생성
+
+        Args:
+            user: 대상 유저 (덱/장비 스탯이 로드된 상태)
+            equipment_configs: 장비 컴포넌트 config 목록
+
+        Returns:
+            시뮬레이션 빌드
+        """
+        return cls(
+            stats={name: getattr(user, name) for name in _BUILD_STAT_FIELDS},
+            equipment_stats=dict(getattr(user, "equipment_stats", {}) or {}),
+            equipped_skill=tuple(getattr(user, "equipped_skill", ()) or ()),
+            equipment_configs=tuple(equipment_configs),
+        )
+
+    def to_user(self) -> User:
+        """빌드로부터 전투용 User 엔티티 생성 (풀 HP)"""
+        from service.item.equipment_component_loader import load_equipment_components
+
+        user = User(discord_id=0, username="시뮬레이션", **self.stats)
+        user.equipment_stats = dict(self.equipment_stats)
+        if self.equipped_skill:
+            user.equipped_skill = list(self.equipped_skill)
+
+        components = []
+        for config in self.equipment_configs:
+            components.extend(load_equipment_components(config))
+        user._equipment_components_cache = components
+
+        user.now_hp = user.get_stat()[UserStatEnum.HP]
+        return user
+
+
+@dataclass
+class FightResult:
+    """단일 전투 결과"""
+
+    won: bool
+    """몬스터 전멸 여부"""
+
+    rounds: int
+    """종료 시점 라운드"""
+
+    actions: int
+    """총 행동 횟수"""
+
+    damage_dealt: int
+    """몬스터에게 준 총 피해량"""
+
+
+@dataclass
+class SimulationReport:
+    """배치 시뮬레이션 통계"""
+
+    fights: int
+    wins: int
+    turn_distribution: dict[int, int]
+    """라운드 수 → 전투 수"""
+
+    total_rounds: int
+    total_damage: int
+
+    @property
+    def win_rate(self) -> float:
+        """승률 (0.0~1.0)"""
+        return self.wins / self.fights if self.fights else 0.0
+
+    @property
+    def avg_rounds(self) -> float:
+        """평균 라운드 수"""
+        return self.total_rounds / self.fights if self.fights else 0.0
+
+    @property
+    def damage_per_round(self) -> float:
+        """라운드당 평균 피해량"""
+        return self.total_damage / self.total_rounds if self.total_rounds else 0.0
+
+    @classmethod
+    def from_results(cls, results: list[FightResult]) -> "SimulationReport":
+        """전투 결과 목록 집계"""
+        return cls(
+            fights=len(results),
+            wins=sum(1 for r in results if r.won),
+            turn_distribution=dict(sorted(Counter(r.rounds for r in results).items())),
+            total_rounds=sum(r.rounds for r in results),
+            total_damage=sum(r.damage_dealt for r in results),
+        )
+
+
+def simulate_fight(
+    user: User,
+    monsters: list[Monster],
+    participants: Optional[dict[int, User]] = None
+) -> FightResult:
+    """
+    단일 전투를 UI/딜레이 없이 끝까지 실행
+
+    Args:
+        user: 파티 리더 (now_hp, 덱, 장비 컴포넌트가 준비된 상태)
+        monsters: 전투할 몬스터 (복사본)
+        participants: 추가 참가자
+
+    Returns:
+        전투 결과
+    """
+    context = CombatContext.from_group(monsters)
+    engine = CombatEngine(user, context, participants)
+
+    token = activate_combat_context(context)
+    try:
+        engine.start()
+        while not engine.is_finished():
+            outcome = engine.step()
+            if outcome is None:
+                break
+            # 실전 전투와 동일하게 행동한 턴에서만 라운드 시작 효과 처리
+            if outcome.acted and outcome.round_advanced:
+                engine.round_start_effects()
+    finally:
+        deactivate_combat_context(token)
+
+    # 소환된 몬스터 포함, 시작 HP 대비 감소량 합산
+    damage_dealt = sum(m.hp - max(0, m.now_hp) for m in context.monsters)
+    return FightResult(
+        won=context.is_all_dead(),
+        rounds=context.round_number,
+        actions=context.action_count,
+        damage_dealt=max(0, damage_dealt),
+    )
+
+
+def simulate_dungeon_fight(
+    build: SimulationBuild,
+    dungeon_id: int,
+    seed: int,
+    progress: float = COMBAT_SIMULATION.DEFAULT_PROGRESS
+) -> FightResult:
+    """
+    던전 스폰 테이블에서 몬스터 그룹을 뽑아 시드 고정 전투 1회 실행
+
+    전투 코드가 모듈 전역 random을 사용하므로 시드를 고정한 뒤 실행하고,
+    끝나면 전역 난수 상태를 되돌립니다. 전투는 await 없이 끝까지 실행되므로
+    봇 프로세스 안에서 호출해도 실전 전투/드롭 판정의 난수에 영향을 주지 않습니다.
+
+    Args:
+        build: 유저 빌드
+        dungeon_id: 던전 ID
+        seed: 난수 시드 (같은 시드면 같은 결과)
+        progress: 던전 진행도 (보스 스폰 판정용)
+
+    Returns:
+        전투 결과
+    """
+    from service.dungeon.encounter_processor import _spawn_monster_group
+
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        monsters = _spawn_monster_group(dungeon_id, progress)
+        return simulate_fight(build.to_user(), monsters)
+    finally:
+        random.setstate(state)
+
+
+def _run_chunk(
+    build: SimulationBuild,
+    dungeon_id: int,
+    seeds: list[int],
+    progress: float
+) -> list[FightResult]:
+    """워커 프로세스 작업 단위 (시드 목록만큼 전투 실행)"""
+    from models.repos import static_cache
+
+    if not static_cache.spawn_info:
+        raise RuntimeError(
+            "정적 데이터가 로드되지 않은 프로세스입니다. "
+            "load_static_data() 이후 fork 방식으로 실행해야 합니다."
+        )
+    return [simulate_dungeon_fight(build, dungeon_id, seed, progress) for seed in seeds]
+
+
+def run_batch(
+    build: SimulationBuild,
+    dungeon_id: int,
+    fights: int = COMBAT_SIMULATION.DEFAULT_FIGHTS,
+    seed: int = 0,
+    workers: Optional[int] = None,
+    progress: float = COMBAT_SIMULATION.DEFAULT_PROGRESS
+) -> SimulationReport:
+    """
+    시드 고정 전투 N회를 프로세스 풀에서 실행하고 통계 반환
+
+    전투 i는 항상 seed + i로 실행되므로 워커 수와 무관하게 결과가 재현됩니다.
+
+    Args:
+        build: 유저 빌드
+        dungeon_id: 던전 ID
+        fights: 전투 횟수
+        seed: 기준 시드
+        workers: 워커 프로세스 수 (None=CPU 수, 1 이하면 현재 프로세스에서 실행)
+        progress: 던전 진행도
+
+    Returns:
+        승률/라운드 분포/라운드당 피해량 통계
+    """
+    seeds = [seed + i for i in range(fights)]
+    chunk_size = COMBAT_SIMULATION.CHUNK_SIZE
+    chunks = [seeds[i:i + chunk_size] for i in range(0, len(seeds), chunk_size)]
+
+    results: list[FightResult] = []
+    if workers is not None and workers <= 1:
+        for chunk in chunks:
+            results.extend(_run_chunk(build, dungeon_id, chunk, progress))
+    else:
+        # 정적 데이터를 상속받기 위해 fork 사용 (불가능한 플랫폼에서는 워커에서 오류 발생)
+        methods = multiprocessing.get_all_start_methods()
+        mp_context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as pool:
+            futures = [
+                pool.submit(_run_chunk, build, dungeon_id, chunk, progress)
+                for chunk in chunks
+            ]
+            for future in futures:
+                results.extend(future.result())
+
+    report = SimulationReport.from_results(results)
+    logger.info(
+        f"Combat simulation: dungeon={dungeon_id}, fights={report.fights}, "
+        f"win_rate={report.win_rate:.2%}, avg_rounds={report.avg_rounds:.1f}, damage_per_round={report.damage_per_round:.1f}"
+    )
+    return report
@@ -0,0 +1,141 @@
+"""
+행동 스케줄러
+
+행동 게이지 시스템을 틱 단위 충전 대신 이벤트 단위로 계산합니다.
+
+게이지는 틱마다 int(속도 × 배율)씩 선형으로 차고 틱 사이에는 바뀌지 않으므로,
+각 전투원의 다음 행동 틱을 (MAX - 게이지) / 충전량으로 바로 구할 수 있습니다.
+행동 순서는 (행동 틱, -그 시점 게이지, 유저 우선, 등록 순서) 우선순위 큐로 결정되며
+기존 틱 단위 시뮬레이션과 같은 순서를 냅니다.
+"""
+import heapq
+from dataclasses import dataclass
+from typing import Optional, Union
+
+from config import COMBAT
+
+ROUND_MARKER_SPEED = 10
+"""라운드 마커 속도 (고정)"""
+
+
+@dataclass
+class Combatant:
+    """스케줄링 대상 전투원 스냅샷"""
+
+    entity: object
+    gauge: int
+    """현재 게이지"""
+
+    fill: int
+    """틱당 충전량"""
+
+    is_user: bool
+    """유저 여부 (동점 시 유저 우선)"""
+
+    can_act: bool = True
+    """행동 후보 여부 (사망한 플레이어는 게이지만 충전됨)"""
+
+
+def gauge_fill_per_tick(speed: Union[int, float]) -> int:
+    """속도에 따른 틱당 게이지 충전량"""
+    return int(speed * COMBAT.ACTION_GAUGE_SPEED_MULTIPLIER)
+
+
+def round_marker_fill_per_tick() -> int:
+    """라운드 마커의 틱당 충전량"""
+    return gauge_fill_per_tick(ROUND_MARKER_SPEED)
+
+
+def ticks_until_ready(gauge: int, fill: int) -> Optional[int]:
+    """
+    게이지가 MAX에 도달하기까지 남은 틱 수
+
+    Args:
+        gauge: 현재 게이지
+        fill: 틱당 충전량
+
+    Returns:
+        남은 틱 수 (이미 가득 찼으면 0, 충전되지 않으면 None)
+    """
+    missing = COMBAT.ACTION_GAUGE_MAX - gauge
+    if missing <= 0:
+        return 0
+    if fill <= 0:
+        return None
+    return -(-missing // fill)
+
+
+def ticks_until_next_action(combatants: list[Combatant]) -> Optional[int]:
+    """
+    행동 가능한 전투원 중 가장 먼저 게이지가 차는 틱 수
+
+    Returns:
+        틱 수 (아무도 행동할 수 없으면 None)
+    """
+    best = None
+    for combatant in combatants:
+        if not combatant.can_act:
+            continue
+        ticks = ticks_until_ready(combatant.gauge, combatant.fill)
+        if ticks is not None and (best is None or ticks < best):
+            best = ticks
+    return best
+
+
+def priority_key(combatant: Combatant, order: int) -> tuple:
+    """같은 틱에 행동 가능한 전투원 간 우선순위 (게이지 높은 순, 동점 시 유저 → 등록 순)"""
+    return (-combatant.gauge, 0 if combatant.is_user else 1, order)
+
+
+def predict_order(
+    combatants: list[Combatant],
+    round_number: int,
+    round_marker_gauge: int,
+    count: int,
+) -> list[tuple[object, int]]:
+    """
+    다음 행동 순서 예측 (O(k log n))
+
+    라운드는 실제 전투와 같이 행동 직후 마커가 MAX 이상이면 1 증가합니다.
+
+    Args:
+        combatants: 현재 전투원 스냅샷 (등록 순서 = 동점 시 순서)
+        round_number: 현재 라운드
+        round_marker_gauge: 현재 라운드 마커 게이지
+        count: 예측할 행동 수
+
+    Returns:
+        [(엔티티, 라운드), ...]
+    """
+    heap: list[tuple] = []
+    for order, combatant in enumerate(combatants):
+        if combatant.can_act:
+            _push(heap, combatant, order, combatant.gauge, 0)
+
+    marker_fill = round_marker_fill_per_tick()
+    marker_consumed = 0
+    result = []
+
+    while heap and len(result) < count:
+        tick, _, _, order, gauge = heapq.heappop(heap)
+        combatant = combatants[order]
+        result.append((combatant.entity, round_number))
+
+        # 행동 직후 라운드 마커 체크 (CombatContext.check_and_advance_round와 동일)
+        marker = round_marker_gauge + tick * marker_fill - marker_consumed
+        if marker >= COMBAT.ACTION_GAUGE_MAX:
+            round_number += 1
+            marker_consumed += min(COMBAT.ACTION_GAUGE_COST, marker)
+
+        _push(heap, combatant, order, max(0, gauge - COMBAT.ACTION_GAUGE_COST), tick)
+
+    return result
+
+
+def _push(heap: list, combatant: Combatant, order: int, gauge: int, tick: int) -> None:
+    """gauge 상태(시점 tick)인 전투원의 다음 행동을 큐에 등록"""
+    wait = ticks_until_ready(gauge, combatant.fill)
+    if wait is None:
+        return
+    ready_gauge = gauge + wait * combatant.fill
+    heapq.heappush(heap, (tick + wait, -ready_gauge, 0 if combatant.is_user else 1, order, ready_gauge))
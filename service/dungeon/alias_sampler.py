@@ -0,0 +1,195 @@
+"""
+별칭(Alias) 샘플러 - 스폰/상자/보스 드롭 가중치 추첨
+
+Walker 별칭 테이블을 한 번 만들어 두면 가중치 추첨이 항목 수와 무관하게
+난수 1회 + O(1)로 끝납니다. 테이블은 정적 데이터(spawn_info, box_drop_table,
+droptable 인덱스)에서 키별로 처음 필요할 때 만들어 재사용하고,
+정적 데이터를 다시 로드하면 rebuild_samplers()로 모두 다시 만듭니다.
+
+난수는 기본적으로 random 모듈을 쓰므로 random.seed()로 재현할 수 있고,
+테스트에서는 random.Random 인스턴스를 직접 넘길 수도 있습니다.
+"""
+import logging
+import random
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, Optional, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AliasSampler(Generic[T]):
+    """가중치 기반 O(1) 추첨기 (Vose 별칭 방법)"""
+
+    def __init__(self, items: Sequence[T], weights: Sequence[float]):
+        """
+        Args:
+            items: 추첨 대상
+            weights: 항목별 가중치 (0 이하 항목은 제외)
+
+        Raises:
+            ValueError: 양수 가중치 항목이 없을 때
+        """
+        pairs = [(item, float(weight)) for item, weight in zip(items, weights) if weight and weight > 0]
+        if not pairs:
+            raise ValueError("AliasSampler requires at least one positive weight")
+
+        self.items: list[T] = [item for item, _ in pairs]
+        size = len(pairs)
+        total = sum(weight for _, weight in pairs)
+        scaled = [weight * size / total for _, weight in pairs]
+
+        self._prob = [1.0] * size
+        self._alias = list(range(size))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self._prob[less] = scaled[less]
+            self._alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+        # 남은 항목은 부동소수점 오차를 제외하면 확률 1
+
+    @classmethod
+    def build(cls, items: Sequence[T], weights: Sequence[float]) -> Optional["AliasSampler[T]"]:
+        """양수 가중치가 없으면 None을 반환하는 생성 헬퍼"""
+        try:
+            return cls(items, weights)
+        except ValueError:
+            return None
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def sample(self, rng: Optional[random.Random] = None) -> T:
+        """
+        항목 1개 추첨
+
+        Args:
+            rng: 난수 생성기 (None이면 random 모듈 전역 상태 사용)
+        """
+        size = len(self.items)
+        scaled = (rng or random).random() * size
+        index = min(int(scaled), size - 1)
+        if scaled - index < self._prob[index]:
+            return self.items[index]
+        return self.items[self._alias[index]]
+
+
+@dataclass(frozen=True)
+class SpawnSampler:
+    """던전 하나의 스폰 추첨기"""
+
+    normal: AliasSampler
+    """일반 스폰 추첨기 (일반 몬스터가 없으면 전체 스폰)"""
+
+    boss: Optional[AliasSampler]
+    """보스 스폰 추첨기 (보스가 없으면 None)"""
+
+
+class _SamplerCache:
+    """
+    키별 추첨기 캐시
+
+    원본 리스트 객체를 함께 보관하여 원본이 교체/변경되면 다시 만듭니다.
+    """
+
+    def __init__(self, builder: Callable[[Hashable, list], Optional[object]]):
+        self._builder = builder
+        self._entries: dict = {}
+
+    def get(self, key: Hashable, source: Optional[list]):
+        if not source:
+            return None
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is source and entry[1] == len(source):
+            return entry[2]
+        sampler = self._builder(key, source)
+        self._entries[key] = (source, len(source), sampler)
+        return sampler
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def _build_spawn_sampler(dungeon_id: int, spawns: list) -> Optional[SpawnSampler]:
+    from models.repos.static_cache import monster_cache_by_id
+    from service.dungeon.reward_calculator import is_boss_monster
+
+    boss_spawns = []
+    normal_spawns = []
+    for spawn in spawns:
+        monster = monster_cache_by_id.get(spawn.monster_id)
+        if monster is not None and is_boss_monster(monster):
+            boss_spawns.append(spawn)
+        else:
+            normal_spawns.append(spawn)
+
+    pool = normal_spawns or spawns
+    normal = AliasSampler.build(pool, [spawn.prob for spawn in pool])
+    if normal is None:
+        logger.warning(f"No positive spawn weight for dungeon: {dungeon_id}")
+        return None
+    boss = AliasSampler.build(boss_spawns, [spawn.prob for spawn in boss_spawns])
+    return SpawnSampler(normal=normal, boss=boss)
+
+
+def _build_box_sampler(monster_type: str, box_pool: list) -> Optional[AliasSampler]:
+    return AliasSampler.build([box_id for box_id, _ in box_pool], [weight for _, weight in box_pool])
+
+
+def _build_drop_sampler(monster_id: int, rows: list) -> Optional[AliasSampler]:
+    valid_rows = [row for row in rows if row.item_id]
+    return AliasSampler.build(valid_rows, [float(row.probability or 0) for row in valid_rows])
+
+
+_spawn_samplers = _SamplerCache(_build_spawn_sampler)
+_box_samplers = _SamplerCache(_build_box_sampler)
+_drop_samplers = _SamplerCache(_build_drop_sampler)
+
+
+def get_spawn_sampler(dungeon_id: int) -> Optional[SpawnSampler]:
+    """던전 스폰 추첨기 (스폰 정보가 없거나 가중치가 모두 0이면 None)"""
+    from models.repos.static_cache import spawn_info
+
+    return _spawn_samplers.get(dungeon_id, spawn_info.get(dungeon_id))
+
+
+def get_box_sampler(monster_type: str) -> Optional[AliasSampler]:
+    """몬스터 타입(CSV 키)별 상자 ID 추첨기"""
+    from models.repos.static_cache import box_drop_table
+
+    return _box_samplers.get(monster_type, box_drop_table.get(monster_type))
+
+
+def get_boss_drop_sampler(monster_id: int) -> Optional[AliasSampler]:
+    """보스 몬스터별 Droptable 행 추첨기"""
+    from models.repos.static_cache import droptable_by_monster
+
+    return _drop_samplers.get(monster_id, droptable_by_monster.get(monster_id))
+
+
+def rebuild_samplers() -> int:
+    """
+    정적 데이터 재로드 후 모든 추첨기 재생성
+
+    Returns:
+        생성된 추첨기 수
+    """
+    from models.repos import static_cache
+
+    for cache in (_spawn_samplers, _box_samplers, _drop_samplers):
+        cache.clear()
+
+    built = 0
+    for dungeon_id in static_cache.spawn_info:
+        built += get_spawn_sampler(dungeon_id) is not None
+    for monster_type in static_cache.box_drop_table:
+        built += get_box_sampler(monster_type) is not None
+    for monster_id in static_cache.droptable_by_monster:
+        built += get_boss_drop_sampler(monster_id) is not None
+    return built
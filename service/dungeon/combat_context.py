@@ -4,6 +4,7 @@
 1:1과 1:N 전투를 통합 처리하는 CombatContext 클래스를 제공합니다.
 """
 from collections import deque
+from contextvars import ContextVar, Token
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Dict, Optional, Union
@@ -12,9 +13,32 @@ import random
 if TYPE_CHECKING:
     from models.monster import Monster
     from models.users import User
+    from service.dungeon.combat_records import CombatRecord
     from service.dungeon.field_effects import FieldEffect
 
 
+@dataclass
+class ComponentRuntimeState:
+    """
+    스킬 컴포넌트의 전투별 런타임 상태
+
+    컴포넌트 인스턴스는 정적 캐시에서 모든 세션이 공유하므로,
+    사용 횟수/적용 대상 같은 가변 상태는 전투 컨텍스트가 소유합니다.
+    """
+
+    used_count: int = 0
+    """전투 중 사용 횟수"""
+
+    applied_entities: set[int] = field(default_factory=set)
+    """1회성 효과가 적용된 엔티티 (id(entity))"""
+
+    turn_counts: Dict[int, int] = field(default_factory=dict)
+    """엔티티별 누적 턴 수"""
+
+    base_stats: Dict[int, int] = field(default_factory=dict)
+    """엔티티별 기준 스탯 (복리 방지용)"""
+
+
 class TargetingMode(Enum):
     """타겟팅 모드"""
     LOWEST_HP = "lowest_hp"      # 가장 HP가 낮은 몬스터
@@ -64,6 +88,57 @@ class CombatContext:
     combat_log: deque = field(default_factory=lambda: deque(maxlen=10))
     """전투 로그 (관전자에게 표시)"""
 
+    component_states: Dict[int, ComponentRuntimeState] = field(default_factory=dict)
+    """스킬 컴포넌트별 런타임 상태 (id(component) → 상태). 전투 종료 시 컨텍스트와 함께 폐기"""
+
+    records: list["CombatRecord"] = field(default_factory=list)
+    """전투 기록 (데미지/치유/보호막/반사/상태이상 적용 순서대로)"""
+
+    damage_dealt: Dict[int, int] = field(default_factory=dict)
+    """엔티티별 누적 가한 피해 (id(entity) → 피해량)"""
+
+    healing_done: Dict[int, int] = field(default_factory=dict)
+    """엔티티별 누적 치유량 (id(entity) → 회복량)"""
+
+    def add_record(self, record: "CombatRecord") -> None:
+        """
+        전투 기록 추가 및 엔티티별 누적치 갱신
+
+        Args:
+            record: 전투 기록
+        """
+        from service.dungeon.combat_records import CombatRecordType
+
+        self.records.append(record)
+        if record.source is None or record.amount <= 0:
+            return
+        key = id(record.source)
+        if record.type is CombatRecordType.DAMAGE:
+            self.damage_dealt[key] = self.damage_dealt.get(key, 0) + record.amount
+        elif record.type is CombatRecordType.HEAL:
+            self.healing_done[key] = self.healing_done.get(key, 0) + record.amount
+
+    def get_damage_dealt(self, entity: object) -> int:
+        """엔티티가 이 전투에서 가한 총 피해"""
+        return self.damage_dealt.get(id(entity), 0)
+
+    def get_component_state(self, component: object) -> ComponentRuntimeState:
+        """
+        컴포넌트의 이 전투 전용 런타임 상태 반환 (없으면 생성)
+
+        Args:
+            component: 스킬 컴포넌트 인스턴스
+
+        Returns:
+            전투별 런타임 상태
+        """
+        key = id(component)
+        state = self.component_states.get(key)
+        if state is None:
+            state = ComponentRuntimeState()
+            self.component_states[key] = state
+        return state
+
     def get_primary_monster(self) -> "Monster":
         """
         단일 타겟 스킬용 주 타겟 반환
@@ -158,7 +233,7 @@ class CombatContext:
 
     def fill_gauges(self, user: "User", participants: dict = None) -> None:
         """
-        모든 전투원의 행동 게이지 충전
+        모든 전투원의 행동 게이지 1틱 충전
 
         각 전투원의 속도에 비례해서 게이지가 충전됩니다.
         충전량 = 속도 × SPEED_MULTIPLIER
@@ -167,30 +242,98 @@ class CombatContext:
             user: 유저 엔티티 (파티 리더)
             participants: 추가 참가자 딕셔너리 (user_id → User)
         """
-        from config import COMBAT
+        self._advance_ticks(self._get_combatants(user, participants), 1)
 
-        # 유저 게이지 충전
-        user_speed = self._get_entity_speed(user)
-        user_id = id(user)
-        self.action_gauges[user_id] = self.action_gauges.get(user_id, 0) + int(user_speed * COMBAT.ACTION_GAUGE_SPEED_MULTIPLIER)
+    def advance_to_next_action(self, user: "User", participants: dict = None) -> bool:
+        """
+        누군가 행동 가능해지는 시점까지 게이지를 한 번에 충전
 
-        # 신규: 추가 참가자 게이지 충전
-        if participants:
-            for participant in participants.values():
-                if id(participant) == user_id:
-                    continue  # 이미 충전됨
-                p_speed = self._get_entity_speed(participant)
-                p_id = id(participant)
-                self.action_gauges[p_id] = self.action_gauges.get(p_id, 0) + int(p_speed * COMBAT.ACTION_GAUGE_SPEED_MULTIPLIER)
+        틱 단위로 fill_gauges()를 반복한 것과 같은 결과를 냅니다.
+        이미 행동 가능한 전투원이 있으면 아무것도 하지 않습니다.
 
-        # 몬스터들 게이지 충전 (새로 추가된 몬스터도 안전하게 처리)
-        for monster in self.get_all_alive_monsters():
-            monster_speed = self._get_entity_speed(monster)
-            monster_id = id(monster)
-            self.action_gauges[monster_id] = self.action_gauges.get(monster_id, 0) + int(monster_speed * COMBAT.ACTION_GAUGE_SPEED_MULTIPLIER)
+        Args:
+            user: 유저 엔티티 (파티 리더)
+            participants: 추가 참가자 딕셔너리 (user_id → User)
+
+        Returns:
+            행동 가능한 전투원이 생겼으면 True (모두 속도 0이면 False)
+        """
+        from service.dungeon.action_scheduler import ticks_until_next_action
+
+        combatants = self._get_combatants(user, participants)
+        ticks = ticks_until_next_action(combatants)
+        if ticks is None:
+            return False
+        if ticks > 0:
+            self._advance_ticks(combatants, ticks)
+        return True
+
+    def predict_action_order(
+        self,
+        user: "User",
+        participants: dict = None,
+        count: int = 6
+    ) -> list[tuple[Union["User", "Monster"], int]]:
+        """
+        현재 게이지 상태에서 다음 행동 순서 예측 (게이지는 변경하지 않음)
+
+        Args:
+            user: 유저 엔티티 (파티 리더)
+            participants: 추가 참가자 딕셔너리 (user_id → User)
+            count: 예측할 행동 수
+
+        Returns:
+            [(엔티티, 행동 라운드), ...]
+        """
+        from service.dungeon.action_scheduler import predict_order
 
-        # 라운드 마커 충전 (속도 10 고정)
-        self.round_marker_gauge += int(10 * COMBAT.ACTION_GAUGE_SPEED_MULTIPLIER)
+        return predict_order(
+            self._get_combatants(user, participants),
+            self.round_number,
+            self.round_marker_gauge,
+            count,
+        )
+
+    def _get_combatants(self, user: "User", participants: dict = None) -> list:
+        """
+        게이지 충전 대상 스냅샷 (리더 → 참가자 → 생존 몬스터 순)
+
+        사망한 플레이어도 게이지는 충전되지만 행동 후보에서는 제외됩니다.
+        """
+        from service.dungeon.action_scheduler import Combatant, gauge_fill_per_tick
+
+        players = [user]
+        if participants:
+            players.extend(p for p in participants.values() if p is not user)
+
+        combatants = [
+            Combatant(
+                entity=player,
+                gauge=self.action_gauges.get(id(player), 0),
+                fill=gauge_fill_per_tick(self._get_entity_speed(player)),
+                is_user=True,
+                can_act=player.now_hp > 0,
+            )
+            for player in players
+        ]
+        combatants.extend(
+            Combatant(
+                entity=monster,
+                gauge=self.action_gauges.get(id(monster), 0),
+                fill=gauge_fill_per_tick(self._get_entity_speed(monster)),
+                is_user=False,
+            )
+            for monster in self.get_all_alive_monsters()
+        )
+        return combatants
+
+    def _advance_ticks(self, combatants: list, ticks: int) -> None:
+        """전투원 게이지와 라운드 마커를 ticks틱만큼 충전"""
+        from service.dungeon.action_scheduler import round_marker_fill_per_tick
+
+        for combatant in combatants:
+            self.action_gauges[id(combatant.entity)] = combatant.gauge + combatant.fill * ticks
+        self.round_marker_gauge += round_marker_fill_per_tick() * ticks
 
     def check_and_advance_round(self) -> bool:
         """
@@ -295,3 +438,47 @@ class CombatContext:
             return entity.get_stat()[UserStatEnum.SPEED]
         else:
             return entity.speed
+
+
+# =============================================================================
+# 활성 전투 컨텍스트 (태스크별)
+# =============================================================================
+
+_active_context: ContextVar[Optional[CombatContext]] = ContextVar(
+    "active_combat_context", default=None
+)
+
+
+def activate_combat_context(context: CombatContext) -> Token:
+    """
+    현재 태스크의 활성 전투 컨텍스트 설정
+
+    전투 루프를 실행하는 태스크에서만 보이므로 동시 전투 간 상태가 섞이지 않습니다.
+
+    Args:
+        context: 전투 컨텍스트
+
+    Returns:
+        deactivate_combat_context()에 전달할 토큰
+    """
+    return _active_context.set(context)
+
+
+def deactivate_combat_context(token: Token) -> None:
+    """
+    활성 전투 컨텍스트 해제
+
+    Args:
+        token: activate_combat_context()가 반환한 토큰
+    """
+    _active_context.reset(token)
+
+
+def get_active_combat_context() -> Optional[CombatContext]:
+    """
+    현재 태스크의 활성 전투 컨텍스트 반환
+
+    Returns:
+        전투 중이면 CombatContext, 아니면 None
+    """
+    return _active_context.get()
@@ -0,0 +1,493 @@
+"""
+전투 엔진 - 동기 전투 코어
+
+행동 게이지 스케줄링, 엔티티 행동, 상태이상 틱, 패시브/장비 훅을
+Discord·asyncio와 무관하게 동기적으로 처리합니다.
+combat_executor는 이 엔진을 구동하며 UI 갱신/딜레이/세션 연동만 담당하고,
+밸런스 시뮬레이션은 같은 엔진을 헤드리스로 반복 실행합니다.
+"""
+import logging
+import random
+from dataclasses import dataclass, field
+from typing import Mapping, Optional, Union
+
+from config import COMBAT
+from models import User, Monster, UserStatEnum
+from service.dungeon.status import (
+    can_entity_act, get_cc_effect_name, process_status_ticks,
+)
+from service.dungeon.combat_context import CombatContext
+from service.dungeon.combat_records import (
+    CombatRecord, CombatRecordType, emit_record, sum_records,
+)
+from service.player.stat_synergy_combat import (
+    has_first_strike, roll_extra_action, get_hp_regen_per_turn_pct,
+)
+from service.dungeon.passive_effect_processor import PassiveEffectProcessor
+from service.dungeon.combat_metrics_recorder import CombatMetricsRecorder
+from service.dungeon.equipment_integration_manager import EquipmentIntegrationManager
+
+logger = logging.getLogger(__name__)
+
+# 싱글톤 인스턴스 (combat_executor와 공유)
+_passive_processor = PassiveEffectProcessor()
+_metrics_recorder = CombatMetricsRecorder()
+_equipment_manager = EquipmentIntegrationManager()
+
+
+@dataclass
+class ActionOutcome:
+    """
+    한 번의 행동 처리 결과
+
+    어댑터(Discord 실행기/시뮬레이터)가 UI 갱신, 기여도 기록,
+    라운드 시작 처리 등을 결정하는 데 사용합니다.
+    """
+
+    actor: Union[User, Monster]
+    """행동한(또는 행동 불가였던) 엔티티"""
+
+    acted: bool = True
+    """실제로 행동했는지 여부 (CC로 행동 불가면 False)"""
+
+    action_logs: list[str] = field(default_factory=list)
+    """행동 자체의 로그"""
+
+    records: list[CombatRecord] = field(default_factory=list)
+    """행동 중 발생한 전투 기록 (기여도 계산용)"""
+
+    logs: list[str] = field(default_factory=list)
+    """이번 처리에서 발생한 전체 로그 (순서대로)"""
+
+    round_advanced: bool = False
+    """이번 처리 후 라운드가 증가했는지 여부"""
+
+
+class CombatEngine:
+    """
+    동기 전투 코어
+
+    리더와 참가자 매핑(난입 시 외부에서 갱신될 수 있음)을 참조하여
+    한 행동씩 전투를 진행합니다. 로그는 반환값으로만 전달합니다.
+    전투 기록(context.records)은 활성 컨텍스트에만 쌓이므로,
+    구동 측은 activate_combat_context()로 컨텍스트를 활성화한 뒤 실행해야 합니다.
+    """
+
+    def __init__(
+        self,
+        user: User,
+        context: CombatContext,
+        participants: Optional[Mapping[int, User]] = None
+    ):
+        """
+        Args:
+            user: 파티 리더
+            context: 전투 컨텍스트
+            participants: 추가 참가자 (user_id → User, 세션의 dict를 그대로 전달 가능)
+        """
+        self.user = user
+        self.context = context
+        self.participants = participants if participants is not None else {}
+
+    # =========================================================================
+    # 상태 조회
+    # =========================================================================
+
+    def get_players(self) -> list[User]:
+        """리더 + 참가자 목록"""
+        players = [self.user]
+        for participant in self.participants.values():
+            if participant is not self.user:
+                players.append(participant)
+        return players
+
+    def all_players_dead(self) -> bool:
+        """모든 플레이어(리더 + 참가자) 사망 여부"""
+        return all(player.now_hp <= 0 for player in self.get_players())
+
+    def is_finished(self) -> bool:
+        """전투 종료 여부 (플레이어 전멸 또는 몬스터 전멸)"""
+        return self.all_players_dead() or self.context.is_all_dead()
+
+    # =========================================================================
+    # 전투 진행
+    # =========================================================================
+
+    def start(self) -> list[str]:
+        """
+        전투 시작 처리 (게이지 초기화, 선공, 전투 시작 패시브/장비, 필드 효과)
+
+        장비 컴포넌트 캐싱(DB 조회)은 호출 전에 완료되어 있어야 합니다.
+
+        Returns:
+            전투 시작 로그
+        """
+        user = self.user
+        context = self.context
+        logs = []
+
+        context.user = user
+        context.initialize_gauges(user)
+
+        # 시너지: 선공 확정
+        if has_first_strike(user):
+            context.action_gauges[id(user)] = COMBAT.ACTION_GAUGE_MAX
+            logs.append("💨 **선공 확정** 시너지 발동!")
+
+        logs.extend(_passive_processor.apply_combat_start_passives(user, context))
+        logs.extend(_equipment_manager.apply_combat_start(user, context))
+
+        if context.field_effect:
+            logs.append(f"━━━ {context.field_effect.get_display_text()} 발동! ━━━")
+            logs.append(f"💬 {context.field_effect.data.description}")
+        logs.append(f"━━━ ⚔️ **전투 시작 - 라운드 {context.round_number}** ━━━")
+
+        # 필드 효과: 1라운드 시작 시 즉시 처리
+        logs.extend(self.round_start_effects())
+        return logs
+
+    def revive_fallen_players(self) -> list[str]:
+        """
+        사망한 플레이어의 부활 효과 처리
+
+        Returns:
+            부활 로그
+        """
+        logs = []
+        for player in self.get_players():
+            if player.now_hp <= 0:
+                logs.extend(check_player_revive(player))
+        return logs
+
+    def step(self) -> Optional[ActionOutcome]:
+        """
+        다음 행동 하나를 처리
+
+        행동 가능한 전투원이 나올 때까지 게이지를 충전한 뒤,
+        상태이상 틱 → (CC 체크) → 행동 → 사망 트리거 → 패시브/장비 → 게이지 소모 →
+        지속시간 감소 → 부활 체크 → 라운드 진행 순으로 처리합니다.
+
+        Returns:
+            행동 결과 (행동 횟수 상한 도달 시 None)
+        """
+        context = self.context
+        user = self.user
+
+        if context.action_count >= COMBAT.MAX_ACTIONS_PER_LOOP:
+            return None
+
+        actor = context.get_next_actor(user, self.participants)
+        if actor is None:
+            # 다음 행동 시점까지 게이지를 한 번에 충전 (속도가 모두 0이면 아무도 행동할 수 없음)
+            if not context.advance_to_next_action(user, self.participants):
+                return None
+            actor = context.get_next_actor(user, self.participants)
+            if actor is None:
+                return None
+
+        context.action_count += 1
+
+        outcome = ActionOutcome(actor=actor)
+        logs = outcome.logs
+
+        # DOT 틱
+        logs.extend(process_status_ticks(actor))
+
+        # CC 체크 (행동하지 못할 때는 지속시간 감소하지 않음)
+        if not can_entity_act(actor):
+            cc_name = get_cc_effect_name(actor)
+            logs.append(f"💫 **{actor.get_name()}** {cc_name}! 행동 불가")
+            context.consume_gauge(actor)
+            outcome.acted = False
+            self._advance_round(outcome)
+            return outcome
+
+        # 행동 실행
+        alive_before = {id(m) for m in context.get_all_alive_monsters()}
+        record_mark = len(context.records)
+        outcome.action_logs = execute_entity_action(user, actor, context, self.participants)
+        outcome.records = context.records[record_mark:]
+        logs.extend(outcome.action_logs)
+
+        # 사망 트리거 (on_death 컴포넌트)
+        logs.extend(check_death_triggers(context, alive_before, user))
+
+        # 패시브: 재생/조건부 처리, 장비 패시브
+        logs.extend(_passive_processor.process_passive_effects(actor))
+        logs.extend(_equipment_manager.apply_passives(actor))
+
+        # 시너지: 유저 행동 후 HP 자동회복
+        if actor is user:
+            regen_log = apply_synergy_hp_regen(user)
+            if regen_log:
+                logs.append(regen_log)
+
+        context.consume_gauge(actor)
+
+        # 시너지: 유저 추가 행동
+        if actor is user and roll_extra_action(user):
+            context.action_gauges[id(user)] += COMBAT.ACTION_GAUGE_COST
+            logs.append("🌀 **잔영** 시너지! 추가 행동!")
+
+        # 필드 효과: 턴 종료 시 처리
+        if context.field_effect:
+            logs.extend(context.field_effect.on_turn_end(actor))
+
+        decrement_status_durations(actor)
+
+        # 플레이어 부활 효과 체크 (리더 + 참가자)
+        logs.extend(self.revive_fallen_players())
+
+        self._advance_round(outcome)
+        return outcome
+
+    def round_start_effects(self) -> list[str]:
+        """
+        라운드 시작 효과 (필드 효과)
+
+        Returns:
+            라운드 시작 로그
+        """
+        field_effect = self.context.field_effect
+        if not field_effect:
+            return []
+        return field_effect.on_round_start(self.get_players(), self.context.get_all_alive_monsters())
+
+    def _advance_round(self, outcome: ActionOutcome) -> None:
+        """라운드 마커 체크 후 결과에 반영"""
+        if self.context.check_and_advance_round():
+            outcome.round_advanced = True
+            outcome.logs.append(f"━━━ 🌟 **라운드 {self.context.round_number}** ━━━")
+
+
+# =============================================================================
+# 엔티티 행동
+# =============================================================================
+
+
+def execute_entity_action(
+    user: User,
+    actor: Union[User, Monster],
+    context: CombatContext,
+    participants: Optional[Mapping[int, User]] = None
+) -> list[str]:
+    """
+    엔티티의 행동 실행
+
+    Args:
+        user: 파티 리더
+        actor: 행동할 엔티티
+        context: 전투 컨텍스트
+        participants: 추가 참가자 (몬스터 공격 대상 선정용)
+
+    Returns:
+        행동 로그
+    """
+    if isinstance(actor, User):
+        return _execute_user_action(actor, context)
+    return _execute_monster_action(actor, user, context, participants or {})
+
+
+def _execute_user_action(user: User, context: CombatContext) -> list[str]:
+    """유저 행동"""
+    from service.dungeon.reward_calculator import get_attack_stat
+
+    logs = []
+    user_skill = user.next_skill()
+
+    # 랜덤으로 몬스터 선택 (살아있는 몬스터 중)
+    alive_monsters = context.get_all_alive_monsters()
+    if not alive_monsters:
+        return []
+    target = random.choice(alive_monsters)
+
+    # 턴 시작 시 장비 효과 (행동 예측 등)
+    logs.extend(_equipment_manager.apply_turn_start(user, target))
+
+    if user_skill:
+        targets = alive_monsters if is_skill_aoe(user_skill) else [target]
+        for monster in targets:
+            record_mark = len(context.records)
+            log = user_skill.on_turn(user, monster)
+            if log and log.strip():
+                logs.append(log)
+            # 공격 후 장비 훅 (추가 공격, 회복 봉인 등) - 이번 스킬의 피해 기록 합산
+            damage_dealt = sum_records(
+                context.records[record_mark:], CombatRecordType.DAMAGE, source=user, target=monster,
+            )
+            logs.extend(_equipment_manager.apply_on_attack(user, monster, damage_dealt))
+    else:
+        from service.dungeon.damage_pipeline import process_incoming_damage
+        damage = get_attack_stat(user)
+        event = process_incoming_damage(target, damage, attacker=user)
+        logs.extend(event.extra_logs)
+        logs.append(f"⚔️ **{user.get_name()}** 기본 공격 → **{target.get_name()}** {event.actual_damage} 데미지")
+
+        # 공격 후 장비 훅 (반격, 추가 공격 등)
+        logs.extend(_equipment_manager.apply_on_attack(user, target, event.actual_damage))
+
+        if event.reflected_damage > 0:
+            reflect_event = process_incoming_damage(user, event.reflected_damage, is_reflected=True)
+            logs.append(f"   🔄 반사 데미지 → **{user.get_name()}** {reflect_event.actual_damage}")
+
+    return logs
+
+
+def _execute_monster_action(
+    monster: Monster,
+    user: User,
+    context: CombatContext,
+    participants: Mapping[int, User]
+) -> list[str]:
+    """몬스터 행동 (멀티플레이어 대응)"""
+    from service.dungeon.reward_calculator import get_attack_stat
+    from service.dungeon.damage_pipeline import process_incoming_damage
+
+    logs = []
+
+    # 공격 대상 선택 (리더 + 난입자 중 생존자)
+    alive_players = [user] if user.now_hp > 0 else []
+    for participant in participants.values():
+        if participant is not user and participant.now_hp > 0:
+            alive_players.append(participant)
+
+    # 모두 죽었으면 그냥 user 사용 (어차피 전투 종료됨)
+    target = random.choice(alive_players) if alive_players else user
+
+    monster_skill = monster.next_skill()
+
+    if monster_skill:
+        record_mark = len(context.records)
+        log = monster_skill.on_turn(monster, target)
+        if log and log.strip():
+            logs.append(log)
+        # 유저 피격 시 장비 훅 (가시 피해, 반격 등) - 이번 스킬의 피해 기록 합산
+        damage_taken = sum_records(
+            context.records[record_mark:], CombatRecordType.DAMAGE, source=monster, target=target,
+        )
+        logs.extend(_equipment_manager.apply_on_damaged(target, monster, damage_taken))
+    else:
+        damage = get_attack_stat(monster)
+        event = process_incoming_damage(target, damage, attacker=monster)
+        logs.extend(event.extra_logs)
+        logs.append(f"⚔️ **{monster.get_name()}** 기본 공격 → **{target.get_name()}** {event.actual_damage} 데미지")
+
+        # 유저 피격 시 장비 훅
+        logs.extend(_equipment_manager.apply_on_damaged(target, monster, event.actual_damage))
+
+        if event.reflected_damage > 0:
+            reflect_event = process_incoming_damage(monster, event.reflected_damage, is_reflected=True)
+            logs.append(f"   🔄 반사 데미지 → **{monster.get_name()}** {reflect_event.actual_damage}")
+
+    return logs
+
+
+# =============================================================================
+# 트리거 / 유틸리티
+# =============================================================================
+
+
+def check_death_triggers(
+    context: CombatContext,
+    alive_before: set[int],
+    killer: User,
+) -> list[str]:
+    """사망한 몬스터의 on_death 컴포넌트 트리거"""
+    from models.repos.skill_repo import get_skill_by_id
+
+    logs = []
+
+    for monster in context.monsters:
+        if id(monster) not in alive_before:
+            continue
+        if monster.now_hp > 0:
+            continue
+
+        # 이 몬스터가 방금 죽음 → on_death 트리거
+        for skill_id in getattr(monster, 'skill_ids', []):
+            if skill_id == 0:
+                continue
+            skill = get_skill_by_id(skill_id)
+            if not skill:
+                continue
+            on_death_handler = getattr(skill, 'on_death', None)
+            if callable(on_death_handler):
+                log = on_death_handler(monster, killer, context)
+                if log and log.strip():
+                    logs.append(log)
+                continue
+
+            # Fallback: 직접 컴포넌트에서 on_death 처리 (비정상 캐시 방어)
+            for component in getattr(skill, 'components', []):
+                if hasattr(component, 'on_death'):
+                    log = component.on_death(monster, killer, context)
+                    if log and log.strip():
+                        logs.append(log)
+
+    return logs
+
+
+def check_player_revive(player: User) -> list[str]:
+    """
+    플레이어 사망 시 부활 효과 체크 (장비 revive 컴포넌트)
+
+    Args:
+        player: 체크할 플레이어 (리더 또는 참가자)
+
+    Returns:
+        부활 로그 리스트
+    """
+    logs = []
+
+    if player.now_hp > 0:
+        return logs
+
+    for on_death in _equipment_manager.get_hook_table(player).revives:
+        log = on_death(player, None)
+        if log and log.strip():
+            logs.append(log)
+            # 부활했으면 다른 부활 컴포넌트는 실행 안함
+            if player.now_hp > 0:
+                logger.info(f"Player {player.discord_id} revived with {player.now_hp} HP")
+                break
+
+    return logs
+
+
+def is_skill_aoe(skill) -> bool:
+    """스킬이 AOE(전체 공격)인지 확인"""
+    if not skill:
+        return False
+    for component in skill.components:
+        if hasattr(component, 'is_aoe') and component.is_aoe:
+            return True
+    return False
+
+
+def apply_synergy_hp_regen(user: User) -> str:
+    """시너지: 턴당 HP 자동회복"""
+    regen_pct = get_hp_regen_per_turn_pct(user)
+    if regen_pct <= 0:
+        return ""
+
+    max_hp = user.get_stat().get(UserStatEnum.HP, user.hp)
+    heal = int(max_hp * regen_pct / 100)
+    if heal <= 0:
+        return ""
+
+    old_hp = user.now_hp
+    user.now_hp = min(user.now_hp + heal, max_hp)
+    actual = user.now_hp - old_hp
+    if actual <= 0:
+        return ""
+    emit_record(CombatRecordType.HEAL, user, actual, source=user, label="영생")
+    return f"💖 **영생** 시너지: HP +{actual} 회복"
+
+
+def decrement_status_durations(entity) -> None:
+    """엔티티의 모든 상태이상 지속시간 감소"""
+    for status in entity.status[:]:
+        if hasattr(status, 'decrement_duration'):
+            status.decrement_duration()
+            if hasattr(status, 'is_expired') and status.is_expired():
+                entity.status.remove(status)
@@ -12,28 +12,25 @@ import discord
 
 from config import COMBAT
 from models import User, Monster, UserStatEnum
-from service.dungeon.status import (
-    can_entity_act, get_cc_effect_name, process_status_ticks,
+from service.dungeon.combat_context import (
+    CombatContext, activate_combat_context, deactivate_combat_context,
 )
-from service.dungeon.combat_context import CombatContext
-from service.player.stat_synergy_combat import (
-    has_first_strike, roll_extra_action, get_hp_regen_per_turn_pct,
+from service.dungeon.combat_engine import (
+    CombatEngine,
+    check_death_triggers,
+    execute_entity_action,
+    _metrics_recorder,
+    _equipment_manager,
 )
 from service.session import set_combat_state
 
 # 리팩토링된 클래스 import
 from service.dungeon.combat_ui_manager import CombatUIManager
-from service.dungeon.passive_effect_processor import PassiveEffectProcessor
-from service.dungeon.combat_metrics_recorder import CombatMetricsRecorder
-from service.dungeon.equipment_integration_manager import EquipmentIntegrationManager
 
 logger = logging.getLogger(__name__)
 
-# 싱글톤 인스턴스 생성
+# 싱글톤 인스턴스 생성 (패시브/지표/장비 매니저는 combat_engine과 공유)
 _ui_manager = CombatUIManager()
-_passive_processor = PassiveEffectProcessor()
-_metrics_recorder = CombatMetricsRecorder()
-_equipment_manager = EquipmentIntegrationManager()
 
 
 def _all_players_dead(user: User, session) -> bool:
@@ -85,6 +82,9 @@ async def execute_combat_context(session, interaction: discord.Interaction, cont
     """
     전투 실행 (1:N 지원)
 
+    세션에 고정된 정적 데이터 스냅샷으로 실행하므로, 어느 태스크에서 호출돼도
+    전투 도중 재로드된 데이터를 보지 않습니다.
+
     Args:
         session: 던전 세션
         interaction: Discord 인터랙션
@@ -93,6 +93,11 @@ async def execute_combat_context(session, interaction: discord.Interaction, cont
     Returns:
         전투 결과 메시지
     """
+    with session.use_static_data():
+        return await _execute_combat_context(session, interaction, context)
+
+
+async def _execute_combat_context(session, interaction: discord.Interaction, context: CombatContext) -> str:
     from service.dungeon.dungeon_ui import create_battle_embed_multi
     from service.dungeon.reward_calculator import process_combat_result_multi
 
@@ -129,6 +134,9 @@ async def execute_combat_context(session, interaction: discord.Interaction, cont
     except Exception as e:
         logger.error(f"Failed to post combat notification: {e}")
 
+    # 스킬 컴포넌트 런타임 상태를 이 전투 컨텍스트에 귀속
+    context_token = activate_combat_context(context)
+
     try:
         # 전투 UI 생성 및 전송 (리더 + 참가자)
         combat_message = await _ui_manager.send_initial_combat_ui(
@@ -174,8 +182,8 @@ async def execute_combat_context(session, interaction: discord.Interaction, cont
         # Phase 3: 캠프파이어 버프 카운트 감소
         _decrement_campfire_buff(session)
 
-        # 스킬 및 장비 컴포넌트 상태 리셋
-        _passive_processor.reset_all_skill_usage_counts()
+        # 스킬 컴포넌트 상태는 컨텍스트와 함께 폐기, 장비 컴포넌트는 유저별 인스턴스라 리셋
+        deactivate_combat_context(context_token)
         _equipment_manager.reset_component_caches(user)
 
 
@@ -195,6 +203,9 @@ async def _process_turn_multi(
     """
     턴 처리 (1:N 지원) - 행동 게이지 시스템
 
+    전투 규칙은 동기 코어인 CombatEngine이 처리하고,
+    여기서는 UI 갱신, 딜레이, 세션 연동(난입/관전/레이스/체크포인트)만 담당합니다.
+
     Args:
         session: 던전 세션 (멀티플레이어 지원)
         user: 유저
@@ -206,213 +217,63 @@ async def _process_turn_multi(
     Returns:
         전투 종료 여부
     """
-    from service.dungeon.dungeon_ui import create_battle_embed_multi
+    engine = CombatEngine(user, context, session.participants)
 
-    # 게이지 초기화 (첫 호출 시)
+    # 전투 시작 처리 (첫 호출 시)
     if not context.action_gauges:
-        context.user = user
-        context.initialize_gauges(user)
         # 장비 컴포넌트 캐싱 (스킬 데미지 강화용)
         from service.dungeon.equipment_skill_modifier import cache_equipment_components
         try:
             await cache_equipment_components(user)
         except Exception as e:
             logger.warning(f"Failed to cache equipment components: {e}")
-        # 시너지: 선공 확정
-        if has_first_strike(user):
-            context.action_gauges[id(user)] = COMBAT.ACTION_GAUGE_MAX
-            combat_log.append("💨 **선공 확정** 시너지 발동!")
-        # 패시브 발동 로그
-        passive_logs = _passive_processor.apply_combat_start_passives(user, context)
-        for log in passive_logs:
-            combat_log.append(log)
-        # 장비 컴포넌트 전투 시작 훅 호출
-        equipment_logs = _equipment_manager.apply_combat_start(user, context)
-        for log in equipment_logs:
-            combat_log.append(log)
-        # 필드 효과 발동 메시지
-        if context.field_effect:
-            combat_log.append(f"━━━ {context.field_effect.get_display_text()} 발동! ━━━")
-            combat_log.append(f"💬 {context.field_effect.data.description}")
-        combat_log.append(f"━━━ ⚔️ **전투 시작 - 라운드 {context.round_number}** ━━━")
-        # 필드 효과: 1라운드 시작 시 즉시 처리
-        if context.field_effect:
-            # 모든 플레이어 수집 (리더 + 난입자)
-            all_players = [user]
-            if session and session.participants:
-                all_players.extend(session.participants.values())
-            field_logs = context.field_effect.on_round_start(all_players, context.get_all_alive_monsters())
-            for log in field_logs:
-                combat_log.append(log)
-
-    while context.action_count < COMBAT.MAX_ACTIONS_PER_LOOP:
+        combat_log.extend(engine.start())
+
+    while True:
         # 플레이어 사망 시 부활 효과 먼저 체크 (전투 종료 전)
-        if _all_players_dead(user, session):
-            revived = False  # 부활 발생 여부 추적
-
-            # 부활 시도
-            if user.now_hp <= 0:
-                revive_logs = _check_player_revive(user, session)
-                for log in revive_logs:
-                    combat_log.append(log)
-                if revive_logs and user.now_hp > 0:
-                    revived = True
-
-            if session and session.participants:
-                for participant in session.participants.values():
-                    if participant.now_hp <= 0:
-                        revive_logs = _check_player_revive(participant, session)
-                        for log in revive_logs:
-                            combat_log.append(log)
-                        if revive_logs and participant.now_hp > 0:
-                            revived = True
+        if engine.all_players_dead():
+            revive_logs = engine.revive_fallen_players()
+            combat_log.extend(revive_logs)
 
             # 부활 발생 시 UI 업데이트
-            if revived:
+            if revive_logs and not engine.all_players_dead():
                 await _update_all_combat_messages(session, combat_message, user, context, combat_log)
                 await asyncio.sleep(COMBAT.TURN_PHASE_DELAY)
 
             # 부활 후에도 모두 죽었으면 전투 종료
-            if _all_players_dead(user, session):
+            if engine.all_players_dead():
                 return True
 
         # 몬스터 전멸 체크
         if context.is_all_dead():
             return True
 
-        actor = context.get_next_actor(user, session.participants)
-        if not actor:
-            context.fill_gauges(user, session.participants)
-            continue
-
-        context.action_count += 1
+        outcome = engine.step()
+        if outcome is None:
+            break
+        combat_log.extend(outcome.logs)
+        actor = outcome.actor
 
-        # DOT 틱
-        status_logs = process_status_ticks(actor)
-        for log in status_logs:
-            combat_log.append(log)
-
-        # CC 체크
-        if not can_entity_act(actor):
-            cc_name = get_cc_effect_name(actor)
-            combat_log.append(f"💫 **{actor.get_name()}** {cc_name}! 행동 불가")
-            context.consume_gauge(actor)
-            # 행동하지 못할 때는 지속시간 감소하지 않음 (행동 후에만 감소)
-            await _update_all_combat_messages(session, combat_message, user, context, combat_log)
-            await asyncio.sleep(COMBAT.TURN_PHASE_DELAY)
-
-            if context.check_and_advance_round():
-                combat_log.append(f"━━━ 🌟 **라운드 {context.round_number}** ━━━")
-                await _update_all_combat_messages(session, combat_message, user, context, combat_log)
-            continue
-
-        # 행동 실행
-        alive_before = {id(m) for m in context.get_all_alive_monsters()}
-        action_logs = _execute_entity_action(session, user, actor, context)
-        for log in action_logs:
-            combat_log.append(log)
-
-        # 신규: 기여도 기록 (파티 리더 + 난입자)
-        if isinstance(actor, User):
-            _metrics_recorder.record_actor_contribution(session, actor, action_logs)
-
-        # 사망 트리거 (on_death 컴포넌트)
-        death_logs = _check_death_triggers(context, alive_before, user)
-        for log in death_logs:
-            combat_log.append(log)
-
-        # 패시브: 재생/조건부 처리
-        passive_logs = _passive_processor.process_passive_effects(actor)
-        for log in passive_logs:
-            combat_log.append(log)
-        # 장비 패시브 효과 처리
-        equipment_passive_logs = _equipment_manager.apply_passives(actor)
-        for log in equipment_passive_logs:
-            combat_log.append(log)
-
-        # 시너지: 유저 행동 후 HP 자동회복
-        if actor is user:
-            regen_log = _apply_synergy_hp_regen(user)
-            if regen_log:
-                combat_log.append(regen_log)
+        if outcome.acted:
+            # 기여도 기록 (파티 리더 + 난입자)
+            if isinstance(actor, User):
+                _metrics_recorder.record_actor_contribution(session, actor, outcome.records)
 
             # Phase 4: 위기 목격 체크 (유저 행동 후 HP 체크)
-            from service.dungeon.social_encounter_checker import check_crisis_witness, get_nearby_sessions, get_sessions_in_voice_channel
-
-            if check_crisis_witness(session):
-                # 근처 플레이어에게 위기 알림
-                other_sessions = get_sessions_in_voice_channel(session.voice_channel_id)
-                eligible = [
-                    s
-                    for s in other_sessions
-                    if s.user_id != session.user_id
-                    and s.dungeon
-                    and s.dungeon.id == session.dungeon.id
-                    and not s.in_combat
-                    and not s.ended
-                ]
-                nearby = get_nearby_sessions(session, eligible, 2)
-
-                if nearby:
-                    from service.dungeon.social_encounter_types import send_crisis_witness_alert
-
-                    # Discord 클라이언트 가져오기 (안전한 fallback)
-                    client = session.discord_client
-                    if not client and hasattr(combat_message, 'channel'):
-                        try:
-                            if hasattr(combat_message.channel, 'guild') and combat_message.channel.guild:
-                                member = combat_message.channel.guild.get_member(user.discord_id)
-                                if member and hasattr(member, '_state'):
-                                    client = getattr(member._state, '_get_client', lambda: None)()
-                        except (AttributeError, TypeError) as e:
-                            logger.debug(f"Failed to get client from combat_message: {e}")
-
-                    if client:
-                        # 비동기 알림 전송 (전투 흐름 차단 방지)
-                        asyncio.create_task(
-                            send_crisis_witness_alert(session, nearby, client)
-                        )
-                        session.crisis_event_sent = True
-                        logger.info(f"Crisis witness alert sent for user {session.user_id}")
-                    else:
-                        logger.warning(f"Failed to get Discord client for crisis alert: user={session.user_id}")
-
-        context.consume_gauge(actor)
-
-        # 시너지: 유저 추가 행동
-        if actor is user and roll_extra_action(user):
-            context.action_gauges[id(user)] += COMBAT.ACTION_GAUGE_COST
-            combat_log.append("🌀 **잔영** 시너지! 추가 행동!")
-
-        # 필드 효과: 턴 종료 시 처리
-        if context.field_effect:
-            field_logs = context.field_effect.on_turn_end(actor)
-            for log in field_logs:
-                combat_log.append(log)
-
-        _decrement_status_durations(actor)
+            if actor is user:
+                _check_crisis_witness(session, user, combat_message)
 
         await _update_all_combat_messages(session, combat_message, user, context, combat_log)
 
         # 관전자 업데이트
-        from service.spectator.spectator_service import SpectatorService
-        if session:
+        if outcome.acted and session:
+            from service.spectator.spectator_service import SpectatorService
             await SpectatorService.update_all_spectators(session)
 
         await asyncio.sleep(COMBAT.TURN_PHASE_DELAY)
 
-        # 유저 부활 효과 체크 (리더 + 참가자)
-        if user.now_hp <= 0:
-            revive_logs = _check_player_revive(user, session)
-            for log in revive_logs:
-                combat_log.append(log)
-
-        if session and session.participants:
-            for participant in session.participants.values():
-                if participant.now_hp <= 0:
-                    revive_logs = _check_player_revive(participant, session)
-                    for log in revive_logs:
-                        combat_log.append(log)
+        if not outcome.acted:
+            continue
 
         # Phase 4: 경쟁 모드 레이스 진행 업데이트
         if session and hasattr(session, "active_encounter_event"):
@@ -425,172 +286,93 @@ async def _process_turn_multi(
                     logger.info(f"Race finished for user {session.user_id}, ending combat")
                     return True
 
-        if context.check_and_advance_round():
-            combat_log.append(f"━━━ 🌟 **라운드 {context.round_number}** ━━━")
-
-            # HP 체크포인트: 5라운드마다 DB 동기화 (봇 크래시 대비)
-            if context.round_number % 5 == 0:
-                try:
-                    await user.save(update_fields=['now_hp'])
-                    if session.participants:
-                        for participant in session.participants.values():
-                            await participant.save(update_fields=['now_hp'])
-                    logger.debug(f"HP checkpointed at round {context.round_number}")
-                except Exception as e:
-                    logger.error(f"Failed to checkpoint HP: {e}")
-
-            # 신규: 난입자 처리
-            from service.intervention.intervention_service import InterventionService
-            intervention_logs = await InterventionService.process_pending_interventions(session, context)
-            for log in intervention_logs:
-                combat_log.append(log)
-
-            # 새로 추가된 난입자들에게 전투 UI 전송
-            if intervention_logs:
-                await _ui_manager.send_ui_to_new_participants(session, user, context, combat_log)
-
-            # 필드 효과: 라운드 시작 시 처리
-            if context.field_effect:
-                # 모든 플레이어 수집 (리더 + 난입자)
-                all_players = [user]
-                if session and session.participants:
-                    all_players.extend(session.participants.values())
-                field_logs = context.field_effect.on_round_start(all_players, context.get_all_alive_monsters())
-                for log in field_logs:
-                    combat_log.append(log)
-            await _update_all_combat_messages(session, combat_message, user, context, combat_log)
-
-        if _all_players_dead(user, session) or context.is_all_dead():
+        if outcome.round_advanced:
+            await _on_round_advanced(session, user, context, engine, combat_log, combat_message)
+
+        if engine.is_finished():
             return True
 
     logger.warning(f"Combat reached max actions: {COMBAT.MAX_ACTIONS_PER_LOOP}")
     return True
 
 
-# =============================================================================
-# 엔티티 행동
-# =============================================================================
-
-
-def _execute_entity_action(
+async def _on_round_advanced(
     session,
     user: User,
-    actor: Union[User, Monster],
-    context: CombatContext
-) -> list[str]:
-    """엔티티의 행동 실행"""
-    from models.users import User as UserClass
-    from service.dungeon.reward_calculator import get_attack_stat
-
-    if isinstance(actor, UserClass):
-        return _execute_user_action(actor, context)
-    return _execute_monster_action(monster=actor, user=user, context=context, session=session)
-
-
-def _execute_user_action(user: User, context: CombatContext) -> list[str]:
-    """유저 행동"""
-    import random
-    from service.dungeon.reward_calculator import get_attack_stat
-
-    logs = []
-    user_skill = user.next_skill()
-
-    # 랜덤으로 몬스터 선택 (살아있는 몬스터 중)
-    alive_monsters = context.get_all_alive_monsters()
-    if not alive_monsters:
-        return []
-    target = random.choice(alive_monsters)
-
-    # 턴 시작 시 장비 효과 (행동 예측 등)
-    turn_start_logs = _equipment_manager.apply_turn_start(user, target)
-    logs.extend(turn_start_logs)
-
-    if user_skill:
-        if _is_skill_aoe(user_skill):
-            for monster in alive_monsters:
-                log = user_skill.on_turn(user, monster)
-                if log and log.strip():
-                    logs.append(log)
-                # 공격 후 장비 훅 (추가 공격, 회복 봉인 등)
-                # 로그에서 데미지 추출
-                damage_dealt, _ = _metrics_recorder.parse_combat_metrics_from_logs([log])
-                attack_logs = _equipment_manager.apply_on_attack(user, monster, damage_dealt)
-                logs.extend(attack_logs)
-        else:
-            log = user_skill.on_turn(user, target)
-            if log and log.strip():
-                logs.append(log)
-            # 공격 후 장비 훅 - 로그에서 데미지 추출
-            damage_dealt, _ = _metrics_recorder.parse_combat_metrics_from_logs([log])
-            attack_logs = _equipment_manager.apply_on_attack(user, target, damage_dealt)
-            logs.extend(attack_logs)
-    else:
-        from service.dungeon.damage_pipeline import process_incoming_damage
-        damage = get_attack_stat(user)
-        event = process_incoming_damage(target, damage, attacker=user)
-        logs.extend(event.extra_logs)
-        logs.append(f"⚔️ **{user.get_name()}** 기본 공격 → **{target.get_name()}** {event.actual_damage} 데미지")
+    context: CombatContext,
+    engine: CombatEngine,
+    combat_log: deque[str],
+    combat_message: discord.Message
+) -> None:
+    """라운드 진행 시 세션 연동 처리 (HP 체크포인트, 난입, 라운드 시작 효과)"""
+    # HP 체크포인트: 변경 표시만 하고 배경 작업이 모든 세션을 주기적으로 일괄 저장 (봇 크래시 대비)
+    from service.session_persistence import session_persistence
+    session_persistence.mark_hp_dirty(user, *session.participants.values())
 
-        # 공격 후 장비 훅 (반격, 추가 공격 등)
-        attack_logs = _equipment_manager.apply_on_attack(user, target, event.actual_damage)
-        logs.extend(attack_logs)
+    # 난입자 처리
+    from service.intervention.intervention_service import InterventionService
+    intervention_logs = await InterventionService.process_pending_interventions(session, context)
+    combat_log.extend(intervention_logs)
 
-        if event.reflected_damage > 0:
-            reflect_event = process_incoming_damage(user, event.reflected_damage, is_reflected=True)
-            logs.append(f"   🔄 반사 데미지 → **{user.get_name()}** {reflect_event.actual_damage}")
+    # 새로 추가된 난입자들에게 전투 UI 전송
+    if intervention_logs:
+        await _ui_manager.send_ui_to_new_participants(session, user, context, combat_log)
 
-    return logs
+    # 필드 효과: 라운드 시작 시 처리
+    combat_log.extend(engine.round_start_effects())
+    await _update_all_combat_messages(session, combat_message, user, context, combat_log)
 
 
-def _execute_monster_action(monster: Monster, user: User, context: CombatContext, session) -> list[str]:
-    """몬스터 행동 (멀티플레이어 대응)"""
-    import random
-    from service.dungeon.reward_calculator import get_attack_stat
-    from service.dungeon.damage_pipeline import process_incoming_damage
+def _check_crisis_witness(session, user: User, combat_message: discord.Message) -> None:
+    """Phase 4: 리더 HP 위기 시 근처 플레이어에게 위기 목격 알림"""
+    from service.dungeon.social_encounter_checker import check_crisis_witness, get_idle_nearby_sessions
 
-    logs = []
+    if not check_crisis_witness(session):
+        return
 
-    # 공격 대상 선택 (리더 + 난입자 중 생존자)
-    alive_players = [user] if user.now_hp > 0 else []
+    # 근처 플레이어에게 위기 알림
+    nearby = get_idle_nearby_sessions(session, 2)
+    if not nearby:
+        return
 
-    # 세션에서 난입자 가져오기
-    if session and session.participants:
-        for participant in session.participants.values():
-            if participant.now_hp > 0:
-                alive_players.append(participant)
+    from service.dungeon.social_encounter_types import send_crisis_witness_alert
 
-    # 랜덤으로 대상 선택
-    if not alive_players:
-        # 모두 죽었으면 그냥 user 사용 (어차피 전투 종료됨)
-        target = user
-    else:
-        target = random.choice(alive_players)
-
-    monster_skill = monster.next_skill()
-
-    if monster_skill:
-        log = monster_skill.on_turn(monster, target)
-        if log and log.strip():
-            logs.append(log)
-        # 유저 피격 시 장비 훅 (가시 피해, 반격 등) - 로그에서 데미지 추출
-        damage_taken, _ = _metrics_recorder.parse_combat_metrics_from_logs([log])
-        damaged_logs = _equipment_manager.apply_on_damaged(target, monster, damage_taken)
-        logs.extend(damaged_logs)
+    # Discord 클라이언트 가져오기 (안전한 fallback)
+    client = session.discord_client
+    if not client and hasattr(combat_message, 'channel'):
+        try:
+            if hasattr(combat_message.channel, 'guild') and combat_message.channel.guild:
+                member = combat_message.channel.guild.get_member(user.discord_id)
+                if member and hasattr(member, '_state'):
+                    client = getattr(member._state, '_get_client', lambda: None)()
+        except (AttributeError, TypeError) as e:
+            logger.debug(f"Failed to get client from combat_message: {e}")
+
+    if client:
+        # 비동기 알림 전송 (전투 흐름 차단 방지)
+        asyncio.create_task(
+            send_crisis_witness_alert(session, nearby, client)
+        )
+        session.crisis_event_sent = True
+        logger.info(f"Crisis witness alert sent for user {session.user_id}")
     else:
-        damage = get_attack_stat(monster)
-        event = process_incoming_damage(target, damage, attacker=monster)
-        logs.extend(event.extra_logs)
-        logs.append(f"⚔️ **{monster.get_name()}** 기본 공격 → **{target.get_name()}** {event.actual_damage} 데미지")
+        logger.warning(f"Failed to get Discord client for crisis alert: user={session.user_id}")
 
-        # 유저 피격 시 장비 훅
-        damaged_logs = _equipment_manager.apply_on_damaged(target, monster, event.actual_damage)
-        logs.extend(damaged_logs)
 
-        if event.reflected_damage > 0:
-            reflect_event = process_incoming_damage(monster, event.reflected_damage, is_reflected=True)
-            logs.append(f"   🔄 반사 데미지 → **{monster.get_name()}** {reflect_event.actual_damage}")
+# =============================================================================
+# 엔티티 행동 (동기 코어는 combat_engine 모듈)
+# =============================================================================
+
 
-    return logs
+def _execute_entity_action(
+    session,
+    user: User,
+    actor: Union[User, Monster],
+    context: CombatContext
+) -> list[str]:
+    """엔티티의 행동 실행 (세션 기반 호출 호환용)"""
+    participants = session.participants if session else None
+    return execute_entity_action(user, actor, context, participants)
 
 
 # =============================================================================
@@ -598,11 +380,12 @@ def _execute_monster_action(monster: Monster, user: User, context: CombatContext
 # =============================================================================
 
 
-# 구형 함수들은 새로운 클래스로 대체됨:
+# 구형 함수들은 새로운 클래스/모듈로 대체됨:
+# - 행동 실행, 사망/부활 트리거, 시너지 회복, 지속시간 감소 → combat_engine 모듈 (CombatEngine)
 # - _apply_combat_start_passives() → _passive_processor.apply_combat_start_passives()
 # - _process_passive_effects() → _passive_processor.process_passive_effects()
-# - _parse_combat_metrics_from_logs() → _metrics_recorder.parse_combat_metrics_from_logs()
-# - _reset_all_skill_usage_counts() → _passive_processor.reset_all_skill_usage_counts()
+# - _parse_combat_metrics_from_logs() → 제거됨 (기여도는 CombatContext.records의 전투 기록으로 집계)
+# - _reset_all_skill_usage_counts() → 제거됨 (컴포넌트 상태는 CombatContext.component_states가 소유)
 # - 모든 _apply_equipment_*() → _equipment_manager.*()
 # - _get_equipment_components_sync() → _equipment_manager.get_equipment_components()
 # - _reset_equipment_component_caches() → _equipment_manager.reset_component_caches()
@@ -613,118 +396,11 @@ def _check_death_triggers(
     alive_before: set[int],
     killer: User,
 ) -> list[str]:
-    """사망한 몬스터의 on_death 컴포넌트 트리거"""
-    from models.repos.skill_repo import get_skill_by_id
-
-    logs = []
-
-    # 몬스터 on_death 트리거
-    for monster in context.monsters:
-        if id(monster) not in alive_before:
-            continue
-        if monster.now_hp > 0:
-            continue
-
-        # 이 몬스터가 방금 죽음 → on_death 트리거
-        for skill_id in getattr(monster, 'skill_ids', []):
-            if skill_id == 0:
-                continue
-            skill = get_skill_by_id(skill_id)
-            if not skill:
-                continue
-            on_death_handler = getattr(skill, 'on_death', None)
-            if callable(on_death_handler):
-                log = on_death_handler(monster, killer, context)
-                if log and log.strip():
-                    logs.append(log)
-                continue
-
-            # Fallback: 직접 컴포넌트에서 on_death 처리 (비정상 캐시 방어)
-            components = getattr(skill, 'components', [])
-            for component in components:
-                if hasattr(component, 'on_death'):
-                    log = component.on_death(monster, killer, context)
-                    if log and log.strip():
-                        logs.append(log)
-
-    return logs
-
-
-def _check_player_revive(player: User, session) -> list[str]:
-    """
-    플레이어 사망 시 부활 효과 체크 (장비 revive 컴포넌트)
-
-    Args:
-        player: 체크할 플레이어 (리더 또는 참가자)
-        session: 던전 세션
-
-    Returns:
-        부활 로그 리스트
-    """
-    logs = []
-
-    # 죽지 않았으면 스킵
-    if player.now_hp > 0:
-        return logs
-
-    # 장비 부활 효과 체크
-    equipment_components = _equipment_manager.get_equipment_components(player)
-    for comp in equipment_components:
-        tag = getattr(comp, '_tag', '')
-        if tag == "revive" and hasattr(comp, 'on_death'):
-            log = comp.on_death(player, None)
-            if log and log.strip():
-                logs.append(log)
-                # 부활했으면 다른 부활 컴포넌트는 실행 안함
-                if player.now_hp > 0:
-                    logger.info(f"Player {player.discord_id} revived with {player.now_hp} HP")
-                    break
-
-    return logs
-
-
-def _is_skill_aoe(skill) -> bool:
-    """스킬이 AOE(전체 공격)인지 확인"""
-    if not skill:
-        return False
-    for component in skill.components:
-        if hasattr(component, 'is_aoe') and component.is_aoe:
-            return True
-    return False
-
-
-# _parse_combat_metrics_from_logs() 함수는 CombatMetricsRecorder 클래스로 이동됨
-
-
-def _apply_synergy_hp_regen(user: User) -> str:
-    """시너지: 턴당 HP 자동회복"""
-    regen_pct = get_hp_regen_per_turn_pct(user)
-    if regen_pct <= 0:
-        return ""
-
-    max_hp = user.get_stat().get(UserStatEnum.HP, user.hp)
-    heal = int(max_hp * regen_pct / 100)
-    if heal <= 0:
-        return ""
-
-    old_hp = user.now_hp
-    user.now_hp = min(user.now_hp + heal, max_hp)
-    actual = user.now_hp - old_hp
-    if actual <= 0:
-        return ""
-    return f"💖 **영생** 시너지: HP +{actual} 회복"
-
-
-def _decrement_status_durations(entity) -> None:
-    """엔티티의 모든 상태이상 지속시간 감소"""
-    for status in entity.status[:]:
-        if hasattr(status, 'decrement_duration'):
-            status.decrement_duration()
-            if hasattr(status, 'is_expired') and status.is_expired():
-                entity.status.remove(status)
+    """사망한 몬스터의 on_death 컴포넌트 트리거 (combat_engine 위임)"""
+    return check_death_triggers(context, alive_before, killer)
 
 
-# _reset_all_skill_usage_counts() 함수는 PassiveEffectProcessor 클래스로 이동됨
+# _reset_all_skill_usage_counts() 함수는 제거됨 (전투별 상태는 CombatContext가 소유)
 
 
 # =============================================================================
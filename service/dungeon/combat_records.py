@@ -0,0 +1,122 @@
+"""
+전투 기록 (Combat Records)
+
+데미지/치유/보호막/반사/상태이상 적용을 타입이 있는 기록으로 남깁니다.
+기여도, 전투 기록(history), 관전 화면은 로그 문자열을 파싱하지 않고 이 기록을 직접 집계합니다.
+표시용 문자열은 render()로 필요할 때만 생성합니다.
+"""
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Iterable, Optional
+
+from service.dungeon.combat_context import get_active_combat_context
+
+
+class CombatRecordType(Enum):
+    """전투 기록 타입"""
+    DAMAGE = "damage"              # HP 피해 (공격, DOT, 장비 추가타)
+    HEAL = "heal"                  # HP 회복 (실제 회복량)
+    SHIELD = "shield"              # 보호막 부여
+    REFLECT = "reflect"            # 반사 피해
+    STATUS_APPLY = "status_apply"  # 상태이상 적용
+
+
+@dataclass(frozen=True)
+class CombatRecord:
+    """전투 기록 1건"""
+
+    type: CombatRecordType
+    source: Optional[Any]
+    """원인 엔티티 (DOT/반사처럼 주체가 없으면 None)"""
+
+    target: Any
+    """대상 엔티티"""
+
+    amount: int = 0
+    """수치 (피해량/회복량/보호막량/스택)"""
+
+    label: str = ""
+    """스킬명/효과명 등 부가 정보"""
+
+    attribute: str = ""
+    """데미지 속성"""
+
+    def render(self) -> str:
+        """표시용 로그 문자열 생성"""
+        target_name = self.target.get_name()
+        source_name = self.source.get_name() if self.source is not None else ""
+        label = f" 「{self.label}」" if self.label else ""
+
+        if self.type == CombatRecordType.DAMAGE:
+            if self.source is None:
+                return f"💢 **{target_name}**{label} **-{self.amount}** HP"
+            return f"⚔️ **{source_name}**{label} → **{target_name}** {self.amount}"
+        if self.type == CombatRecordType.HEAL:
+            return f"💚 **{target_name}**{label} +{self.amount} HP"
+        if self.type == CombatRecordType.SHIELD:
+            return f"🛡️ **{target_name}**{label} 보호막 **{self.amount}**"
+        if self.type == CombatRecordType.REFLECT:
+            return f"🔄 반사 데미지 → **{target_name}** {self.amount}"
+        return f"✨ **{target_name}** {self.label} x{self.amount}"
+
+
+def emit_record(
+    record_type: CombatRecordType,
+    target,
+    amount: int = 0,
+    source=None,
+    label: str = "",
+    attribute: str = "",
+) -> Optional[CombatRecord]:
+    """
+    활성 전투 컨텍스트에 기록 추가
+
+    전투 밖(아이템 사용, 휴식 등)에서 호출되면 아무것도 기록하지 않습니다.
+
+    Args:
+        record_type: 기록 타입
+        target: 대상 엔티티
+        amount: 수치
+        source: 원인 엔티티
+        label: 스킬명/효과명
+        attribute: 데미지 속성
+
+    Returns:
+        추가된 기록 (활성 전투가 없으면 None)
+    """
+    context = get_active_combat_context()
+    if context is None:
+        return None
+    record = CombatRecord(record_type, source, target, amount, label, attribute)
+    context.add_record(record)
+    return record
+
+
+def sum_records(
+    records: Iterable[CombatRecord],
+    record_type: CombatRecordType,
+    source=None,
+    target=None,
+) -> int:
+    """
+    조건에 맞는 기록의 수치 합계
+
+    Args:
+        records: 기록 목록
+        record_type: 합산할 기록 타입
+        source: 지정 시 이 엔티티가 원인인 기록만
+        target: 지정 시 이 엔티티가 대상인 기록만
+
+    Returns:
+        수치 합계
+    """
+    total = 0
+    for record in records:
+        if record.type is not record_type:
+            continue
+        if source is not None and record.source is not source:
+            continue
+        if target is not None and record.target is not target:
+            continue
+        total += record.amount
+    return total
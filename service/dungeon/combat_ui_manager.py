@@ -9,6 +9,8 @@ from typing import TYPE_CHECKING, Optional
 
 import discord
 
+from service.dungeon.embed_update_scheduler import embed_update_scheduler
+
 if TYPE_CHECKING:
     from models import User
     from service.dungeon.combat_context import CombatContext
@@ -88,18 +90,10 @@ class CombatUIManager:
 
         embed = create_battle_embed_multi(user, context, combat_log, session.participants)
 
-        # 리더 메시지 업데이트
-        try:
-            await combat_message.edit(embed=embed)
-        except Exception as e:
-            logger.error(f"Failed to update leader combat message: {e}")
-
-        # 참가자 메시지 업데이트
+        # 편집은 스케줄러가 메시지별 최신 프레임만 병합해 동시 전송 (여기서는 대기하지 않음)
+        embed_update_scheduler.submit(combat_message, embed)
         for participant_msg in session.participant_combat_messages.values():
-            try:
-                await participant_msg.edit(embed=embed)
-            except Exception as e:
-                logger.error(f"Failed to update participant combat UI: {e}")
+            embed_update_scheduler.submit(participant_msg, embed)
 
     async def send_ui_to_new_participants(
         self,
@@ -158,18 +152,11 @@ class CombatUIManager:
 
         final_embed = create_battle_embed_multi(user, context, combat_log, session.participants)
 
-        # 리더 메시지 업데이트
-        try:
-            await combat_message.edit(embed=final_embed)
-        except Exception as e:
-            logger.error(f"Failed to update leader combat message: {e}")
-
-        # 참가자 메시지 업데이트
-        for participant_msg in session.participant_combat_messages.values():
-            try:
-                await participant_msg.edit(embed=final_embed)
-            except Exception as e:
-                logger.error(f"Failed to update participant combat message: {e}")
+        # 대기 중인 중간 프레임을 최종 프레임으로 대체하고 전송 완료까지 대기
+        messages = [combat_message, *session.participant_combat_messages.values()]
+        for message in messages:
+            embed_update_scheduler.submit(message, final_embed)
+        await embed_update_scheduler.flush(messages)
 
     async def cleanup_combat_messages(
         self,
@@ -185,6 +172,7 @@ class CombatUIManager:
         """
         # 리더 전투 메시지 삭제
         if combat_message:
+            embed_update_scheduler.cancel(combat_message)
             try:
                 await combat_message.delete()
             except Exception as e:
@@ -192,6 +180,7 @@ class CombatUIManager:
 
         # 참가자 전투 메시지 삭제 및 참조 제거
         for participant_id, participant_msg in list(session.participant_combat_messages.items()):
+            embed_update_scheduler.cancel(participant_msg)
             try:
                 await participant_msg.delete()
             except Exception as e:
@@ -6,6 +6,7 @@ import random
 from config import DAMAGE, get_attribute_multiplier
 from models import UserStatEnum
 from service.combat.damage_calculator import DamageCalculator
+from service.dungeon.combat_records import CombatRecordType, emit_record
 from service.dungeon.components.base import SkillComponent, register_skill_with_tag
 from service.dungeon.damage_pipeline import process_incoming_damage
 from service.dungeon.status import (
@@ -198,6 +199,7 @@ class DamageComponent(SkillComponent):
                 attacker.now_hp = min(attacker.now_hp + heal, max_hp)
                 actual = attacker.now_hp - old_hp
                 if actual > 0:
+                    emit_record(CombatRecordType.HEAL, attacker, actual, source=attacker, label="광전사 흡혈")
                     hit_logs.append(f"   🩸 광전사 흡혈: +{actual} HP")
 
             # 패시브 흡혈 (장비 + 패시브 스킬의 lifesteal 스탯)
@@ -209,6 +211,7 @@ class DamageComponent(SkillComponent):
                 attacker.now_hp = min(attacker.now_hp + heal, max_hp)
                 actual = attacker.now_hp - old_hp
                 if actual > 0:
+                    emit_record(CombatRecordType.HEAL, attacker, actual, source=attacker, label="흡혈")
                     hit_logs.append(f"   💚 흡혈: +{actual} HP")
 
             crit_text = " 💥" if result.is_critical else ""
@@ -266,20 +269,11 @@ class DamageComponent(SkillComponent):
             event_method_name: 호출할 메서드 이름 (예: "on_damage_calculation")
             event: 이벤트 객체
         """
-        if not hasattr(attacker, '_equipment_components_cache'):
-            return
-
-        components = attacker._equipment_components_cache
-        for comp in components:
-            if hasattr(comp, event_method_name):
-                method = getattr(comp, event_method_name)
-                try:
-                    method(event)
-                except Exception as e:
-                    # 에러 발생 시 로깅만 하고 계속 진행
-                    import logging
-                    logger = logging.getLogger(__name__)
-                    logger.error(f"Error calling {event_method_name} on {comp.__class__.__name__}: {e}", exc_info=True)
+        from service.dungeon.hook_dispatch import dispatch_event, get_entity_hook_table
+
+        # 전투 시작 시 컴파일된 테이블에서 해당 훅 구현 컴포넌트만 호출 (오류는 로깅 후 계속)
+        handlers = get_entity_hook_table(attacker).handlers(event_method_name)
+        dispatch_event(event_method_name, handlers, event)
 
     def _get_defense(self, target_stat, target) -> int:
         if self.is_physical:
@@ -423,7 +417,9 @@ class LifestealComponent(SkillComponent):
 
         old_hp = attacker.now_hp
         attacker.now_hp = min(attacker.now_hp + heal_amount, max_hp)
-        return attacker.now_hp - old_hp
+        actual_heal = attacker.now_hp - old_hp
+        emit_record(CombatRecordType.HEAL, attacker, actual_heal, source=attacker, label=self.skill_name)
+        return actual_heal
 
 
 @register_skill_with_tag("consume")
@@ -28,7 +28,6 @@ class AuraDebuffComponent(SkillComponent):
         self.attack_percent: float = 0.0
         self.defense_percent: float = 0.0
         self.speed_percent: float = 0.0
-        self._applied_entities: set[int] = set()
 
     def apply_config(self, config, skill_name, priority=0):
         super().apply_config(config, skill_name, priority)
@@ -39,9 +38,9 @@ class AuraDebuffComponent(SkillComponent):
 
     def on_turn_start(self, attacker, context):
         entity_id = id(attacker)
-        if entity_id in self._applied_entities:
+        if entity_id in self.runtime_state.applied_entities:
             return ""
-        self._applied_entities.add(entity_id)
+        self.runtime_state.applied_entities.add(entity_id)
 
         targets = self._resolve_targets(attacker, context)
         if not targets:
@@ -135,7 +134,6 @@ class AuraBuffComponent(SkillComponent):
         self.attack_percent: float = 0.0
         self.defense_percent: float = 0.0
         self.speed_percent: float = 0.0
-        self._applied_entities: set[int] = set()
 
     def apply_config(self, config, skill_name, priority=0):
         super().apply_config(config, skill_name, priority)
@@ -146,9 +144,9 @@ class AuraBuffComponent(SkillComponent):
 
     def on_turn_start(self, attacker, context):
         entity_id = id(attacker)
-        if entity_id in self._applied_entities:
+        if entity_id in self.runtime_state.applied_entities:
             return ""
-        self._applied_entities.add(entity_id)
+        self.runtime_state.applied_entities.add(entity_id)
 
         targets = self._resolve_targets(attacker, context)
         if not targets:
@@ -10,6 +10,7 @@
 - 하이브리드 스킬은 두 계수 모두 사용 가능
 """
 from models import UserStatEnum
+from service.dungeon.combat_context import ComponentRuntimeState, get_active_combat_context
 from service.dungeon.turn_config import TurnConfig
 
 skill_component_register = {}
@@ -36,6 +37,24 @@ class SkillComponent(TurnConfig):
         self.priority = priority
         self.skill_name = skill_name
 
+    @property
+    def runtime_state(self) -> ComponentRuntimeState:
+        """
+        전투별 런타임 상태 (사용 횟수, 적용 대상 등)
+
+        컴포넌트는 모든 세션이 공유하므로 가변 상태는 활성 CombatContext에 보관합니다.
+        전투 밖에서 호출되면 컴포넌트 자체의 임시 상태를 사용합니다.
+        """
+        context = get_active_combat_context()
+        if context is not None:
+            return context.get_component_state(self)
+
+        fallback = self.__dict__.get("_fallback_runtime_state")
+        if fallback is None:
+            fallback = ComponentRuntimeState()
+            self.__dict__["_fallback_runtime_state"] = fallback
+        return fallback
+
     def _calculate_base_attack_power(self, attacker_stat) -> int:
         """스탯 계수를 적용한 기본 공격력 계산"""
         ad = attacker_stat.get(UserStatEnum.ATTACK, 0)
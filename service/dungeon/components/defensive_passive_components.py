@@ -18,7 +18,6 @@ class ElementImmunityComponent(SkillComponent):
     def __init__(self):
         super().__init__()
         self.immune_to: list[str] = []
-        self._applied_entities: set[int] = set()
 
     def apply_config(self, config, skill_name, priority=0):
         super().apply_config(config, skill_name, priority)
@@ -26,9 +25,9 @@ class ElementImmunityComponent(SkillComponent):
 
     def on_turn_start(self, attacker, target):
         entity_id = id(attacker)
-        if entity_id in self._applied_entities:
+        if entity_id in self.runtime_state.applied_entities:
             return ""
-        self._applied_entities.add(entity_id)
+        self.runtime_state.applied_entities.add(entity_id)
 
         if not self.immune_to:
             return ""
@@ -53,7 +52,6 @@ class ElementResistanceComponent(SkillComponent):
         super().__init__()
         self.resist_type: str = ""
         self.resist_percent: float = 0.0
-        self._applied_entities: set[int] = set()
 
     def apply_config(self, config, skill_name, priority=0):
         super().apply_config(config, skill_name, priority)
@@ -62,9 +60,9 @@ class ElementResistanceComponent(SkillComponent):
 
     def on_turn_start(self, attacker, target):
         entity_id = id(attacker)
-        if entity_id in self._applied_entities:
+        if entity_id in self.runtime_state.applied_entities:
             return ""
-        self._applied_entities.add(entity_id)
+        self.runtime_state.applied_entities.add(entity_id)
 
         if not self.resist_type or self.resist_percent <= 0:
             return ""
@@ -89,7 +87,6 @@ class DamageReflectionComponent(SkillComponent):
     def __init__(self):
         super().__init__()
         self.reflect_percent: float = 0.0
-        self._applied_entities: set[int] = set()
 
     def apply_config(self, config, skill_name, priority=0):
         super().apply_config(config, skill_name, priority)
@@ -97,9 +94,9 @@ class DamageReflectionComponent(SkillComponent):
 
     def on_turn_start(self, attacker, target):
         entity_id = id(attacker)
-        if entity_id in self._applied_entities:
+        if entity_id in self.runtime_state.applied_entities:
             return ""
-        self._applied_entities.add(entity_id)
+        self.runtime_state.applied_entities.add(entity_id)
 
         if self.reflect_percent <= 0:
             return ""
@@ -126,7 +123,6 @@ class StatusImmunityComponent(SkillComponent):
         super().__init__()
         self.immune_all: bool = False
         self.immune_types: list[str] = []
-        self._applied_entities: set[int] = set()
 
     def apply_config(self, config, skill_name, priority=0):
         super().apply_config(config, skill_name, priority)
@@ -135,9 +131,9 @@ class StatusImmunityComponent(SkillComponent):
 
     def on_turn_start(self, attacker, target):
         entity_id = id(attacker)
-        if entity_id in self._applied_entities:
+        if entity_id in self.runtime_state.applied_entities:
             return ""
-        self._applied_entities.add(entity_id)
+        self.runtime_state.applied_entities.add(entity_id)
 
         if self.immune_all:
             return f"🌟 **{attacker.get_name()}** 패시브 「{self.skill_name}」 → 상태이상 면역"
@@ -189,7 +189,6 @@ class SummonComponent(SkillComponent):
         self.monster_ids = []
         self.count = 1
         self.use_limit = None
-        self.used_count = 0
 
     def apply_config(self, config, skill_name, priority=0):
         super().apply_config(config, skill_name, priority)
@@ -202,14 +201,14 @@ class SummonComponent(SkillComponent):
         from service.session import get_session, get_all_sessions
 
         # 사용 제한 체크
-        if self.use_limit is not None and self.used_count >= self.use_limit:
+        if self.use_limit is not None and self.runtime_state.used_count >= self.use_limit:
             return f"💫 **{attacker.get_name()}** {self.skill_name} 사용 불가 (제한 초과)"
 
         if not self.monster_ids:
             return f"⚠️ **{attacker.get_name()}** {self.skill_name} 소환 실패 (설정 오류)"
 
-        session = self._find_session(attacker, defender)
-        if not session or not session.combat_context:
+        context = self._find_combat_context(attacker, defender)
+        if not context:
             return f"⚠️ **{attacker.get_name()}** {self.skill_name} 소환 실패 (전투 컨텍스트 없음)"
 
         summoned_names = []
@@ -217,10 +216,10 @@ class SummonComponent(SkillComponent):
             selected_id = random.choice(self.monster_ids)
             if selected_id in monster_cache_by_id:
                 summoned = monster_cache_by_id[selected_id].copy()
-                session.combat_context.monsters.append(summoned)
+                context.monsters.append(summoned)
                 summoned_names.append(summoned.get_name())
 
-        self.used_count += 1
+        self.runtime_state.used_count += 1
 
         if not summoned_names:
             return f"⚠️ **{attacker.get_name()}** {self.skill_name} 소환 실패"
@@ -228,6 +227,17 @@ class SummonComponent(SkillComponent):
         names_str = ", ".join(summoned_names)
         return f"✨ **{attacker.get_name()}** {self.skill_name}! → {names_str} 소환!"
 
+    def _find_combat_context(self, attacker, defender):
+        from service.dungeon.combat_context import get_active_combat_context
+
+        # 현재 태스크에서 진행 중인 전투 (헤드리스 시뮬레이션 포함)
+        context = get_active_combat_context()
+        if context is not None:
+            return context
+
+        session = self._find_session(attacker, defender)
+        return session.combat_context if session else None
+
     def _find_session(self, attacker, defender):
         from service.session import get_session, get_all_sessions
 
@@ -251,7 +261,7 @@ class OnDeathReviveComponent(SkillComponent):
     사망 시 부활 패시브 - 사망 시 HP를 회복하여 부활
 
     _check_death_triggers()에서 on_death 호출 시 발동합니다.
-    _applied_entities로 전투당 1회 제한.
+    전투 컨텍스트의 runtime_state로 전투당 1회 제한.
 
     Config options:
         hp_percent (float): 부활 시 최대 HP 대비 회복 비율 (예: 0.5 = 50%)
@@ -262,7 +272,6 @@ class OnDeathReviveComponent(SkillComponent):
         super().__init__()
         self.hp_percent: float = 0.3
         self.max_uses: int = 1
-        self._applied_entities: set[int] = set()
 
     def apply_config(self, config, skill_name, priority=0):
         super().apply_config(config, skill_name, priority)
@@ -271,10 +280,10 @@ class OnDeathReviveComponent(SkillComponent):
 
     def on_death(self, dying_entity, killer, context):
         entity_id = id(dying_entity)
-        if entity_id in self._applied_entities:
+        if entity_id in self.runtime_state.applied_entities:
             return ""
 
-        self._applied_entities.add(entity_id)
+        self.runtime_state.applied_entities.add(entity_id)
 
         from models import UserStatEnum
         max_hp = dying_entity.get_stat().get(UserStatEnum.HP, getattr(dying_entity, 'hp', 0))
@@ -288,7 +297,7 @@ class OnDeathReviveComponent(SkillComponent):
 
     def on_turn_start(self, attacker, target):
         entity_id = id(attacker)
-        if entity_id in self._applied_entities:
+        if entity_id in self.runtime_state.applied_entities:
             return ""
         return (
             f"🌟 **{attacker.get_name()}** 패시브 「{self.skill_name}」 → "
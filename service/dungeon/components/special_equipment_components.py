@@ -5,6 +5,7 @@
 """
 import random
 from typing import Optional
+from service.dungeon.combat_records import CombatRecordType, emit_record
 from service.dungeon.components.base import SkillComponent, register_skill_with_tag
 
 
@@ -152,6 +153,7 @@ class OnKillHealComponent(SkillComponent):
         actual_heal = killer.now_hp - old_hp
 
         if actual_heal > 0:
+            emit_record(CombatRecordType.HEAL, killer, actual_heal, source=killer, label="처치 시 회복")
             return f"💚 **{killer.get_name()}** 처치 시 HP 회복: +{actual_heal}"
 
         return ""
@@ -455,6 +457,7 @@ class CounterAttackComponent(SkillComponent):
 
         # 반격 실행
         actual_damage = attacker.take_damage(counter_damage)
+        emit_record(CombatRecordType.DAMAGE, attacker, actual_damage, source=defender, label="반격")
 
         return (
             f"⚔️ **{defender.get_name()}** 반격! "
@@ -513,6 +516,7 @@ class ExtraAttackComponent(SkillComponent):
 
         # 추가 공격 실행
         actual_damage = target.take_damage(extra_damage)
+        emit_record(CombatRecordType.DAMAGE, target, actual_damage, source=attacker, label="연쇄 공격")
 
         return (
             f"⚡ **{attacker.get_name()}** 연쇄 공격! ({self._chain_count}회) "
@@ -574,6 +578,7 @@ class RegenerationComponent(SkillComponent):
         actual_regen = attacker.now_hp - old_hp
 
         if actual_regen > 0:
+            emit_record(CombatRecordType.HEAL, attacker, actual_regen, source=attacker, label="HP 재생")
             return f"💚 **{attacker.get_name()}** HP 재생: +{actual_regen}"
 
         return ""
@@ -706,6 +711,7 @@ class ThornsDamageComponent(SkillComponent):
 
         # 가시 피해 실행
         actual_damage = attacker.take_damage(total_thorns)
+        emit_record(CombatRecordType.REFLECT, attacker, actual_damage, source=defender, label="가시 피해")
 
         return (
             f"🌵 **{defender.get_name()}** 가시 피해! "
@@ -1135,6 +1141,7 @@ class DamageDelayComponent(SkillComponent):
 
         # 이연 피해 적용
         actual_damage = attacker.take_damage(self._delayed_damage)
+        emit_record(CombatRecordType.DAMAGE, attacker, actual_damage, label="이연 피해")
         delayed_msg = f"⏰ 이연 피해 {actual_damage} 적용!"
 
         self._delayed_damage = 0
@@ -13,6 +13,7 @@ PassiveBuffComponent를 행동별로 분리한 컴포넌트들입니다.
 import random
 from typing import TYPE_CHECKING
 
+from service.dungeon.combat_records import CombatRecordType, emit_record
 from service.dungeon.components.base import SkillComponent, register_skill_with_tag
 from service.dungeon.combat_events import (
     DamageCalculationEvent,
@@ -144,7 +145,11 @@ class CombatStatComponent(SkillComponent):
         if self.lifesteal > 0:
             heal = int(event.damage * self.lifesteal / 100)
             if heal > 0:
-                event.attacker.heal(heal)
+                actual_heal = event.attacker.heal(heal)
+                emit_record(
+                    CombatRecordType.HEAL, event.attacker, actual_heal,
+                    source=event.attacker, label="흡혈",
+                )
                 event.add_log(f"💉 흡혈 {heal} HP 회복")
 
     def _roll_critical(self) -> bool:
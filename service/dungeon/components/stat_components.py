@@ -3,6 +3,7 @@
               TurnScalingComponent, DebuffReductionComponent
 """
 from models import UserStatEnum
+from service.dungeon.combat_records import CombatRecordType, emit_record
 from service.dungeon.components.base import SkillComponent, register_skill_with_tag
 from service.dungeon.status import (
     AttackBuff, DefenseBuff, SpeedBuff,
@@ -188,7 +189,6 @@ class PassiveBuffComponent(SkillComponent):
         self.crit_damage = 0.0
         self.lifesteal = 0.0
         self.drop_rate = 0.0
-        self._applied_entities: set[int] = set()
         self._raw_config: dict = {}
 
     def apply_config(self, config, skill_name, priority=0):
@@ -232,9 +232,9 @@ class PassiveBuffComponent(SkillComponent):
     def on_turn_start(self, attacker, target):
         """전투 시작 시 패시브 발동 로그 출력 (스탯은 get_stat()에서 이미 적용)"""
         entity_id = id(attacker)
-        if entity_id in self._applied_entities:
+        if entity_id in self.runtime_state.applied_entities:
             return ""
-        self._applied_entities.add(entity_id)
+        self.runtime_state.applied_entities.add(entity_id)
 
         effects = []
         if self.attack_percent != 0:
@@ -298,6 +298,7 @@ class PassiveRegenComponent(SkillComponent):
         actual = entity.now_hp - old_hp
         if actual <= 0:
             return ""
+        emit_record(CombatRecordType.HEAL, entity, actual, source=entity, label=self.skill_name)
 
         return f"💚 **{entity.get_name()}** 「{self.skill_name}」 HP +{actual} 회복"
 
@@ -328,7 +329,6 @@ class ConditionalPassiveComponent(SkillComponent):
         self.attack_percent = 0.0
         self.defense_percent = 0.0
         self.speed_percent = 0.0
-        self._applied_entities: set[int] = set()
 
     def apply_config(self, config, skill_name, priority=0):
         super().apply_config(config, skill_name, priority)
@@ -340,7 +340,7 @@ class ConditionalPassiveComponent(SkillComponent):
     def process_conditional(self, entity) -> str:
         """매 턴 HP 조건 체크, 충족 시 1회 영구 버프 적용"""
         entity_id = id(entity)
-        if entity_id in self._applied_entities:
+        if entity_id in self.runtime_state.applied_entities:
             return ""
 
         max_hp = entity.get_stat().get(UserStatEnum.HP, getattr(entity, 'hp', 0))
@@ -352,7 +352,7 @@ class ConditionalPassiveComponent(SkillComponent):
             return ""
 
         # 조건 충족 → 영구 버프 적용
-        self._applied_entities.add(entity_id)
+        self.runtime_state.applied_entities.add(entity_id)
         stat = entity.get_stat()
         effects = []
         duration = COMBAT.PERMANENT_BUFF_DURATION
@@ -424,9 +424,6 @@ class TurnScalingComponent(SkillComponent):
         super().__init__()
         self.stat: str = "attack"
         self.percent_per_turn: float = 0.05
-        self._base_stats: dict[int, int] = {}
-        self._turn_counts: dict[int, int] = {}
-        self._applied_entities: set[int] = set()
 
     def apply_config(self, config, skill_name, priority=0):
         super().apply_config(config, skill_name, priority)
@@ -442,14 +439,15 @@ class TurnScalingComponent(SkillComponent):
             return ""
 
         stat_enum, buff_class = stat_info
+        state = self.runtime_state
 
         # 첫 호출 시 기본 스탯 저장 (복리 방지)
-        if entity_id not in self._base_stats:
-            self._base_stats[entity_id] = entity.get_stat().get(stat_enum, 0)
+        if entity_id not in state.base_stats:
+            state.base_stats[entity_id] = entity.get_stat().get(stat_enum, 0)
 
-        self._turn_counts[entity_id] = self._turn_counts.get(entity_id, 0) + 1
+        state.turn_counts[entity_id] = state.turn_counts.get(entity_id, 0) + 1
 
-        base = self._base_stats[entity_id]
+        base = state.base_stats[entity_id]
         increment = max(1, int(base * self.percent_per_turn))
 
         buff = buff_class()
@@ -457,15 +455,15 @@ class TurnScalingComponent(SkillComponent):
         buff.duration = COMBAT.PERMANENT_BUFF_DURATION
         entity.status.append(buff)
 
-        turn = self._turn_counts[entity_id]
+        turn = state.turn_counts[entity_id]
         total = increment * turn
         return f"📈 **{entity.get_name()}** 「{self.skill_name}」 {self.stat} +{increment} (누적 +{total})"
 
     def on_turn_start(self, attacker, target):
         entity_id = id(attacker)
-        if entity_id in self._applied_entities:
+        if entity_id in self.runtime_state.applied_entities:
             return ""
-        self._applied_entities.add(entity_id)
+        self.runtime_state.applied_entities.add(entity_id)
         return (
             f"🌟 **{attacker.get_name()}** 패시브 「{self.skill_name}」 → "
             f"매 턴 {self.stat} +{int(self.percent_per_turn * 100)}%"
@@ -487,7 +485,6 @@ class DebuffReductionComponent(SkillComponent):
     def __init__(self):
         super().__init__()
         self.reduction_percent: float = 0.0
-        self._applied_entities: set[int] = set()
 
     def apply_config(self, config, skill_name, priority=0):
         super().apply_config(config, skill_name, priority)
@@ -495,9 +492,9 @@ class DebuffReductionComponent(SkillComponent):
 
     def on_turn_start(self, attacker, target):
         entity_id = id(attacker)
-        if entity_id in self._applied_entities:
+        if entity_id in self.runtime_state.applied_entities:
             return ""
-        self._applied_entities.add(entity_id)
+        self.runtime_state.applied_entities.add(entity_id)
 
         if self.reduction_percent <= 0:
             return ""
@@ -2,6 +2,7 @@
 지원 컴포넌트: HealComponent, ShieldComponent, CleanseComponent
 """
 from models import UserStatEnum
+from service.dungeon.combat_records import CombatRecordType, emit_record
 from service.dungeon.components.base import SkillComponent, register_skill_with_tag
 from service.dungeon.status import (
     ShieldBuff, has_curse_effect, remove_status_effects,
@@ -67,6 +68,7 @@ class HealComponent(SkillComponent):
         old_hp = attacker.now_hp
         attacker.now_hp = min(attacker.now_hp + total_heal, max_hp)
         actual_heal = attacker.now_hp - old_hp
+        emit_record(CombatRecordType.HEAL, attacker, actual_heal, source=attacker, label=self.skill_name)
 
         return f"💚 **{attacker.get_name()}** 「{self.skill_name}」 → **{attacker.get_name()}**에게 +{actual_heal} HP"
 
@@ -105,6 +107,7 @@ class ShieldComponent(SkillComponent):
         shield.shield_hp = shield_amount
         shield.duration = duration
         attacker.status.append(shield)
+        emit_record(CombatRecordType.SHIELD, attacker, shield_amount, source=attacker, label=self.skill_name)
 
         return f"🛡️ **{attacker.get_name()}** 「{self.skill_name}」 → 보호막 **{shield_amount}**!"
 
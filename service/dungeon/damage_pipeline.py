@@ -6,8 +6,11 @@
 """
 import logging
 from dataclasses import dataclass, field
+from typing import Mapping
 
 from config.attributes import ATTRIBUTE
+from service.dungeon.combat_records import CombatRecordType, emit_record
+from service.dungeon.passive_profile import get_entity_passive_profile
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +44,8 @@ def process_incoming_damage(
     4. HP 데미지 적용
     5. 반사 데미지 계산 (is_reflected=True면 스킵)
 
+    실제 HP 피해는 활성 전투 컨텍스트에 DAMAGE(반사면 REFLECT) 기록으로 남습니다.
+
     Args:
         target: 데미지를 받는 엔티티
         damage: 원본 데미지
@@ -95,6 +100,10 @@ def process_incoming_damage(
     # 5. HP 데미지 적용 (최소 1 데미지 보장)
     remaining = max(remaining, 1)
     event.actual_damage = target.take_damage(remaining)
+    emit_record(
+        CombatRecordType.REFLECT if is_reflected else CombatRecordType.DAMAGE,
+        target, event.actual_damage, source=attacker, attribute=attribute,
+    )
 
     # 6. 반사 데미지 계산 (반사 데미지는 다시 반사하지 않음)
     if not is_reflected and event.actual_damage > 0:
@@ -110,111 +119,30 @@ def process_incoming_damage(
 # =============================================================================
 
 
-def get_passive_immunities(entity) -> set[str]:
+def get_passive_immunities(entity) -> frozenset[str]:
     """엔티티의 속성 면역 목록 반환"""
-    from models.repos.skill_repo import get_skill_by_id
-
-    immunities: set[str] = set()
-    skill_ids = _get_skill_ids(entity)
+    return get_entity_passive_profile(entity).element_immunities
 
-    for sid in skill_ids:
-        if sid == 0:
-            continue
-        skill = get_skill_by_id(sid)
-        if not skill or not skill.is_passive:
-            continue
-        for comp in skill.components:
-            if getattr(comp, '_tag', '') == 'passive_element_immunity':
-                for attr in getattr(comp, 'immune_to', []):
-                    immunities.add(attr)
 
-    return immunities
-
-
-def get_passive_resistances(entity) -> dict[str, float]:
+def get_passive_resistances(entity) -> Mapping[str, float]:
     """엔티티의 속성 저항 반환 {속성: 비율}"""
-    from models.repos.skill_repo import get_skill_by_id
-
-    resistances: dict[str, float] = {}
-    skill_ids = _get_skill_ids(entity)
-
-    for sid in skill_ids:
-        if sid == 0:
-            continue
-        skill = get_skill_by_id(sid)
-        if not skill or not skill.is_passive:
-            continue
-        for comp in skill.components:
-            if getattr(comp, '_tag', '') == 'passive_element_resistance':
-                resist_type = getattr(comp, 'resist_type', '')
-                resist_pct = getattr(comp, 'resist_percent', 0.0)
-                if resist_type:
-                    resistances[resist_type] = resistances.get(resist_type, 0.0) + resist_pct
-
-    return resistances
+    return get_entity_passive_profile(entity).element_resistances
 
 
 def get_passive_reflection(entity) -> float:
     """엔티티의 반사 비율 합계 반환"""
-    from models.repos.skill_repo import get_skill_by_id
-
-    total = 0.0
-    skill_ids = _get_skill_ids(entity)
-
-    for sid in skill_ids:
-        if sid == 0:
-            continue
-        skill = get_skill_by_id(sid)
-        if not skill or not skill.is_passive:
-            continue
-        for comp in skill.components:
-            if getattr(comp, '_tag', '') == 'passive_damage_reflection':
-                total += getattr(comp, 'reflect_percent', 0.0)
-
-    return total
+    return get_entity_passive_profile(entity).reflection
 
 
 def get_status_immunities(entity) -> dict:
     """엔티티의 상태이상 면역 정보 반환"""
-    from models.repos.skill_repo import get_skill_by_id
-
-    result = {"all": False, "types": set()}
-    skill_ids = _get_skill_ids(entity)
-
-    for sid in skill_ids:
-        if sid == 0:
-            continue
-        skill = get_skill_by_id(sid)
-        if not skill or not skill.is_passive:
-            continue
-        for comp in skill.components:
-            if getattr(comp, '_tag', '') == 'passive_status_immunity':
-                if getattr(comp, 'immune_all', False):
-                    result["all"] = True
-                for t in getattr(comp, 'immune_types', []):
-                    result["types"].add(t)
-
-    return result
+    profile = get_entity_passive_profile(entity)
+    return {"all": profile.status_immune_all, "types": profile.status_immune_types}
 
 
 def get_debuff_reduction(entity) -> float:
     """엔티티의 디버프 지속시간 감소 비율 반환"""
-    from models.repos.skill_repo import get_skill_by_id
-
-    total = 0.0
-    skill_ids = _get_skill_ids(entity)
-
-    for sid in skill_ids:
-        if sid == 0:
-            continue
-        skill = get_skill_by_id(sid)
-        if not skill or not skill.is_passive:
-            continue
-        for comp in skill.components:
-            if getattr(comp, '_tag', '') == 'passive_debuff_reduction':
-                total += getattr(comp, 'reduction_percent', 0.0)
-
-    return min(total, 0.9)
+    return get_entity_passive_profile(entity).debuff_reduction
 
 
 # =============================================================================
@@ -222,11 +150,6 @@ def get_debuff_reduction(entity) -> float:
 # =============================================================================
 
 
-def _get_skill_ids(entity) -> list[int]:
-    """엔티티의 스킬 ID 목록 반환"""
-    return getattr(entity, 'equipped_skill', None) or getattr(entity, 'use_skill', [])
-
-
 def _has_invulnerability(entity) -> bool:
     """무적 버프 보유 여부"""
     for status in getattr(entity, 'status', []):
@@ -2,6 +2,8 @@
 드롭 핸들러 - 상자/보스 아이템/스킬/장비 드롭
 
 전투 승리 후 아이템, 스킬, 장비 드롭을 처리합니다.
+전투 중 몬스터 드롭은 정적 캐시(item_cache, droptable 인덱스)로만 판정하고,
+인벤토리 지급은 InventoryBatch에 모아 전투당 한 번 반영합니다.
 """
 import logging
 import random
@@ -9,7 +11,11 @@ from typing import Optional
 
 from config import DROP, DUNGEON
 from exceptions import InventoryFullError, ItemNotFoundError
-from models import Droptable, Item, Monster, Skill_Model, User
+from models import Monster, User
+from models.repos.item_repo import find_item_by_id
+from models.repos.static_cache import get_droptable_rows, get_obtainable_skills_by_source
+from service.dungeon.alias_sampler import get_box_sampler, get_boss_drop_sampler
+from service.item.inventory_batch import InventoryBatch
 from service.item.inventory_service import InventoryService
 from service.item.grade_service import GradeService
 
@@ -34,18 +40,19 @@ def _get_grade_drop_rate(grade_id: int) -> float:
     return getattr(DROP, attr)
 
 
-async def try_drop_monster_box(session, monster: Monster) -> Optional[str]:
+async def try_drop_monster_box(session, monster: Monster, inventory: InventoryBatch) -> Optional[str]:
     """
     몬스터 상자 드랍 시도
 
     Args:
         session: 던전 세션
         monster: 몬스터 객체
+        inventory: 전투 보상 인벤토리 지급 배치
 
     Returns:
         드랍 메시지 또는 None
     """
-    from service.dungeon.reward_calculator import get_monster_drop_multiplier, get_box_pool_by_monster
+    from service.dungeon.reward_calculator import get_monster_drop_multiplier, get_box_pool_key
 
     base_rate = DROP.BOX_DROP_RATE * get_monster_drop_multiplier(monster)
     luck = session.user.get_luck()
@@ -66,14 +73,16 @@ async def try_drop_monster_box(session, monster: Monster) -> Optional[str]:
     if random.random() > min(drop_rate, 1.0):
         return None
 
-    box_pool = get_box_pool_by_monster(monster)
-    if not box_pool:
+    box_sampler = get_box_sampler(get_box_pool_key(monster))
+    if box_sampler is None:
         logger.warning(f"No box pool for monster type: {monster.type}")
         return None
 
-    box_ids = [box_id for box_id, _ in box_pool]
-    weights = [weight for _, weight in box_pool]
-    box_id = random.choices(box_ids, weights=weights, k=1)[0]
+    box_id = box_sampler.sample()
+    item = find_item_by_id(box_id)
+    if not item:
+        logger.warning(f"Box item not found: {box_id}")
+        return None
 
     # 던전 레벨을 instance_grade에 저장 (상자 렙제 필터링용)
     from models.repos.static_cache import get_previous_dungeon_level
@@ -81,42 +90,26 @@ async def try_drop_monster_box(session, monster: Monster) -> Optional[str]:
     prev_level = get_previous_dungeon_level(dungeon_level)
 
     try:
-        await InventoryService.add_item(
-            session.user, box_id, 1,
-            instance_grade=dungeon_level,
-        )
+        await inventory.add(item, 1, instance_grade=dungeon_level)
     except InventoryFullError:
         return "📦 상자를 얻었지만 인벤토리가 가득 찼다..."
-    except ItemNotFoundError:
-        logger.warning(f"Box item not found: {box_id}")
-        return None
 
-    item = await Item.get_or_none(id=box_id)
-    item_name = item.name if item else "상자"
-    return f"📦 「{item_name}({prev_level}~{dungeon_level}Lv)」 획득!"
+    return f"📦 「{item.name}({prev_level}~{dungeon_level}Lv)」 획득!"
 
 
-async def try_drop_boss_special_item(user: User, monster: Monster) -> Optional[str]:
+async def try_drop_boss_special_item(monster: Monster, inventory: InventoryBatch) -> Optional[str]:
     """보스 전용 아이템 드롭 (인스턴스 등급 부여)"""
     from service.dungeon.reward_calculator import is_boss_monster
 
     if not is_boss_monster(monster):
         return None
 
-    drop_rows = await Droptable.filter(drop_monster=monster.id).all()
-    if not drop_rows:
+    drop_sampler = get_boss_drop_sampler(monster.id)
+    if drop_sampler is None:
         return None
 
-    valid_rows = [row for row in drop_rows if row.item_id]
-    if not valid_rows:
-        return None
-
-    weights = [float(row.probability or 0) for row in valid_rows]
-    if sum(weights) <= 0:
-        return None
-
-    chosen = random.choices(valid_rows, weights=weights, k=1)[0]
-    item = await Item.get_or_none(id=chosen.item_id)
+    chosen = drop_sampler.sample()
+    item = find_item_by_id(chosen.item_id)
     if not item:
         return None
 
@@ -126,24 +119,20 @@ async def try_drop_boss_special_item(user: User, monster: Monster) -> Optional[s
     grade_display = GradeService.get_grade_display(grade)
 
     try:
-        await InventoryService.add_item(
-            user, item.id, 1,
-            instance_grade=grade,
-            special_effects=effects,
-        )
+        await inventory.add(item, 1, instance_grade=grade, special_effects=effects)
     except InventoryFullError:
         return "🎖️ 보스 전리품을 얻었지만 인벤토리가 가득 찼다..."
 
     return f"🎖️ **보스 전리품!** {grade_display} 「{item.name}」 획득!"
 
 
-async def try_drop_monster_material(user: User, monster: Monster) -> Optional[str]:
+async def try_drop_monster_material(monster: Monster, inventory: InventoryBatch) -> Optional[str]:
     """
-    일반 몬스터 재료 드롭 시도 (Droptable 기반)
+    일반 몬스터 재료 드롭 시도 (Droptable 인덱스 기반)
 
     Args:
-        user: 플레이어
         monster: 처치한 몬스터
+        inventory: 전투 보상 인벤토리 지급 배치
 
     Returns:
         드롭 메시지 또는 None
@@ -154,11 +143,7 @@ async def try_drop_monster_material(user: User, monster: Monster) -> Optional[st
     if is_boss_monster(monster):
         return None
 
-    drop_rows = await Droptable.filter(drop_monster=monster.id).all()
-    if not drop_rows:
-        return None
-
-    valid_rows = [row for row in drop_rows if row.item_id]
+    valid_rows = [row for row in get_droptable_rows(monster.id) if row.item_id]
     if not valid_rows:
         return None
 
@@ -170,23 +155,20 @@ async def try_drop_monster_material(user: User, monster: Monster) -> Optional[st
             continue
 
         if random.random() <= prob:
-            item = await Item.get_or_none(id=row.item_id)
+            item = find_item_by_id(row.item_id)
             if not item:
+                logger.warning(f"Material item not found: {row.item_id}")
                 continue
 
             try:
-                await InventoryService.add_item(user, item.id, 1)
+                await inventory.add(item, 1)
                 dropped_items.append(item.name)
                 logger.info(
-                    f"Material drop: user={user.discord_id}, monster={monster.name}, "
+                    f"Material drop: user={inventory.user.discord_id}, monster={monster.name}, "
                     f"item_id={item.id}, item_name={item.name}"
                 )
             except InventoryFullError:
                 dropped_items.append(f"{item.name} (인벤 부족)")
-            except ItemNotFoundError:
-                logger.warning(f"Material item not found: {item.id}")
-            except Exception as e:
-                logger.error(f"Failed to drop material: {e}")
 
     if not dropped_items:
         return None
@@ -268,10 +250,7 @@ async def try_drop_dungeon_skill(session) -> Optional[str]:
         return None
 
     dungeon_name = session.dungeon.name
-    skills = await Skill_Model.filter(
-        acquisition_source=dungeon_name,
-        player_obtainable=True,
-    )
+    skills = get_obtainable_skills_by_source(dungeon_name)
     if not skills:
         return None
 
@@ -300,18 +279,18 @@ async def try_drop_dungeon_skill(session) -> Optional[str]:
         return None
 
 
-async def try_drop_monster_equipment(user: User, monster: Monster) -> Optional[str]:
+async def try_drop_monster_equipment(monster: Monster, inventory: InventoryBatch) -> Optional[str]:
     """
     몬스터 장비 드롭 시도 (acquisition_source 기반)
 
     Args:
-        user: 플레이어
         monster: 처치한 몬스터
+        inventory: 전투 보상 인벤토리 지급 배치
 
     Returns:
         드롭 메시지 또는 None
     """
-    from models.repos.static_cache import get_equipment_ids_by_source, item_cache
+    from models.repos.static_cache import get_equipment_ids_by_source
     from service.dungeon.reward_calculator import is_boss_monster
 
     equipment_ids = get_equipment_ids_by_source(monster.name)
@@ -322,7 +301,7 @@ async def try_drop_monster_equipment(user: User, monster: Monster) -> Optional[s
         return None
 
     dropped_item_id = random.choice(equipment_ids)
-    item = item_cache.get(dropped_item_id)
+    item = find_item_by_id(dropped_item_id)
     if not item:
         return None
 
@@ -332,24 +311,15 @@ async def try_drop_monster_equipment(user: User, monster: Monster) -> Optional[s
     grade_display = GradeService.get_grade_display(grade)
 
     try:
-        await InventoryService.add_item(
-            user, dropped_item_id, 1,
-            instance_grade=grade,
-            special_effects=effects,
-        )
-        logger.info(
-            f"Equipment drop: user={user.discord_id}, monster={monster.name}, "
-            f"item_id={dropped_item_id}, item_name={item.name}, grade={grade}"
-        )
-        return f"⚔️ **장비 드롭!** {grade_display} 「{item.name}」 획득!"
+        await inventory.add(item, 1, instance_grade=grade, special_effects=effects)
     except InventoryFullError:
         return f"⚔️ 장비를 얻었지만 인벤토리가 가득 찼다..."
-    except ItemNotFoundError:
-        logger.warning(f"Equipment item not found: {dropped_item_id}")
-        return None
-    except Exception as e:
-        logger.error(f"Failed to drop equipment: {e}")
-        return None
+
+    logger.info(
+        f"Equipment drop: user={inventory.user.discord_id}, monster={monster.name}, "
+        f"item_id={dropped_item_id}, item_name={item.name}, grade={grade}"
+    )
+    return f"⚔️ **장비 드롭!** {grade_display} 「{item.name}」 획득!"
 
 
 async def try_drop_dungeon_equipment(session) -> Optional[str]:
@@ -362,7 +332,7 @@ async def try_drop_dungeon_equipment(session) -> Optional[str]:
     Returns:
         드롭 메시지 또는 None
     """
-    from models.repos.static_cache import get_equipment_ids_by_source, item_cache
+    from models.repos.static_cache import get_equipment_ids_by_source
 
     if not session.dungeon:
         return None
@@ -376,7 +346,7 @@ async def try_drop_dungeon_equipment(session) -> Optional[str]:
         return None
 
     dropped_item_id = random.choice(equipment_ids)
-    item = item_cache.get(dropped_item_id)
+    item = find_item_by_id(dropped_item_id)
     if not item:
         return None
 
@@ -180,7 +180,7 @@ def create_battle_embed_multi(
     _add_all_monster_fields(embed, context.get_all_alive_monsters())
 
     # 행동 순서 예측
-    action_order = predict_action_order(player, context, max_count=4)
+    action_order = predict_action_order(player, context, max_count=4, participants=participants)
     if action_order:
         order_items = []
         for actor, round_num in action_order:
@@ -289,66 +289,8 @@ def _add_monster_field(embed: Embed, monster: Monster) -> None:
 def predict_action_order(
     player: User,
     context: CombatContext,
-    max_count: int = 6
+    max_count: int = 6,
+    participants: dict = None
 ) -> list[tuple[Union[User, Monster], int]]:
     """현재 게이지 상태에서 다음 행동 순서 예측"""
-    from models.users import User as UserClass
-
-    gauges = context.action_gauges.copy()
-    round_marker_gauge = context.round_marker_gauge
-    current_round = context.round_number
-    action_order = []
-
-    for _ in range(1000):
-        if len(action_order) >= max_count:
-            break
-
-        # 라운드 마커 체크
-        if round_marker_gauge >= COMBAT.ACTION_GAUGE_MAX:
-            current_round += 1
-            round_marker_gauge = max(0, round_marker_gauge - COMBAT.ACTION_GAUGE_COST)
-
-        # 행동 가능한 엔티티
-        ready = _find_ready_entities(player, context, gauges)
-
-        if ready:
-            actor = _select_actor(ready, UserClass)
-            action_order.append((actor, current_round))
-            gauges[id(actor)] = max(0, gauges.get(id(actor), 0) - COMBAT.ACTION_GAUGE_COST)
-        else:
-            # 게이지 충전
-            _fill_simulation_gauges(player, context, gauges)
-            round_marker_gauge += int(10 * COMBAT.ACTION_GAUGE_SPEED_MULTIPLIER)
-
-    return action_order
-
-
-def _find_ready_entities(player, context, gauges) -> list[tuple]:
-    """게이지 MAX 이상인 엔티티 찾기"""
-    ready = []
-    user_gauge = gauges.get(id(player), 0)
-    if user_gauge >= COMBAT.ACTION_GAUGE_MAX and player.now_hp > 0:
-        ready.append((player, user_gauge))
-
-    for monster in context.get_all_alive_monsters():
-        gauge = gauges.get(id(monster), 0)
-        if gauge >= COMBAT.ACTION_GAUGE_MAX:
-            ready.append((monster, gauge))
-    return ready
-
-
-def _select_actor(ready_entities, user_class):
-    """가장 높은 게이지의 엔티티 선택 (유저 우선)"""
-    max_gauge = max(g for _, g in ready_entities)
-    max_entities = [e for e, g in ready_entities if g == max_gauge]
-    user_entities = [e for e in max_entities if isinstance(e, user_class)]
-    return user_entities[0] if user_entities else max_entities[0]
-
-
-def _fill_simulation_gauges(player, context, gauges) -> None:
-    """시뮬레이션용 게이지 충전"""
-    user_speed = player.get_stat()[UserStatEnum.SPEED]
-    gauges[id(player)] = gauges.get(id(player), 0) + int(user_speed * COMBAT.ACTION_GAUGE_SPEED_MULTIPLIER)
-
-    for monster in context.get_all_alive_monsters():
-        gauges[id(monster)] = gauges.get(id(monster), 0) + int(monster.speed * COMBAT.ACTION_GAUGE_SPEED_MULTIPLIER)
+    return context.predict_action_order(player, participants, max_count)
@@ -0,0 +1,230 @@
+"""
+Embed 업데이트 스케줄러
+
+전투 UI(리더/난입자 DM)와 관전자 메시지 편집을 메시지별로 병합해 전송합니다.
+
+- 메시지마다 최신 Embed 한 장만 보관하고, 전송 전에 쌓인 중간 프레임은 버림
+- 서로 다른 메시지 편집은 세마포어 한도 내에서 동시에 전송
+- 채널(라우트 버킷)별 최소 간격을 지키고, 429 응답 시 해당 버킷을 잠시 멈춤
+- 마지막 전송이 끝나고 간격(또는 429 정지)이 지난 버킷은 제거
+"""
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import discord
+
+from config import EMBED_UPDATE
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingEdit:
+    """전송 대기 중인 최신 프레임"""
+    message: discord.Message
+    embed: discord.Embed
+    on_not_found: Optional[Callable[[], None]] = None
+
+
+class _RouteBucket:
+    """
+    채널 단위 편집 레이트 리밋 버킷
+
+    메시지 편집 라우트(PATCH /channels/{channel_id}/messages/{message_id})는
+    channel_id 기준으로 버킷이 나뉘므로, 같은 채널의 편집끼리 간격을 둡니다.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.next_allowed = 0.0
+        self.users = 0
+        """이 버킷을 사용 중인 전송 루프 수"""
+
+    async def acquire(self) -> None:
+        """다음 전송 슬롯을 예약하고 그 시점까지 대기"""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        slot = max(now, self.next_allowed)
+        self.next_allowed = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def penalize(self, retry_after: float) -> None:
+        """429 응답 후 retry_after 동안 버킷 정지"""
+        now = asyncio.get_running_loop().time()
+        self.next_allowed = max(self.next_allowed, now + retry_after)
+
+
+class EmbedUpdateScheduler:
+    """메시지별 최신 프레임만 전송하는 Embed 편집 스케줄러"""
+
+    def __init__(
+        self,
+        max_concurrent: int = EMBED_UPDATE.MAX_CONCURRENT_EDITS,
+        route_interval: float = EMBED_UPDATE.ROUTE_EDIT_INTERVAL,
+    ):
+        """
+        Args:
+            max_concurrent: 동시 편집 요청 수
+            route_interval: 같은 채널 편집 최소 간격 (초)
+        """
+        self._max_concurrent = max_concurrent
+        self._route_interval = route_interval
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._pending: dict[int, _PendingEdit] = {}
+        self._workers: dict[int, asyncio.Task] = {}
+        self._buckets: dict[int, _RouteBucket] = {}
+
+        self.submitted = 0
+        """제출된 프레임 수"""
+
+        self.dropped = 0
+        """전송 전에 더 새 프레임으로 대체된 프레임 수"""
+
+        self.sent = 0
+        """실제 편집 요청 수"""
+
+    def submit(
+        self,
+        message: discord.Message,
+        embed: discord.Embed,
+        on_not_found: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        메시지의 다음 Embed 프레임 제출 (즉시 반환)
+
+        Args:
+            message: 편집할 메시지
+            embed: 최신 Embed
+            on_not_found: 메시지가 삭제되어 있을 때 호출할 정리 콜백
+        """
+        key = message.id
+        self.submitted += 1
+        if key in self._pending:
+            self.dropped += 1
+        self._pending[key] = _PendingEdit(message, embed, on_not_found)
+
+        if key not in self._workers:
+            self._workers[key] = asyncio.create_task(self._run(key))
+
+    async def flush(self, messages: Optional[list[discord.Message]] = None) -> None:
+        """
+        대기 중인 편집이 모두 전송될 때까지 대기
+
+        Args:
+            messages: 지정 시 해당 메시지의 편집만 대기
+        """
+        if messages is None:
+            tasks = list(self._workers.values())
+        else:
+            tasks = [self._workers[m.id] for m in messages if m.id in self._workers]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def cancel(self, message: discord.Message) -> None:
+        """메시지의 대기 중인 편집 취소 (메시지 삭제 전 호출)"""
+        self._pending.pop(message.id, None)
+        worker = self._workers.pop(message.id, None)
+        if worker is not None:
+            worker.cancel()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrent)
+        return self._semaphore
+
+    @staticmethod
+    def _route_key(message: discord.Message) -> int:
+        channel = getattr(message, "channel", None)
+        return getattr(channel, "id", None) or message.id
+
+    def _get_bucket(self, route_key: int) -> _RouteBucket:
+        bucket = self._buckets.get(route_key)
+        if bucket is None:
+            bucket = _RouteBucket(self._route_interval)
+            self._buckets[route_key] = bucket
+        return bucket
+
+    def _release_bucket(self, route_key: int, bucket: _RouteBucket) -> None:
+        """
+        전송 루프 종료 시 버킷 반납
+
+        사용 중인 루프가 없으면 다음 슬롯(간격/429 정지)이 지난 뒤 제거합니다.
+        슬롯 전에 제거하면 새 버킷이 간격을 무시하고 바로 전송하게 됩니다.
+        """
+        bucket.users -= 1
+        if bucket.users > 0:
+            return
+        loop = asyncio.get_running_loop()
+        delay = bucket.next_allowed - loop.time()
+        if delay > 0:
+            loop.call_later(delay, self._drop_idle_bucket, route_key, bucket)
+        else:
+            self._drop_idle_bucket(route_key, bucket)
+
+    def _drop_idle_bucket(self, route_key: int, bucket: _RouteBucket) -> None:
+        """여전히 유휴 상태인 버킷 제거 (그 사이 재사용되었으면 유지)"""
+        if bucket.users == 0 and self._buckets.get(route_key) is bucket:
+            del self._buckets[route_key]
+
+    async def _run(self, key: int) -> None:
+        """메시지 하나의 전송 루프 (대기 프레임이 없으면 종료)"""
+        pending = self._pending.get(key)
+        if pending is None:
+            if self._workers.get(key) is asyncio.current_task():
+                del self._workers[key]
+            return
+
+        # 메시지의 채널은 바뀌지 않으므로 루프 동안 같은 버킷 사용
+        route_key = self._route_key(pending.message)
+        bucket = self._get_bucket(route_key)
+        bucket.users += 1
+        try:
+            while key in self._pending:
+                await bucket.acquire()
+
+                # 버킷 대기 중 들어온 프레임까지 반영한 최신 프레임 전송
+                pending = self._pending.pop(key, None)
+                if pending is None:
+                    return
+
+                async with self._get_semaphore():
+                    retry = await self._send(pending, bucket)
+                if retry and key not in self._pending:
+                    self._pending[key] = pending
+        finally:
+            self._release_bucket(route_key, bucket)
+            if self._workers.get(key) is asyncio.current_task():
+                del self._workers[key]
+
+    async def _send(self, pending: _PendingEdit, bucket: _RouteBucket) -> bool:
+        """
+        편집 요청 1회 전송
+
+        Returns:
+            레이트 리밋으로 재시도가 필요하면 True
+        """
+        self.sent += 1
+        try:
+            await pending.message.edit(embed=pending.embed)
+        except discord.NotFound:
+            if pending.on_not_found:
+                pending.on_not_found()
+            logger.debug(f"Embed update target deleted: message={pending.message.id}")
+        except discord.HTTPException as e:
+            if e.status != 429:
+                logger.error(f"Failed to update embed message {pending.message.id}: {e}")
+                return False
+            retry_after = getattr(e, "retry_after", None) or EMBED_UPDATE.RATE_LIMIT_FALLBACK_DELAY
+            bucket.penalize(retry_after)
+            logger.warning(f"Embed update rate limited: message={pending.message.id}, retry_after={retry_after}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to update embed message {pending.message.id}: {e}")
+        return False
+
+
+# 싱글톤 인스턴스 (전투 UI/관전자 공유)
+embed_update_scheduler = EmbedUpdateScheduler()
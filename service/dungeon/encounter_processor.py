@@ -13,9 +13,9 @@ from discord import Embed
 from config import COMBAT, DUNGEON, EmbedColor
 from exceptions import MonsterNotFoundError, MonsterSpawnNotFoundError, WeeklyTowerRestrictionError
 from models import Monster, UserStatEnum
-from models.repos.dungeon_repo import find_all_dungeon_spawn_monster_by
 from models.repos.monster_repo import find_monster_by_id
 from views.fight_or_flee import FightOrFleeView
+from service.dungeon.alias_sampler import get_spawn_sampler
 from service.dungeon.encounter_service import EncounterFactory
 from service.dungeon.encounter_types import EncounterType
 from service.dungeon.combat_context import CombatContext
@@ -304,37 +304,19 @@ async def _attempt_flee(session: DungeonSession, monster: Monster) -> str:
 
 
 def _spawn_random_monster(dungeon_id: int, progress: float = 0.0) -> Monster:
-    """던전에서 랜덤 몬스터 스폰 (단일)"""
-    from service.dungeon.reward_calculator import is_boss_monster
-
-    monsters_spawn = find_all_dungeon_spawn_monster_by(dungeon_id)
-    if not monsters_spawn:
+    """던전에서 랜덤 몬스터 스폰 (단일, 사전 계산된 별칭 추첨기 사용)"""
+    sampler = get_spawn_sampler(dungeon_id)
+    if sampler is None:
         raise MonsterSpawnNotFoundError(dungeon_id)
 
-    boss_spawns = []
-    normal_spawns = []
-
-    for spawn in monsters_spawn:
-        monster = find_monster_by_id(spawn.monster_id)
-        if is_boss_monster(monster):
-            boss_spawns.append(spawn)
-        else:
-            normal_spawns.append(spawn)
-
     # 마지막 스텝(100%)에서만 보스 등장 가능 (10% 확률)
     is_final_step = progress >= 1.0
     boss_roll = random.random() < DUNGEON.BOSS_SPAWN_RATE_AT_END
 
-    if boss_spawns and is_final_step and boss_roll:
-        spawn_pool = boss_spawns
+    if sampler.boss and is_final_step and boss_roll:
+        random_spawn = sampler.boss.sample()
     else:
-        spawn_pool = normal_spawns or monsters_spawn
-
-    random_spawn = random.choices(
-        population=spawn_pool,
-        weights=[spawn.prob for spawn in spawn_pool],
-        k=1
-    )[0]
+        random_spawn = sampler.normal.sample()
 
     monster = find_monster_by_id(random_spawn.monster_id)
     if not monster:
@@ -2,9 +2,18 @@
 장비 통합 관리자 (Equipment Integration Manager)
 
 장비 컴포넌트의 전투 훅(hook) 처리를 담당합니다.
+훅 호출은 엔티티별로 컴파일된 디스패치 테이블(hook_dispatch)을 통해
+해당 훅을 구현한 컴포넌트에만 전달됩니다.
 """
 import logging
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING
+
+from service.dungeon.hook_dispatch import (
+    EMPTY_TABLE,
+    HookDispatchTable,
+    dispatch,
+    get_entity_hook_table,
+)
 
 if TYPE_CHECKING:
     from models import User
@@ -49,6 +58,20 @@ class EquipmentIntegrationManager:
             self._warned_users.add(entity.discord_id)
         return []
 
+    def get_hook_table(self, entity) -> HookDispatchTable:
+        """
+        엔티티의 장비 훅 디스패치 테이블 (장비 캐시가 바뀌면 재컴파일)
+
+        Args:
+            entity: User 또는 Monster
+
+        Returns:
+            HookDispatchTable
+        """
+        if not self.get_equipment_components(entity):
+            return EMPTY_TABLE
+        return get_entity_hook_table(entity)
+
     def apply_combat_start(
         self,
         user: "User",
@@ -64,18 +87,10 @@ class EquipmentIntegrationManager:
         Returns:
             로그 메시지 리스트
         """
-        logs = []
-        components = self.get_equipment_components(user)
-
-        for comp in components:
-            if hasattr(comp, 'on_combat_start'):
-                # 대상은 첫 번째 몬스터 (없으면 None)
-                target = context.get_primary_monster() if context.monsters else None
-                log = comp.on_combat_start(user, target)
-                if log and log.strip():
-                    logs.append(log)
-
-        return logs
+        handlers = self.get_hook_table(user).handlers("on_combat_start")
+        # 대상은 첫 번째 몬스터 (없으면 None)
+        target = context.get_primary_monster() if handlers and context.monsters else None
+        return dispatch("on_combat_start", handlers, user, target)
 
     def apply_turn_start(
         self,
@@ -92,16 +107,8 @@ class EquipmentIntegrationManager:
         Returns:
             로그 메시지 리스트
         """
-        logs = []
-        components = self.get_equipment_components(entity)
-
-        for comp in components:
-            if hasattr(comp, 'on_turn_start'):
-                log = comp.on_turn_start(entity, target)
-                if log and log.strip():
-                    logs.append(log)
-
-        return logs
+        handlers = self.get_hook_table(entity).handlers("on_turn_start")
+        return dispatch("on_turn_start", handlers, entity, target)
 
     def apply_on_attack(
         self,
@@ -120,16 +127,8 @@ class EquipmentIntegrationManager:
         Returns:
             로그 메시지 리스트
         """
-        logs = []
-        components = self.get_equipment_components(attacker)
-
-        for comp in components:
-            if hasattr(comp, 'on_attack'):
-                log = comp.on_attack(attacker, target, damage)
-                if log and log.strip():
-                    logs.append(log)
-
-        return logs
+        handlers = self.get_hook_table(attacker).handlers("on_attack")
+        return dispatch("on_attack", handlers, attacker, target, damage)
 
     def apply_on_damaged(
         self,
@@ -148,16 +147,8 @@ class EquipmentIntegrationManager:
         Returns:
             로그 메시지 리스트
         """
-        logs = []
-        components = self.get_equipment_components(defender)
-
-        for comp in components:
-            if hasattr(comp, 'on_damaged'):
-                log = comp.on_damaged(defender, attacker, damage)
-                if log and log.strip():
-                    logs.append(log)
-
-        return logs
+        handlers = self.get_hook_table(defender).handlers("on_damaged")
+        return dispatch("on_damaged", handlers, defender, attacker, damage)
 
     def apply_passives(self, actor) -> list[str]:
         """
@@ -169,37 +160,8 @@ class EquipmentIntegrationManager:
         Returns:
             로그 메시지 리스트
         """
-        logs = []
-        components = self.get_equipment_components(actor)
-
-        for comp in components:
-            tag = getattr(comp, '_tag', '')
-            log = ""
-
-            # 재생 효과
-            if tag == "regeneration" and hasattr(comp, 'on_turn_start'):
-                log = comp.on_turn_start(actor, None)
-
-            # 전투 성장 효과
-            elif tag == "combat_stat_growth" and hasattr(comp, 'on_turn_start'):
-                log = comp.on_turn_start(actor, None)
-
-            # 조건부 스탯 보너스
-            elif tag == "conditional_stat_bonus" and hasattr(comp, 'on_turn_start'):
-                log = comp.on_turn_start(actor, None)
-
-            # 주기적 무적
-            elif tag == "periodic_invincibility" and hasattr(comp, 'on_turn_start'):
-                log = comp.on_turn_start(actor, None)
-
-            # 아군 보호
-            elif tag == "ally_protection" and hasattr(comp, 'on_turn_start'):
-                log = comp.on_turn_start(actor, None)
-
-            if log and log.strip():
-                logs.append(log)
-
-        return logs
+        # 재생/전투 성장/조건부 스탯/주기적 무적/아군 보호 (hook_dispatch.PASSIVE_TURN_START_TAGS)
+        return dispatch("equipment_passive", self.get_hook_table(actor).passives, actor, None)
 
     def reset_component_caches(self, user: "User") -> None:
         """
@@ -254,6 +216,8 @@ class EquipmentIntegrationManager:
         # 캐시 자체도 제거
         if hasattr(user, '_equipment_components_cache'):
             delattr(user, '_equipment_components_cache')
+        if hasattr(user, '_equipment_hook_table'):
+            delattr(user, '_equipment_hook_table')
 
         # 경고 기록 제거
         if user.discord_id in self._warned_users:
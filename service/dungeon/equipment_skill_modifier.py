@@ -114,28 +114,16 @@ async def cache_equipment_components(attacker):
         return
 
     try:
-        from models.user_equipment import UserEquipment
-        from models.equipment_item import EquipmentItem
-        from service.item.equipment_component_loader import load_equipment_components
-
-        equipped = await UserEquipment.filter(user=attacker).prefetch_related(
-            "inventory_item__item"
-        )
-
-        all_components = []
+        from service.item.equipment_snapshot import get_equipment_snapshot
+        from service.dungeon.hook_dispatch import HookDispatchTable
 
-        for eq in equipped:
-            equipment = await EquipmentItem.get_or_none(
-                item=eq.inventory_item.item
-            )
-            if not equipment or not equipment.config:
-                continue
-
-            components = load_equipment_components(equipment.config)
-            all_components.extend(components)
+        # 장비 스냅샷의 config로 전투마다 새 컴포넌트 생성 (컴포넌트는 전투 중 상태를 가짐)
+        snapshot = await get_equipment_snapshot(attacker)
+        components = snapshot.create_components()
 
-        # 런타임 캐시에 저장
-        attacker._equipment_components_cache = all_components
+        # 런타임 캐시에 저장 + 훅별 디스패치 테이블 컴파일
+        attacker._equipment_components_cache = components
+        attacker._equipment_hook_table = HookDispatchTable(components)
 
     except Exception as e:
         import logging
@@ -0,0 +1,204 @@
+"""
+전투 훅 디스패치 테이블
+
+전투 시작 시 장비 컴포넌트를 훅별 목록(on_attack, on_damaged 등)으로 한 번만 분류해 두고,
+매 행동에서는 해당 훅을 실제로 구현한 컴포넌트만 호출합니다.
+훅별 호출 횟수/소요 시간은 hook_metrics로 집계합니다.
+"""
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Sequence
+
+from service.dungeon.turn_config import TurnConfig
+
+logger = logging.getLogger(__name__)
+
+# apply_passives에서 매 행동마다 on_turn_start를 호출하는 장비 태그
+PASSIVE_TURN_START_TAGS = frozenset({
+    "regeneration",
+    "combat_stat_growth",
+    "conditional_stat_bonus",
+    "periodic_invincibility",
+    "ally_protection",
+})
+
+
+@dataclass
+class HookMetrics:
+    """훅별 디스패치 지표"""
+
+    calls: int = 0
+    """디스패치 횟수 (핸들러가 없던 호출 포함)"""
+
+    empty_calls: int = 0
+    """핸들러가 없어 바로 반환한 디스패치 횟수"""
+
+    invocations: int = 0
+    """실제로 호출된 핸들러 수"""
+
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+    @property
+    def avg_time(self) -> float:
+        """핸들러가 있던 디스패치의 평균 소요 시간 (초)"""
+        timed_calls = self.calls - self.empty_calls
+        return self.total_time / timed_calls if timed_calls else 0.0
+
+    def record(self, invocations: int, elapsed: float) -> None:
+        """디스패치 1회 결과 기록"""
+        self.calls += 1
+        self.invocations += invocations
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+
+
+_metrics: Dict[str, HookMetrics] = {}
+
+
+def _get_metrics(hook: str) -> HookMetrics:
+    metrics = _metrics.get(hook)
+    if metrics is None:
+        metrics = HookMetrics()
+        _metrics[hook] = metrics
+    return metrics
+
+
+def get_hook_metrics() -> Dict[str, HookMetrics]:
+    """훅별 디스패치 지표 조회"""
+    return dict(_metrics)
+
+
+def reset_hook_metrics() -> None:
+    """훅 지표 초기화"""
+    _metrics.clear()
+
+
+def dispatch(hook: str, handlers: Sequence[Callable], *args) -> list[str]:
+    """
+    훅 핸들러 순차 호출 후 로그 수집
+
+    Args:
+        hook: 지표 집계용 훅 이름
+        handlers: 호출할 바운드 메서드 목록
+        *args: 핸들러 인자
+
+    Returns:
+        비어 있지 않은 로그 목록
+    """
+    metrics = _get_metrics(hook)
+    if not handlers:
+        metrics.calls += 1
+        metrics.empty_calls += 1
+        return []
+
+    started = time.perf_counter()
+    logs = []
+    for handler in handlers:
+        log = handler(*args)
+        if log and log.strip():
+            logs.append(log)
+    metrics.record(len(handlers), time.perf_counter() - started)
+    return logs
+
+
+def dispatch_event(hook: str, handlers: Sequence[Callable], event) -> None:
+    """
+    이벤트 훅(on_damage_calculation 등) 호출 - 핸들러 오류는 로깅만 하고 계속 진행
+
+    Args:
+        hook: 훅 이름
+        handlers: 호출할 바운드 메서드 목록
+        event: 이벤트 객체
+    """
+    metrics = _get_metrics(hook)
+    if not handlers:
+        metrics.calls += 1
+        metrics.empty_calls += 1
+        return
+
+    started = time.perf_counter()
+    for handler in handlers:
+        try:
+            handler(event)
+        except Exception as e:
+            logger.error(f"Error calling {hook} on {handler.__self__.__class__.__name__}: {e}", exc_info=True)
+    metrics.record(len(handlers), time.perf_counter() - started)
+
+
+def _overrides(component, method_name: str) -> bool:
+    """컴포넌트가 훅을 구현했는지 (TurnConfig 기본 no-op 제외)"""
+    method = getattr(type(component), method_name, None)
+    if method is None:
+        return False
+    return method is not getattr(TurnConfig, method_name, None)
+
+
+class HookDispatchTable:
+    """
+    컴포넌트 목록의 훅별 핸들러 테이블
+
+    주요 훅은 생성 시 컴파일하고, 그 외 이벤트 훅(on_damage_calculation 등)은
+    처음 조회할 때 컴파일해 재사용합니다.
+    """
+
+    def __init__(self, components: list):
+        self.components = components
+        self._handlers: Dict[str, tuple] = {}
+        for hook in ("on_combat_start", "on_turn_start", "on_attack", "on_damaged"):
+            self.handlers(hook)
+
+        # 장비 패시브 (재생, 성장 등 특정 태그의 on_turn_start)
+        self.passives = tuple(
+            comp.on_turn_start
+            for comp in components
+            if getattr(comp, '_tag', '') in PASSIVE_TURN_START_TAGS and _overrides(comp, 'on_turn_start')
+        )
+        # 부활 (revive 태그의 on_death)
+        self.revives = tuple(
+            comp.on_death
+            for comp in components
+            if getattr(comp, '_tag', '') == "revive" and _overrides(comp, 'on_death')
+        )
+
+    def handlers(self, hook: str) -> tuple:
+        """
+        훅을 구현한 컴포넌트의 바운드 메서드 목록
+
+        Args:
+            hook: 메서드 이름
+
+        Returns:
+            바운드 메서드 튜플 (컴포넌트 순서 유지)
+        """
+        handlers = self._handlers.get(hook)
+        if handlers is None:
+            handlers = tuple(
+                getattr(comp, hook) for comp in self.components if _overrides(comp, hook)
+            )
+            self._handlers[hook] = handlers
+        return handlers
+
+
+EMPTY_TABLE = HookDispatchTable([])
+
+
+def get_entity_hook_table(entity) -> HookDispatchTable:
+    """
+    엔티티의 장비 훅 테이블 조회
+
+    _equipment_components_cache가 바뀌면(전투 시작 시 재캐싱, 시뮬레이션 등) 다시 컴파일합니다.
+
+    Returns:
+        HookDispatchTable (장비 캐시가 없으면 빈 테이블)
+    """
+    components = getattr(entity, '_equipment_components_cache', None)
+    if not components:
+        return EMPTY_TABLE
+
+    table = getattr(entity, '_equipment_hook_table', None)
+    if table is None or table.components is not components:
+        table = HookDispatchTable(components)
+        entity._equipment_hook_table = table
+    return table
@@ -2,10 +2,15 @@
 패시브 효과 프로세서 (Passive Effect Processor)
 
 패시브 스킬 효과 발동 및 관리를 담당합니다.
+호출할 패시브 메서드는 덱별 패시브 프로필에 미리 컴파일되어 있으므로
+매 행동마다 스킬/컴포넌트를 다시 순회하지 않습니다.
 """
 import logging
 from typing import TYPE_CHECKING
 
+from service.dungeon.hook_dispatch import dispatch
+from service.dungeon.passive_profile import get_entity_passive_profile
+
 if TYPE_CHECKING:
     from models import User
     from service.dungeon.combat_context import CombatContext
@@ -35,26 +40,15 @@ class PassiveEffectProcessor:
         Returns:
             패시브 발동 로그 리스트
         """
-        from models.repos.skill_repo import get_skill_by_id
-
         logs = []
         entities = [user] + list(context.monsters)
 
-        # NOTE: _applied_entities는 전투 종료 시 reset_all_skill_usage_counts()에서 일괄 초기화됨
-        # 동시 전투 시 싱글톤 컴포넌트 공유 문제를 방지하기 위해,
-        # 각 컴포넌트는 id(entity)로 엔티티를 구분하여 중복 적용을 방지함
+        # NOTE: 컴포넌트의 적용 대상/사용 횟수는 활성 CombatContext의 runtime_state에 저장되므로
+        # 동시 전투 간 공유되지 않으며, 전투 종료 시 컨텍스트와 함께 폐기됨
 
         for entity in entities:
-            skill_ids = getattr(entity, 'equipped_skill', None) or getattr(entity, 'use_skill', [])
-            for sid in skill_ids:
-                if sid == 0:
-                    continue
-                skill = get_skill_by_id(sid)
-                if not skill or not skill.is_passive:
-                    continue
-                log = skill.on_turn_start(entity, context)
-                if log and log.strip():
-                    logs.append(log)
+            hooks = get_entity_passive_profile(entity).combat_start_hooks
+            logs.extend(dispatch("passive_combat_start", hooks, entity, context))
 
         return logs
 
@@ -68,43 +62,5 @@ class PassiveEffectProcessor:
         Returns:
             패시브 효과 로그 리스트
         """
-        from models.repos.skill_repo import get_skill_by_id
-
-        logs = []
-        skill_ids = getattr(actor, 'equipped_skill', None) or getattr(actor, 'use_skill', [])
-
-        for sid in skill_ids:
-            if sid == 0:
-                continue
-            skill = get_skill_by_id(sid)
-            if not skill or not skill.is_passive:
-                continue
-
-            for comp in skill.components:
-                tag = getattr(comp, '_tag', '')
-                log = ""
-                if tag == "passive_regen":
-                    log = comp.process_regen(actor)
-                elif tag == "conditional_passive":
-                    log = comp.process_conditional(actor)
-                elif tag == "passive_turn_scaling":
-                    log = comp.process_turn_scaling(actor)
-                if log and log.strip():
-                    logs.append(log)
-
-        return logs
-
-    def reset_all_skill_usage_counts(self) -> None:
-        """모든 스킬의 사용 횟수 카운터 및 패시브 적용 상태 리셋 (전투 종료 시)"""
-        from models.repos.static_cache import skill_cache_by_id
-
-        for skill in skill_cache_by_id.values():
-            for component in skill.components:
-                if hasattr(component, 'used_count'):
-                    component.used_count = 0
-                if hasattr(component, '_applied_entities'):
-                    component._applied_entities.clear()
-                if hasattr(component, '_turn_counts'):
-                    component._turn_counts.clear()
-                if hasattr(component, '_base_stats'):
-                    component._base_stats.clear()
+        hooks = get_entity_passive_profile(actor).turn_hooks
+        return dispatch("passive_turn", hooks, actor)
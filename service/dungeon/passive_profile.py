@@ -0,0 +1,205 @@
+"""
+패시브 프로필 - 스킬 덱별 패시브 효과 사전 계산
+
+덱(장착 스킬 ID 튜플)마다 패시브 컴포넌트를 한 번만 순회하여
+스탯 보너스, 속성 면역/저항, 반사, 상태이상 면역, 디버프 감소를 불변 객체로 만들어 둡니다.
+damage_pipeline / get_passive_stat_bonuses는 이 프로필을 조회만 합니다.
+"""
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional
+
+from config.skills import PASSIVE_PROFILE_CACHE_SIZE
+
+logger = logging.getLogger(__name__)
+
+# passive_buff 컴포넌트에서 합산하는 스탯 키
+PASSIVE_STAT_KEYS = (
+    "attack_percent",
+    "defense_percent",
+    "speed_percent",
+    "hp_percent",
+    "evasion_percent",
+    "ap_attack_percent",
+    "crit_rate",
+    "crit_damage",
+    "lifesteal",
+    "drop_rate",
+)
+
+MAX_DEBUFF_REDUCTION = 0.9
+
+
+@dataclass(frozen=True)
+class PassiveProfile:
+    """덱 하나의 패시브 효과 요약 (불변)"""
+
+    stat_bonuses: Mapping[str, float]
+    """passive_buff 스탯 보너스 합계 (같은 스킬 중복 장착은 1회만 반영)"""
+
+    element_immunities: frozenset
+    """면역 속성"""
+
+    element_resistances: Mapping[str, float]
+    """속성별 저항 비율 합계"""
+
+    reflection: float
+    """반사 비율 합계"""
+
+    status_immune_all: bool
+    """모든 상태이상 면역 여부"""
+
+    status_immune_types: frozenset
+    """면역 상태이상 타입"""
+
+    debuff_reduction: float
+    """디버프 지속시간 감소 비율 (최대 MAX_DEBUFF_REDUCTION)"""
+
+    combat_start_hooks: tuple = ()
+    """전투 시작 시 호출할 패시브 스킬의 on_turn_start (슬롯 순서, 중복 장착 포함)"""
+
+    turn_hooks: tuple = ()
+    """매 행동 후 호출할 패시브 컴포넌트 메서드 (재생/조건부/턴 성장, 슬롯 순서)"""
+
+
+def compile_passive_profile(skill_ids: Iterable[int]) -> PassiveProfile:
+    """
+    스킬 ID 목록으로 패시브 프로필 생성 (캐시 미사용)
+
+    Args:
+        skill_ids: 장착 스킬 ID 목록 (0은 빈 슬롯)
+
+    Returns:
+        PassiveProfile
+    """
+    from models.repos.skill_repo import get_skill_by_id
+
+    stat_bonuses = {key: 0.0 for key in PASSIVE_STAT_KEYS}
+    immunities: set[str] = set()
+    resistances: dict[str, float] = {}
+    reflection = 0.0
+    immune_all = False
+    immune_types: set[str] = set()
+    debuff_reduction = 0.0
+    combat_start_hooks = []
+    turn_hooks = []
+
+    seen = set()
+    for sid in skill_ids:
+        if sid == 0:
+            continue
+        skill = get_skill_by_id(sid)
+        if not skill or not skill.is_passive:
+            continue
+
+        # 스탯 보너스는 같은 스킬을 여러 슬롯에 장착해도 1회만 적용
+        first_occurrence = sid not in seen
+        seen.add(sid)
+        combat_start_hooks.append(skill.on_turn_start)
+
+        for comp in skill.components:
+            tag = getattr(comp, '_tag', '')
+            turn_hook = _get_turn_hook(comp, tag)
+            if turn_hook is not None:
+                turn_hooks.append(turn_hook)
+
+            if tag == "passive_buff":
+                if first_occurrence:
+                    for key in PASSIVE_STAT_KEYS:
+                        stat_bonuses[key] += getattr(comp, key, 0.0)
+            elif tag == "passive_element_immunity":
+                immunities.update(getattr(comp, 'immune_to', []))
+            elif tag == "passive_element_resistance":
+                resist_type = getattr(comp, 'resist_type', '')
+                if resist_type:
+                    resistances[resist_type] = (
+                        resistances.get(resist_type, 0.0) + getattr(comp, 'resist_percent', 0.0)
+                    )
+            elif tag == "passive_damage_reflection":
+                reflection += getattr(comp, 'reflect_percent', 0.0)
+            elif tag == "passive_status_immunity":
+                if getattr(comp, 'immune_all', False):
+                    immune_all = True
+                immune_types.update(getattr(comp, 'immune_types', []))
+            elif tag == "passive_debuff_reduction":
+                debuff_reduction += getattr(comp, 'reduction_percent', 0.0)
+
+    return PassiveProfile(
+        stat_bonuses=MappingProxyType(stat_bonuses),
+        element_immunities=frozenset(immunities),
+        element_resistances=MappingProxyType(resistances),
+        reflection=reflection,
+        status_immune_all=immune_all,
+        status_immune_types=frozenset(immune_types),
+        debuff_reduction=min(debuff_reduction, MAX_DEBUFF_REDUCTION),
+        combat_start_hooks=tuple(combat_start_hooks),
+        turn_hooks=tuple(turn_hooks),
+    )
+
+
+# 매 행동 후 처리하는 패시브 컴포넌트 태그 → 메서드 이름
+_TURN_HOOK_METHODS = {
+    "passive_regen": "process_regen",
+    "conditional_passive": "process_conditional",
+    "passive_turn_scaling": "process_turn_scaling",
+}
+
+
+def _get_turn_hook(comp, tag: str):
+    """매 행동 후 호출할 컴포넌트 메서드 (해당 없으면 None)"""
+    method_name = _TURN_HOOK_METHODS.get(tag)
+    if method_name is None:
+        return None
+    return getattr(comp, method_name)
+
+
+# 덱 튜플 → PassiveProfile (LRU)
+_profile_cache: "OrderedDict[tuple[int, ...], PassiveProfile]" = OrderedDict()
+
+
+def get_passive_profile(skill_ids: Optional[Iterable[int]]) -> PassiveProfile:
+    """
+    덱의 패시브 프로필 조회 (LRU 메모이즈)
+
+    Args:
+        skill_ids: 장착 스킬 ID 목록
+
+    Returns:
+        PassiveProfile
+    """
+    key = tuple(skill_ids or ())
+    profile = _profile_cache.get(key)
+    if profile is not None:
+        _profile_cache.move_to_end(key)
+        return profile
+
+    profile = compile_passive_profile(key)
+    _profile_cache[key] = profile
+    if len(_profile_cache) > PASSIVE_PROFILE_CACHE_SIZE:
+        _profile_cache.popitem(last=False)
+    return profile
+
+
+def get_entity_passive_profile(entity) -> PassiveProfile:
+    """엔티티(User: equipped_skill / Monster: use_skill)의 패시브 프로필 조회"""
+    skill_ids = getattr(entity, 'equipped_skill', None) or getattr(entity, 'use_skill', [])
+    return get_passive_profile(skill_ids)
+
+
+def invalidate_passive_profile(skill_ids: Optional[Iterable[int]] = None) -> None:
+    """
+    패시브 프로필 캐시 무효화
+
+    Args:
+        skill_ids: 무효화할 덱 (None이면 전체 - 스킬 정적 데이터 재로드 시)
+    """
+    if skill_ids is None:
+        from models.stat_cache import invalidate_all_stat_caches
+
+        _profile_cache.clear()
+        invalidate_all_stat_caches()
+        logger.debug("Passive profile cache cleared")
+        return
+    _profile_cache.pop(tuple(skill_ids), None)
@@ -11,6 +11,7 @@ from models import Monster, MonsterTypeEnum, User, UserStatEnum
 from service.session import ContentType
 from service.collection_service import CollectionService
 from service.event import EventBus, GameEvent, GameEventType
+from service.item.inventory_batch import InventoryBatch
 
 logger = logging.getLogger(__name__)
 
@@ -58,10 +59,8 @@ def get_monster_drop_multiplier(monster: Monster) -> float:
     return 1.0
 
 
-def get_box_pool_by_monster(monster: Monster) -> list[tuple[int, float]]:
-    """몬스터 타입에 따른 상자 풀 조회 (CSV 기반)"""
-    from models.repos.static_cache import get_box_pool_by_monster_type
-
+def get_box_pool_key(monster: Monster) -> str:
+    """몬스터 타입에 대응하는 상자 드랍 테이블 CSV 키"""
     monster_type = normalize_monster_type(monster)
 
     # Enum 값 → CSV 키 매핑 (CommonMob → normal, EliteMob → elite, BossMob → boss)
@@ -72,8 +71,14 @@ def get_box_pool_by_monster(monster: Monster) -> list[tuple[int, float]]:
         "RadeMob": "raid",  # 레이드도 매핑 (CSV에 없으면 빈 리스트 반환)
     }
 
-    csv_key = type_mapping.get(monster_type, monster_type)
-    return get_box_pool_by_monster_type(csv_key)
+    return type_mapping.get(monster_type, monster_type)
+
+
+def get_box_pool_by_monster(monster: Monster) -> list[tuple[int, float]]:
+    """몬스터 타입에 따른 상자 풀 조회 (CSV 기반)"""
+    from models.repos.static_cache import get_box_pool_by_monster_type
+
+    return get_box_pool_by_monster_type(get_box_pool_key(monster))
 
 
 # =============================================================================
@@ -88,6 +93,18 @@ def get_attack_stat(entity) -> int:
     return getattr(entity, "attack", 0)
 
 
+def get_party_damage(session, context) -> int:
+    """
+    파티(리더 + 난입자)가 이번 전투에서 몬스터에게 가한 총 피해
+
+    기여도 점수가 아닌 전투 기록(CombatContext.records)의 실제 피해량을 합산합니다.
+    """
+    players = {id(session.user): session.user}
+    for participant in (getattr(session, "participants", None) or {}).values():
+        players[id(participant)] = participant
+    return sum(context.get_damage_dealt(player) for player in players.values())
+
+
 # =============================================================================
 # 전투 결과 처리 (다중 몬스터)
 # =============================================================================
@@ -133,7 +150,7 @@ async def process_combat_result_multi(session, context, turn_count: int) -> str:
                 step=session.exploration_step,
                 monster_name=monster_name,
                 result="defeat",
-                damage=sum(session.contribution.values()) if session.contribution else 0,
+                damage=get_party_damage(session, context),
                 turns=turn_count,
                 voice_channel_id=session.voice_channel_id
             )
@@ -159,6 +176,9 @@ async def process_combat_result_multi(session, context, turn_count: int) -> str:
     # 이벤트 버스 (싱글톤)
     event_bus = EventBus()
 
+    # 드롭 아이템은 모아서 전투당 한 번에 지급 (이전 전투에서 지급 실패한 분량 포함)
+    inventory = session.pending_drops or InventoryBatch(user)
+
     for monster in context.monsters:
         exp_mult = get_monster_exp_multiplier(monster)
         gold_mult = get_monster_gold_multiplier(monster)
@@ -186,9 +206,18 @@ async def process_combat_result_multi(session, context, turn_count: int) -> str:
 
         # 드롭 시도 (각 몬스터 독립)
         if not is_tower:
-            for drop_msg in await _try_all_drops(session, user, monster):
+            for drop_msg in await _try_all_drops(session, user, monster, inventory):
                 result_lines.append(f"   {drop_msg}")
 
+    try:
+        await inventory.commit()
+        session.pending_drops = None
+    except Exception as e:
+        # 전리품은 세션에 보관해 다음 전투 또는 던전 종료 시 다시 지급
+        logger.error(f"Failed to commit combat drops for user {user.discord_id}: {e}", exc_info=True)
+        session.pending_drops = inventory
+        result_lines.append("   ⚠️ 전리품 지급에 실패했습니다. 다음 전투 또는 던전 종료 시 다시 지급합니다.")
+
     # 그룹 보너스 (2마리 이상)
     if len(context.monsters) >= 2:
         total_exp = int(total_exp * 1.2)
@@ -307,7 +336,7 @@ async def process_combat_result_multi(session, context, turn_count: int) -> str:
             step=session.exploration_step,
             monster_name=monster_name,
             result="victory",
-            damage=sum(session.contribution.values()) if session.contribution else 0,
+            damage=get_party_damage(session, context),
             turns=turn_count,
             voice_channel_id=session.voice_channel_id
         )
@@ -322,7 +351,7 @@ async def process_combat_result_multi(session, context, turn_count: int) -> str:
             from service.session import get_sessions_in_voice_channel
 
             # 채널 경험치 추가 (기본 10 EXP)
-            total_damage = sum(session.contribution.values()) if session.contribution else 0
+            total_damage = get_party_damage(session, context)
             result = await ChannelLevelService.add_channel_exp(
                 voice_channel_id=session.voice_channel_id,
                 exp=10,
@@ -353,8 +382,8 @@ async def process_combat_result_multi(session, context, turn_count: int) -> str:
     return result_msg
 
 
-async def _try_all_drops(session, user: User, monster: Monster) -> list[str]:
-    """모든 드롭 시도 후 메시지 리스트 반환"""
+async def _try_all_drops(session, user: User, monster: Monster, inventory: InventoryBatch) -> list[str]:
+    """모든 드롭 시도 후 메시지 리스트 반환 (인벤토리 지급은 inventory에 누적)"""
     if session.content_type == ContentType.WEEKLY_TOWER:
         return []
     from service.dungeon.drop_handler import (
@@ -365,17 +394,17 @@ async def _try_all_drops(session, user: User, monster: Monster) -> list[str]:
     drops = []
 
     # 보스 전용 아이템
-    boss_item = await try_drop_boss_special_item(user, monster)
+    boss_item = await try_drop_boss_special_item(monster, inventory)
     if boss_item:
         drops.append(boss_item)
 
     # 일반 재료 드롭 (일반 몬스터)
-    material = await try_drop_monster_material(user, monster)
+    material = await try_drop_monster_material(monster, inventory)
     if material:
         drops.append(material)
 
     # 상자 드롭
-    chest = await try_drop_monster_box(session, monster)
+    chest = await try_drop_monster_box(session, monster, inventory)
     if chest:
         drops.append(chest)
 
@@ -385,7 +414,7 @@ async def _try_all_drops(session, user: User, monster: Monster) -> list[str]:
         drops.append(skill)
 
     # 장비 드롭
-    equipment = await try_drop_monster_equipment(user, monster)
+    equipment = await try_drop_monster_equipment(monster, inventory)
     if equipment:
         drops.append(equipment)
 
@@ -1,3 +1,7 @@
+from typing import Mapping
+
+from service.skill.deck_synergy_profile import parse_keyword_ids
+
 PASSIVE_TAGS = {
     # Phase 1
     "passive_buff", "passive_regen", "conditional_passive",
@@ -21,48 +25,18 @@ def is_passive_skill(skill_id: int) -> bool:
     return skill.is_passive
 
 
-def get_passive_stat_bonuses(skill_ids: list[int]) -> dict:
+def get_passive_stat_bonuses(skill_ids: list[int]) -> Mapping[str, float]:
     """
-    passive_buff 컴포넌트의 스탯 보너스 합산 반환
+    passive_buff 컴포넌트의 스탯 보너스 합산 반환 (덱별 패시브 프로필에서 조회, 읽기 전용)
 
     Returns:
         {"attack_percent": 0.0, "defense_percent": 0.0, "speed_percent": 0.0,
          "hp_percent": 0.0, "evasion_percent": 0.0, "ap_attack_percent": 0.0,
          "crit_rate": 0.0}
     """
-    from models.repos.skill_repo import get_skill_by_id
+    from service.dungeon.passive_profile import get_passive_profile
 
-    totals = {
-        "attack_percent": 0.0,
-        "defense_percent": 0.0,
-        "speed_percent": 0.0,
-        "hp_percent": 0.0,
-        "evasion_percent": 0.0,
-        "ap_attack_percent": 0.0,
-        "crit_rate": 0.0,
-        "crit_damage": 0.0,
-        "lifesteal": 0.0,
-        "drop_rate": 0.0,
-    }
-
-    seen = set()
-    for sid in skill_ids:
-        if sid == 0 or sid in seen:
-            continue
-        seen.add(sid)
-
-        skill = get_skill_by_id(sid)
-        if not skill or not skill.is_passive:
-            continue
-
-        for comp in skill.components:
-            tag = getattr(comp, '_tag', '')
-            if tag != "passive_buff":
-                continue
-            for key in totals:
-                totals[key] += getattr(comp, key, 0.0)
-
-    return totals
+    return get_passive_profile(skill_ids).stat_bonuses
 
 
 class Skill:
@@ -73,6 +47,14 @@ class Skill:
         for comp in self._components:
             comp.skill = self
 
+        # 덱 시너지 계산용 (정적 데이터 로드 시 1회 파싱)
+        self.keyword_ids = parse_keyword_ids(getattr(skill_model, 'keyword', None))
+        config_tags = {
+            c.get("tag") for c in (getattr(skill_model, 'config', None) or {}).get("components", [])
+        }
+        self.has_attack_component = "attack" in config_tags
+        self.has_heal_buff_component = bool(config_tags & {"heal", "buff"})
+
     @property
     def skill_model(self):
         """스킬 모델 반환"""
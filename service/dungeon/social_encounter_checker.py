@@ -9,8 +9,7 @@ import random
 from typing import TYPE_CHECKING, Optional
 
 from config.social_encounter import SOCIAL_ENCOUNTER
-from service.session import get_sessions_in_voice_channel
-from service.voice_channel.proximity_calculator import ProximityCalculator
+from service.session import get_nearby_sessions
 
 if TYPE_CHECKING:
     from service.session import DungeonSession
@@ -51,17 +50,10 @@ def check_social_encounter(session: "DungeonSession") -> Optional[str]:
         logger.debug(f"User {session.user_id} already has active encounter event")
         return None
 
-    # 같은 음성 채널의 다른 세션 조회
-    other_sessions = get_sessions_in_voice_channel(session.voice_channel_id)
-
-    # 필터: 같은 던전 + 비전투 + 비종료 + 본인 제외
+    # 캠프파이어 초대 범위 내 비전투/비종료 세션 (세션 위치 인덱스 사용)
     eligible = [
-        s for s in other_sessions
-        if s.user_id != session.user_id
-        and s.dungeon
-        and s.dungeon.id == session.dungeon.id
-        and not s.in_combat
-        and not s.ended
+        s for s in get_idle_nearby_sessions(session, SOCIAL_ENCOUNTER.CAMPFIRE_DISTANCE_THRESHOLD)
+        if not s.ended
     ]
 
     if not eligible:
@@ -69,9 +61,10 @@ def check_social_encounter(session: "DungeonSession") -> Optional[str]:
         return None
 
     # 1. 교차로 만남 우선 체크 (±2 스텝)
-    nearby_sessions = get_nearby_sessions(
-        session, eligible, SOCIAL_ENCOUNTER.CROSSROADS_DISTANCE_THRESHOLD
-    )
+    nearby_sessions = [
+        s for s in eligible
+        if abs(s.exploration_step - session.exploration_step) <= SOCIAL_ENCOUNTER.CROSSROADS_DISTANCE_THRESHOLD
+    ]
     if nearby_sessions and random.random() < SOCIAL_ENCOUNTER.CROSSROADS_PROBABILITY:
         logger.info(
             f"Crossroads encounter triggered for user {session.user_id}, "
@@ -83,38 +76,28 @@ def check_social_encounter(session: "DungeonSession") -> Optional[str]:
     if random.random() < SOCIAL_ENCOUNTER.CAMPFIRE_PROBABILITY:
         logger.info(
             f"Campfire encounter triggered for user {session.user_id}, "
-            f"{len(eligible)} players in channel"
+            f"{len(eligible)} players nearby"
         )
         return "campfire"
 
     return None
 
 
-def get_nearby_sessions(
+def get_idle_nearby_sessions(
     session: "DungeonSession",
-    candidate_sessions: list["DungeonSession"],
     distance_threshold: int,
 ) -> list["DungeonSession"]:
     """
-    거리 제한 내의 세션 필터링
+    같은 음성 채널/던전에서 거리 제한 내에 있는 비전투 세션 조회 (세션 위치 인덱스 사용)
 
     Args:
         session: 기준 세션
-        candidate_sessions: 후보 세션 목록
         distance_threshold: 최대 거리 (절댓값)
 
     Returns:
         거리 제한 내의 세션 목록
     """
-    nearby = []
-    for other_session in candidate_sessions:
-        distance = ProximityCalculator.calculate_distance(
-            session.exploration_step, other_session.exploration_step
-        )
-        if distance <= distance_threshold:
-            nearby.append(other_session)
-
-    return nearby
+    return [s for s in get_nearby_sessions(session, distance_threshold) if not s.in_combat]
 
 
 # Phase 4: 고급 만남 이벤트 체커 함수들
@@ -152,22 +135,16 @@ def check_simultaneous_encounter(session: "DungeonSession") -> Optional["Dungeon
         logger.debug(f"User {session.user_id} already has active encounter event")
         return None
 
-    # 같은 음성 채널의 다른 세션 조회
-    other_sessions = get_sessions_in_voice_channel(session.voice_channel_id)
+    # 같은 음성 채널 + 같은 던전 + 정확히 같은 스텝 (세션 위치 인덱스 사용)
+    other_sessions = get_nearby_sessions(session, 0)
 
-    # 필터: 같은 던전 + 정확히 같은 스텝 + 전투 중 + 5초 이내 시작
+    # 필터: 전투 중 + 5초 이내 시작
     import asyncio
 
     current_time = asyncio.get_event_loop().time()
     eligible = []
 
     for s in other_sessions:
-        if s.user_id == session.user_id:
-            continue
-        if not s.dungeon or s.dungeon.id != session.dungeon.id:
-            continue
-        if s.exploration_step != session.exploration_step:
-            continue
         if not s.in_combat:
             continue
         if not s.combat_context:
@@ -263,19 +240,7 @@ def check_crisis_witness(session: "DungeonSession") -> bool:
         return False
 
     # 근처 플레이어 찾기 (±2 스텝)
-    other_sessions = get_sessions_in_voice_channel(session.voice_channel_id)
-
-    eligible = [
-        s
-        for s in other_sessions
-        if s.user_id != session.user_id
-        and s.dungeon
-        and s.dungeon.id == session.dungeon.id
-        and not s.in_combat
-        and not s.ended
-    ]
-
-    nearby = get_nearby_sessions(session, eligible, 2)
+    nearby = get_idle_nearby_sessions(session, 2)
 
     if not nearby:
         logger.debug(f"No nearby players for crisis witness: user={session.user_id}")
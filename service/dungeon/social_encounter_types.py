@@ -14,7 +14,7 @@ import discord
 from config.social_encounter import SOCIAL_ENCOUNTER
 from exceptions import NoEligiblePartnersError, EncounterTimeoutError
 from service.dungeon.encounter_types import Encounter, EncounterType, EncounterResult
-from service.session import SessionType, get_session, get_sessions_in_voice_channel
+from service.session import SessionType, get_session
 from service.voice_channel.proximity_calculator import ProximityCalculator
 
 if TYPE_CHECKING:
@@ -79,21 +79,11 @@ class CrossroadsEncounter(Encounter):
         self, session: "DungeonSession", interaction: discord.Interaction
     ) -> Optional[EncounterResult]:
         """교차로 만남 실행"""
-        from service.dungeon.social_encounter_checker import get_nearby_sessions
+        from service.dungeon.social_encounter_checker import get_idle_nearby_sessions
         from views.social_encounter_view import CrossroadsInviteView, CrossroadsMeetingView
 
         # 1. 근처 세션 찾기 (±2 스텝)
-        other_sessions = get_sessions_in_voice_channel(session.voice_channel_id)
-        eligible = [
-            s for s in other_sessions
-            if s.user_id != session.user_id
-            and s.dungeon
-            and s.dungeon.id == session.dungeon.id
-            and not s.in_combat
-            and not s.ended
-        ]
-
-        nearby = get_nearby_sessions(session, eligible, SOCIAL_ENCOUNTER.CROSSROADS_DISTANCE_THRESHOLD)
+        nearby = get_idle_nearby_sessions(session, SOCIAL_ENCOUNTER.CROSSROADS_DISTANCE_THRESHOLD)
         if not nearby:
             logger.warning(f"Crossroads triggered but no nearby players for user {session.user_id}")
             raise NoEligiblePartnersError()
@@ -318,15 +308,12 @@ class CampfireEncounter(Encounter):
         # 발견자는 자동 참여
         event.responses[session.user_id] = "join"
 
-        # 3. 근처 플레이어 찾기
-        other_sessions = get_sessions_in_voice_channel(session.voice_channel_id)
+        # 3. 근처 플레이어 찾기 (±CAMPFIRE_DISTANCE_THRESHOLD 스텝, 세션 위치 인덱스 사용)
+        from service.dungeon.social_encounter_checker import get_idle_nearby_sessions
+
         eligible = [
-            s for s in other_sessions
-            if s.user_id != session.user_id
-            and s.dungeon
-            and s.dungeon.id == session.dungeon.id
-            and not s.in_combat
-            and not s.ended
+            s for s in get_idle_nearby_sessions(session, SOCIAL_ENCOUNTER.CAMPFIRE_DISTANCE_THRESHOLD)
+            if not s.ended
         ]
 
         if eligible:
@@ -337,11 +324,6 @@ class CampfireEncounter(Encounter):
                 distance = ProximityCalculator.calculate_distance(
                     session.exploration_step, other_session.exploration_step
                 )
-
-                # 거리 체크
-                if distance > SOCIAL_ENCOUNTER.CAMPFIRE_DISTANCE_THRESHOLD:
-                    continue  # 너무 멀면 알림 안 보냄
-
                 delay = 0 if distance <= 3 else 5
 
                 asyncio.create_task(
@@ -369,7 +351,7 @@ class CampfireEncounter(Encounter):
             user = participant_session.user
             heal_amount = int(user.max_hp * heal_pct)
             user.now_hp = min(user.max_hp, user.now_hp + heal_amount)
-            await user.save()
+            await user.save(update_fields=["now_hp"])
 
         # 8. ATK 버프 적용 (2+명)
         if participant_count >= 2:
@@ -555,20 +537,9 @@ class BossRoomEncounter(Encounter):
         )
 
         # 2. 근처 플레이어 찾기 (±10 스텝)
-        from service.dungeon.social_encounter_checker import get_nearby_sessions
-
-        other_sessions = get_sessions_in_voice_channel(session.voice_channel_id)
-        eligible = [
-            s
-            for s in other_sessions
-            if s.user_id != session.user_id
-            and s.dungeon
-            and s.dungeon.id == session.dungeon.id
-            and not s.in_combat
-            and not s.ended
-        ]
+        from service.dungeon.social_encounter_checker import get_idle_nearby_sessions
 
-        nearby = get_nearby_sessions(session, eligible, 10)
+        nearby = get_idle_nearby_sessions(session, 10)
 
         # 3. 초대 DM 전송 (거리별 지연: 0s/5s)
         client = session.discord_client or interaction.client
@@ -3,6 +3,7 @@ DOT 상태이상 (Damage over Time): 화상, 독, 출혈, 잠식
 """
 from config import STATUS_EFFECT
 from models import UserStatEnum
+from service.dungeon.combat_records import CombatRecordType, emit_record
 from service.dungeon.status.base import StatusEffect, register_status_effect
 
 
@@ -25,7 +26,8 @@ class BurnEffect(StatusEffect):
 
         damage = int(max_hp * STATUS_EFFECT.BURN_DAMAGE_PERCENT * self.stacks)
         damage = max(1, damage)
-        entity.take_damage(damage)
+        actual = entity.take_damage(damage)
+        emit_record(CombatRecordType.DAMAGE, entity, actual, label="화상")
         return f"🔥 **{entity.get_name()}** 화상! **-{damage}** HP"
 
     def get_emoji(self) -> str:
@@ -51,7 +53,8 @@ class PoisonEffect(StatusEffect):
 
         damage = int(max_hp * STATUS_EFFECT.POISON_DAMAGE_PERCENT * self.stacks)
         damage = max(1, damage)
-        entity.take_damage(damage)
+        actual = entity.take_damage(damage)
+        emit_record(CombatRecordType.DAMAGE, entity, actual, label="중독")
         return f"☠️ **{entity.get_name()}** 중독! **-{damage}** HP"
 
     def get_emoji(self) -> str:
@@ -77,7 +80,8 @@ class BleedEffect(StatusEffect):
 
         damage = int(max_hp * STATUS_EFFECT.BLEED_DAMAGE_PERCENT)
         damage = max(1, damage)
-        entity.take_damage(damage)
+        actual = entity.take_damage(damage)
+        emit_record(CombatRecordType.DAMAGE, entity, actual, label="출혈")
         return f"🩸 **{entity.get_name()}** 출혈! **-{damage}** HP"
 
     def get_emoji(self) -> str:
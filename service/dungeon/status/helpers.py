@@ -8,6 +8,7 @@ import random
 from typing import Optional
 
 from config import STATUS_EFFECT
+from service.dungeon.combat_records import CombatRecordType, emit_record
 from service.dungeon.status.base import (
     Buff, StatusEffect,
     status_effect_register, get_status_effect_by_type,
@@ -60,6 +61,7 @@ def apply_status_effect(
         existing.add_stacks(stacks)
         if duration > 0:
             existing.duration = max(existing.duration, duration)
+        emit_record(CombatRecordType.STATUS_APPLY, entity, existing.stacks, label=effect_type)
         emoji = existing.get_emoji()
         stack_text = f" x{existing.stacks}" if existing.stacks > 1 else ""
         return f"{emoji} **{entity.get_name()}** {effect_type}{stack_text}!"
@@ -69,6 +71,7 @@ def apply_status_effect(
     effect.duration = duration if duration > 0 else _get_default_duration(effect_type)
 
     entity.status.append(effect)
+    emit_record(CombatRecordType.STATUS_APPLY, entity, effect.stacks, label=effect_type)
     emoji = effect.get_emoji()
     stack_text = f" x{effect.stacks}" if effect.stacks > 1 else ""
     return f"{emoji} **{entity.get_name()}** {effect_type}{stack_text} ({effect.duration}턴)!"
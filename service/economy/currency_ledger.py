@@ -0,0 +1,340 @@
+"""
+재화 원장 (골드 / 경험치 / 스탯 포인트)
+
+User를 읽어 파이썬에서 값을 바꾼 뒤 save()로 모든 컬럼을 덮어쓰는 대신,
+변화량만 SQL 증감식(F 표현식)으로 반영합니다. 동시에 다른 경로(경매 정산 등)가
+같은 유저의 골드를 바꿔도 서로 덮어쓰지 않습니다.
+
+- apply_currency_delta: 즉시 반영 (골드/스탯 포인트 차감은 잔액 조건부 갱신)
+- currency_ledger: 던전 진행 중 발생하는 작은 변화량을 유저별로 합산해 두었다가 한 번에 반영
+  (메모리에만 있으므로 반영 전 프로세스가 죽으면 최대 CURRENCY_LEDGER.FLUSH_INTERVAL초분의 누적분이 유실됨)
+- 반영 후 DB 기준 값을 User 객체에 동기화하고 GOLD_CHANGED 발행
+- 경험치/레벨 변화는 publish_progress_events로 EXP_OBTAINED / LEVEL_UP 발행 (업적, 리더보드 갱신용)
+"""
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Iterable, Optional, Union
+
+from tortoise.expressions import F
+from tortoise.transactions import in_transaction
+
+from config import USER_STATS
+from exceptions import InsufficientGoldError, InsufficientStatPointsError, UserNotFoundError
+from models import User
+from service.event import EventBus, GameEvent, GameEventType
+
+logger = logging.getLogger(__name__)
+
+# 원장이 관리하는 User 컬럼 (전체 save()에서 제외해야 하는 필드)
+LEDGER_FIELDS = ("gold", "exp", "level", "stat_points")
+
+_INCREMENT_FIELDS = ("gold", "exp", "stat_points")
+
+
+@dataclass
+class CurrencyDelta:
+    """재화 변화량"""
+
+    gold: int = 0
+    exp: int = 0
+    stat_points: int = 0
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.gold or self.exp or self.stat_points)
+
+    def merge(self, other: "CurrencyDelta") -> None:
+        """다른 변화량 합산"""
+        self.gold += other.gold
+        self.exp += other.exp
+        self.stat_points += other.stat_points
+
+
+@dataclass(frozen=True)
+class LedgerResult:
+    """반영 결과 (반영 직후 DB 기준 값)"""
+
+    user_id: int
+    delta: CurrencyDelta
+    gold: int
+    exp: int
+    level: int
+    stat_points: int
+    old_level: int
+
+    @property
+    def levels_gained(self) -> int:
+        return self.level - self.old_level
+
+    @property
+    def stat_points_gained(self) -> int:
+        """레벨업으로 얻은 스탯 포인트"""
+        return self.levels_gained * USER_STATS.STAT_POINTS_PER_LEVEL
+
+    def sync_to(self, user: User) -> None:
+        """User 객체의 원장 필드를 DB 기준 값으로 갱신"""
+        user.gold = self.gold
+        user.exp = self.exp
+        user.level = self.level
+        user.stat_points = self.stat_points
+
+
+async def apply_currency_delta(
+    user: Union[User, int],
+    gold: int = 0,
+    exp: int = 0,
+    stat_points: int = 0,
+    using_db=None,
+    publish: bool = True
+) -> LedgerResult:
+    """
+    재화 변화량을 원자적으로 반영
+
+    경험치가 늘면 누적 경험치 기준으로 레벨과 레벨업 스탯 포인트도 같은 트랜잭션에서 갱신합니다.
+
+    Args:
+        user: 대상 사용자 (User면 반영 후 필드 동기화) 또는 User ID
+        gold: 골드 변화량 (음수면 차감, 잔액 부족 시 실패)
+        exp: 경험치 변화량
+        stat_points: 스탯 포인트 변화량 (음수면 차감, 잔여 포인트 부족 시 실패)
+        using_db: 사용할 연결 (호출 측 트랜잭션에 참여할 때)
+        publish: GOLD_CHANGED 발행 여부 (트랜잭션 커밋 후 직접 발행하려면 False)
+
+    Returns:
+        LedgerResult
+
+    Raises:
+        InsufficientGoldError: 차감할 골드가 부족
+        InsufficientStatPointsError: 차감할 스탯 포인트가 부족
+        UserNotFoundError: 사용자 없음
+    """
+    user_id = user if isinstance(user, int) else user.id
+    delta = CurrencyDelta(gold=gold, exp=exp, stat_points=stat_points)
+
+    if using_db is not None:
+        result = await _apply(user_id, delta, using_db)
+    else:
+        async with in_transaction() as conn:
+            result = await _apply(user_id, delta, conn)
+
+    if isinstance(user, User):
+        result.sync_to(user)
+    if publish:
+        await publish_gold_changed(result)
+    return result
+
+
+async def save_user_state(user: User) -> None:
+    """
+    원장 필드(골드/경험치/레벨/스탯 포인트)를 제외한 User 컬럼 저장
+
+    세션이 오래 들고 있던 User 객체를 저장할 때 사용합니다.
+    그 사이 다른 경로에서 반영된 골드 등을 이전 값으로 덮어쓰지 않습니다.
+    """
+    await user.save(update_fields=_non_ledger_fields())
+
+
+def _non_ledger_fields() -> list[str]:
+    meta = User._meta
+    return [
+        name for name in meta.fields_db_projection
+        if name != meta.pk_attr and name not in LEDGER_FIELDS
+    ]
+
+
+async def publish_gold_changed(*results: LedgerResult) -> None:
+    """골드가 바뀐 결과마다 반영 후 보유 골드로 GOLD_CHANGED 발행 (트랜잭션 커밋 후 호출)"""
+    event_bus = EventBus()
+    for result in results:
+        if not result.delta.gold:
+            continue
+        await event_bus.publish(GameEvent(
+            type=GameEventType.GOLD_CHANGED,
+            user_id=result.user_id,
+            data={"amount": result.delta.gold, "current_gold": result.gold}
+        ))
+
+
+async def publish_progress_events(*results: LedgerResult) -> None:
+    """경험치를 얻은 결과마다 EXP_OBTAINED, 레벨이 오른 결과마다 LEVEL_UP 발행 (반영 후 호출)"""
+    event_bus = EventBus()
+    for result in results:
+        if result.delta.exp:
+            await event_bus.publish(GameEvent(
+                type=GameEventType.EXP_OBTAINED,
+                user_id=result.user_id,
+                data={"exp_amount": result.delta.exp, "total_exp": result.exp, "level": result.level}
+            ))
+        if result.levels_gained > 0:
+            await event_bus.publish(GameEvent(
+                type=GameEventType.LEVEL_UP,
+                user_id=result.user_id,
+                data={"old_level": result.old_level, "new_level": result.level, "total_exp": result.exp}
+            ))
+
+
+async def _apply(user_id: int, delta: CurrencyDelta, conn) -> LedgerResult:
+    """트랜잭션 안에서 증감 반영 → 결과 조회 → 레벨 재계산"""
+    if not delta.is_empty:
+        query = User.filter(id=user_id)
+        if delta.gold < 0:
+            query = query.filter(gold__gte=-delta.gold)
+        if delta.stat_points < 0:
+            query = query.filter(stat_points__gte=-delta.stat_points)
+        updates = {
+            name: F(name) + getattr(delta, name)
+            for name in _INCREMENT_FIELDS
+            if getattr(delta, name)
+        }
+        updated = await query.using_db(conn).update(**updates)
+        if not updated:
+            current = await User.filter(id=user_id).using_db(conn).values_list("gold", "stat_points")
+            if not current:
+                raise UserNotFoundError(user_id)
+            gold, stat_points = current[0]
+            if delta.gold < 0 and gold < -delta.gold:
+                raise InsufficientGoldError(-delta.gold, gold)
+            raise InsufficientStatPointsError(-delta.stat_points, stat_points)
+
+    rows = await User.filter(id=user_id).using_db(conn).values_list("gold", "exp", "level", "stat_points")
+    if not rows:
+        raise UserNotFoundError(user_id)
+    gold, exp, level, stat_points = rows[0]
+    old_level = level
+
+    if delta.exp > 0:
+        from service.economy.reward_service import calculate_level_from_exp
+
+        new_level = calculate_level_from_exp(exp)
+        if new_level > level:
+            gained = (new_level - level) * USER_STATS.STAT_POINTS_PER_LEVEL
+            await User.filter(id=user_id).using_db(conn).update(
+                level=new_level,
+                stat_points=F("stat_points") + gained
+            )
+            level = new_level
+            stat_points += gained
+
+    return LedgerResult(
+        user_id=user_id,
+        delta=delta,
+        gold=gold,
+        exp=exp,
+        level=level,
+        stat_points=stat_points,
+        old_level=old_level,
+    )
+
+
+@dataclass
+class _PendingCurrency:
+    """반영 대기 중인 유저별 변화량"""
+
+    delta: CurrencyDelta = field(default_factory=CurrencyDelta)
+    user: Optional[User] = None
+    """반영 후 값을 동기화할 User 객체 (세션이 들고 있는 객체)"""
+
+
+class CurrencyLedger:
+    """
+    재화 변화량 누적기
+
+    던전 한 번 동안 전투마다 생기는 골드/경험치를 유저별로 합산해 두고,
+    세션 종료 또는 주기적 flush에서 유저당 UPDATE 한 번으로 반영합니다.
+    누적분은 메모리에만 있으므로 봇이 비정상 종료되면 마지막 flush 이후 누적분은 반영되지 않습니다.
+    """
+
+    def __init__(self):
+        self._pending: dict[int, _PendingCurrency] = {}
+        self._flush_lock = asyncio.Lock()
+
+    @property
+    def pending_count(self) -> int:
+        """반영 대기 중인 유저 수"""
+        return len(self._pending)
+
+    def pending_delta(self, user_id: int) -> CurrencyDelta:
+        """유저의 반영 대기 중인 변화량 (복사본)"""
+        pending = self._pending.get(user_id)
+        return CurrencyDelta(**vars(pending.delta)) if pending else CurrencyDelta()
+
+    def add(self, user: User, gold: int = 0, exp: int = 0, stat_points: int = 0) -> None:
+        """
+        변화량 누적 (증가분 전용 - 차감은 apply_currency_delta로 즉시 반영)
+
+        Args:
+            user: 대상 사용자
+            gold: 획득 골드
+            exp: 획득 경험치
+            stat_points: 획득 스탯 포인트
+        """
+        pending = self._pending.get(user.id)
+        if pending is None:
+            pending = _PendingCurrency()
+            self._pending[user.id] = pending
+        pending.user = user
+        pending.delta.merge(CurrencyDelta(gold=gold, exp=exp, stat_points=stat_points))
+
+    async def flush(self, user_ids: Iterable[int] = None) -> int:
+        """
+        누적된 변화량을 DB에 반영
+
+        유저별로 따로 반영하므로 한 유저의 실패가 다른 유저 반영을 막지 않으며,
+        실패한 변화량은 다음 flush에서 다시 시도합니다.
+
+        Args:
+            user_ids: 반영할 유저 ID 목록 (None이면 전체)
+
+        Returns:
+            반영한 유저 수
+        """
+        async with self._flush_lock:
+            if user_ids is None:
+                batch = self._pending
+                self._pending = {}
+            else:
+                batch = {
+                    user_id: self._pending.pop(user_id)
+                    for user_id in set(user_ids)
+                    if user_id in self._pending
+                }
+
+            applied = 0
+            for user_id, pending in batch.items():
+                if pending.delta.is_empty:
+                    continue
+                try:
+                    result = await apply_currency_delta(
+                        pending.user or user_id,
+                        **vars(pending.delta)
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to flush currency for user {user_id}: {e}", exc_info=True)
+                    self._merge_back(user_id, pending)
+                    continue
+
+                applied += 1
+                if result.levels_gained:
+                    logger.info(
+                        f"Level up on currency flush: user_id={user_id}, "
+                        f"{result.old_level} -> {result.level}"
+                    )
+                await publish_progress_events(result)
+
+        if applied:
+            logger.debug(f"Currency ledger flushed: {applied} users")
+        return applied
+
+    def _merge_back(self, user_id: int, pending: _PendingCurrency) -> None:
+        """반영 실패한 변화량을 대기열에 되돌림 (그 사이 누적된 값과 병합)"""
+        newer = self._pending.get(user_id)
+        if newer is None:
+            self._pending[user_id] = pending
+            return
+        newer.delta.merge(pending.delta)
+        newer.user = newer.user or pending.user
+
+
+# 전역 인스턴스 (세션 종료/배경 작업에서 flush)
+currency_ledger = CurrencyLedger()
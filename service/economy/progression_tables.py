@@ -0,0 +1,162 @@
+"""
+성장 수치 테이블 (레벨 / 강화 / 등급)
+
+보상마다 레벨을 한 단계씩 세며 누적 경험치를 계산하거나,
+강화/등급 배율을 설정 범위에서 매번 찾는 대신 import 시점에 설정값으로 배열을 한 번 만들어 둡니다.
+
+- 레벨: 레벨별 필요 경험치 / 누적 경험치 배열 → 누적 경험치로 레벨 찾기는 bisect
+- 강화: 레벨별 성공률, 등급×레벨별 비용 배열 → O(1) 인덱스 조회
+- 등급: 등급 ID별 스탯 배율 배열 → O(1) 인덱스 조회
+
+테이블 범위를 벗어난 입력은 기존 계산식과 같은 결과를 내도록 직접 계산합니다.
+"""
+from bisect import bisect_right
+
+from config import (
+    ENHANCEMENT,
+    ENHANCEMENT_COST_GRADE_MULTIPLIERS,
+    ENHANCEMENT_SUCCESS_RATES,
+    GRADE_TABLE,
+    LEVELING_EXP_DEFAULT,
+    LEVELING_EXP_TABLE,
+    LEVELING_MAX_LEVEL,
+)
+
+
+# =============================================================================
+# 레벨
+# =============================================================================
+
+
+def _exp_multiplier(level: int) -> int:
+    for max_level, exp_required in LEVELING_EXP_TABLE:
+        if level <= max_level:
+            return exp_required
+    return LEVELING_EXP_DEFAULT
+
+
+def _compile_exp_tables() -> tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...]]:
+    """레벨별 (경험치 배율, 다음 레벨까지 필요 경험치, 해당 레벨 도달 누적 경험치) - 인덱스 = 레벨"""
+    top = LEVELING_MAX_LEVEL + 1
+    multipliers = [0] * (top + 1)
+    to_next = [0] * (top + 1)
+    cumulative = [0] * (top + 1)
+    for level in range(1, top + 1):
+        multipliers[level] = _exp_multiplier(level)
+        to_next[level] = multipliers[level] * level
+        if level > 1:
+            cumulative[level] = cumulative[level - 1] + to_next[level - 1]
+    return tuple(multipliers), tuple(to_next), tuple(cumulative)
+
+
+EXP_MULTIPLIERS, EXP_TO_NEXT_LEVEL, CUMULATIVE_EXP = _compile_exp_tables()
+"""EXP_TO_NEXT_LEVEL[lv]: lv → lv+1 필요 경험치, CUMULATIVE_EXP[lv]: lv 도달 누적 경험치"""
+
+
+def exp_multiplier(level: int) -> int:
+    """레벨 구간별 경험치 배율"""
+    if 1 <= level < len(EXP_MULTIPLIERS):
+        return EXP_MULTIPLIERS[level]
+    return _exp_multiplier(level)
+
+
+def exp_to_next_level(level: int) -> int:
+    """다음 레벨까지 필요한 경험치"""
+    if 1 <= level < len(EXP_TO_NEXT_LEVEL):
+        return EXP_TO_NEXT_LEVEL[level]
+    return _exp_multiplier(level) * level
+
+
+def cumulative_exp_for_level(level: int) -> int:
+    """특정 레벨까지 필요한 누적 경험치"""
+    if level <= 1:
+        return 0
+    if level < len(CUMULATIVE_EXP):
+        return CUMULATIVE_EXP[level]
+
+    last = len(CUMULATIVE_EXP) - 1
+    total = CUMULATIVE_EXP[last]
+    for lv in range(last, level):
+        total += _exp_multiplier(lv) * lv
+    return total
+
+
+def level_from_exp(total_exp: int) -> int:
+    """누적 경험치로 레벨 계산 (최대 LEVELING_MAX_LEVEL)"""
+    # CUMULATIVE_EXP[1..MAX] 중 total_exp 이하인 마지막 레벨
+    index = bisect_right(CUMULATIVE_EXP, total_exp, 1, LEVELING_MAX_LEVEL + 1)
+    return max(1, index - 1)
+
+
+# =============================================================================
+# 강화
+# =============================================================================
+
+
+def _compile_success_rates() -> tuple[float, ...]:
+    top = max(max_lvl for _, max_lvl in ENHANCEMENT_SUCCESS_RATES)
+    rates = [0.0] * (top + 1)
+    # 범위가 겹치면 먼저 정의된 범위 우선 (dict 순서)
+    for (min_lvl, max_lvl), rate in reversed(list(ENHANCEMENT_SUCCESS_RATES.items())):
+        for level in range(max(0, min_lvl), max_lvl + 1):
+            rates[level] = rate
+    return tuple(rates)
+
+
+def _enhancement_cost(grade_id: int, level: int) -> int:
+    grade_mult = ENHANCEMENT_COST_GRADE_MULTIPLIERS.get(grade_id, 1.0)
+    level_mult = 1.0 + (level * ENHANCEMENT.COST_PER_LEVEL_MULTIPLIER)
+    return int(ENHANCEMENT.BASE_COST * grade_mult * level_mult)
+
+
+def _compile_enhancement_costs() -> dict[int, tuple[int, ...]]:
+    return {
+        grade_id: tuple(_enhancement_cost(grade_id, level) for level in range(ENHANCEMENT.MAX_LEVEL + 1))
+        for grade_id in ENHANCEMENT_COST_GRADE_MULTIPLIERS
+    }
+
+
+ENHANCEMENT_SUCCESS_BY_LEVEL = _compile_success_rates()
+"""강화 레벨별 성공률 (인덱스 = 현재 강화 레벨)"""
+
+ENHANCEMENT_COST_BY_GRADE = _compile_enhancement_costs()
+"""등급 ID -> 강화 레벨별 비용 (인덱스 = 현재 강화 레벨)"""
+
+
+def enhancement_success_rate(level: int) -> float:
+    """현재 강화 레벨의 성공률 (범위 밖이면 0.0)"""
+    if 0 <= level < len(ENHANCEMENT_SUCCESS_BY_LEVEL):
+        return ENHANCEMENT_SUCCESS_BY_LEVEL[level]
+    return 0.0
+
+
+def enhancement_cost(grade_id: int, level: int) -> int:
+    """강화 비용 (골드)"""
+    costs = ENHANCEMENT_COST_BY_GRADE.get(grade_id)
+    if costs is not None and 0 <= level < len(costs):
+        return costs[level]
+    return _enhancement_cost(grade_id, level)
+
+
+# =============================================================================
+# 등급
+# =============================================================================
+
+
+def _compile_grade_multipliers() -> tuple[float, ...]:
+    multipliers = [1.0] * (max(GRADE_TABLE) + 1)
+    for grade_id, info in GRADE_TABLE.items():
+        if grade_id > 0:
+            multipliers[grade_id] = info.stat_multiplier
+    return tuple(multipliers)
+
+
+GRADE_STAT_MULTIPLIERS = _compile_grade_multipliers()
+"""인스턴스 등급 ID별 스탯 배율 (인덱스 = 등급 ID, 0은 1.0)"""
+
+
+def grade_stat_multiplier(grade_id: int) -> float:
+    """인스턴스 등급 스탯 배율 (등급 없음/미정의 등급은 1.0)"""
+    if 0 <= grade_id < len(GRADE_STAT_MULTIPLIERS):
+        return GRADE_STAT_MULTIPLIERS[grade_id]
+    return 1.0
@@ -8,7 +8,14 @@ from dataclasses import dataclass
 from typing import Optional
 
 from models import User
-from config import USER_STATS, LEVELING_EXP_TABLE, LEVELING_EXP_DEFAULT
+from config import USER_STATS
+from service.economy.currency_ledger import apply_currency_delta, currency_ledger, publish_progress_events
+from service.economy.progression_tables import (
+    cumulative_exp_for_level,
+    exp_multiplier,
+    exp_to_next_level,
+    level_from_exp,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +39,8 @@ class RewardResult:
     exp_gained: int
     gold_gained: int
     level_up: Optional[LevelUpResult]
+    level: int = 0
+    """보상 반영 후 레벨 (누적 보상은 예상 레벨)"""
 
 
 def get_exp_multiplier(level: int) -> int:
@@ -44,10 +53,7 @@ def get_exp_multiplier(level: int) -> int:
     Returns:
         필요 경험치 배율
     """
-    for max_level, exp_required in LEVELING_EXP_TABLE:
-        if level <= max_level:
-            return exp_required
-    return LEVELING_EXP_DEFAULT
+    return exp_multiplier(level)
 
 
 def get_exp_for_level(level: int) -> int:
@@ -60,10 +66,7 @@ def get_exp_for_level(level: int) -> int:
     Returns:
         필요 누적 경험치
     """
-    total_exp = 0
-    for lv in range(1, level):
-        total_exp += get_exp_multiplier(lv) * lv
-    return total_exp
+    return cumulative_exp_for_level(level)
 
 
 def get_exp_to_next_level(level: int) -> int:
@@ -76,7 +79,7 @@ def get_exp_to_next_level(level: int) -> int:
     Returns:
         다음 레벨까지 필요한 경험치
     """
-    return get_exp_multiplier(level) * level
+    return exp_to_next_level(level)
 
 
 def calculate_level_from_exp(total_exp: int) -> int:
@@ -89,17 +92,7 @@ def calculate_level_from_exp(total_exp: int) -> int:
     Returns:
         계산된 레벨
     """
-    level = 1
-    cumulative = 0
-
-    while level < 100:
-        exp_needed = get_exp_multiplier(level) * level
-        if cumulative + exp_needed > total_exp:
-            break
-        cumulative += exp_needed
-        level += 1
-
-    return level
+    return level_from_exp(total_exp)
 
 
 class RewardService:
@@ -114,6 +107,9 @@ class RewardService:
         """
         보상 적용 및 레벨업 처리
 
+        골드/경험치는 증감식으로 반영하고(다른 컬럼은 건드리지 않음),
+        반영 후 DB 기준 값이 user에 동기화됩니다.
+
         Args:
             user: 대상 사용자
             exp_gained: 획득 경험치
@@ -122,51 +118,86 @@ class RewardService:
         Returns:
             보상 적용 결과
         """
-        old_level = user.level
-
-        # 경험치 및 골드 추가
-        user.exp += exp_gained
-        user.gold += gold_gained
-
-        # 레벨업 체크
-        new_level = calculate_level_from_exp(user.exp)
+        # 경험치/골드 반영 + 레벨업 (GOLD_CHANGED는 원장에서 발행)
+        ledger_result = await apply_currency_delta(user, gold=gold_gained, exp=exp_gained)
         level_up_result = None
 
-        if new_level > old_level:
-            # 레벨업!
-            levels_gained = new_level - old_level
-            stat_points_gained = levels_gained * STAT_POINTS_PER_LEVEL
-
-            user.level = new_level
-            user.stat_points += stat_points_gained
-
+        if ledger_result.levels_gained > 0:
             level_up_result = LevelUpResult(
                 leveled_up=True,
-                old_level=old_level,
-                new_level=new_level,
-                levels_gained=levels_gained,
-                stat_points_gained=stat_points_gained
+                old_level=ledger_result.old_level,
+                new_level=ledger_result.level,
+                levels_gained=ledger_result.levels_gained,
+                stat_points_gained=ledger_result.stat_points_gained
             )
 
             logger.info(
                 f"Level up: user={user.discord_id}, "
-                f"{old_level} -> {new_level}, "
-                f"stat_points=+{stat_points_gained} (total: {user.stat_points})"
+                f"{ledger_result.old_level} -> {ledger_result.level}, "
+                f"stat_points=+{ledger_result.stat_points_gained} (total: {user.stat_points})"
             )
 
-        # DB 저장
-        await user.save()
-
         logger.info(
             f"Rewards applied: user={user.discord_id}, "
             f"exp=+{exp_gained} (total: {user.exp}), "
             f"gold=+{gold_gained} (total: {user.gold})"
         )
 
+        # 업적/리더보드 갱신용 EXP_OBTAINED / LEVEL_UP
+        await publish_progress_events(ledger_result)
+
+        return RewardResult(
+            exp_gained=exp_gained,
+            gold_gained=gold_gained,
+            level_up=level_up_result,
+            level=ledger_result.level
+        )
+
+    @staticmethod
+    def buffer_rewards(
+        user: User,
+        exp_gained: int,
+        gold_gained: int
+    ) -> RewardResult:
+        """
+        보상 누적 (진행 중 전투/층마다 호출)
+
+        골드/경험치는 재화 원장에 합산해 두었다가 세션 종료 또는 주기적 flush에서
+        유저당 한 번에 반영합니다. 레벨업 결과는 반영 대기 중인 경험치까지 더해 미리 계산한 값이며,
+        실제 레벨 갱신과 EXP_OBTAINED / LEVEL_UP 발행은 flush 시점에 이루어집니다.
+
+        Args:
+            user: 대상 사용자
+            exp_gained: 획득 경험치
+            gold_gained: 획득 골드
+
+        Returns:
+            보상 적용 결과 (예상 레벨업 포함)
+        """
+        pending_exp = user.exp + currency_ledger.pending_delta(user.id).exp
+        currency_ledger.add(user, gold=gold_gained, exp=exp_gained)
+
+        old_level = max(user.level, calculate_level_from_exp(pending_exp))
+        new_level = max(old_level, calculate_level_from_exp(pending_exp + exp_gained))
+        level_up_result = None
+        if new_level > old_level:
+            levels_gained = new_level - old_level
+            level_up_result = LevelUpResult(
+                leveled_up=True,
+                old_level=old_level,
+                new_level=new_level,
+                levels_gained=levels_gained,
+                stat_points_gained=levels_gained * STAT_POINTS_PER_LEVEL
+            )
+
+        logger.debug(
+            f"Rewards buffered: user={user.discord_id}, exp=+{exp_gained}, gold=+{gold_gained}"
+        )
         return RewardResult(
             exp_gained=exp_gained,
             gold_gained=gold_gained,
-            level_up=level_up_result
+            level_up=level_up_result,
+            level=new_level
         )
 
     @staticmethod
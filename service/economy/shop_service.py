@@ -19,8 +19,10 @@ from exceptions import (
     ItemNotFoundError,
     SkillNotFoundError,
 )
+from service.economy.currency_ledger import apply_currency_delta
 from service.skill.skill_ownership_service import SkillOwnershipService
 from service.collection_service import CollectionService
+from service.item.equipment_snapshot import invalidate_equipment_snapshot
 from service.item.grade_service import GradeService
 
 # Grade name → ID 캐시 (load_grade_cache로 초기화)
@@ -403,9 +405,8 @@ class ShopService:
         if not skill:
             raise SkillNotFoundError(skill_id)
 
-        # 골드 차감
-        user.gold -= total_cost
-        await user.save()
+        # 골드 차감 (잔액 조건부 원자적 차감)
+        await apply_currency_delta(user, gold=-total_cost)
 
         # 스킬 소유권 추가
         await SkillOwnershipService.add_skill(user, skill_id, quantity)
@@ -444,9 +445,8 @@ class ShopService:
         if not item:
             raise ItemNotFoundError(item_id)
 
-        # 골드 차감
-        user.gold -= total_cost
-        await user.save()
+        # 골드 차감 (잔액 조건부 원자적 차감)
+        await apply_currency_delta(user, gold=-total_cost)
 
         # 장비 아이템이면 인스턴스 등급 부여 (상점은 A등급까지)
         if item.type == ItemType.EQUIP:
@@ -508,14 +508,16 @@ class ShopService:
         sell_price = int(base_price * SHOP.SELL_PRICE_RATIO) * quantity
 
         # 골드 추가
-        user.gold += sell_price
-        await user.save()
+        await apply_currency_delta(user, gold=sell_price)
 
         # 인벤토리에서 제거
         item_name = inventory.item.name
         inventory.quantity -= quantity
         if inventory.quantity <= 0:
             await inventory.delete()
+            # 장착 중이던 장비면 UserEquipment도 CASCADE 삭제되므로 스냅샷 무효화
+            if inventory.item.type == ItemType.EQUIP:
+                invalidate_equipment_snapshot(user.id)
         else:
             await inventory.save()
 
@@ -1,5 +1,11 @@
 """이벤트 시스템"""
 
-from .event_bus import EventBus, GameEvent, GameEventType
+from .event_bus import (
+    EventBus, GameEvent, GameEventType,
+    DispatchMode, BackpressurePolicy, SubscriberMetrics, subscriber_name,
+)
 
-__all__ = ["EventBus", "GameEvent", "GameEventType"]
+__all__ = [
+    "EventBus", "GameEvent", "GameEventType",
+    "DispatchMode", "BackpressurePolicy", "SubscriberMetrics", "subscriber_name",
+]
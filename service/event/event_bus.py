@@ -3,14 +3,22 @@
 
 옵저버 패턴을 사용하여 게임 내 이벤트를 발행하고 구독합니다.
 각 시스템은 이벤트를 발행하기만 하면 되고, 구독자(업적, 퀘스트 등)가 자동으로 처리합니다.
+
+디스패치 모드:
+- INLINE: publish()가 구독자 콜백을 순차적으로 await (기본값)
+- QUEUED: publish()는 구독자별 큐에 넣고 즉시 반환, 워커 태스크가 처리
 """
 
+import asyncio
 import logging
+import time
 from datetime import datetime
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Callable, Dict, List, Any
 
+from config import EVENT_BUS
+
 logger = logging.getLogger(__name__)
 
 
@@ -56,6 +64,103 @@ class GameEvent:
         return f"GameEvent(type={self.type.value}, user_id={self.user_id}, data={self.data})"
 
 
+class DispatchMode(Enum):
+    """이벤트 디스패치 모드"""
+
+    INLINE = "inline"   # 발행자가 모든 콜백을 순차 await
+    QUEUED = "queued"   # 구독자별 큐 + 워커 태스크
+
+
+class BackpressurePolicy(Enum):
+    """구독자 큐가 가득 찼을 때의 처리 정책"""
+
+    BLOCK = "block"               # 자리가 날 때까지 발행자 대기
+    DROP_NEWEST = "drop_newest"   # 새 이벤트 버림
+    DROP_OLDEST = "drop_oldest"   # 가장 오래된 이벤트 버리고 새 이벤트 추가
+
+
+@dataclass
+class SubscriberMetrics:
+    """구독자별 처리 지표"""
+
+    processed: int = 0
+    errors: int = 0
+    dropped: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    queue_depth: int = 0
+
+    @property
+    def avg_latency(self) -> float:
+        """평균 핸들러 처리 시간 (초)"""
+        return self.total_latency / self.processed if self.processed else 0.0
+
+    def record(self, latency: float, failed: bool) -> None:
+        """핸들러 1회 실행 결과 기록"""
+        self.processed += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        if failed:
+            self.errors += 1
+
+
+class _SubscriberChannel:
+    """
+    구독자 1개의 큐/워커 묶음
+
+    user_id 해시로 샤드를 고르므로 같은 유저의 이벤트는 같은 워커가 발행 순서대로 처리합니다.
+    """
+
+    def __init__(self, callback: Callable, shard_count: int, max_size: int, metrics: SubscriberMetrics):
+        self.callback = callback
+        self.queues: List[asyncio.Queue] = [asyncio.Queue(maxsize=max_size) for _ in range(shard_count)]
+        self.workers: List[asyncio.Task] = []
+        self.metrics = metrics
+
+    def start(self, invoke: Callable) -> None:
+        """워커 태스크 시작"""
+        self.workers = [
+            asyncio.create_task(self._run(queue, invoke), name=f"event-worker:{subscriber_name(self.callback)}:{i}")
+            for i, queue in enumerate(self.queues)
+        ]
+
+    def queue_for(self, user_id: int) -> asyncio.Queue:
+        """user_id에 해당하는 샤드 큐"""
+        return self.queues[hash(user_id) % len(self.queues)]
+
+    @property
+    def depth(self) -> int:
+        """대기 중인 이벤트 수"""
+        return sum(queue.qsize() for queue in self.queues)
+
+    async def _run(self, queue: asyncio.Queue, invoke: Callable) -> None:
+        while True:
+            event = await queue.get()
+            try:
+                await invoke(self.callback, event)
+            finally:
+                queue.task_done()
+
+    async def join(self) -> None:
+        """모든 샤드 큐가 비워질 때까지 대기"""
+        for queue in self.queues:
+            await queue.join()
+
+    def stop(self) -> None:
+        """워커 태스크 취소"""
+        for worker in self.workers:
+            worker.cancel()
+        self.workers = []
+
+
+def subscriber_name(callback: Callable) -> str:
+    """구독자 식별 이름 (모듈 + 정규화 이름, 지표 키로 사용)"""
+    qualname = getattr(callback, "__qualname__", None)
+    if qualname is None:
+        return repr(callback)
+    return f"{callback.__module__}.{qualname}"
+
+
 class EventBus:
     """
     이벤트 버스 (싱글톤)
@@ -86,6 +191,12 @@ class EventBus:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._subscribers = {}
+            cls._instance._mode = DispatchMode.INLINE
+            cls._instance._channels = {}
+            cls._instance._metrics = {}
+            cls._instance._policy = BackpressurePolicy.BLOCK
+            cls._instance._queue_size = EVENT_BUS.QUEUE_MAX_SIZE
+            cls._instance._shard_count = EVENT_BUS.WORKERS_PER_SUBSCRIBER
             cls._instance._initialized = True
             logger.info("EventBus instance created")
         return cls._instance
@@ -103,7 +214,7 @@ class EventBus:
 
         if callback not in self._subscribers[event_type]:
             self._subscribers[event_type].append(callback)
-            logger.debug(f"Subscribed to {event_type.value}: {callback.__name__}")
+            logger.debug(f"Subscribed to {event_type.value}: {subscriber_name(callback)}")
 
     def unsubscribe(self, event_type: GameEventType, callback: Callable) -> None:
         """
@@ -116,16 +227,84 @@ class EventBus:
         if event_type in self._subscribers:
             try:
                 self._subscribers[event_type].remove(callback)
-                logger.debug(f"Unsubscribed from {event_type.value}: {callback.__name__}")
+                logger.debug(f"Unsubscribed from {event_type.value}: {subscriber_name(callback)}")
             except ValueError:
                 pass
 
+    @property
+    def mode(self) -> DispatchMode:
+        """현재 디스패치 모드"""
+        return self._mode
+
+    def start_workers(
+        self,
+        queue_size: int = None,
+        workers_per_subscriber: int = None,
+        policy: BackpressurePolicy = None
+    ) -> None:
+        """
+        큐 디스패치 모드로 전환
+
+        이후 publish()는 구독자별 큐에 이벤트를 넣고 즉시 반환합니다.
+        실행 중인 이벤트 루프 안에서 호출해야 합니다.
+
+        Args:
+            queue_size: 샤드 큐당 최대 크기 (기본: EVENT_BUS.QUEUE_MAX_SIZE)
+            workers_per_subscriber: 구독자당 워커 수 (기본: EVENT_BUS.WORKERS_PER_SUBSCRIBER)
+            policy: 큐가 가득 찼을 때 정책 (기본: EVENT_BUS.BACKPRESSURE_POLICY)
+        """
+        if self._mode == DispatchMode.QUEUED:
+            return
+
+        self._queue_size = queue_size or EVENT_BUS.QUEUE_MAX_SIZE
+        self._shard_count = max(1, workers_per_subscriber or EVENT_BUS.WORKERS_PER_SUBSCRIBER)
+        self._policy = policy or BackpressurePolicy(EVENT_BUS.BACKPRESSURE_POLICY)
+        self._mode = DispatchMode.QUEUED
+        logger.info(
+            f"EventBus switched to queued dispatch: queue_size={self._queue_size}, "
+            f"workers={self._shard_count}, policy={self._policy.value}"
+        )
+
+    async def drain(self, timeout: float = None) -> bool:
+        """
+        대기 중인 이벤트를 모두 처리한 뒤 워커를 정지하고 INLINE 모드로 복귀 (종료 시 호출)
+
+        Args:
+            timeout: 최대 대기 시간 (기본: EVENT_BUS.DRAIN_TIMEOUT)
+
+        Returns:
+            제한 시간 안에 모든 큐를 비웠으면 True
+        """
+        if self._mode != DispatchMode.QUEUED:
+            return True
+
+        # 새 이벤트는 발행자가 직접 처리하도록 먼저 전환
+        self._mode = DispatchMode.INLINE
+        channels = list(self._channels.values())
+        drained = True
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(channel.join() for channel in channels)),
+                timeout=timeout if timeout is not None else EVENT_BUS.DRAIN_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            drained = False
+            remaining = sum(channel.depth for channel in channels)
+            logger.warning(f"EventBus drain timed out: {remaining} events left unprocessed")
+
+        for channel in channels:
+            channel.stop()
+        self._channels.clear()
+        logger.info("EventBus drained and switched to inline dispatch")
+        return drained
+
     async def publish(self, event: GameEvent) -> None:
         """
         이벤트 발행
 
-        구독자들에게 이벤트를 전파합니다.
-        각 구독자의 콜백이 순차적으로 호출되며, 에러가 발생해도 다른 구독자에게 영향을 주지 않습니다.
+        INLINE 모드에서는 각 구독자의 콜백이 순차적으로 호출되고,
+        QUEUED 모드에서는 구독자별 큐에 넣은 뒤 바로 반환합니다.
+        에러가 발생해도 다른 구독자에게 영향을 주지 않습니다.
 
         Args:
             event: 발행할 이벤트
@@ -136,14 +315,75 @@ class EventBus:
 
         logger.debug(f"Publishing event: {event}")
 
-        for callback in self._subscribers[event.type]:
-            try:
-                await callback(event)
-            except Exception as e:
-                logger.error(
-                    f"Error in event callback {callback.__name__} for {event.type.value}: {e}",
-                    exc_info=True
-                )
+        for callback in list(self._subscribers[event.type]):
+            if self._mode == DispatchMode.QUEUED:
+                await self._enqueue(callback, event)
+            else:
+                await self._invoke(callback, event)
+
+    async def _invoke(self, callback: Callable, event: GameEvent) -> None:
+        """콜백 실행 (에러 격리 + 처리 시간 기록)"""
+        started = time.perf_counter()
+        failed = False
+        try:
+            await callback(event)
+        except Exception as e:
+            failed = True
+            logger.error(
+                f"Error in event callback {subscriber_name(callback)} for {event.type.value}: {e}",
+                exc_info=True
+            )
+        finally:
+            self._get_metrics(callback).record(time.perf_counter() - started, failed)
+
+    async def _enqueue(self, callback: Callable, event: GameEvent) -> None:
+        """구독자 큐에 이벤트 추가 (백프레셔 정책 적용)"""
+        channel = self._channels.get(callback)
+        if channel is None:
+            channel = _SubscriberChannel(
+                callback, self._shard_count, self._queue_size, self._get_metrics(callback)
+            )
+            channel.start(self._invoke)
+            self._channels[callback] = channel
+
+        queue = channel.queue_for(event.user_id)
+
+        if self._policy == BackpressurePolicy.BLOCK:
+            await queue.put(event)
+            return
+
+        if queue.full():
+            channel.metrics.dropped += 1
+            if self._policy == BackpressurePolicy.DROP_NEWEST:
+                logger.warning(f"Event dropped (queue full): {subscriber_name(callback)} <- {event.type.value}")
+                return
+            # DROP_OLDEST
+            dropped = queue.get_nowait()
+            queue.task_done()
+            logger.warning(f"Event dropped (queue full): {subscriber_name(callback)} <- {dropped.type.value}")
+
+        queue.put_nowait(event)
+
+    def _get_metrics(self, callback: Callable) -> SubscriberMetrics:
+        metrics = self._metrics.get(callback)
+        if metrics is None:
+            metrics = SubscriberMetrics()
+            self._metrics[callback] = metrics
+        return metrics
+
+    def get_metrics(self) -> Dict[str, SubscriberMetrics]:
+        """
+        구독자별 처리 지표 조회
+
+        Returns:
+            구독자 이름(subscriber_name) → SubscriberMetrics (queue_depth는 조회 시점 값)
+        """
+        result = {}
+        for callback, metrics in self._metrics.items():
+            channel = self._channels.get(callback)
+            metrics.queue_depth = channel.depth if channel else 0
+            result[subscriber_name(callback)] = metrics
+        return result
 
     def get_subscriber_count(self, event_type: GameEventType) -> int:
         """
@@ -158,6 +398,10 @@ class EventBus:
         return len(self._subscribers.get(event_type, []))
 
     def clear_all_subscribers(self) -> None:
-        """모든 구독자 제거 (테스트용)"""
+        """모든 구독자 제거 (테스트용, 큐 워커도 함께 정지)"""
+        for channel in self._channels.values():
+            channel.stop()
+        self._channels.clear()
         self._subscribers.clear()
+        self._metrics.clear()
         logger.info("All subscribers cleared")
@@ -88,6 +88,7 @@ async def distribute_rewards(
         참가자별 보상 {user_id: {"exp": int, "gold": int}}
     """
     from models import User
+    from service.economy.currency_ledger import currency_ledger
 
     rewards = {}
 
@@ -162,37 +163,24 @@ async def distribute_rewards(
             final_exp = max(final_exp, 1)
             final_gold = max(final_gold, 1)
 
-        # 보상 지급 (트랜잭션으로 원자성 보장)
-        try:
-            from tortoise.transactions import in_transaction
-
-            async with in_transaction() as conn:
-                # User 엔티티 가져오기
-                if user_id == session.user_id:
-                    user = session.user
-                else:
-                    user = session.participants.get(user_id)
-
-                if not user:
-                    user = await User.get_or_none(discord_id=user_id, using_db=conn)
-
-                if user:
-                    # 경험치 및 골드 추가
-                    user.exp += final_exp
-                    user.gold += final_gold
-                    await user.save(using_db=conn)
-
-                    # DB 저장 성공 시에만 rewards에 추가
-                    rewards[user_id] = {"exp": final_exp, "gold": final_gold}
-
-                    logger.info(
-                        f"Reward distributed: user={user_id}, "
-                        f"exp={final_exp}, gold={final_gold}, share={share:.2%}"
-                    )
-                else:
-                    logger.warning(f"User not found for reward distribution: {user_id}")
-        except Exception as e:
-            logger.error(f"Failed to distribute reward to {user_id}: {e}", exc_info=True)
-            # 트랜잭션 실패 시 자동 롤백되며, rewards에 추가되지 않음
+        # 보상 누적 (전투마다 쓰지 않고 세션 종료/주기적 flush에서 유저당 1회 반영)
+        if user_id == session.user_id:
+            user = session.user
+        else:
+            user = session.participants.get(user_id)
+
+        if not user:
+            user = await User.get_or_none(discord_id=user_id)
+
+        if user:
+            currency_ledger.add(user, gold=final_gold, exp=final_exp)
+            rewards[user_id] = {"exp": final_exp, "gold": final_gold}
+
+            logger.info(
+                f"Reward distributed: user={user_id}, "
+                f"exp={final_exp}, gold={final_gold}, share={share:.2%}"
+            )
+        else:
+            logger.warning(f"User not found for reward distribution: {user_id}")
 
     return rewards
@@ -19,6 +19,7 @@ from exceptions import (
     InterventionNotAllowedError,
 )
 from config.multiplayer import PARTY
+from service.economy.currency_ledger import apply_currency_delta, publish_gold_changed
 from service.session import DungeonSession
 from models import User
 
@@ -67,19 +68,24 @@ class InterventionService:
             target_session.user.level
         )
 
-        # Phase 2: 근접도 계산 및 저장
-        from service.session import get_session
+        # Phase 2: 근접도 계산 및 저장 (세션 위치 인덱스로 같은 던전 ±NEARBY 스텝 이내인지 확인)
+        from config.voice_channel import VOICE_CHANNEL
+        from service.session import get_nearby_sessions
         from service.voice_channel.proximity_calculator import ProximityCalculator
         from service.notification.proximity_reward_calculator import get_intervention_cost
 
-        requester_session = get_session(requester_id)
-        if requester_session and requester_session.dungeon:
+        nearby = {
+            s.user_id: s
+            for s in get_nearby_sessions(target_session, VOICE_CHANNEL.PROXIMITY_NEARBY_STEPS)
+        }
+        requester_session = nearby.get(requester_id)
+        if requester_session:
             distance = ProximityCalculator.calculate_distance(
                 target_session.exploration_step,
                 requester_session.exploration_step
             )
         else:
-            distance = 999  # 던전 미진입 시 최대 거리 취급
+            distance = 999  # 원거리/다른 던전/던전 미진입은 최대 거리 취급
 
         target_session.intervention_distances[requester_id] = distance
         cost = get_intervention_cost(distance)
@@ -88,7 +94,8 @@ class InterventionService:
         target_session.intervention_pending[requester_id] = time.time()
 
         # 응답 메시지
-        response_msg = f"✅ 다음 라운드에 전투에 참여합니다!\n💰 비용: {cost}G (거리: {distance}걸음)"
+        distance_text = f"{distance}걸음" if requester_session else "원거리"
+        response_msg = f"✅ 다음 라운드에 전투에 참여합니다!\n💰 비용: {cost}G (거리: {distance_text})"
         if warning_msg:
             response_msg += f"\n\n{warning_msg}"
 
@@ -232,6 +239,7 @@ class InterventionService:
 
                 distance = session.intervention_distances.get(user_id, 999)
                 cost = get_intervention_cost(distance)
+                ledger_result = None
 
                 # 트랜잭션으로 골드 차감 및 참가자 추가 원자적 처리
                 async with in_transaction() as conn:
@@ -249,21 +257,14 @@ class InterventionService:
                                 del session.intervention_distances[user_id]
                             continue
 
-                        user.gold -= cost
-                        await user.save(using_db=conn)
+                        ledger_result = await apply_currency_delta(
+                            user, gold=-cost, using_db=conn, publish=False
+                        )
                         logger.info(f"Intervention cost deducted: {user_id} paid {cost}G (distance={distance})")
 
-                    # 트랜잭션 성공 후 전투 초기화 (런타임 필드 + 스킬 덱)
-                    if not hasattr(user, 'status') or user.status is None:
-                        user._init_runtime_fields()
-
-                    # 스킬 덱 로드
-                    from service.skill.skill_deck_service import SkillDeckService
-                    await SkillDeckService.load_deck_to_user(user)
-
-                    # 장비 스탯 로드
-                    from service.item.equipment_service import EquipmentService
-                    await EquipmentService.apply_equipment_stats(user)
+                    # 트랜잭션 성공 후 전투 초기화 (런타임 필드 + 스킬 덱 + 장비 스탯)
+                    from service.player.player_loadout import hydrate_user_loadout
+                    await hydrate_user_loadout(user)
 
                     # participants에 추가 (트랜잭션 성공 후에만)
                     session.participants[user_id] = user
@@ -287,6 +288,9 @@ class InterventionService:
                         f"round={context.round_number}"
                     )
 
+                if ledger_result:
+                    await publish_gold_changed(ledger_result)
+
             except Exception as e:
                 logger.error(f"Failed to process intervention for {user_id}: {e}", exc_info=True)
                 # 트랜잭션 실패 시 자동 롤백됨
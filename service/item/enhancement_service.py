@@ -17,7 +17,8 @@ from exceptions import (
     InsufficientGoldError,
     CombatRestrictionError,
 )
-from config import ENHANCEMENT
+from config import ENHANCEMENT, ENHANCEMENT_SUCCESS_RATES, ENHANCEMENT_COST_GRADE_MULTIPLIERS
+from service.economy.progression_tables import enhancement_cost, enhancement_success_rate
 from service.session import get_session
 
 logger = logging.getLogger(__name__)
@@ -47,33 +48,14 @@ class EnhancementAttempt:
 class EnhancementService:
     """아이템 강화 서비스"""
 
-    # 강화 성공률 (레벨 범위별)
-    SUCCESS_RATES = {
-        (0, 3): 1.0,    # +0~3: 100%
-        (4, 6): 0.8,    # +4~6: 80%
-        (7, 9): 0.6,    # +7~9: 60%
-        (10, 12): 0.4,  # +10~12: 40%
-        (13, 15): 0.2,  # +13~15: 20%
-    }
-
-    GRADE_MULTIPLIERS = {
-        1: 0.5,   # D등급
-        2: 0.8,   # C등급
-        3: 1.0,   # B등급
-        4: 1.5,   # A등급
-        5: 2.0,   # S등급
-        6: 3.0,   # SS등급
-        7: 5.0,   # SSS등급
-        8: 10.0,  # 신화등급
-    }
+    # 강화 성공률 (레벨 범위별) / 등급별 비용 배율 - 조회는 progression_tables의 사전 계산 배열 사용
+    SUCCESS_RATES = ENHANCEMENT_SUCCESS_RATES
+    GRADE_MULTIPLIERS = ENHANCEMENT_COST_GRADE_MULTIPLIERS
 
     @staticmethod
     def _get_success_rate(current_level: int) -> float:
         """강화 성공률 조회"""
-        for (min_lvl, max_lvl), rate in EnhancementService.SUCCESS_RATES.items():
-            if min_lvl <= current_level <= max_lvl:
-                return rate
-        return 0.0
+        return enhancement_success_rate(current_level)
 
     @staticmethod
     def _calculate_cost(grade_id: int, current_level: int) -> int:
@@ -87,10 +69,7 @@ class EnhancementService:
         Returns:
             필요 골드
         """
-        grade_mult = EnhancementService.GRADE_MULTIPLIERS.get(grade_id, 1.0)
-        level_mult = 1.0 + (current_level * ENHANCEMENT.COST_PER_LEVEL_MULTIPLIER)
-        cost = int(ENHANCEMENT.BASE_COST * grade_mult * level_mult)
-        return cost
+        return enhancement_cost(grade_id, current_level)
 
     @staticmethod
     async def get_enhancement_info(
@@ -254,10 +233,10 @@ class EnhancementService:
 
         # 트랜잭션 시작: 골드 차감 및 강화 시도를 원자적으로 처리
         from tortoise import transactions
+        from service.economy.currency_ledger import apply_currency_delta, publish_gold_changed
 
-        async with transactions.in_transaction():
-            user.gold -= cost
-            await user.save()
+        async with transactions.in_transaction() as conn:
+            cost_result = await apply_currency_delta(user, gold=-cost, using_db=conn, publish=False)
 
             # 성공률 조회 (축복/저주 보정)
             success_rate = EnhancementService._get_success_rate(current_level)
@@ -325,6 +304,12 @@ class EnhancementService:
                         inv_item.enhancement_level = 0
                         await inv_item.save()
 
+        await publish_gold_changed(cost_result)
+
+        if new_level != current_level or item_destroyed:
+            from service.item.equipment_snapshot import invalidate_equipment_snapshot
+            invalidate_equipment_snapshot(user.id)
+
         logger.info(
             f"User {user.id} enhancement attempt: {inv_item.item.name} "
             f"+{current_level} → +{new_level} ({result_type}), cost={cost}"
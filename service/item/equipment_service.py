@@ -19,11 +19,11 @@ from exceptions import (
     StatRequirementError,
 )
 from service.session import get_session
-from service.tower.tower_restriction import enforce_equipment_change_restriction
-from service.item.equipment_component_loader import (
-    load_equipment_components,
-    get_equipment_passive_stats
+from service.item.equipment_snapshot import (
+    get_equipment_snapshot,
+    invalidate_equipment_snapshot,
 )
+from service.tower.tower_restriction import enforce_equipment_change_restriction
 
 logger = logging.getLogger(__name__)
 
@@ -112,6 +112,7 @@ class EquipmentService:
         )
 
         logger.info(f"User {user.id} equipped item {inv_item.item.id} in slot {slot.name}")
+        invalidate_equipment_snapshot(user.id)
         await EquipmentService.apply_equipment_stats(user)
         return equipped
 
@@ -150,6 +151,7 @@ class EquipmentService:
         deleted = await UserEquipment.filter(user=user, slot=slot).delete()
         if deleted:
             logger.info(f"User {user.id} unequipped slot {slot.name}")
+            invalidate_equipment_snapshot(user.id)
             await EquipmentService.apply_equipment_stats(user)
         return deleted > 0
 
@@ -193,101 +195,16 @@ class EquipmentService:
         """
         장착 장비 스탯 합산 (장비 * 등급 배율 + 강화 + 특수효과 + 세트 효과)
 
+        장비 스냅샷(equipment_snapshot)을 사용하므로 장착/해제/강화 이후가 아니면 DB를 조회하지 않습니다.
+
         Args:
             user: 대상 사용자
 
         Returns:
             스탯 딕셔너리
         """
-        from service.item.set_detection_service import SetDetectionService
-        from service.item.grade_service import GradeService
-
-        equipped = await UserEquipment.filter(user=user).prefetch_related(
-            "inventory_item__item"
-        )
-
-        total_stats = {
-            "hp": 0,
-            "attack": 0,
-            "ap_attack": 0,
-            "ad_defense": 0,
-            "ap_defense": 0,
-            "speed": 0
-        }
-
-        # 모든 장비의 컴포넌트를 수집
-        all_components = []
-
-        for eq in equipped:
-            equipment = await EquipmentItem.get_or_none(
-                item=eq.inventory_item.item
-            )
-            if not equipment:
-                continue
-
-            # 인스턴스 등급 배율
-            grade_mult = GradeService.get_stat_multiplier(
-                eq.inventory_item.instance_grade
-            )
-
-            # 기본 스탯 * 등급 배율
-            base_stats = {
-                "hp": int(equipment.hp * grade_mult) if equipment.hp else 0,
-                "attack": int(equipment.attack * grade_mult) if equipment.attack else 0,
-                "ap_attack": int(equipment.ap_attack * grade_mult) if equipment.ap_attack else 0,
-                "ad_defense": int(equipment.ad_defense * grade_mult) if equipment.ad_defense else 0,
-                "ap_defense": int(equipment.ap_defense * grade_mult) if equipment.ap_defense else 0,
-                "speed": int(equipment.speed * grade_mult) if equipment.speed else 0,
-            }
-
-            for stat_key, base_val in base_stats.items():
-                total_stats[stat_key] += base_val
-
-            # 강화 보너스 (등급 적용 후 기준, 5% per level)
-            enhancement = eq.inventory_item.enhancement_level
-            if enhancement > 0:
-                bonus_mult = enhancement * 0.05
-                for stat_key, base_val in base_stats.items():
-                    total_stats[stat_key] += int(base_val * bonus_mult)
-
-            # 베이스 아이템 컴포넌트 로드 (EquipmentItem.config에서)
-            if equipment.config:
-                components = load_equipment_components(equipment.config)
-                all_components.extend(components)
-
-            # 랜덤 특수 효과 컴포넌트 (A등급 이상 인스턴스)
-            if eq.inventory_item.special_effects:
-                # special_effects를 components 형식으로 변환
-                special_config = _convert_effects_to_components(
-                    eq.inventory_item.special_effects
-                )
-                if special_config:
-                    components = load_equipment_components(special_config)
-                    all_components.extend(components)
-
-        # 컴포넌트에서 스탯 추출
-        passive_stats = get_equipment_passive_stats(all_components)
-
-        # 퍼센트 기반 효과 계산
-        passive_stats = _apply_percent_bonuses(passive_stats, total_stats)
-
-        # 집계된 특수 효과 스탯을 total_stats에 병합
-        for stat_key, value in passive_stats.items():
-            total_stats[stat_key] = total_stats.get(stat_key, 0) + int(value)
-
-        # 세트 효과 보너스 적용
-        set_bonuses = await SetDetectionService.get_set_bonus_stats(user)
-        for stat, bonus in set_bonuses.items():
-            if stat not in total_stats:
-                continue
-            if isinstance(bonus, int):
-                total_stats[stat] += bonus
-            elif isinstance(bonus, float) and 0 < bonus < 1:
-                total_stats[stat] = int(total_stats[stat] * (1 + bonus))
-            else:
-                total_stats[stat] += int(bonus)
-
-        return total_stats
+        snapshot = await get_equipment_snapshot(user)
+        return dict(snapshot.stats)
 
     @staticmethod
     async def apply_equipment_stats(user: User) -> None:
@@ -0,0 +1,229 @@
+"""
+장비 스냅샷 - 유저별 장착 장비 스탯 사전 계산
+
+장착 인스턴스를 한 번의 조회(UserEquipment + UserInventory JOIN)로 가져오고,
+장비 정의/세트 효과는 정적 캐시(equipment_cache, set_ids_by_item_id, set_effects_by_set_id)에서
+찾아 스탯 합계와 전투용 컴포넌트 설정을 불변 객체로 만들어 둡니다.
+
+스냅샷은 장착/해제/강화 시에만 무효화되므로 던전 입장이나 정보 화면은
+DB 조회 1회(캐시 적중 시 0회)로 장비 스탯을 얻습니다.
+"""
+import logging
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
+
+from models import User
+from models.user_equipment import UserEquipment
+
+logger = logging.getLogger(__name__)
+
+EQUIPMENT_STAT_KEYS = ("hp", "attack", "ap_attack", "ad_defense", "ap_defense", "speed")
+
+ENHANCEMENT_BONUS_PER_LEVEL = 0.05
+"""강화 1단계당 스탯 보너스 (등급 적용 후 기준)"""
+
+
+@dataclass(frozen=True)
+class EquippedInstance:
+    """장착 중인 장비 인스턴스 (스냅샷 계산 입력)"""
+
+    slot: int
+    inventory_id: int
+    item_id: int
+    instance_grade: int = 0
+    enhancement_level: int = 0
+    special_effects: Optional[tuple] = None
+
+
+@dataclass(frozen=True)
+class EquipmentSnapshot:
+    """유저 한 명의 장비 효과 요약 (불변)"""
+
+    user_id: int
+    instances: tuple
+    """장착 인스턴스 (EquippedInstance)"""
+
+    stats: Mapping[str, int]
+    """장비 * 등급 + 강화 + 특수효과 + 세트 효과가 반영된 스탯 합계"""
+
+    set_bonuses: Mapping[str, float]
+    """활성 세트 효과 스탯 보너스 합계"""
+
+    component_configs: tuple
+    """장비 정의 config (전투 시작 시 컴포넌트 생성용)"""
+
+    @property
+    def item_ids(self) -> list[int]:
+        """장착 아이템 ID 목록"""
+        return [instance.item_id for instance in self.instances]
+
+    def create_components(self) -> list:
+        """
+        전투용 장비 컴포넌트 생성
+
+        컴포넌트는 전투 중 상태(연쇄 횟수 등)를 가지므로 호출마다 새 인스턴스를 만듭니다.
+        """
+        from service.item.equipment_component_loader import load_equipment_components
+
+        components = []
+        for config in self.component_configs:
+            components.extend(load_equipment_components(config))
+        return components
+
+
+_snapshots: dict[int, EquipmentSnapshot] = {}
+_generations: dict[int, int] = {}
+_epoch = 0
+
+
+async def get_equipment_snapshot(user: User) -> EquipmentSnapshot:
+    """
+    유저 장비 스냅샷 조회 (캐시 미스 시 장착 인스턴스 1회 조회 후 계산)
+
+    Args:
+        user: 대상 사용자
+
+    Returns:
+        EquipmentSnapshot
+    """
+    return await get_equipment_snapshot_by_user_id(user.id)
+
+
+async def get_equipment_snapshot_by_user_id(user_id: int) -> EquipmentSnapshot:
+    """
+    유저 ID로 장비 스냅샷 조회 (User 조회와 동시에 실행할 때 사용)
+
+    Args:
+        user_id: User.id
+
+    Returns:
+        EquipmentSnapshot
+    """
+    snapshot = _snapshots.get(user_id)
+    if snapshot is not None:
+        return snapshot
+
+    key = (_epoch, _generations.get(user_id, 0))
+    rows = await UserEquipment.filter(user_id=user_id).select_related("inventory_item")
+    snapshot = build_equipment_snapshot(user_id, [_to_instance(row) for row in rows])
+
+    # 조회 중 무효화되었다면 캐시에 남기지 않음
+    if key == (_epoch, _generations.get(user_id, 0)):
+        _snapshots[user_id] = snapshot
+    return snapshot
+
+
+def invalidate_equipment_snapshot(user_id: int) -> None:
+    """유저 장비 스냅샷 무효화 (장착/해제/강화 시 호출)"""
+    _snapshots.pop(user_id, None)
+    _generations[user_id] = _generations.get(user_id, 0) + 1
+
+
+def invalidate_all_equipment_snapshots() -> None:
+    """모든 장비 스냅샷 무효화 (장비/세트 정적 데이터 재로드 시)"""
+    global _epoch
+    _snapshots.clear()
+    _epoch += 1
+
+
+def _to_instance(row: UserEquipment) -> EquippedInstance:
+    inventory_item = row.inventory_item
+    effects = inventory_item.special_effects
+    return EquippedInstance(
+        slot=int(row.slot),
+        inventory_id=inventory_item.id,
+        item_id=inventory_item.item_id,
+        instance_grade=inventory_item.instance_grade or 0,
+        enhancement_level=inventory_item.enhancement_level or 0,
+        special_effects=tuple(effects) if effects else None,
+    )
+
+
+def build_equipment_snapshot(user_id: int, instances: List[EquippedInstance]) -> EquipmentSnapshot:
+    """
+    장착 인스턴스로부터 스냅샷 계산 (DB 조회 없음)
+
+    Args:
+        user_id: 유저 ID
+        instances: 장착 인스턴스 목록
+
+    Returns:
+        EquipmentSnapshot
+    """
+    from models.repos import static_cache
+    from service.item.equipment_component_loader import (
+        get_equipment_passive_stats,
+        load_equipment_components,
+    )
+    from service.item.equipment_service import (
+        _apply_percent_bonuses,
+        _convert_effects_to_components,
+    )
+    from service.item.grade_service import GradeService
+    from service.item.set_detection_service import SetDetectionService
+
+    total_stats = {key: 0 for key in EQUIPMENT_STAT_KEYS}
+    all_components = []
+    component_configs = []
+    equipped_item_ids = []
+
+    for instance in instances:
+        equipment = static_cache.equipment_cache.get(instance.item_id)
+        if not equipment:
+            continue
+        equipped_item_ids.append(instance.item_id)
+
+        # 기본 스탯 * 인스턴스 등급 배율
+        grade_mult = GradeService.get_stat_multiplier(instance.instance_grade)
+        base_stats = {}
+        for stat_key in EQUIPMENT_STAT_KEYS:
+            value = getattr(equipment, stat_key)
+            base_stats[stat_key] = int(value * grade_mult) if value else 0
+            total_stats[stat_key] += base_stats[stat_key]
+
+        # 강화 보너스
+        if instance.enhancement_level > 0:
+            bonus_mult = instance.enhancement_level * ENHANCEMENT_BONUS_PER_LEVEL
+            for stat_key, base_val in base_stats.items():
+                total_stats[stat_key] += int(base_val * bonus_mult)
+
+        # 베이스 아이템 컴포넌트
+        if equipment.config:
+            component_configs.append(equipment.config)
+            all_components.extend(load_equipment_components(equipment.config))
+
+        # 랜덤 특수 효과 컴포넌트 (A등급 이상 인스턴스)
+        if instance.special_effects:
+            special_config = _convert_effects_to_components(list(instance.special_effects))
+            if special_config:
+                all_components.extend(load_equipment_components(special_config))
+
+    passive_stats = get_equipment_passive_stats(all_components)
+    passive_stats = _apply_percent_bonuses(passive_stats, total_stats)
+    for stat_key, value in passive_stats.items():
+        total_stats[stat_key] = total_stats.get(stat_key, 0) + int(value)
+
+    set_bonuses = SetDetectionService.calculate_set_bonus_stats(equipped_item_ids)
+    _apply_set_bonuses(total_stats, set_bonuses)
+
+    return EquipmentSnapshot(
+        user_id=user_id,
+        instances=tuple(instances),
+        stats=MappingProxyType(total_stats),
+        set_bonuses=MappingProxyType(dict(set_bonuses)),
+        component_configs=tuple(component_configs),
+    )
+
+
+def _apply_set_bonuses(total_stats: Dict[str, Any], set_bonuses: Dict[str, float]) -> None:
+    """세트 효과 보너스 적용 (정수는 고정값, 0~1 실수는 비율)"""
+    for stat, bonus in set_bonuses.items():
+        if stat not in total_stats:
+            continue
+        if isinstance(bonus, int):
+            total_stats[stat] += bonus
+        elif isinstance(bonus, float) and 0 < bonus < 1:
+            total_stats[stat] = int(total_stats[stat] * (1 + bonus))
+        else:
+            total_stats[stat] += int(bonus)
@@ -7,6 +7,7 @@ import logging
 import random
 from typing import Optional
 
+from service.economy.progression_tables import grade_stat_multiplier
 from config.grade import (
     InstanceGrade,
     GRADE_TABLE,
@@ -105,14 +106,7 @@ class GradeService:
         Returns:
             스탯 배율 (1.0 ~ 3.0)
         """
-        if grade_id <= 0:
-            return 1.0
-
-        grade_info = get_grade_info(grade_id)
-        if not grade_info:
-            return 1.0
-
-        return grade_info.stat_multiplier
+        return grade_stat_multiplier(grade_id)
 
     @staticmethod
     def get_grade_display(grade_id: int) -> str:
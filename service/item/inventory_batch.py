@@ -0,0 +1,196 @@
+"""
+인벤토리 일괄 지급
+
+전투 보상처럼 한 번에 여러 아이템을 지급할 때 아이템마다 InventoryService.add_item
+트랜잭션을 열지 않고, 메모리에서 스택/슬롯을 계산한 뒤 commit()에서
+bulk_create 한 번과 기존 스택 증분 갱신으로 반영합니다.
+"""
+import logging
+from typing import Optional
+
+from tortoise.expressions import F
+from tortoise.transactions import in_transaction
+
+from config import INVENTORY
+from exceptions import InventoryFullError
+from models import Item, User
+from models.user_inventory import UserInventory
+from resources.item_emoji import ItemType
+from service.collection_service import CollectionService
+from service.event import EventBus, GameEvent, GameEventType
+
+logger = logging.getLogger(__name__)
+
+
+class InventoryBatch:
+    """
+    한 유저에 대한 인벤토리 지급 누적기
+
+    스택/슬롯 규칙은 InventoryService.add_item과 같습니다.
+    - 장비는 항상 새 슬롯
+    - 소모품/기타는 특수 효과/축복/저주가 없으면 같은 (아이템, 강화, 등급) 행에 스택
+    """
+
+    def __init__(self, user: User):
+        self.user = user
+        self._rows_loaded = False
+        self._slots_used = 0
+        self._stack_rows: dict[tuple[int, int, int], UserInventory] = {}
+        self._new_rows: list[UserInventory] = []
+        self._updated_rows: dict[int, UserInventory] = {}
+        self._increments: dict[int, int] = {}
+        self._new_items: list[tuple[Item, int]] = []
+
+    @property
+    def pending_count(self) -> int:
+        """반영 대기 중인 행 수 (새 슬롯 + 스택 갱신)"""
+        return len(self._new_rows) + len(self._updated_rows)
+
+    async def add(
+        self,
+        item: Item,
+        quantity: int = 1,
+        instance_grade: int = 0,
+        special_effects: Optional[list] = None,
+    ) -> UserInventory:
+        """
+        아이템 지급 예약
+
+        Args:
+            item: 지급할 아이템 (정적 캐시 객체)
+            quantity: 수량
+            instance_grade: 인스턴스 등급 (0=없음, 1=D ~ 8=신화)
+            special_effects: 특수 효과 리스트
+
+        Returns:
+            반영 예정 UserInventory 객체
+
+        Raises:
+            InventoryFullError: 새 슬롯이 필요한데 인벤토리가 가득 참
+        """
+        await self._load_rows()
+
+        stack_key = None
+        if item.type != ItemType.EQUIP and not special_effects:
+            stack_key = (item.id, 0, instance_grade)
+            existing = self._stack_rows.get(stack_key)
+            if existing is not None:
+                existing.quantity += quantity
+                if existing.pk is not None:
+                    self._updated_rows[existing.pk] = existing
+                    self._increments[existing.pk] = self._increments.get(existing.pk, 0) + quantity
+                return existing
+
+        if self._slots_used >= INVENTORY.MAX_SLOTS:
+            raise InventoryFullError(INVENTORY.MAX_SLOTS)
+
+        row = UserInventory(
+            user=self.user,
+            item=item,
+            quantity=quantity,
+            instance_grade=instance_grade,
+            special_effects=special_effects,
+        )
+        self._slots_used += 1
+        self._new_rows.append(row)
+        self._new_items.append((item, quantity))
+        if stack_key is not None:
+            self._stack_rows[stack_key] = row
+        return row
+
+    async def commit(self) -> int:
+        """
+        누적된 지급을 한 트랜잭션으로 반영
+
+        기존 스택은 지급 수량만큼 증분으로 갱신하므로, 조회 이후(또는 실패 후 재시도 전)
+        사용/판매된 수량을 덮어쓰지 않습니다. 그 사이 삭제된 스택은 지급분으로 새 행을 만듭니다.
+        도감 등록과 ITEM_OBTAINED 이벤트 발행은 반영 후에 처리합니다.
+        반영에 실패하면 누적분을 그대로 되돌려 두므로 다시 commit()할 수 있습니다.
+
+        Returns:
+            반영한 행 수
+        """
+        new_rows = self._new_rows
+        updated_rows = list(self._updated_rows.values())
+        increments = self._increments
+        new_items = self._new_items
+        self._new_rows = []
+        self._updated_rows = {}
+        self._increments = {}
+        self._new_items = []
+
+        if not new_rows and not updated_rows:
+            return 0
+
+        recreated = []
+        try:
+            async with in_transaction():
+                for row in updated_rows:
+                    updated = await UserInventory.filter(id=row.pk).update(
+                        quantity=F("quantity") + increments[row.pk]
+                    )
+                    if not updated:
+                        recreated.append(UserInventory(
+                            user=self.user,
+                            item_id=row.item_id,
+                            quantity=increments[row.pk],
+                            enhancement_level=row.enhancement_level,
+                            instance_grade=row.instance_grade,
+                        ))
+                if new_rows or recreated:
+                    await UserInventory.bulk_create(new_rows + recreated)
+        except Exception:
+            self._restore(new_rows, updated_rows, increments, new_items)
+            raise
+
+        # 삭제되어 다시 만든 스택은 이후 지급이 옛 행에 쌓이지 않도록 스택 대상에서 제외
+        for row in recreated:
+            self._stack_rows.pop((row.item_id, row.enhancement_level, row.instance_grade), None)
+
+        item_ids = {row.item_id for row in new_rows} | {row.item_id for row in updated_rows}
+        for item_id in item_ids:
+            await CollectionService.register_item(self.user, item_id)
+
+        event_bus = EventBus()
+        for item, quantity in new_items:
+            await event_bus.publish(GameEvent(
+                type=GameEventType.ITEM_OBTAINED,
+                user_id=self.user.id,
+                data={
+                    "item_id": item.id,
+                    "item_name": item.name,
+                    "item_type": item.type.value if hasattr(item, "type") else None,
+                    "quantity": quantity
+                }
+            ))
+
+        logger.info(
+            f"Inventory batch committed for user {self.user.id}: "
+            f"{len(new_rows)} new, {len(updated_rows)} stacked"
+        )
+        return len(new_rows) + len(updated_rows)
+
+    def _restore(self, new_rows: list, updated_rows: list, increments: dict, new_items: list) -> None:
+        """반영 실패한 누적분을 되돌림 (그 사이 추가된 지급 앞에 배치)"""
+        for row in new_rows:
+            # 롤백된 INSERT로 받은 ID가 있으면 제거
+            row.pk = None
+        self._new_rows = new_rows + self._new_rows
+        for row in updated_rows:
+            self._updated_rows.setdefault(row.pk, row)
+            self._increments[row.pk] = increments[row.pk] + self._increments.get(row.pk, 0)
+        self._new_items = new_items + self._new_items
+
+    async def _load_rows(self) -> None:
+        """유저 인벤토리를 한 번만 조회하여 슬롯 수와 스택 대상 행 파악"""
+        if self._rows_loaded:
+            return
+        self._rows_loaded = True
+
+        rows = await UserInventory.filter(user=self.user)
+        self._slots_used = len(rows)
+        for row in rows:
+            if row.is_blessed or row.is_cursed:
+                continue
+            key = (row.item_id, row.enhancement_level, row.instance_grade)
+            self._stack_rows.setdefault(key, row)
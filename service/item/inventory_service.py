@@ -17,6 +17,7 @@ from exceptions import (
 from config import INVENTORY
 from service.collection_service import CollectionService
 from service.event import EventBus, GameEvent, GameEventType
+from service.item.equipment_snapshot import invalidate_equipment_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -157,6 +158,9 @@ class InventoryService:
         inv_item.quantity -= quantity
         if inv_item.quantity <= 0:
             await inv_item.delete()
+            # 장착 중이던 장비면 UserEquipment도 CASCADE 삭제되므로 스냅샷 무효화
+            if inv_item.item.type == ItemType.EQUIP:
+                invalidate_equipment_snapshot(user.id)
             logger.info(f"Removed all of item {item_id} from user {user.id}")
         else:
             await inv_item.save()
@@ -275,6 +279,8 @@ class InventoryService:
             raise ItemNotFoundError(inventory_id)
 
         await inv_item.delete()
+        # 장착 중이던 항목이면 UserEquipment도 CASCADE 삭제됨
+        invalidate_equipment_snapshot(user.id)
         logger.info(f"Deleted inventory item {inventory_id} from user {user.id}")
         return True
 
@@ -297,6 +303,8 @@ class InventoryService:
             id__in=inventory_ids,
             user=user
         ).delete()
+        if deleted_count:
+            invalidate_equipment_snapshot(user.id)
 
         logger.info(f"Batch deleted {deleted_count} items from user {user.id}")
         return deleted_count
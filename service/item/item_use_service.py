@@ -229,8 +229,9 @@ class ItemUseService:
         else:
             await inv_item.save()
 
-        # 유저 저장
-        await user.save()
+        # 유저 저장 (골드/경험치는 원장으로만 반영하므로 제외)
+        from service.economy.currency_ledger import save_user_state
+        await save_user_state(user)
 
         logger.info(
             f"User {user.id} used consumable {item.id} ({item.name}): {effect_desc}"
@@ -521,8 +522,8 @@ class ItemUseService:
             # 골드 지급
             gold_gained = ItemUseService._calculate_chest_gold(user.level, "normal")
             gold_gained = int(gold_gained * box_config.gold_multiplier)
-            user.gold += gold_gained
-            await user.save()
+            from service.economy.currency_ledger import apply_currency_delta
+            await apply_currency_delta(user, gold=gold_gained)
             effect_desc = f"골드 +{gold_gained}"
 
         elif selected_type == BoxRewardType.EQUIPMENT:
@@ -2,13 +2,16 @@
 SetDetectionService
 
 장착된 장비를 기반으로 활성 세트 효과를 감지합니다.
+
+세트 정의(SetItem/SetItemMember/SetEffect)는 static_cache의 세트 카탈로그에서 조회하므로
+아이템 ID 목록을 받는 함수들은 DB 조회 없이 동기로 호출할 수 있습니다 (전투/UI 공용).
 """
 import logging
-from typing import List, Dict, Tuple
+from typing import List, Dict, Iterable, Tuple
 from collections import defaultdict
 
-from models import User, SetItem, SetItemMember, SetEffect
-from models.user_equipment import UserEquipment
+from models import User, SetEffect
+from models.repos.static_cache import get_set_effects, get_set_ids_by_item, get_set_item
 
 logger = logging.getLogger(__name__)
 
@@ -17,74 +20,93 @@ class SetDetectionService:
     """세트 아이템 감지 및 효과 적용 서비스"""
 
     @staticmethod
-    async def detect_active_sets(user: User) -> List[SetEffect]:
+    def count_set_pieces(item_ids: Iterable[int]) -> Dict[int, int]:
         """
-        사용자가 장착한 장비로부터 활성화된 세트 효과 감지
+        세트별 장착 개수 집계 (같은 아이템 중복 장착은 1개로 계산)
 
         Args:
-            user: 사용자
+            item_ids: 장착 아이템 ID 목록
 
         Returns:
-            활성화된 세트 효과 리스트 (2세트, 4세트 등)
+            {세트 ID: 장착 개수}
         """
-        # 1. 장착된 장비 조회
-        equipped_items = await UserEquipment.filter(
-            user=user
-        ).prefetch_related("inventory_item__item")
+        set_counts: Dict[int, int] = defaultdict(int)
+        for item_id in set(item_ids):
+            for set_id in get_set_ids_by_item(item_id):
+                set_counts[set_id] += 1
+        return dict(set_counts)
 
-        if not equipped_items:
-            return []
+    @staticmethod
+    def find_active_set_effects(item_ids: Iterable[int]) -> List[SetEffect]:
+        """
+        장착 아이템 ID 목록으로 활성 세트 효과 감지
 
-        # 2. 장비 ID 추출
-        equipped_ids = []
-        for user_equip in equipped_items:
-            if user_equip.inventory_item and user_equip.inventory_item.item:
-                # EquipmentItem ID가 필요하므로 item_id로 조회
-                equipped_ids.append(user_equip.inventory_item.item.id)
+        Args:
+            item_ids: 장착 아이템 ID 목록
 
-        if not equipped_ids:
-            return []
+        Returns:
+            활성화된 세트 효과 리스트 (세트별 pieces_required 오름차순)
+        """
+        active_effects = []
+        for set_id, count in SetDetectionService.count_set_pieces(item_ids).items():
+            active_effects.extend(_active_effects_of(set_id, count))
+        return active_effects
 
-        # 3. 세트 구성원 정보 조회 (장착된 아이템들이 속한 세트 찾기)
-        # EquipmentItem을 item_id로 조회
-        from models import EquipmentItem
-        equipment_items = await EquipmentItem.filter(
-            item_id__in=equipped_ids
-        ).prefetch_related("item")
+    @staticmethod
+    def calculate_set_bonus_stats(item_ids: Iterable[int]) -> Dict[str, float]:
+        """
+        장착 아이템 ID 목록으로 세트 스탯 보너스 계산
 
-        equipment_item_ids = [eq.id for eq in equipment_items]
+        Args:
+            item_ids: 장착 아이템 ID 목록
 
-        if not equipment_item_ids:
-            return []
+        Returns:
+            스탯 보너스 딕셔너리 (key: 스탯 이름, value: 보너스 값)
+        """
+        total_bonuses: Dict[str, float] = defaultdict(float)
+        for effect in SetDetectionService.find_active_set_effects(item_ids):
+            for stat, value in effect.get_stat_bonuses().items():
+                total_bonuses[stat] += value
+        return dict(total_bonuses)
 
-        set_members = await SetItemMember.filter(
-            equipment_item_id__in=equipment_item_ids
-        ).prefetch_related("set_item")
+    @staticmethod
+    def summarize_sets(item_ids: Iterable[int]) -> List[Tuple[str, int, List[str]]]:
+        """
+        장착 아이템 ID 목록으로 세트 장착 상황 요약
 
-        if not set_members:
-            return []
+        Args:
+            item_ids: 장착 아이템 ID 목록
 
-        # 4. 세트별 장착 개수 카운트
-        set_counts: Dict[int, int] = defaultdict(int)
-        for member in set_members:
-            set_counts[member.set_item_id] += 1
+        Returns:
+            [(세트 이름, 장착 개수, [활성 효과 설명])] 리스트
+        """
+        summaries = []
+        for set_id, count in SetDetectionService.count_set_pieces(item_ids).items():
+            set_item = get_set_item(set_id)
+            if not set_item:
+                continue
+            effect_descs = [
+                f"{e.pieces_required}세트: {e.effect_description}"
+                for e in _active_effects_of(set_id, count)
+            ]
+            summaries.append((set_item.name, count, effect_descs))
+        return summaries
 
-        # 5. 활성화된 세트 효과 조회
-        active_effects = []
-        for set_id, count in set_counts.items():
-            # 해당 세트의 모든 효과 조회
-            effects = await SetEffect.filter(
-                set_item_id=set_id,
-                pieces_required__lte=count  # 필요 개수 이하인 효과만
-            ).order_by("pieces_required")
+    @staticmethod
+    async def detect_active_sets(user: User) -> List[SetEffect]:
+        """
+        사용자가 장착한 장비로부터 활성화된 세트 효과 감지
 
-            active_effects.extend(effects)
+        Args:
+            user: 사용자
 
-        logger.debug(
-            f"User {user.id} has {len(active_effects)} active set effects "
-            f"from {len(set_counts)} sets"
-        )
+        Returns:
+            활성화된 세트 효과 리스트 (2세트, 4세트 등)
+        """
+        item_ids = await _get_equipped_item_ids(user)
+        active_effects = SetDetectionService.find_active_set_effects(item_ids)
 
+        logger.debug(f"User {user.id} has {len(active_effects)} active set effects")
         return active_effects
 
     @staticmethod
@@ -98,20 +120,10 @@ class SetDetectionService:
         Returns:
             스탯 보너스 딕셔너리 (key: 스탯 이름, value: 보너스 값)
         """
-        active_effects = await SetDetectionService.detect_active_sets(user)
-
-        if not active_effects:
-            return {}
+        from service.item.equipment_snapshot import get_equipment_snapshot
 
-        # 모든 활성 효과의 스탯 보너스 합산
-        total_bonuses: Dict[str, float] = defaultdict(float)
-
-        for effect in active_effects:
-            bonuses = effect.get_stat_bonuses()
-            for stat, value in bonuses.items():
-                total_bonuses[stat] += value
-
-        return dict(total_bonuses)
+        snapshot = await get_equipment_snapshot(user)
+        return dict(snapshot.set_bonuses)
 
     @staticmethod
     async def get_set_summary(user: User) -> List[Tuple[str, int, List[str]]]:
@@ -124,65 +136,23 @@ class SetDetectionService:
         Returns:
             [(세트 이름, 장착 개수, [활성 효과 설명])] 리스트
         """
-        # 장착된 장비 조회
-        equipped_items = await UserEquipment.filter(
-            user=user
-        ).prefetch_related("inventory_item__item")
-
-        if not equipped_items:
-            return []
-
-        equipped_ids = []
-        for user_equip in equipped_items:
-            if user_equip.inventory_item and user_equip.inventory_item.item:
-                equipped_ids.append(user_equip.inventory_item.item.id)
-
-        if not equipped_ids:
-            return []
-
-        # EquipmentItem 조회
-        from models import EquipmentItem
-        equipment_items = await EquipmentItem.filter(
-            item_id__in=equipped_ids
-        ).prefetch_related("item")
-
-        equipment_item_ids = [eq.id for eq in equipment_items]
+        item_ids = await _get_equipped_item_ids(user)
+        return SetDetectionService.summarize_sets(item_ids)
 
-        if not equipment_item_ids:
-            return []
 
-        # 세트 구성원 조회
-        set_members = await SetItemMember.filter(
-            equipment_item_id__in=equipment_item_ids
-        ).prefetch_related("set_item")
+def _active_effects_of(set_id: int, count: int) -> List[SetEffect]:
+    """세트 효과 중 장착 개수로 활성화된 효과 (pieces_required 오름차순 목록 앞부분)"""
+    active = []
+    for effect in get_set_effects(set_id):
+        if effect.pieces_required > count:
+            break
+        active.append(effect)
+    return active
 
-        if not set_members:
-            return []
 
-        # 세트별 카운트
-        set_counts: Dict[int, int] = defaultdict(int)
-        set_names: Dict[int, str] = {}
-
-        for member in set_members:
-            set_id = member.set_item_id
-            set_counts[set_id] += 1
-            if set_id not in set_names:
-                set_names[set_id] = member.set_item.name
-
-        # 각 세트별 활성 효과 설명 수집
-        summaries = []
-        for set_id, count in set_counts.items():
-            effects = await SetEffect.filter(
-                set_item_id=set_id,
-                pieces_required__lte=count
-            ).order_by("pieces_required")
+async def _get_equipped_item_ids(user: User) -> List[int]:
+    """장비 스냅샷에서 장착 아이템 ID 목록 조회"""
+    from service.item.equipment_snapshot import get_equipment_snapshot
 
-            effect_descs = [f"{e.pieces_required}세트: {e.effect_description}" for e in effects]
-
-            summaries.append((
-                set_names[set_id],
-                count,
-                effect_descs
-            ))
-
-        return summaries
+    snapshot = await get_equipment_snapshot(user)
+    return snapshot.item_ids
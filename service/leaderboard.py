@@ -0,0 +1,263 @@
+"""
+메모리 리더보드
+
+랭킹 화면을 열 때마다 users 테이블 전체를 정렬하거나 COUNT(*)를 돌리지 않도록
+레벨/골드/타워 순위를 정렬된 키 목록으로 메모리에 유지합니다.
+
+- 시작 시(또는 첫 조회 시) DB에서 한 번 채움
+- LEVEL_UP / EXP_OBTAINED / GOLD_CHANGED / FLOOR_CLEARED 이벤트로 해당 유저만 갱신
+- 이벤트가 없는 변경(관리자 수정, 경매 정산 등)은 주기적 reconcile()로 보정
+
+상위 N명 조회는 O(N), 내 순위 조회는 이진 탐색 O(log n)입니다.
+"""
+import asyncio
+import logging
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from typing import Optional
+
+from tortoise.exceptions import OperationalError
+
+from models import User, UserTowerProgress
+from service.event import EventBus, GameEvent, GameEventType
+from service.tower.tower_season_service import get_current_season
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LeaderboardProfile:
+    """순위 표시용 유저 정보"""
+
+    discord_id: int
+    username: str
+
+
+class Leaderboard:
+    """
+    점수 내림차순 정렬 리더보드
+
+    키는 (음수 점수 튜플, user_id) 오름차순으로 저장되어 bisect로 순위를 구합니다.
+    """
+
+    def __init__(self, name: str, share_ties: bool = True):
+        """
+        Args:
+            name: 리더보드 이름 (로그용)
+            share_ties: True면 같은 점수는 같은 순위 (경쟁 순위),
+                False면 user_id 순으로 순위를 나눔
+        """
+        self.name = name
+        self.share_ties = share_ties
+        self._keys: list[tuple] = []
+        self._scores: dict[int, tuple] = {}
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self._scores
+
+    def __iter__(self):
+        return iter(self._scores)
+
+    def get_score(self, user_id: int) -> Optional[tuple]:
+        """유저 점수 (없으면 None)"""
+        return self._scores.get(user_id)
+
+    def update(self, user_id: int, score: tuple) -> None:
+        """유저 점수 등록/갱신"""
+        old_score = self._scores.get(user_id)
+        if old_score == score:
+            return
+        if old_score is not None:
+            self._remove_key(user_id, old_score)
+        self._scores[user_id] = score
+        insort(self._keys, (_negate(score), user_id))
+
+    def remove(self, user_id: int) -> None:
+        """유저 제거"""
+        old_score = self._scores.pop(user_id, None)
+        if old_score is not None:
+            self._remove_key(user_id, old_score)
+
+    def replace_all(self, scores: dict[int, tuple]) -> None:
+        """전체 점수 교체 (DB 재동기화)"""
+        self._scores = dict(scores)
+        self._keys = sorted((_negate(score), user_id) for user_id, score in self._scores.items())
+
+    def top(self, limit: int) -> list[tuple[int, tuple]]:
+        """상위 limit명의 (user_id, 점수)"""
+        return [(user_id, self._scores[user_id]) for _, user_id in self._keys[:limit]]
+
+    def rank_of(self, user_id: int) -> int:
+        """
+        유저 순위 (1-based)
+
+        Returns:
+            순위 (리더보드에 없으면 0)
+        """
+        score = self._scores.get(user_id)
+        if score is None:
+            return 0
+        if self.share_ties:
+            return bisect_left(self._keys, (_negate(score),)) + 1
+        return bisect_left(self._keys, (_negate(score), user_id)) + 1
+
+    def _remove_key(self, user_id: int, score: tuple) -> None:
+        key = (_negate(score), user_id)
+        index = bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            del self._keys[index]
+
+
+def _negate(score: tuple) -> tuple:
+    return tuple(-value for value in score)
+
+
+class LeaderboardStore:
+    """
+    레벨/골드/타워 리더보드 묶음
+
+    레벨은 (레벨, 경험치), 골드는 (골드,), 타워는 현재 시즌의 (최고 층,) 점수입니다.
+    """
+
+    def __init__(self):
+        self.level = Leaderboard("level")
+        self.gold = Leaderboard("gold")
+        self.tower = Leaderboard("tower", share_ties=False)
+        self.tower_season: Optional[int] = None
+        self._profiles: dict[int, LeaderboardProfile] = {}
+        self._hydrated = False
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_hydrated(self) -> bool:
+        """DB에서 한 번 이상 채워졌는지 여부"""
+        return self._hydrated
+
+    def register(self, event_bus: EventBus) -> None:
+        """이벤트 구독 등록"""
+        event_bus.subscribe(GameEventType.LEVEL_UP, self.on_exp_changed)
+        event_bus.subscribe(GameEventType.EXP_OBTAINED, self.on_exp_changed)
+        event_bus.subscribe(GameEventType.GOLD_CHANGED, self.on_gold_changed)
+        event_bus.subscribe(GameEventType.FLOOR_CLEARED, self.on_floor_cleared)
+
+    def get_profile(self, user_id: int) -> Optional[LeaderboardProfile]:
+        """순위 표시용 유저 정보"""
+        return self._profiles.get(user_id)
+
+    async def ensure_hydrated(self) -> None:
+        """아직 채워지지 않았으면 DB에서 채움"""
+        if not self._hydrated:
+            await self.reconcile()
+
+    async def reconcile(self) -> int:
+        """
+        DB 기준으로 리더보드 재구성
+
+        Returns:
+            메모리 값과 달랐던 (리더보드, 유저) 수
+        """
+        async with self._lock:
+            rows = await User.all().values_list("id", "discord_id", "username", "level", "exp", "gold")
+            season_id = get_current_season()
+            try:
+                floors = await UserTowerProgress.filter(season_id=season_id).values_list(
+                    "user_id", "highest_floor_reached"
+                )
+            except OperationalError:
+                logger.warning("Tower ranking table not found; tower leaderboard left empty")
+                floors = []
+
+            level_scores = {}
+            gold_scores = {}
+            profiles = {}
+            for user_id, discord_id, username, level, exp, gold in rows:
+                profiles[user_id] = LeaderboardProfile(discord_id, username)
+                level_scores[user_id] = (level or 0, exp or 0)
+                gold_scores[user_id] = (gold or 0,)
+            tower_scores = {user_id: (floor or 0,) for user_id, floor in floors if user_id in profiles}
+
+            drift = 0
+            if self._hydrated:
+                drift += _count_drift(self.level, level_scores)
+                drift += _count_drift(self.gold, gold_scores)
+                if self.tower_season == season_id:
+                    drift += _count_drift(self.tower, tower_scores)
+
+            self._profiles = profiles
+            self.level.replace_all(level_scores)
+            self.gold.replace_all(gold_scores)
+            self.tower.replace_all(tower_scores)
+            self.tower_season = season_id
+            self._hydrated = True
+
+        if drift:
+            logger.info(f"Leaderboards reconciled: {len(profiles)} users, {drift} drifted entries")
+        else:
+            logger.debug(f"Leaderboards reconciled: {len(profiles)} users")
+        return drift
+
+    async def ensure_user(self, user_id: int) -> bool:
+        """
+        리더보드에 없는 유저(마지막 재동기화 이후 가입)를 DB에서 추가
+
+        Returns:
+            유저가 존재하면 True
+        """
+        if user_id in self.level:
+            return True
+        user = await User.get_or_none(id=user_id)
+        if user is None:
+            return False
+        self._track(user)
+        return True
+
+    def _track(self, user: User) -> None:
+        """User 객체 기준으로 레벨/골드 점수 갱신"""
+        self._profiles[user.id] = LeaderboardProfile(user.discord_id, user.username)
+        self.level.update(user.id, (user.level or 0, user.exp or 0))
+        self.gold.update(user.id, (user.gold or 0,))
+
+    async def on_exp_changed(self, event: GameEvent) -> None:
+        """레벨업/경험치 획득 이벤트 핸들러"""
+        if not self._hydrated or event.user_id not in self.level:
+            return
+        level, exp = self.level.get_score(event.user_id)
+        level = event.data.get("new_level", event.data.get("level", level))
+        exp = event.data.get("total_exp", exp)
+        self.level.update(event.user_id, (level, exp))
+
+    async def on_gold_changed(self, event: GameEvent) -> None:
+        """보유 골드 변경 이벤트 핸들러"""
+        if not self._hydrated or event.user_id not in self.gold:
+            return
+        current_gold = event.data.get("current_gold")
+        if current_gold is not None:
+            self.gold.update(event.user_id, (current_gold,))
+
+    async def on_floor_cleared(self, event: GameEvent) -> None:
+        """타워 층 클리어 이벤트 핸들러"""
+        if not self._hydrated or event.user_id not in self._profiles:
+            return
+        season_id = event.data.get("season_id")
+        if season_id != self.tower_season:
+            # 시즌이 바뀌면 다음 재동기화까지 새 시즌 기록만 쌓음
+            self.tower.replace_all({})
+            self.tower_season = season_id
+        highest_floor = event.data.get("highest_floor", 0)
+        current = self.tower.get_score(event.user_id)
+        if current is None or highest_floor > current[0]:
+            self.tower.update(event.user_id, (highest_floor,))
+
+
+def _count_drift(board: Leaderboard, scores: dict[int, tuple]) -> int:
+    """DB 점수와 다른 메모리 항목 수"""
+    drift = sum(1 for user_id, score in scores.items() if board.get_score(user_id) != score)
+    drift += sum(1 for user_id in board if user_id not in scores)
+    return drift
+
+
+# 전역 리더보드
+leaderboards = LeaderboardStore()
@@ -9,7 +9,9 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 
 from models.mail import Mail, MailType
-from models.users import User
+from tortoise.transactions import in_transaction
+
+from service.economy.currency_ledger import apply_currency_delta, publish_gold_changed
 from .exceptions import (
     MailNotFoundError,
     AlreadyClaimedError,
@@ -166,29 +168,34 @@ class MailService:
 
         # 보상 지급
         reward = mail.reward_config
-        user = await User.get(id=user_id)
 
         # 경험치 지급
         if "exp" in reward and reward["exp"] > 0:
             # TODO: 경험치 지급 로직 (level_up 이벤트 발행 포함)
             logger.debug(f"EXP reward: user_id={user_id}, exp={reward['exp']}")
 
-        # 골드 지급
-        if "gold" in reward and reward["gold"] > 0:
-            user.gold += reward["gold"]
-            logger.debug(f"Gold reward: user_id={user_id}, gold={reward['gold']}")
-
         # 아이템 지급
         if "items" in reward and reward["items"]:
             # TODO: 아이템 지급 로직
             logger.debug(f"Item reward: user_id={user_id}, items={reward['items']}")
 
-        await user.save()
+        # 수령 완료 처리 + 골드 지급 (동시 수령 시 한 번만 지급)
+        ledger_result = None
+        async with in_transaction() as conn:
+            claimed = await Mail.filter(id=mail_id, is_claimed=False).using_db(conn).update(
+                is_claimed=True, is_read=True
+            )
+            if not claimed:
+                raise AlreadyClaimedError()
+
+            if "gold" in reward and reward["gold"] > 0:
+                ledger_result = await apply_currency_delta(
+                    user_id, gold=reward["gold"], using_db=conn, publish=False
+                )
+                logger.debug(f"Gold reward: user_id={user_id}, gold={reward['gold']}")
 
-        # 수령 완료 처리
-        mail.is_claimed = True
-        mail.is_read = True
-        await mail.save()
+        if ledger_result:
+            await publish_gold_changed(ledger_result)
 
         logger.info(f"Reward claimed: mail_id={mail_id}, user_id={user_id}, reward={reward}")
         return reward
@@ -235,41 +242,46 @@ class MailService:
         ).all()
 
         total_reward = {"exp": 0, "gold": 0, "items": []}
-        claimed_count = 0
-
-        for mail in mails:
-            if mail.is_expired:
-                continue
+        claimable = [mail for mail in mails if not mail.is_expired]
 
+        for mail in claimable:
             reward = mail.reward_config
             total_reward["exp"] += reward.get("exp", 0)
             total_reward["gold"] += reward.get("gold", 0)
             total_reward["items"].extend(reward.get("items", []))
 
-            mail.is_claimed = True
-            mail.is_read = True
-            await mail.save()
-            claimed_count += 1
-
-        # 일괄 지급
-        if total_reward["exp"] > 0 or total_reward["gold"] > 0:
-            user = await User.get(id=user_id)
-
-            # 경험치
-            if total_reward["exp"] > 0:
-                # TODO: 경험치 지급 로직
-                pass
-
-            # 골드
-            if total_reward["gold"] > 0:
-                user.gold += total_reward["gold"]
-
-            # 아이템
-            if total_reward["items"]:
-                # TODO: 아이템 지급 로직
-                pass
-
-            await user.save()
+        claimed_count = len(claimable)
+
+        # 수령 완료 처리 + 일괄 지급 (트랜잭션 1회)
+        ledger_result = None
+        if claimable:
+            async with in_transaction() as conn:
+                claimed = await Mail.filter(
+                    id__in=[mail.id for mail in claimable],
+                    is_claimed=False
+                ).using_db(conn).update(is_claimed=True, is_read=True)
+                if claimed != claimed_count:
+                    # 동시 수령과 겹침 - 롤백하여 중복 지급 방지
+                    raise AlreadyClaimedError()
+
+                # 경험치
+                if total_reward["exp"] > 0:
+                    # TODO: 경험치 지급 로직
+                    pass
+
+                # 골드
+                if total_reward["gold"] > 0:
+                    ledger_result = await apply_currency_delta(
+                        user_id, gold=total_reward["gold"], using_db=conn, publish=False
+                    )
+
+                # 아이템
+                if total_reward["items"]:
+                    # TODO: 아이템 지급 로직
+                    pass
+
+        if ledger_result:
+            await publish_gold_changed(ledger_result)
 
         logger.info(
             f"All rewards claimed: user_id={user_id}, "
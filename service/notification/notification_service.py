@@ -13,7 +13,8 @@ from typing import Optional
 import discord
 
 from config.notification import NOTIFICATION as NOTIF_CONFIG
-from service.session import get_session, get_sessions_in_voice_channel
+from config.voice_channel import VOICE_CHANNEL
+from service.session import get_nearby_sessions, get_session, get_sessions_in_voice_channel
 from service.voice_channel.proximity_calculator import ProximityCalculator
 
 logger = logging.getLogger(__name__)
@@ -53,9 +54,15 @@ class NotificationService:
             logger.debug(f"User {session.user_id} not in voice channel, skipping tiered notifications")
             return None
 
-        # 1. 같은 음성 채널의 다른 세션 조회
-        other_sessions = get_sessions_in_voice_channel(session.voice_channel_id)
-        other_sessions = [s for s in other_sessions if s.user_id != session.user_id]
+        # 1. 근처 세션은 위치 인덱스로 조회 (같은 던전 ±NEARBY 스텝), 나머지 채널 세션은 원거리
+        distances = {
+            s.user_id: ProximityCalculator.calculate_distance(session.exploration_step, s.exploration_step)
+            for s in get_nearby_sessions(session, VOICE_CHANNEL.PROXIMITY_NEARBY_STEPS)
+        }
+        other_sessions = [
+            s for s in get_sessions_in_voice_channel(session.voice_channel_id)
+            if s.user_id != session.user_id
+        ]
 
         if not other_sessions:
             logger.debug(f"No other users in voice channel {session.voice_channel_id}")
@@ -63,14 +70,8 @@ class NotificationService:
 
         # 2. 거리별 분류 및 알림 발송
         for other_session in other_sessions:
-            # 다른 던전은 원거리 취급 (관전만 가능)
-            if not other_session.dungeon or other_session.dungeon.id != session.dungeon.id:
-                distance = 999
-            else:
-                distance = ProximityCalculator.calculate_distance(
-                    session.exploration_step,
-                    other_session.exploration_step
-                )
+            # 근처가 아닌 세션(다른 던전 포함)은 원거리 취급 (관전만 가능)
+            distance = distances.get(other_session.user_id, 999)
 
             # 거리에 따른 지연 시간 결정
             if distance <= 3:
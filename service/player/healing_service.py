@@ -35,7 +35,7 @@ class HealingService:
         # last_regen_time이 None이면 현재 시간으로 초기화
         if user.last_regen_time is None:
             user.last_regen_time = now
-            await user.save()
+            await user.save(update_fields=["now_hp", "last_regen_time"])
             return 0
 
         # 시간대 정보 처리
@@ -54,7 +54,7 @@ class HealingService:
         max_hp = user.get_stat()[UserStatEnum.HP]
         if user.now_hp >= max_hp:
             user.last_regen_time = now
-            await user.save()
+            await user.save(update_fields=["now_hp", "last_regen_time"])
             return 0
 
         # VIT 기반 회복량 계산
@@ -65,7 +65,7 @@ class HealingService:
 
         # 시간 갱신
         user.last_regen_time = now
-        await user.save()
+        await user.save(update_fields=["now_hp", "last_regen_time"])
 
         logger.info(
             f"Natural regen applied: user={user.discord_id}, "
@@ -90,7 +90,7 @@ class HealingService:
         # last_regen_time이 None이면 현재 시간으로 초기화
         if user.last_regen_time is None:
             user.last_regen_time = now
-            await user.save()
+            await user.save(update_fields=["now_hp", "last_regen_time"])
 
         # 시간대 정보 처리
         last_time = user.last_regen_time
@@ -141,7 +141,7 @@ class HealingService:
         heal_amount = max_hp - user.now_hp
         user.now_hp = max_hp
         user.last_regen_time = datetime.now(timezone.utc)
-        await user.save()
+        await user.save(update_fields=["now_hp", "last_regen_time"])
 
         logger.info(f"Full heal: user={user.discord_id}, healed={heal_amount}")
         return heal_amount
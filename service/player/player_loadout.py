@@ -0,0 +1,191 @@
+"""
+플레이어 로드아웃 - 전투 준비 상태 일괄 로드
+
+던전/타워 입장, 난입, /내정보에서 반복되던
+계정 조회 → 스킬 덱 로드 → 장비 스탯 반영 → 자연 회복 순서를 하나로 묶습니다.
+
+- User / 스킬 덱 / 장비 스냅샷을 가능한 한 동시에 조회
+- 스킬 덱은 discord_id별로 짧은 TTL 캐시, 덱 변경 시 즉시 무효화
+- 장비는 equipment_snapshot 캐시(장착/해제/강화 시 무효화)를 그대로 사용
+
+User 행 자체(골드, HP 등)는 매번 새로 조회하므로 캐시로 인해 오래된 값을 쓰지 않습니다.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from config import LOADOUT, SKILL_DECK_SIZE
+from models import SkillEquip, User
+from models.user_skill_deck import UserSkillDeck
+from service.item.equipment_snapshot import (
+    EquipmentSnapshot,
+    get_equipment_snapshot_by_user_id,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PlayerLoadout:
+    """전투 준비가 끝난 유저와 그 덱/장비 요약"""
+
+    user: User
+    """덱/장비 스탯이 반영된 User (런타임 필드 초기화됨)"""
+
+    deck: tuple
+    """스킬 덱 (SKILL_DECK_SIZE 길이, 빈 슬롯은 0)"""
+
+    equipment: EquipmentSnapshot
+    """장비 스냅샷"""
+
+    @property
+    def set_summary(self) -> list:
+        """세트 장착 상황 요약 (DB 조회 없음)"""
+        from service.item.set_detection_service import SetDetectionService
+
+        return SetDetectionService.summarize_sets(self.equipment.item_ids)
+
+
+@dataclass(frozen=True)
+class _CachedDeck:
+    user_id: int
+    deck: tuple
+    expires_at: float
+
+
+_decks: dict[int, _CachedDeck] = {}
+_generations: dict[int, int] = {}
+
+
+async def load_player_loadout(discord_id: int, apply_regen: bool = True) -> Optional[PlayerLoadout]:
+    """
+    discord_id로 전투 준비 상태 로드
+
+    덱 캐시 적중 시 User 조회 1회(장비 스냅샷도 미캐시면 동시 조회),
+    미적중 시 User/덱 동시 조회 후 장비 스냅샷 조회로 최대 2회 왕복입니다.
+
+    Args:
+        discord_id: Discord 사용자 ID
+        apply_regen: 자연 회복 적용 여부 (장비 스탯 반영 후 최대 HP 기준)
+
+    Returns:
+        PlayerLoadout (계정이 없으면 None)
+    """
+    cached = _get_cached_deck(discord_id)
+    if cached is not None:
+        user, snapshot = await asyncio.gather(
+            User.get_or_none(discord_id=discord_id),
+            get_equipment_snapshot_by_user_id(cached.user_id),
+        )
+        if user is None or user.id != cached.user_id:
+            invalidate_player_loadout(discord_id)
+            return await load_player_loadout(discord_id, apply_regen) if user else None
+        deck = cached.deck
+    else:
+        generation = _generations.get(discord_id, 0)
+        user, deck_rows = await asyncio.gather(
+            User.get_or_none(discord_id=discord_id),
+            UserSkillDeck.filter(user__discord_id=discord_id).values_list("slot_index", "skill_id"),
+        )
+        if user is None:
+            return None
+        deck = _to_deck(await _with_legacy_fallback(user.id, deck_rows))
+        _store_deck(discord_id, user.id, deck, generation)
+        snapshot = await get_equipment_snapshot_by_user_id(user.id)
+
+    return await _apply_loadout(user, deck, snapshot, apply_regen)
+
+
+async def hydrate_user_loadout(user: User, apply_regen: bool = False) -> PlayerLoadout:
+    """
+    이미 조회한 User에 덱/장비 스탯 반영 (트랜잭션 안에서 다시 읽은 User 등)
+
+    트랜잭션 연결 하나를 공유할 수 있으므로 조회는 순차로 실행합니다.
+
+    Args:
+        user: 대상 사용자
+        apply_regen: 자연 회복 적용 여부
+
+    Returns:
+        PlayerLoadout
+    """
+    cached = _get_cached_deck(user.discord_id)
+    if cached is not None and cached.user_id == user.id:
+        deck = cached.deck
+        snapshot = await get_equipment_snapshot_by_user_id(user.id)
+    else:
+        generation = _generations.get(user.discord_id, 0)
+        deck_rows = await UserSkillDeck.filter(user_id=user.id).values_list("slot_index", "skill_id")
+        deck = _to_deck(await _with_legacy_fallback(user.id, deck_rows))
+        _store_deck(user.discord_id, user.id, deck, generation)
+        snapshot = await get_equipment_snapshot_by_user_id(user.id)
+
+    return await _apply_loadout(user, deck, snapshot, apply_regen)
+
+
+def invalidate_player_loadout(discord_id: int) -> None:
+    """유저 로드아웃 캐시 무효화 (스킬 덱 변경 시 호출)"""
+    _decks.pop(discord_id, None)
+    _generations[discord_id] = _generations.get(discord_id, 0) + 1
+
+
+def clear_player_loadouts() -> None:
+    """모든 로드아웃 캐시 제거"""
+    _decks.clear()
+    for discord_id in list(_generations):
+        _generations[discord_id] += 1
+
+
+async def _apply_loadout(
+    user: User,
+    deck: tuple,
+    snapshot: EquipmentSnapshot,
+    apply_regen: bool
+) -> PlayerLoadout:
+    """User 런타임 필드에 덱/장비 스탯 반영"""
+    if getattr(user, 'status', None) is None:
+        user._init_runtime_fields()
+    user.equipped_skill = list(deck)
+    user.skill_queue = []
+    user.equipment_stats = dict(snapshot.stats)
+
+    if apply_regen:
+        from service.player.healing_service import HealingService
+        await HealingService.apply_natural_regen(user)
+
+    return PlayerLoadout(user=user, deck=deck, equipment=snapshot)
+
+
+async def _with_legacy_fallback(user_id: int, deck_rows) -> list:
+    """UserSkillDeck 행이 없으면 기존 SkillEquip 행으로 폴백 (마이그레이션 전 호환성)"""
+    if deck_rows:
+        return deck_rows
+    return await SkillEquip.filter(user_id=user_id, pos__isnull=False).values_list("pos", "skill_id")
+
+
+def _to_deck(deck_rows) -> tuple:
+    """(slot_index, skill_id) 행 → 덱 튜플"""
+    deck = [0] * SKILL_DECK_SIZE
+    for slot_index, skill_id in deck_rows:
+        if 0 <= slot_index < SKILL_DECK_SIZE:
+            deck[slot_index] = skill_id
+    return tuple(deck)
+
+
+def _get_cached_deck(discord_id: int) -> Optional[_CachedDeck]:
+    cached = _decks.get(discord_id)
+    if cached is None:
+        return None
+    if cached.expires_at <= time.monotonic():
+        del _decks[discord_id]
+        return None
+    return cached
+
+
+def _store_deck(discord_id: int, user_id: int, deck: tuple, generation: int) -> None:
+    """조회 중 무효화되지 않았을 때만 덱 캐시 저장"""
+    if _generations.get(discord_id, 0) != generation:
+        return
+    _decks[discord_id] = _CachedDeck(user_id, deck, time.monotonic() + LOADOUT.CACHE_TTL)
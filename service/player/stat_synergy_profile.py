@@ -0,0 +1,221 @@
+"""
+스탯 시너지 프로필 - 능력치 조합별 시너지 사전 계산
+
+시너지 카탈로그(ALL_SYNERGIES)를 import 시점에 능력치별 임계값 인덱스로 컴파일합니다.
+능력치마다 "이 값 이상이면 조건을 만족하는 시너지" 비트마스크를 임계값 순으로 누적해 두고,
+(STR, INT, DEX, VIT, LUK) 조회 시 능력치별 bisect 5회 + 비트 AND로 활성 시너지를 구합니다.
+
+활성 시너지의 스탯 효과 합계와 전투 특수효과 합계는 StatSynergyProfile(불변)로 만들어
+능력치 튜플 단위 LRU로 메모이즈합니다. 스탯 분배 미리보기와 전투 판정은 이 프로필을 조회만 합니다.
+"""
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from typing import Any, Dict
+
+from config.stat_synergies import ALL_SYNERGIES, STAT_SYNERGY_CACHE_SIZE, Synergy, SynergyEffect
+
+# 조건 필드 순서 = 조회 튜플 순서
+_STAT_CONDITION_FIELDS = ("str_min", "int_min", "dex_min", "vit_min", "luk_min")
+
+# SynergyEffect 중 가산 합산하는 수치 필드
+_EFFECT_FIELDS = tuple(
+    f.name for f in fields(SynergyEffect) if f.name not in ("description", "special")
+)
+
+
+@dataclass(frozen=True)
+class StatSynergyProfile:
+    """능력치 조합 하나의 시너지 효과 요약 (불변)"""
+
+    active: tuple
+    """활성 시너지 (카탈로그 순서)"""
+
+    effect: SynergyEffect
+    """활성 시너지 스탯 효과 가산 합계 (공유 객체이므로 읽기 전용)"""
+
+    first_strike: bool = False
+    """선공 확정 여부"""
+
+    extra_action_chance: float = 0.0
+    """추가 행동 확률 (0.0 ~ 1.0)"""
+
+    hp_regen_per_turn_pct: float = 0.0
+    """턴당 HP 자동 회복률 (%)"""
+
+    heal_bonus_pct: float = 0.0
+    """회복량 보너스 (%)"""
+
+    status_resist_pct: float = 0.0
+    """상태이상 저항 확률 (%)"""
+
+    buff_duration_bonus: int = 0
+    """버프 지속시간 추가 턴 수"""
+
+    drop_rate_multiplier: float = 1.0
+    """드롭률 배수"""
+
+    phys_crit_dmg_bonus: float = 0.0
+    """물리 치명타 추가 데미지 배율 (0.25 = +25%)"""
+
+    attr_dmg_bonus: float = 0.0
+    """속성 데미지 보너스 배율 (0.1 = +10%)"""
+
+    hp_conditional: tuple = ()
+    """HP 조건부 보너스: ((hp_below_pct, ((키, 값), ...)), ...)"""
+
+
+def _effective_min(synergy: Synergy, field_name: str) -> int:
+    """조건의 능력치별 최소값 (all_min이 있으면 모든 능력치에 all_min만 적용)"""
+    condition = synergy.condition
+    if condition.all_min > 0:
+        return condition.all_min
+    return getattr(condition, field_name)
+
+
+def _compile_stat_index(synergies, field_name: str) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """
+    능력치 하나의 (임계값 목록, 누적 비트마스크 목록)
+
+    masks[i]는 능력치가 thresholds[i] 이상일 때 이 능력치 조건을 만족하는 시너지 집합입니다.
+    """
+    by_threshold: dict[int, int] = {}
+    for index, synergy in enumerate(synergies):
+        minimum = _effective_min(synergy, field_name)
+        by_threshold[minimum] = by_threshold.get(minimum, 0) | (1 << index)
+
+    thresholds = []
+    masks = []
+    cumulative = 0
+    for threshold in sorted(by_threshold):
+        cumulative |= by_threshold[threshold]
+        thresholds.append(threshold)
+        masks.append(cumulative)
+    return tuple(thresholds), tuple(masks)
+
+
+_SYNERGIES = tuple(ALL_SYNERGIES)
+_STAT_INDEXES = tuple(_compile_stat_index(_SYNERGIES, name) for name in _STAT_CONDITION_FIELDS)
+
+
+def active_synergy_mask(stats: tuple) -> int:
+    """(STR, INT, DEX, VIT, LUK) → 활성 시너지 비트마스크 (비트 i = ALL_SYNERGIES[i])"""
+    mask = (1 << len(_SYNERGIES)) - 1
+    for value, (thresholds, masks) in zip(stats, _STAT_INDEXES):
+        position = bisect_right(thresholds, value) - 1
+        if position < 0:
+            return 0
+        mask &= masks[position]
+        if not mask:
+            return 0
+    return mask
+
+
+def compile_stat_synergy_profile(mask: int) -> StatSynergyProfile:
+    """활성 시너지 비트마스크로 프로필 생성"""
+    active = tuple(synergy for index, synergy in enumerate(_SYNERGIES) if mask >> index & 1)
+
+    totals = {name: 0.0 for name in _EFFECT_FIELDS}
+    totals["speed_flat"] = 0
+    specials: dict[str, Any] = {
+        "extra_action_pct": 0.0,
+        "hp_regen_per_turn_pct": 0.0,
+        "heal_bonus_pct": 0.0,
+        "status_resist_pct": 0.0,
+        "buff_duration_bonus": 0,
+        "phys_crit_dmg_bonus_pct": 0.0,
+        "attr_dmg_bonus_pct": 0.0,
+    }
+    first_strike = False
+    drop_rate_multiplier = 1.0
+    hp_conditional = []
+
+    for synergy in active:
+        effect = synergy.effect
+        for name in _EFFECT_FIELDS:
+            totals[name] += getattr(effect, name)
+
+        special = effect.special
+        if not special:
+            continue
+        first_strike = first_strike or bool(special.get("first_strike"))
+        for key in specials:
+            specials[key] += special.get(key, 0)
+        drop_mult = special.get("drop_rate_mult", 0)
+        if drop_mult > 0:
+            drop_rate_multiplier *= drop_mult
+        for condition in special.get("hp_conditional", []):
+            bonuses = tuple((key, value) for key, value in condition.items() if key != "hp_below_pct")
+            hp_conditional.append((condition.get("hp_below_pct", 0), bonuses))
+
+    return StatSynergyProfile(
+        active=active,
+        effect=SynergyEffect(**totals),
+        first_strike=first_strike,
+        extra_action_chance=specials["extra_action_pct"] / 100.0,
+        hp_regen_per_turn_pct=specials["hp_regen_per_turn_pct"],
+        heal_bonus_pct=specials["heal_bonus_pct"],
+        status_resist_pct=specials["status_resist_pct"],
+        buff_duration_bonus=specials["buff_duration_bonus"],
+        drop_rate_multiplier=drop_rate_multiplier,
+        phys_crit_dmg_bonus=specials["phys_crit_dmg_bonus_pct"] / 100.0,
+        attr_dmg_bonus=specials["attr_dmg_bonus_pct"] / 100.0,
+        hp_conditional=tuple(hp_conditional),
+    )
+
+
+EMPTY_STAT_SYNERGY_PROFILE = compile_stat_synergy_profile(0)
+"""시너지가 없는 엔티티(몬스터 등)용 프로필"""
+
+# 능력치 튜플 → StatSynergyProfile (LRU)
+_profile_cache: "OrderedDict[tuple[int, ...], StatSynergyProfile]" = OrderedDict()
+
+
+def get_stat_synergy_profile(
+    bonus_str: int,
+    bonus_int: int,
+    bonus_dex: int,
+    bonus_vit: int,
+    bonus_luk: int,
+) -> StatSynergyProfile:
+    """
+    능력치 조합의 시너지 프로필 조회 (LRU 메모이즈)
+
+    Args:
+        bonus_str~bonus_luk: 5대 능력치
+
+    Returns:
+        StatSynergyProfile
+    """
+    key = (bonus_str, bonus_int, bonus_dex, bonus_vit, bonus_luk)
+    profile = _profile_cache.get(key)
+    if profile is not None:
+        _profile_cache.move_to_end(key)
+        return profile
+
+    profile = compile_stat_synergy_profile(active_synergy_mask(key))
+    _profile_cache[key] = profile
+    if len(_profile_cache) > STAT_SYNERGY_CACHE_SIZE:
+        _profile_cache.popitem(last=False)
+    return profile
+
+
+def get_entity_stat_synergy_profile(entity) -> StatSynergyProfile:
+    """엔티티의 현재 능력치 시너지 프로필 (능력치가 없는 몬스터 등은 빈 프로필)"""
+    if not hasattr(entity, "bonus_str"):
+        return EMPTY_STAT_SYNERGY_PROFILE
+    return get_stat_synergy_profile(
+        entity.bonus_str, entity.bonus_int, entity.bonus_dex,
+        entity.bonus_vit, entity.bonus_luk,
+    )
+
+
+def hp_conditional_bonuses(profile: StatSynergyProfile, hp_ratio_pct: float) -> Dict[str, float]:
+    """현재 HP 비율(%)에서 활성화되는 HP 조건부 보너스 합계"""
+    bonuses: Dict[str, float] = {}
+    for threshold, items in profile.hp_conditional:
+        if hp_ratio_pct > threshold:
+            continue
+        for key, value in items:
+            bonuses[key] = bonuses.get(key, 0) + value
+    return bonuses
@@ -6,7 +6,8 @@ SynergyService
 from dataclasses import dataclass
 from typing import List
 
-from config.stat_synergies import ALL_SYNERGIES, Synergy, SynergyEffect
+from config.stat_synergies import Synergy, SynergyEffect
+from service.player.stat_synergy_profile import get_stat_synergy_profile
 
 
 @dataclass
@@ -38,18 +39,18 @@ class SynergyService:
         Returns:
             활성화된 시너지 목록
         """
-        active = []
-        for synergy in ALL_SYNERGIES:
-            if synergy.condition.is_met(
-                bonus_str, bonus_int, bonus_dex, bonus_vit, bonus_luk
-            ):
-                active.append(ActiveSynergy(
-                    synergy=synergy,
-                    tier=synergy.tier,
-                    name=synergy.name,
-                    effect=synergy.effect,
-                ))
-        return active
+        profile = get_stat_synergy_profile(
+            bonus_str, bonus_int, bonus_dex, bonus_vit, bonus_luk
+        )
+        return [
+            ActiveSynergy(
+                synergy=synergy,
+                tier=synergy.tier,
+                name=synergy.name,
+                effect=synergy.effect,
+            )
+            for synergy in profile.active
+        ]
 
     @staticmethod
     def aggregate_synergy_effects(
@@ -10,7 +10,6 @@ from typing import Optional
 from models import User
 from models.user_skill_deck import UserSkillDeck
 from config import USER_STATS, SKILL_DECK_SIZE, SKILL_ID
-from config.leveling import LEVELING_EXP_TABLE, LEVELING_EXP_DEFAULT
 from exceptions import (
     UserNotFoundError,
     UserAlreadyExistsError,
@@ -195,8 +194,9 @@ class UserService:
         streak_bonus = min(user.attendance_streak, USER_STATS.ATTENDANCE_MAX_STREAK) * USER_STATS.ATTENDANCE_STREAK_BONUS
         total_gold = base_gold + streak_bonus
 
-        user.gold += total_gold
-        await user.save()
+        await user.save(update_fields=["last_attendance", "attendance_streak"])
+        from service.economy.currency_ledger import apply_currency_delta
+        await apply_currency_delta(user, gold=total_gold)
 
         logger.info(f"User {user.id} attendance: streak={user.attendance_streak}, gold={total_gold}")
 
@@ -219,25 +219,15 @@ class UserService:
         Returns:
             레벨업 결과 딕셔너리
         """
-        user.exp += amount
-        old_level = user.level
-        new_level = old_level
-
-        # 레벨업 체크
-        while user.exp >= UserService._get_required_exp(new_level + 1):
-            required_exp = UserService._get_required_exp(new_level + 1)
-            user.exp -= required_exp
-            new_level += 1
-            user.stat_points += USER_STATS.STAT_POINTS_PER_LEVEL
-
-        # 경험치가 음수가 되지 않도록 보호
-        if user.exp < 0:
-            user.exp = 0
+        # 경험치/레벨/스탯 포인트는 원장 증감식으로 반영 (다른 경로의 골드 등을 덮어쓰지 않음)
+        from service.economy.currency_ledger import apply_currency_delta, publish_progress_events
 
+        result = await apply_currency_delta(user, exp=amount)
+        old_level = result.old_level
+        new_level = result.level
         leveled_up = new_level > old_level
 
         if leveled_up:
-            user.level = new_level
             base_stats = UserService.calculate_base_stats(new_level)
             old_max_hp = UserService.calculate_base_stats(old_level)["hp"]
             user.hp = base_stats["hp"]
@@ -245,31 +235,15 @@ class UserService:
             # HP 비율 유지 (단, 100%를 초과하지 않도록)
             hp_ratio = min(user.now_hp / old_max_hp, 1.0) if old_max_hp > 0 else 1.0
             user.now_hp = int(base_stats["hp"] * hp_ratio)
+            await user.save(update_fields=["hp", "attack", "now_hp"])
 
-        # User 저장
-        await user.save()
+        await publish_progress_events(result)
 
         return {
             "leveled_up": leveled_up,
             "old_level": old_level,
             "new_level": new_level,
             "experience_gained": amount,
-            "current_experience": user.exp,
-            "stat_points_gained": (new_level - old_level) * USER_STATS.STAT_POINTS_PER_LEVEL
+            "current_experience": result.exp,
+            "stat_points_gained": result.stat_points_gained
         }
-
-    @staticmethod
-    def _get_required_exp(level: int) -> int:
-        """
-        특정 레벨 달성에 필요한 경험치 계산
-
-        Args:
-            level: 목표 레벨
-
-        Returns:
-            필요 경험치
-        """
-        for max_level, exp_mult in LEVELING_EXP_TABLE:
-            if level <= max_level:
-                return exp_mult * level
-        return LEVELING_EXP_DEFAULT * level
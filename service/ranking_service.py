@@ -2,19 +2,16 @@
 RankingService
 
 랭킹 시스템 비즈니스 로직을 제공합니다.
+레벨/골드/현재 시즌 타워 순위는 메모리 리더보드(service.leaderboard)에서 조회하고,
+지난 시즌 타워 순위만 DB를 조회합니다.
 """
 import logging
 from typing import Dict, List
 
 from tortoise.exceptions import OperationalError
 
-from models.repos.users_repo import (
-    get_top_users_by_level,
-    get_top_users_by_gold,
-    get_user_rank_by_level,
-    get_user_rank_by_gold,
-)
 from models import UserTowerProgress
+from service.leaderboard import Leaderboard, leaderboards
 from service.tower.tower_season_service import get_current_season
 
 logger = logging.getLogger(__name__)
@@ -44,17 +41,15 @@ class RankingService:
                 ...
             ]
         """
-        users = await get_top_users_by_level(limit)
+        await leaderboards.ensure_hydrated()
 
         return [
             {
-                "rank": idx + 1,
-                "username": user.username,
-                "discord_id": user.discord_id,
-                "level": user.level,
-                "exp": user.exp,
+                **entry,
+                "level": score[0],
+                "exp": score[1],
             }
-            for idx, user in enumerate(users)
+            for entry, score in _top_entries(leaderboards.level, limit)
         ]
 
     @staticmethod
@@ -77,20 +72,28 @@ class RankingService:
                 ...
             ]
         """
-        users = await get_top_users_by_gold(limit)
+        await leaderboards.ensure_hydrated()
 
         return [
             {
-                "rank": idx + 1,
-                "username": user.username,
-                "discord_id": user.discord_id,
-                "gold": user.gold,
+                **entry,
+                "gold": score[0],
             }
-            for idx, user in enumerate(users)
+            for entry, score in _top_entries(leaderboards.gold, limit)
         ]
 
     @staticmethod
     async def get_tower_ranking(season_id: int, limit: int = 100) -> List[Dict]:
+        await leaderboards.ensure_hydrated()
+        if season_id == leaderboards.tower_season:
+            return [
+                {
+                    **entry,
+                    "highest_floor": score[0],
+                }
+                for entry, score in _top_entries(leaderboards.tower, limit)
+            ]
+
         try:
             progresses = await UserTowerProgress.filter(
                 season_id=season_id
@@ -124,17 +127,24 @@ class RankingService:
                 "gold_rank": 5,
             }
         """
+        await leaderboards.ensure_hydrated()
+        await leaderboards.ensure_user(user_id)
+
         current_season = get_current_season()
         tower_rank = await RankingService.get_user_tower_rank(user_id, current_season)
 
         return {
-            "level_rank": await get_user_rank_by_level(user_id),
-            "gold_rank": await get_user_rank_by_gold(user_id),
+            "level_rank": leaderboards.level.rank_of(user_id),
+            "gold_rank": leaderboards.gold.rank_of(user_id),
             "tower_rank": tower_rank,
         }
 
     @staticmethod
     async def get_user_tower_rank(user_id: int, season_id: int) -> int:
+        await leaderboards.ensure_hydrated()
+        if season_id == leaderboards.tower_season:
+            return leaderboards.tower.rank_of(user_id)
+
         try:
             progresses = await UserTowerProgress.filter(
                 season_id=season_id
@@ -147,3 +157,16 @@ class RankingService:
             if progress.user_id == user_id:
                 return idx + 1
         return 0
+
+
+def _top_entries(board: Leaderboard, limit: int) -> list[tuple[Dict, tuple]]:
+    """리더보드 상위 항목을 (공통 표시 정보, 점수) 목록으로 변환"""
+    entries = []
+    for user_id, score in board.top(limit):
+        profile = leaderboards.get_profile(user_id)
+        entries.append(({
+            "rank": len(entries) + 1,
+            "username": profile.username if profile else None,
+            "discord_id": profile.discord_id if profile else None,
+        }, score))
+    return entries
@@ -9,10 +9,14 @@ from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import Optional, TYPE_CHECKING
 
+from config.social_encounter import SOCIAL_ENCOUNTER
+
 if TYPE_CHECKING:
     from models import Dungeon, User
     from discord import Message
     from service.dungeon.combat_context import CombatContext
+    from models.repos.static_cache import StaticDataSnapshot
+    from service.item.inventory_batch import InventoryBatch
 
 logger = logging.getLogger(__name__)
 
@@ -135,13 +139,106 @@ class DungeonSession:
     allow_intervention: bool = True
     """난입 허용 여부 (유저가 설정)"""
 
+    static_data: Optional["StaticDataSnapshot"] = None
+    """세션 생성 시 고정된 정적 데이터 스냅샷 (진행 중 재로드와 무관하게 유지)"""
+
+    pending_drops: Optional["InventoryBatch"] = None
+    """지급에 실패해 다음 전투/세션 종료 시 다시 반영할 전리품"""
+
+    def use_static_data(self):
+        """
+        세션에 고정된 정적 데이터 스냅샷을 블록 안에서 사용
+
+        버튼/뷰 콜백, 난입 처리 등 세션을 만든 작업이 아닌 태스크에서 세션을 다룰 때 감쌉니다.
+        """
+        from models.repos.static_cache import use_snapshot
+        return use_snapshot(self.static_data)
+
+    def __setattr__(self, key, value) -> None:
+        super().__setattr__(key, value)
+        # 등록된 세션의 위치 관련 필드가 바뀌면 보조 인덱스 갱신
+        if key in _INDEXED_FIELDS and active_sessions.get(self.__dict__.get("user_id")) is self:
+            _session_index.update(self)
+
     def is_dungeon_cleared(self) -> bool:
         """던전 클리어 조건 확인"""
         return self.exploration_step >= self.max_steps
 
 
+# 보조 인덱스 키에 영향을 주는 필드
+_INDEXED_FIELDS = frozenset({"voice_channel_id", "dungeon", "exploration_step", "ended"})
+
+
+def _step_bucket(step: int) -> int:
+    return step // SOCIAL_ENCOUNTER.PROXIMITY_BUCKET_SIZE
+
+
+class _SessionIndex:
+    """
+    활성 세션 보조 인덱스
+
+    - 음성 채널별: channel_id -> {user_id: session}
+    - 위치별: (channel_id, dungeon_id, 스텝 구간) -> {user_id: session}
+
+    근접 조회는 모두 같은 음성 채널 안에서만 일어나므로 음성 채널에 없는 세션과 종료된 세션은 색인하지 않습니다.
+    """
+
+    def __init__(self):
+        self.by_voice: dict[int, dict[int, DungeonSession]] = {}
+        self.by_position: dict[tuple[int, int, int], dict[int, DungeonSession]] = {}
+        self._keys: dict[int, tuple[int, Optional[tuple[int, int, int]]]] = {}
+
+    def update(self, session: DungeonSession) -> None:
+        """세션의 현재 상태로 색인 위치 갱신 (키가 그대로면 아무것도 하지 않음)"""
+        keys = self._keys_for(session)
+        if self._keys.get(session.user_id) == keys:
+            return
+        self.remove(session.user_id)
+        if keys is None:
+            return
+
+        voice_key, position_key = keys
+        self.by_voice.setdefault(voice_key, {})[session.user_id] = session
+        if position_key is not None:
+            self.by_position.setdefault(position_key, {})[session.user_id] = session
+        self._keys[session.user_id] = keys
+
+    def remove(self, user_id: int) -> None:
+        """세션 색인 제거"""
+        keys = self._keys.pop(user_id, None)
+        if keys is None:
+            return
+        voice_key, position_key = keys
+        _discard(self.by_voice, voice_key, user_id)
+        if position_key is not None:
+            _discard(self.by_position, position_key, user_id)
+
+    @staticmethod
+    def _keys_for(session: DungeonSession) -> Optional[tuple[int, Optional[tuple[int, int, int]]]]:
+        if session.ended or not session.voice_channel_id:
+            return None
+        position_key = None
+        if session.dungeon is not None:
+            position_key = (
+                session.voice_channel_id,
+                session.dungeon.id,
+                _step_bucket(session.exploration_step),
+            )
+        return session.voice_channel_id, position_key
+
+
+def _discard(index: dict, key, user_id: int) -> None:
+    bucket = index.get(key)
+    if bucket is None:
+        return
+    bucket.pop(user_id, None)
+    if not bucket:
+        del index[key]
+
+
 # 활성 세션 저장소 (user_id -> DungeonSession)
 active_sessions: dict[int, DungeonSession] = {}
+_session_index = _SessionIndex()
 
 
 async def create_session(user_id: int) -> Optional[DungeonSession]:
@@ -174,11 +271,16 @@ async def create_session(user_id: int) -> Optional[DungeonSession]:
             else:
                 # 종료된 세션은 제거
                 del active_sessions[user_id]
+                _session_index.remove(user_id)
                 logger.info(f"Cleaned up ended session for user {user_id}")
 
         logger.info(f"Creating new session for user {user_id}")
         session = DungeonSession(user_id=user_id)
+        # 세션을 진행하는 작업이 이 시점의 정적 데이터 버전을 계속 보도록 고정
+        from models.repos.static_cache import pin_static_snapshot
+        session.static_data = pin_static_snapshot()
         active_sessions[user_id] = session
+        _session_index.update(session)
         return session
 
 
@@ -222,14 +324,41 @@ async def end_session(user_id: int) -> None:
             except Exception as e:
                 logger.error(f"Failed to cleanup spectators on session end: {e}")
 
-        # 사용자 데이터 저장
+        # 이전에 지급 실패한 전리품 재시도
+        if session.pending_drops is not None:
+            try:
+                await session.pending_drops.commit()
+            except Exception as e:
+                logger.error(f"Failed to commit pending drops on session end: {e}", exc_info=True)
+
+        # 누적된 골드/경험치 반영 후 나머지 사용자 데이터 저장 (원장 필드는 덮어쓰지 않음)
         if session.user:
             try:
-                await session.user.save()
+                from service.economy.currency_ledger import currency_ledger, save_user_state
+                member_ids = [session.user.id] + [p.id for p in session.participants.values()]
+                await currency_ledger.flush(member_ids)
+                await save_user_state(session.user)
             except Exception as e:
                 logger.error(f"Failed to save user data on session end: {e}")
 
+        # 정상 종료이므로 크래시 복구용 체크포인트 제거
+        try:
+            from service.session_persistence import session_persistence
+            await session_persistence.discard(session)
+        except Exception as e:
+            logger.error(f"Failed to discard session checkpoint: {e}")
+
+        # 누적된 업적 진행도 반영 (리더 + 파티 참가자)
+        if session.user:
+            try:
+                from service.achievement.progress_buffer import achievement_progress_buffer
+                member_ids = [session.user.id] + [p.id for p in session.participants.values()]
+                await achievement_progress_buffer.flush(member_ids)
+            except Exception as e:
+                logger.error(f"Failed to flush achievement progress on session end: {e}")
+
         del active_sessions[user_id]
+        _session_index.remove(user_id)
 
 
 def is_in_session(user_id: int) -> bool:
@@ -299,15 +428,41 @@ def get_all_sessions() -> dict[int, DungeonSession]:
 
 def get_sessions_in_voice_channel(channel_id: int) -> list[DungeonSession]:
     """
-    특정 음성 채널의 세션 목록 조회
+    특정 음성 채널의 세션 목록 조회 (음성 채널 인덱스 사용)
 
     Args:
         channel_id: 음성 채널 ID
 
     Returns:
-        해당 채널의 DungeonSession 목록
+        해당 채널의 DungeonSession 목록 (종료된 세션 제외)
+    """
+    return list(_session_index.by_voice.get(channel_id, {}).values())
+
+
+def get_nearby_sessions(session: DungeonSession, distance: int) -> list[DungeonSession]:
+    """
+    같은 음성 채널 + 같은 던전에서 ±distance 스텝 이내인 다른 세션 조회
+
+    위치 인덱스에서 ±distance를 덮는 스텝 구간만 확인합니다.
+
+    Args:
+        session: 기준 세션
+        distance: 최대 스텝 거리 (절댓값)
+
+    Returns:
+        근처 DungeonSession 목록 (기준 세션/종료된 세션 제외)
     """
-    return [
-        session for session in active_sessions.values()
-        if session.voice_channel_id == channel_id and not session.ended
-    ]
+    if not session.voice_channel_id or session.dungeon is None:
+        return []
+
+    step = session.exploration_step
+    nearby = []
+    for bucket in range(_step_bucket(step - distance), _step_bucket(step + distance) + 1):
+        candidates = _session_index.by_position.get((session.voice_channel_id, session.dungeon.id, bucket))
+        if not candidates:
+            continue
+        nearby.extend(
+            other for other in candidates.values()
+            if other.user_id != session.user_id and abs(other.exploration_step - step) <= distance
+        )
+    return nearby
@@ -0,0 +1,234 @@
+"""
+세션 영속화 (HP 체크포인트 / 세션 진행 상황 저장 및 복구)
+
+전투 중 라운드마다 참가자별로 save()를 호출하는 대신, 바뀐 HP를 표시만 해 두었다가
+주기적으로 모든 세션의 HP와 진행 상황을 한 번에 저장합니다.
+
+- HP: 표시된 User 중 마지막 저장 이후 값이 바뀐 것만 bulk UPDATE 1회
+- 진행 상황: 일반 던전 세션의 탐험 스텝/누적 보상/획득 아이템을 SessionCheckpoint에 upsert 1회
+- 정상 종료된 세션의 체크포인트는 삭제되므로, 재시작 시 남아 있는 행은 비정상 종료된 세션입니다.
+  같은 던전에 다시 입장하면 진행 상황을 이어받습니다.
+"""
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from tortoise.exceptions import OperationalError
+from tortoise.transactions import in_transaction
+
+from models import SessionCheckpoint, User
+from service.session import ContentType, DungeonSession, active_sessions
+
+logger = logging.getLogger(__name__)
+
+# 체크포인트 upsert 시 갱신하는 컬럼 (updated_at은 auto_now라 쓸 때마다 현재 시각)
+_PROGRESS_FIELDS = (
+    "discord_id", "dungeon_id", "content_type", "exploration_step", "max_steps",
+    "total_exp", "total_gold", "monsters_defeated", "items_found", "explore_buffs",
+    "updated_at",
+)
+
+
+@dataclass(frozen=True)
+class CheckpointReport:
+    """체크포인트 결과"""
+
+    hp_rows: int
+    """HP를 저장한 유저 수"""
+
+    sessions: int
+    """진행 상황을 저장한 세션 수"""
+
+
+class SessionPersistence:
+    """
+    세션 상태 일괄 저장기
+
+    전역 인스턴스 session_persistence를 사용합니다.
+    """
+
+    def __init__(self):
+        self._dirty_hp: dict[int, User] = {}
+        self._written_hp: dict[int, int] = {}
+        self._signatures: dict[int, tuple] = {}
+        """user_id -> 마지막으로 저장한 진행 상황 (변경 없으면 건너뜀)"""
+        self._persisted: set[int] = set()
+        """체크포인트 행이 있는 user_id"""
+        self._recoverable: dict[int, SessionCheckpoint] = {}
+        """discord_id -> 재시작 전 남은 체크포인트"""
+        self._progress_enabled = True
+        """진행 상황 저장 여부 (session_checkpoint 테이블이 없으면 HP만 저장)"""
+        self._lock = asyncio.Lock()
+
+    def mark_hp_dirty(self, *users: User) -> None:
+        """HP가 바뀐 유저 표시 (다음 체크포인트에서 저장)"""
+        for user in users:
+            if user is not None:
+                self._dirty_hp[user.id] = user
+
+    async def checkpoint(self, sessions: Iterable[DungeonSession] = None) -> CheckpointReport:
+        """
+        표시된 HP와 세션 진행 상황 일괄 저장
+
+        Args:
+            sessions: 진행 상황을 저장할 세션 (기본: 모든 활성 세션)
+
+        Returns:
+            CheckpointReport
+        """
+        async with self._lock:
+            users = [
+                user for user in self._dirty_hp.values()
+                if self._written_hp.get(user.id) != user.now_hp
+            ]
+            self._dirty_hp = {}
+
+            rows = []
+            signatures = {}
+            if not self._progress_enabled:
+                sessions = ()
+            for session in (sessions if sessions is not None else list(active_sessions.values())):
+                row = _to_checkpoint(session)
+                if row is None:
+                    continue
+                signature = tuple(getattr(row, name) for name in _PROGRESS_FIELDS if name != "updated_at")
+                if self._signatures.get(row.user_id) == signature:
+                    continue
+                rows.append(row)
+                signatures[row.user_id] = signature
+
+            if not users and not rows:
+                return CheckpointReport(hp_rows=0, sessions=0)
+
+            try:
+                async with in_transaction() as conn:
+                    if users:
+                        await User.bulk_update(users, fields=["now_hp"], using_db=conn)
+                    if rows:
+                        await SessionCheckpoint.bulk_create(
+                            rows,
+                            on_conflict=["user_id"],
+                            update_fields=list(_PROGRESS_FIELDS),
+                            using_db=conn,
+                        )
+            except Exception:
+                # 실패한 HP는 다음 체크포인트에서 다시 시도 (그 사이 새로 표시된 객체 우선)
+                for user in users:
+                    self._dirty_hp.setdefault(user.id, user)
+                raise
+
+            self._written_hp.update({user.id: user.now_hp for user in users})
+            self._signatures.update(signatures)
+            self._persisted.update(signatures)
+
+        logger.debug(f"Session checkpoint: {len(users)} HP rows, {len(rows)} sessions")
+        return CheckpointReport(hp_rows=len(users), sessions=len(rows))
+
+    async def discard(self, session: DungeonSession) -> None:
+        """
+        정상 종료된 세션의 체크포인트 제거 (세션 종료 시 호출)
+
+        리더의 HP는 세션 종료 시 직접 저장되므로 표시만 지웁니다.
+        참가자의 표시된 HP는 지금 저장하고 지워서, 이후 체크포인트가 종료된 세션의
+        오래된 HP로 더 새로운 값을 덮어쓰지 않게 합니다.
+        """
+        if session.user is None:
+            return
+        user_id = session.user.id
+
+        async with self._lock:
+            # 같은 유저를 다른 세션이 따로 표시한 경우(다른 User 객체)는 건드리지 않음
+            participants = []
+            for member in (session.user, *session.participants.values()):
+                self._written_hp.pop(member.id, None)
+                if self._dirty_hp.get(member.id) is member:
+                    del self._dirty_hp[member.id]
+                    if member.id != user_id:
+                        participants.append(member)
+
+            if participants:
+                await User.bulk_update(participants, fields=["now_hp"])
+
+            self._signatures.pop(user_id, None)
+            self._recoverable.pop(session.user_id, None)
+            if user_id in self._persisted:
+                self._persisted.discard(user_id)
+                await SessionCheckpoint.filter(user_id=user_id).delete()
+
+    async def load_recoverable(self) -> int:
+        """
+        재시작 전 남은 체크포인트 로드 (봇 시작 시 1회)
+
+        Returns:
+            복구 가능한 세션 수
+        """
+        try:
+            checkpoints = await SessionCheckpoint.all()
+        except OperationalError:
+            # 마이그레이션(scripts/migrate_session_checkpoint.py) 전: 진행 상황 저장 없이 HP만 저장
+            logger.warning("Session checkpoint table not found; session progress will not be persisted")
+            self._progress_enabled = False
+            return 0
+
+        self._progress_enabled = True
+        self._recoverable = {checkpoint.discord_id: checkpoint for checkpoint in checkpoints}
+        self._persisted.update(checkpoint.user_id for checkpoint in checkpoints)
+        if checkpoints:
+            logger.info(f"Loaded {len(checkpoints)} recoverable dungeon sessions")
+        return len(checkpoints)
+
+    def restore(self, session: DungeonSession) -> Optional[SessionCheckpoint]:
+        """
+        비정상 종료 전 진행 상황을 새 세션에 반영 (같은 던전에 다시 입장한 경우)
+
+        Args:
+            session: 던전이 정해진 새 세션
+
+        Returns:
+            반영한 체크포인트 (없거나 다른 던전이면 None)
+        """
+        checkpoint = self._recoverable.pop(session.user_id, None)
+        if checkpoint is None or session.dungeon is None:
+            return None
+        if checkpoint.dungeon_id != session.dungeon.id or checkpoint.content_type != session.content_type:
+            return None
+
+        session.exploration_step = checkpoint.exploration_step
+        session.total_exp = checkpoint.total_exp
+        session.total_gold = checkpoint.total_gold
+        session.monsters_defeated = checkpoint.monsters_defeated
+        session.items_found = list(checkpoint.items_found or [])
+        session.explore_buffs = dict(checkpoint.explore_buffs or {})
+
+        logger.info(
+            f"Restored dungeon session progress: user={session.user_id}, "
+            f"dungeon={checkpoint.dungeon_id}, step={checkpoint.exploration_step}"
+        )
+        return checkpoint
+
+
+def _to_checkpoint(session: DungeonSession) -> Optional[SessionCheckpoint]:
+    """체크포인트 대상 세션 → 저장할 행 (주간 타워는 자체 진행도 테이블 사용)"""
+    if session.ended or session.user is None or session.dungeon is None:
+        return None
+    if session.content_type != ContentType.NORMAL_DUNGEON:
+        return None
+
+    return SessionCheckpoint(
+        user_id=session.user.id,
+        discord_id=session.user_id,
+        dungeon_id=session.dungeon.id,
+        content_type=int(session.content_type),
+        exploration_step=session.exploration_step,
+        max_steps=session.max_steps,
+        total_exp=session.total_exp,
+        total_gold=session.total_gold,
+        monsters_defeated=session.monsters_defeated,
+        items_found=list(session.items_found),
+        explore_buffs=dict(session.explore_buffs),
+    )
+
+
+# 전역 인스턴스 (배경 작업에서 주기적으로 checkpoint)
+session_persistence = SessionPersistence()
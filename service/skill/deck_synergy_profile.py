@@ -0,0 +1,221 @@
+"""
+덱 시너지 프로필 - 스킬 덱별 키워드 시너지 사전 계산
+
+스킬 키워드 문자열은 정적 데이터 로드 시(Skill 생성 시) 정수 키워드 ID로 한 번만 파싱합니다.
+덱(장착 스킬 ID 튜플)마다 키워드 ID 개수를 세어 활성 속성/복합 시너지와
+데미지/회복/받는 피해 배율을 불변 객체로 만들어 두고, 데미지 계산은 이 프로필을 조회만 합니다.
+"""
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional
+
+from config import ATTRIBUTE_SYNERGIES, COMBO_SYNERGIES, ComboSynergy, SynergyTier
+from config.skills import DECK_SYNERGY_CACHE_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# 키워드 ID
+# =============================================================================
+
+_keyword_ids: dict[str, int] = {}
+_keyword_names: list[str] = []
+
+
+def keyword_id(keyword: str) -> int:
+    """키워드 이름 → 정수 ID (처음 보는 키워드는 새 ID 발급)"""
+    kid = _keyword_ids.get(keyword)
+    if kid is None:
+        kid = _keyword_ids[keyword] = len(_keyword_names)
+        _keyword_names.append(keyword)
+    return kid
+
+
+def find_keyword_id(keyword: str) -> Optional[int]:
+    """키워드 이름 → 정수 ID (발급된 적 없는 키워드는 None, 새 ID 발급 안 함)"""
+    return _keyword_ids.get(keyword.strip())
+
+
+def keyword_names(keyword_ids: Iterable[int]) -> list[str]:
+    """키워드 ID 목록 → 키워드 이름 목록 (표시용)"""
+    return [_keyword_names[kid] for kid in keyword_ids]
+
+
+def parse_keyword_ids(keyword_string: Optional[str]) -> tuple[int, ...]:
+    """슬래시로 구분된 키워드 문자열 (예: "화염/화상/셋업") → 키워드 ID 튜플"""
+    if not keyword_string:
+        return ()
+    return tuple(keyword_id(k.strip()) for k in keyword_string.split("/") if k.strip())
+
+
+# 속성 밀도 시너지: (속성, 키워드 ID, 단계 - 높은 단계부터)
+_ATTRIBUTE_TIERS = tuple(
+    (attribute, keyword_id(attribute), tuple(reversed(tiers)))
+    for attribute, tiers in ATTRIBUTE_SYNERGIES.items()
+)
+
+# 복합 시너지: (시너지, 공격 스킬 최소 수, 회복/버프 스킬 최소 수, ((키워드 ID, 최소 수), ...))
+_COMBO_CONDITIONS = tuple(
+    (
+        combo,
+        combo.conditions.get("__attack_count__", 0),
+        combo.conditions.get("__heal_buff_count__", 0),
+        tuple(
+            (keyword_id(keyword), min_count)
+            for keyword, min_count in combo.conditions.items()
+            if not keyword.startswith("__")
+        ),
+    )
+    for combo in COMBO_SYNERGIES
+)
+
+
+# =============================================================================
+# 덱 프로필
+# =============================================================================
+
+
+@dataclass
+class ActiveSynergy:
+    """활성화된 시너지"""
+    name: str
+    description: str
+    tier: Optional[SynergyTier] = None
+    combo: Optional[ComboSynergy] = None
+
+
+@dataclass(frozen=True)
+class DeckSynergyProfile:
+    """덱 하나의 키워드 시너지 요약 (불변)"""
+
+    active: tuple
+    """활성 시너지 (속성 밀도 시너지 → 복합 시너지 순)"""
+
+    damage_multipliers: Mapping[str, float]
+    """속성별 데미지 배율 (속성 밀도 시너지 × 복합 시너지)"""
+
+    base_damage_multiplier: float = 1.0
+    """속성 밀도 시너지가 없는 속성의 데미지 배율 (복합 시너지만)"""
+
+    heal_multiplier: float = 1.0
+    """회복 배율"""
+
+    damage_taken_multiplier: float = 1.0
+    """받는 피해 배율"""
+
+    def damage_multiplier(self, attribute: str) -> float:
+        """스킬 속성의 데미지 배율"""
+        return self.damage_multipliers.get(attribute, self.base_damage_multiplier)
+
+
+def compile_deck_synergy_profile(skill_ids: Iterable[int]) -> DeckSynergyProfile:
+    """
+    스킬 ID 목록으로 덱 시너지 프로필 생성 (캐시 미사용)
+
+    Args:
+        skill_ids: 장착 스킬 ID 목록 (0은 빈 슬롯)
+
+    Returns:
+        DeckSynergyProfile
+    """
+    from models.repos import static_cache
+
+    keyword_counts: dict[int, int] = {}
+    attack_count = 0
+    heal_buff_count = 0
+    for sid in skill_ids:
+        if sid == 0:
+            continue
+        skill = static_cache.skill_cache_by_id.get(sid)
+        if not skill:
+            continue
+        for kid in skill.keyword_ids:
+            keyword_counts[kid] = keyword_counts.get(kid, 0) + 1
+        attack_count += skill.has_attack_component
+        heal_buff_count += skill.has_heal_buff_component
+
+    active = []
+    tier_by_attribute: dict[str, SynergyTier] = {}
+    heal_multiplier = 1.0
+
+    # 속성 밀도 시너지 (가장 높은 달성 단계)
+    for attribute, kid, tiers in _ATTRIBUTE_TIERS:
+        count = keyword_counts.get(kid, 0)
+        for tier in tiers:
+            if count >= tier.threshold:
+                active.append(ActiveSynergy(
+                    name=f"{attribute} ×{tier.threshold}",
+                    description=tier.effect,
+                    tier=tier
+                ))
+                tier_by_attribute[attribute] = tier
+                # 회복 관련 시너지만 회복 배율에 적용
+                if "회복" in tier.effect or "힐" in tier.effect:
+                    heal_multiplier *= tier.damage_mult
+                break
+
+    # 복합 시너지
+    combos = []
+    for combo, attack_min, heal_buff_min, keyword_mins in _COMBO_CONDITIONS:
+        if attack_count < attack_min or heal_buff_count < heal_buff_min:
+            continue
+        if any(keyword_counts.get(kid, 0) < min_count for kid, min_count in keyword_mins):
+            continue
+        combos.append(combo)
+        active.append(ActiveSynergy(
+            name=combo.name,
+            description=combo.description,
+            combo=combo
+        ))
+
+    def _combo_product(multiplier: float, attr_name: str) -> float:
+        for combo in combos:
+            multiplier *= getattr(combo, attr_name)
+        return multiplier
+
+    return DeckSynergyProfile(
+        active=tuple(active),
+        damage_multipliers=MappingProxyType({
+            attribute: _combo_product(tier.damage_mult, "damage_mult")
+            for attribute, tier in tier_by_attribute.items()
+        }),
+        base_damage_multiplier=_combo_product(1.0, "damage_mult"),
+        heal_multiplier=heal_multiplier,
+        damage_taken_multiplier=_combo_product(1.0, "damage_taken_mult"),
+    )
+
+
+# 덱 튜플 → DeckSynergyProfile (LRU)
+_profile_cache: "OrderedDict[tuple[int, ...], DeckSynergyProfile]" = OrderedDict()
+
+
+def get_deck_synergy_profile(skill_ids: Optional[Iterable[int]]) -> DeckSynergyProfile:
+    """
+    덱의 시너지 프로필 조회 (LRU 메모이즈)
+
+    Args:
+        skill_ids: 장착 스킬 ID 목록
+
+    Returns:
+        DeckSynergyProfile
+    """
+    key = tuple(skill_ids or ())
+    profile = _profile_cache.get(key)
+    if profile is not None:
+        _profile_cache.move_to_end(key)
+        return profile
+
+    profile = compile_deck_synergy_profile(key)
+    _profile_cache[key] = profile
+    if len(_profile_cache) > DECK_SYNERGY_CACHE_SIZE:
+        _profile_cache.popitem(last=False)
+    return profile
+
+
+def invalidate_deck_synergy_profile() -> None:
+    """덱 시너지 프로필 캐시 초기화 (스킬 정적 데이터 재로드 시)"""
+    _profile_cache.clear()
+    logger.debug("Deck synergy profile cache cleared")
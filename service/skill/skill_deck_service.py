@@ -16,6 +16,7 @@ from exceptions import (
     CombatRestrictionError,
 )
 from service.collection_service import CollectionService
+from service.player.player_loadout import invalidate_player_loadout
 from service.session import get_session
 from service.tower.tower_restriction import enforce_skill_change_restriction
 
@@ -69,6 +70,8 @@ class SkillDeckService:
             defaults={"skill": skill}
         )
 
+        invalidate_player_loadout(user.discord_id)
+
         # 도감에 스킬 등록
         await CollectionService.register_skill(user, skill_id)
 
@@ -160,6 +163,7 @@ class SkillDeckService:
         enforce_skill_change_restriction(session)
 
         deleted = await UserSkillDeck.filter(user=user).delete()
+        invalidate_player_loadout(user.discord_id)
         logger.info(f"Cleared deck for user {user.id}: {deleted} slots")
         return deleted
 
@@ -205,5 +209,6 @@ class SkillDeckService:
                 slot_index=slot.slot_index,
                 skill_id=slot.skill_id
             )
+        invalidate_player_loadout(target_user.discord_id)
 
         logger.info(f"Copied deck from user {source_user.id} to user {target_user.id}")
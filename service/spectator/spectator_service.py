@@ -8,6 +8,7 @@ from typing import Optional
 import discord
 
 from exceptions import SpectatorError, SpectatorTargetNotInDungeonError, SpectatorDMFailedError
+from service.dungeon.embed_update_scheduler import embed_update_scheduler
 from service.spectator.spectator_state import (
     start_spectating,
     stop_spectating,
@@ -22,6 +23,25 @@ from service.spectator.spectator_ui import (
 logger = logging.getLogger(__name__)
 
 
+def _get_party(session) -> list:
+    """세션의 파티원 목록 (리더 + 난입자)"""
+    party = [session.user]
+    for participant in (session.participants or {}).values():
+        if participant is not session.user:
+            party.append(participant)
+    return party
+
+
+def _make_spectator_cleanup(session, spectator_id: int):
+    """관전 메시지가 삭제되었을 때 관전 상태를 정리하는 콜백 생성"""
+    def cleanup() -> None:
+        session.spectators.discard(spectator_id)
+        session.spectator_messages.pop(spectator_id, None)
+        stop_spectating(spectator_id)
+        logger.debug(f"Spectator message not found, cleaned up: {spectator_id}")
+    return cleanup
+
+
 class SpectatorService:
     """관전 시스템 서비스"""
 
@@ -102,7 +122,8 @@ class SpectatorService:
         if target_session.in_combat and target_session.combat_context:
             embed = create_spectator_combat_embed(
                 target_session.user,
-                target_session.combat_context
+                target_session.combat_context,
+                _get_party(target_session),
             )
         else:
             # 대기 화면
@@ -169,6 +190,7 @@ class SpectatorService:
             # 관전자 메시지 삭제
             if spectator_id in target_session.spectator_messages:
                 msg = target_session.spectator_messages[spectator_id]
+                embed_update_scheduler.cancel(msg)
                 try:
                     await msg.delete()
                 except discord.NotFound:
@@ -196,25 +218,17 @@ class SpectatorService:
             return
 
         # 전투 embed 생성
-        embed = create_spectator_combat_embed(session.user, session.combat_context)
+        embed = create_spectator_combat_embed(session.user, session.combat_context, _get_party(session))
 
-        # 모든 관전자 메시지 업데이트
+        # 모든 관전자 메시지 업데이트 (스케줄러가 최신 프레임만 병합 전송)
         for spectator_id in list(session.spectators):
             if spectator_id not in session.spectator_messages:
                 continue
 
             msg = session.spectator_messages[spectator_id]
-
-            try:
-                await msg.edit(embed=embed)
-            except discord.NotFound:
-                # 메시지가 삭제됨 - 정리
-                session.spectators.discard(spectator_id)
-                del session.spectator_messages[spectator_id]
-                stop_spectating(spectator_id)
-                logger.debug(f"Spectator message not found, cleaned up: {spectator_id}")
-            except Exception as e:
-                logger.error(f"Failed to update spectator {spectator_id}: {e}")
+            embed_update_scheduler.submit(
+                msg, embed, on_not_found=_make_spectator_cleanup(session, spectator_id),
+            )
 
     @staticmethod
     async def cleanup_spectators(session) -> None:
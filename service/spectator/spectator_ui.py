@@ -64,15 +64,17 @@ def create_combat_notification_embed(session) -> discord.Embed:
     return embed
 
 
-def create_spectator_combat_embed(player, context) -> discord.Embed:
+def create_spectator_combat_embed(player, context, party=None) -> discord.Embed:
     """
     관전자 DM용 전투 화면 Embed 생성
 
-    기존 전투 embed를 재사용하되 관전 모드임을 표시합니다.
+    기존 전투 embed를 재사용하되 관전 모드임을 표시하고,
+    전투 기록(context.records)에서 집계한 파티원별 피해/치유량을 함께 보여줍니다.
 
     Args:
         player: 전투 중인 유저 (User)
         context: CombatContext
+        party: 피해량을 표시할 파티원 목록 (None이면 player만)
 
     Returns:
         Discord Embed
@@ -80,6 +82,16 @@ def create_spectator_combat_embed(player, context) -> discord.Embed:
     # 실제 전투 로그 사용 (context.combat_log)
     embed = create_battle_embed_multi(player, context, context.combat_log)
 
+    meter_lines = []
+    for member in party or [player]:
+        damage = context.damage_dealt.get(id(member), 0)
+        healing = context.healing_done.get(id(member), 0)
+        line = f"**{member.get_name()}** ⚔️ {damage:,}"
+        if healing > 0:
+            line += f" │ 💚 {healing:,}"
+        meter_lines.append(line)
+    embed.add_field(name="📊 전투 기여", value="\n".join(meter_lines), inline=False)
+
     # 색상 변경 (관전 모드 표시)
     embed.color = EmbedColor.SPECTATOR
 
@@ -43,4 +43,5 @@ async def apply_floor_reward(
     reward = calculate_floor_reward(floor, is_boss)
     progress.tower_coins += reward.tower_coins
     await progress.save()
-    return await RewardService.apply_rewards(user, reward.exp, reward.gold)
+    # 층마다 쓰지 않고 원장에 누적 (세션 종료/주기적 flush에서 한 번에 반영)
+    return RewardService.buffer_rewards(user, reward.exp, reward.gold)
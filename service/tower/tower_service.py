@@ -14,8 +14,9 @@ from exceptions import WeeklyTowerRestrictionError
 from models import Dungeon, MonsterTypeEnum
 from models.repos.dungeon_repo import find_all_dungeon_spawn_monster_by
 from models.repos.monster_repo import find_monster_by_id
-from models.repos.static_cache import dungeon_cache, monster_cache_by_id
+from models.repos import static_cache
 from models.repos.tower_progress_repo import get_or_create_progress, save_progress
+from service.event import EventBus, GameEvent, GameEventType
 from service.session import ContentType, SessionType, DungeonSession, end_session
 from service.tower.tower_reward_service import calculate_floor_reward, apply_floor_reward
 from service.tower.tower_season_service import get_current_season
@@ -73,7 +74,7 @@ async def prepare_floor(session: DungeonSession, progress) -> None:
 
     session.current_floor = progress.current_floor if progress.current_floor > 0 else 1
     dungeon_id = get_dungeon_for_floor(session.current_floor)
-    session.dungeon = dungeon_cache.get(dungeon_id) or await Dungeon.get(id=dungeon_id)
+    session.dungeon = static_cache.dungeon_cache.get(dungeon_id) or await Dungeon.get(id=dungeon_id)
 
 
 async def get_floor_monster(tower_floor: int):
@@ -86,13 +87,13 @@ async def get_floor_monster(tower_floor: int):
     if is_boss_floor(tower_floor):
         monster_ids = [spawn.monster_id for spawn in spawns]
         boss_candidates = [
-            monster_cache_by_id[mid]
+            static_cache.monster_cache_by_id[mid]
             for mid in monster_ids
-            if mid in monster_cache_by_id and monster_cache_by_id[mid].type in (MonsterTypeEnum.BOSS, MonsterTypeEnum.BOSS.value)
+            if mid in static_cache.monster_cache_by_id and static_cache.monster_cache_by_id[mid].type in (MonsterTypeEnum.BOSS, MonsterTypeEnum.BOSS.value)
         ]
         if not boss_candidates:
             boss_candidates = [
-                m for m in monster_cache_by_id.values()
+                m for m in static_cache.monster_cache_by_id.values()
                 if getattr(m, "type", None) in (MonsterTypeEnum.BOSS, MonsterTypeEnum.BOSS.value)
             ]
         if not boss_candidates:
@@ -125,6 +126,17 @@ async def handle_floor_clear(session: DungeonSession, interaction: discord.Inter
 
     await save_progress(progress)
 
+    await EventBus().publish(GameEvent(
+        type=GameEventType.FLOOR_CLEARED,
+        user_id=session.user.id,
+        data={
+            "floor": cleared_floor,
+            "highest_floor": progress.highest_floor_reached,
+            "season_id": progress.season_id,
+            "is_boss": is_boss,
+        }
+    ))
+
     if progress.current_floor > WEEKLY_TOWER.TOTAL_FLOORS:
         await _handle_tower_complete(session, interaction)
         return
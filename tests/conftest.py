@@ -246,31 +246,16 @@ def mock_dungeon_session(test_user, test_monster, mock_discord_message):
 
 @pytest.fixture
 def mock_static_cache():
-    """Mock 정적 캐시"""
+    """Mock 정적 캐시 (수정 가능한 빈 스냅샷으로 교체)"""
     from models.repos import static_cache
 
-    # 기존 캐시 백업
-    original_dungeon_cache = static_cache.dungeon_cache.copy()
-    original_monster_cache = static_cache.monster_cache_by_id.copy()
-    original_item_cache = static_cache.item_cache.copy()
-    original_skill_cache = static_cache.skill_cache_by_id.copy()
-    original_spawn_info = static_cache.spawn_info.copy()
-
-    # 테스트용 빈 캐시로 초기화
-    static_cache.dungeon_cache.clear()
-    static_cache.monster_cache_by_id.clear()
-    static_cache.item_cache.clear()
-    static_cache.skill_cache_by_id.clear()
-    static_cache.spawn_info.clear()
+    # 테스트용 빈 스냅샷으로 교체 (테이블은 일반 dict라 테스트에서 채울 수 있음)
+    original_snapshot = static_cache.install_static_snapshot(static_cache.StaticDataSnapshot())
 
     yield static_cache
 
-    # 원래 캐시 복원
-    static_cache.dungeon_cache.update(original_dungeon_cache)
-    static_cache.monster_cache_by_id.update(original_monster_cache)
-    static_cache.item_cache.update(original_item_cache)
-    static_cache.skill_cache_by_id.update(original_skill_cache)
-    static_cache.spawn_info.update(original_spawn_info)
+    # 원래 스냅샷 복원
+    static_cache.install_static_snapshot(original_snapshot)
 
 
 # =============================================================================
@@ -0,0 +1,57 @@
+"""
+업적 인덱스 (static_cache) 유닛 테스트
+"""
+import pytest
+
+from models.achievement import Achievement, AchievementCategory
+from models.repos import static_cache
+
+
+async def _create_achievement(objective_config: dict) -> Achievement:
+    return await Achievement.create(
+        name="테스트 업적",
+        description="테스트",
+        category=AchievementCategory.COMBAT,
+        tier=1,
+        objective_config=objective_config,
+        reward_config={},
+    )
+
+
+class TestAchievementIndex:
+    """업적 인덱스 조회 테스트"""
+
+    async def test_lookup_by_type(self, test_db):
+        """타입만으로 조회"""
+        kill = await _create_achievement({"type": "kill_total", "count": 100})
+        await _create_achievement({"type": "gold_earned", "count": 1000})
+        await static_cache.load_achievement_index()
+
+        result = static_cache.get_achievements_by_objective("kill_total")
+        assert [a.id for a in result] == [kill.id]
+
+    async def test_lookup_with_filter(self, test_db):
+        """필터 필드가 일치하는 업적만 조회"""
+        slime = await _create_achievement({"type": "kill_monster", "monster_id": 1, "count": 10})
+        await _create_achievement({"type": "kill_monster", "monster_id": 2, "count": 10})
+        await static_cache.load_achievement_index()
+
+        result = static_cache.get_achievements_by_objective("kill_monster", {"monster_id": 1})
+        assert [a.id for a in result] == [slime.id]
+        assert static_cache.get_achievements_by_objective("kill_monster", {"monster_id": 3}) == []
+
+    async def test_filter_key_missing_in_config(self, test_db):
+        """필터 키가 없는 업적은 매칭되지 않음"""
+        await _create_achievement({"type": "win_fast", "count": 10})
+        await static_cache.load_achievement_index()
+
+        assert static_cache.get_achievements_by_objective("win_fast", {"turns": 3}) == []
+
+    async def test_reload_replaces_index(self, test_db):
+        """재로드 시 인덱스가 새로 구성됨"""
+        achievement = await _create_achievement({"type": "kill_boss", "count": 10})
+        await static_cache.load_achievement_index()
+        await achievement.delete()
+        await static_cache.load_achievement_index()
+
+        assert static_cache.get_achievements_by_objective("kill_boss") == []
@@ -0,0 +1,106 @@
+"""
+AchievementProgressBuffer 유닛 테스트
+
+진행도 누적, 일괄 반영, 완료 시 우편 1회 발송을 테스트합니다.
+"""
+from unittest.mock import MagicMock, AsyncMock
+
+import pytest
+
+from models.achievement import Achievement, AchievementCategory
+from models.user_achievement import UserAchievement
+from models.users import User
+from service.achievement.progress_buffer import AchievementProgressBuffer
+
+
+@pytest.fixture
+def mail_service() -> MagicMock:
+    service = MagicMock()
+    service.send_mail = AsyncMock()
+    return service
+
+
+async def _create_achievement(count: int, prerequisite_id: int = None) -> Achievement:
+    return await Achievement.create(
+        name="몬스터 사냥꾼",
+        description="테스트",
+        category=AchievementCategory.COMBAT,
+        tier=2 if prerequisite_id else 1,
+        objective_config={"type": "kill_total", "count": count},
+        reward_config={"gold": 100},
+        prerequisite_achievement_id=prerequisite_id,
+    )
+
+
+class TestAchievementProgressBuffer:
+    """업적 진행도 버퍼 테스트"""
+
+    async def test_increments_are_coalesced(self, test_db, mail_service):
+        """같은 (유저, 업적)의 증가량은 합산되어 한 행으로 반영"""
+        user = await User.create(discord_id=1)
+        achievement = await _create_achievement(count=100)
+        buffer = AchievementProgressBuffer(mail_service)
+
+        for _ in range(3):
+            buffer.add(user.id, achievement, increment=1)
+        assert buffer.pending_count == 1
+
+        assert await buffer.flush() == 1
+        row = await UserAchievement.get(user_id=user.id, achievement_id=achievement.id)
+        assert row.progress_current == 3
+        assert row.is_completed is False
+        assert buffer.pending_count == 0
+
+    async def test_set_value_keeps_last(self, test_db, mail_service):
+        """절대값형 진행도는 마지막 값만 반영"""
+        user = await User.create(discord_id=1)
+        achievement = await _create_achievement(count=100)
+        buffer = AchievementProgressBuffer(mail_service)
+
+        buffer.add(user.id, achievement, set_value=10)
+        buffer.add(user.id, achievement, set_value=7)
+        await buffer.flush()
+
+        row = await UserAchievement.get(user_id=user.id, achievement_id=achievement.id)
+        assert row.progress_current == 7
+
+    async def test_completion_mail_sent_once(self, test_db, mail_service):
+        """완료 우편은 한 번만 발송"""
+        user = await User.create(discord_id=1)
+        achievement = await _create_achievement(count=2)
+        buffer = AchievementProgressBuffer(mail_service)
+
+        buffer.add(user.id, achievement, increment=2)
+        await buffer.flush()
+        buffer.add(user.id, achievement, increment=5)
+        await buffer.flush()
+
+        row = await UserAchievement.get(user_id=user.id, achievement_id=achievement.id)
+        assert row.is_completed is True
+        assert row.progress_current == 2
+        assert mail_service.send_mail.await_count == 1
+
+    async def test_prerequisite_required(self, test_db, mail_service):
+        """선행 업적 미완료 시 다음 티어는 진행되지 않음"""
+        user = await User.create(discord_id=1)
+        tier1 = await _create_achievement(count=10)
+        tier2 = await _create_achievement(count=20, prerequisite_id=tier1.id)
+        buffer = AchievementProgressBuffer(mail_service)
+
+        buffer.add(user.id, tier1, increment=1)
+        buffer.add(user.id, tier2, increment=1)
+        await buffer.flush()
+
+        assert await UserAchievement.get_or_none(user_id=user.id, achievement_id=tier2.id) is None
+
+    async def test_flush_only_selected_users(self, test_db, mail_service):
+        """지정한 유저의 진행도만 반영"""
+        user_a = await User.create(discord_id=1)
+        user_b = await User.create(discord_id=2)
+        achievement = await _create_achievement(count=100)
+        buffer = AchievementProgressBuffer(mail_service)
+
+        buffer.add(user_a.id, achievement, increment=1)
+        buffer.add(user_b.id, achievement, increment=1)
+        assert await buffer.flush([user_a.id]) == 1
+        assert buffer.pending_count == 1
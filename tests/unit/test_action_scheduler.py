@@ -0,0 +1,85 @@
+"""
+행동 스케줄러 유닛 테스트
+
+이벤트 단위 게이지 계산이 기존 틱 단위 충전과 같은 행동 순서를 내는지 테스트합니다.
+"""
+from config import COMBAT
+from service.dungeon.combat_context import CombatContext
+
+
+def _build_combat(user_factory, monster_factory):
+    leader = user_factory(discord_id=1, username="리더", speed=13)
+    participant = user_factory(discord_id=2, username="난입자", speed=7)
+    monsters = [
+        monster_factory(name="빠른", speed=17),
+        monster_factory(name="보통", speed=9),
+        monster_factory(name="느린", speed=4),
+    ]
+    context = CombatContext.from_group(monsters)
+    context.initialize_gauges(leader)
+    participants = {participant.discord_id: participant}
+    return leader, participants, context
+
+
+def _run(context, leader, participants, actions, use_scheduler, on_action=None):
+    """행동 actions회 진행 후 (이름, 라운드) 목록 반환"""
+    order = []
+    for index in range(actions):
+        actor = context.get_next_actor(leader, participants)
+        if actor is None:
+            if use_scheduler:
+                assert context.advance_to_next_action(leader, participants)
+            else:
+                while actor is None:
+                    context.fill_gauges(leader, participants)
+                    actor = context.get_next_actor(leader, participants)
+            actor = context.get_next_actor(leader, participants)
+
+        order.append((actor.get_name(), context.round_number))
+        context.consume_gauge(actor)
+        if on_action:
+            on_action(index, actor, context)
+        context.check_and_advance_round()
+    return order
+
+
+class TestActionScheduler:
+    """행동 스케줄러 테스트"""
+
+    def test_matches_tick_by_tick_filling(self, user_factory, monster_factory):
+        def events(index, actor, context):
+            # 추가 행동 (잔영 시너지)과 전투 중 몬스터 합류
+            if index == 4:
+                context.action_gauges[id(leader)] += COMBAT.ACTION_GAUGE_COST
+            if index == 9:
+                joined = monster_factory(name="소환", speed=11)
+                context.monsters.append(joined)
+                context.action_gauges[id(joined)] = 0
+
+        leader, participants, context = _build_combat(user_factory, monster_factory)
+        expected = _run(context, leader, participants, 40, use_scheduler=False, on_action=events)
+
+        leader, participants, context = _build_combat(user_factory, monster_factory)
+        actual = _run(context, leader, participants, 40, use_scheduler=True, on_action=events)
+
+        assert actual == expected
+
+    def test_prediction_matches_actual_order(self, user_factory, monster_factory):
+        leader, participants, context = _build_combat(user_factory, monster_factory)
+        predicted = context.predict_action_order(leader, participants, count=15)
+        predicted = [(entity.get_name(), round_number) for entity, round_number in predicted]
+
+        assert context.action_gauges[id(leader)] == 0  # 예측은 게이지를 바꾸지 않음
+        assert predicted == _run(context, leader, participants, 15, use_scheduler=True)
+
+    def test_dead_player_skipped_and_zero_speed_stalls(self, user_factory, monster_factory):
+        leader, participants, context = _build_combat(user_factory, monster_factory)
+        leader.now_hp = 0
+        predicted = context.predict_action_order(leader, participants, count=10)
+        assert all(entity is not leader for entity, _ in predicted)
+
+        for monster in context.monsters:
+            monster.now_hp = 0
+        for participant in participants.values():
+            participant.now_hp = 0
+        assert context.advance_to_next_action(leader, participants) is False
@@ -0,0 +1,67 @@
+"""
+별칭 샘플러 유닛 테스트
+
+가중치 분포, 시드 재현성, 스폰 추첨기 재생성을 테스트합니다.
+"""
+import random
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+
+from models.monster import MonsterTypeEnum
+from service.dungeon.alias_sampler import AliasSampler, get_spawn_sampler
+
+
+class TestAliasSampler:
+    """별칭 샘플러 테스트"""
+
+    def test_matches_weights_and_skips_zero(self):
+        sampler = AliasSampler(["a", "b", "c", "d"], [1, 3, 6, 0])
+        rng = random.Random(1)
+
+        counts = Counter(sampler.sample(rng) for _ in range(20000))
+
+        assert "d" not in counts
+        assert counts["a"] / 20000 == pytest.approx(0.1, abs=0.02)
+        assert counts["b"] / 20000 == pytest.approx(0.3, abs=0.02)
+        assert counts["c"] / 20000 == pytest.approx(0.6, abs=0.02)
+        assert AliasSampler.build(["x"], [0]) is None
+
+    def test_seeded_draws_are_reproducible(self):
+        sampler = AliasSampler(list(range(10)), [i + 1 for i in range(10)])
+
+        rng = random.Random(42)
+        first = [sampler.sample(rng) for _ in range(20)]
+        rng = random.Random(42)
+        second = [sampler.sample(rng) for _ in range(20)]
+
+        random.seed(7)
+        third = [sampler.sample() for _ in range(20)]
+        random.seed(7)
+        fourth = [sampler.sample() for _ in range(20)]
+
+        assert first == second
+        assert third == fourth
+
+    def test_spawn_sampler_splits_boss_and_rebuilds(self, mock_static_cache, monster_factory):
+        normal = monster_factory(name="슬라임")
+        boss = monster_factory(name="드래곤")
+        boss.type = MonsterTypeEnum.BOSS.value
+        mock_static_cache.monster_cache_by_id.update({1: normal, 2: boss})
+        mock_static_cache.spawn_info[1] = [
+            SimpleNamespace(monster_id=1, prob=1.0),
+            SimpleNamespace(monster_id=2, prob=1.0),
+        ]
+
+        sampler = get_spawn_sampler(1)
+        assert sampler.normal.sample().monster_id == 1
+        assert sampler.boss.sample().monster_id == 2
+        assert get_spawn_sampler(1) is sampler
+
+        # 원본이 교체되면 다시 만듦
+        mock_static_cache.spawn_info[1] = [SimpleNamespace(monster_id=2, prob=1.0)]
+        rebuilt = get_spawn_sampler(1)
+        assert rebuilt is not sampler
+        assert rebuilt.normal.sample().monster_id == 2
+        assert get_spawn_sampler(999) is None
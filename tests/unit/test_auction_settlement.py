@@ -0,0 +1,73 @@
+"""
+경매 만료 정산 유닛 테스트
+"""
+from datetime import datetime, timedelta, timezone
+
+from models import Item
+from models.auction_bid import AuctionBid
+from models.auction_history import AuctionHistory
+from models.auction_listing import AuctionListing, AuctionStatus, AuctionType
+from models.mail import Mail
+from models.user_inventory import UserInventory
+from models.users import User
+from resources.item_emoji import ItemType
+from service.auction.settlement import fetch_top_bids, settle_expired_listings
+
+
+async def _create_listing(seller, item, auction_type, expires_at):
+    inventory = await UserInventory.create(user=seller, item=item, is_locked=True)
+    return await AuctionListing.create(
+        seller=seller, inventory_item=inventory, item_id=item.id, item_name=item.name,
+        auction_type=auction_type, starting_price=100, current_price=100, expires_at=expires_at,
+    )
+
+
+class TestAuctionSettlement:
+    """만료 정산 테스트"""
+
+    async def test_settles_bids_and_expiries_in_chunks(self, test_db):
+        seller = await User.create(discord_id=1, gold=0)
+        winner = await User.create(discord_id=2, gold=0)
+        loser = await User.create(discord_id=3, gold=0)
+        sword = await Item.create(name="철검", type=ItemType.EQUIP)
+        past = datetime.now(timezone.utc) - timedelta(minutes=1)
+
+        bid_listing = await _create_listing(seller, sword, AuctionType.BID, past)
+        await AuctionBid.create(auction=bid_listing, bidder=loser, bid_amount=150, is_refunded=True)
+        await AuctionBid.create(auction=bid_listing, bidder=loser, bid_amount=180)
+        top = await AuctionBid.create(auction=bid_listing, bidder=winner, bid_amount=200)
+        empty_listing = await _create_listing(seller, sword, AuctionType.BID, past)
+        buynow_listing = await _create_listing(seller, sword, AuctionType.BUYNOW, past)
+        active_listing = await _create_listing(
+            seller, sword, AuctionType.BUYNOW, datetime.now(timezone.utc) + timedelta(hours=1)
+        )
+
+        top_bids = await fetch_top_bids([bid_listing.id, empty_listing.id])
+        assert list(top_bids) == [bid_listing.id]
+        assert top_bids[bid_listing.id].id == top.id
+
+        report = await settle_expired_listings(chunk_size=2)
+        assert (report.sold, report.expired, report.refunded_bids, report.chunks) == (1, 2, 1, 2)
+        assert report.mails == 4
+
+        sold = await AuctionListing.get(id=bid_listing.id)
+        assert sold.status == AuctionStatus.SOLD
+        assert (sold.buyer_id, sold.final_price, sold.inventory_item_id) == (winner.id, 200, None)
+        transferred = await UserInventory.filter(user=winner).first()
+        assert transferred is not None and not transferred.is_locked
+
+        for listing in (empty_listing, buynow_listing):
+            listing = await AuctionListing.get(id=listing.id).prefetch_related("inventory_item")
+            assert listing.status == AuctionStatus.EXPIRED
+            assert not listing.inventory_item.is_locked
+        assert (await AuctionListing.get(id=active_listing.id)).status == AuctionStatus.ACTIVE
+
+        await seller.refresh_from_db()
+        await loser.refresh_from_db()
+        assert seller.gold == 200 - int(200 * 0.05)
+        assert loser.gold == 180
+        assert await AuctionHistory.filter(buyer_id=winner.id).count() == 1
+        assert await Mail.filter(user=seller).count() == 3
+
+        # 재실행 시 이미 정산된 리스팅은 건너뜀
+        assert (await settle_expired_listings()).settled == 0
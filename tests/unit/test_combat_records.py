@@ -0,0 +1,64 @@
+"""
+전투 기록 유닛 테스트
+
+데미지 파이프라인/회복/상태이상이 타입 있는 기록을 남기고,
+기여도 집계가 로그 문자열 없이 기록만으로 동작하는지 테스트합니다.
+"""
+from service.dungeon.combat_context import (
+    CombatContext,
+    activate_combat_context,
+    deactivate_combat_context,
+)
+from service.dungeon.combat_metrics_recorder import CombatMetricsRecorder
+from service.dungeon.combat_records import CombatRecordType, emit_record
+from service.dungeon.damage_pipeline import process_incoming_damage
+from service.dungeon.status import apply_status_effect
+
+
+class TestCombatRecords:
+    """전투 기록 테스트"""
+
+    def test_pipeline_and_status_emit_records(self, test_user, test_monster):
+        context = CombatContext.from_single(test_monster)
+        test_monster.now_hp = test_monster.hp
+
+        token = activate_combat_context(context)
+        try:
+            event = process_incoming_damage(test_monster, 10, attacker=test_user)
+            process_incoming_damage(test_user, 3, is_reflected=True)
+            apply_status_effect(test_monster, "burn", stacks=2, duration=3)
+        finally:
+            deactivate_combat_context(token)
+
+        types = [r.type for r in context.records]
+        assert types == [
+            CombatRecordType.DAMAGE, CombatRecordType.REFLECT, CombatRecordType.STATUS_APPLY,
+        ]
+        assert context.records[0].amount == event.actual_damage
+        assert context.records[0].source is test_user
+        assert context.get_damage_dealt(test_user) == event.actual_damage
+        assert "burn" in context.records[2].render()
+
+    def test_no_records_outside_combat(self, test_user, test_monster):
+        test_monster.now_hp = test_monster.hp
+        assert emit_record(CombatRecordType.HEAL, test_user, 5, source=test_user) is None
+
+        context = CombatContext.from_single(test_monster)
+        process_incoming_damage(test_monster, 10, attacker=test_user)
+        assert context.records == []
+
+    def test_contribution_summary_from_records(self, test_user, test_monster):
+        context = CombatContext.from_single(test_monster)
+        token = activate_combat_context(context)
+        try:
+            emit_record(CombatRecordType.DAMAGE, test_monster, 40, source=test_user)
+            emit_record(CombatRecordType.DAMAGE, test_user, 7, source=test_user)
+            emit_record(CombatRecordType.HEAL, test_user, 15, source=test_user)
+            emit_record(CombatRecordType.DAMAGE, test_user, 20, source=test_monster)
+            emit_record(CombatRecordType.REFLECT, test_monster, 5, source=test_user)
+        finally:
+            deactivate_combat_context(token)
+
+        damage, healing = CombatMetricsRecorder().summarize_records(context.records, test_user)
+        assert (damage, healing) == (40, 15)
+        assert context.healing_done[id(test_user)] == 15
@@ -0,0 +1,76 @@
+"""
+헤드리스 전투 시뮬레이션 유닛 테스트
+
+동기 전투 코어 실행과 시드 고정 배치 통계를 테스트합니다.
+"""
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from service.combat.simulation import (
+    SimulationBuild,
+    run_batch,
+    simulate_fight,
+)
+from service.dungeon.combat_context import get_active_combat_context
+
+
+class TestSimulateFight:
+    """단일 전투 시뮬레이션 테스트"""
+
+    def test_strong_user_wins(self, user_factory, monster_factory):
+        user = user_factory(hp=1000, attack=200)
+        user._equipment_components_cache = []
+        monster = monster_factory(hp=50, attack=1)
+
+        result = simulate_fight(user, [monster])
+
+        assert result.won
+        assert result.actions > 0
+        assert result.damage_dealt == 50
+        assert get_active_combat_context() is None
+
+    def test_weak_user_loses(self, user_factory, monster_factory):
+        user = user_factory(hp=10, attack=1)
+        user._equipment_components_cache = []
+        monster = monster_factory(hp=100000, attack=500)
+
+        result = simulate_fight(user, [monster])
+
+        assert not result.won
+        assert user.now_hp <= 0
+
+
+class TestRunBatch:
+    """배치 시뮬레이션 테스트"""
+
+    @pytest.fixture
+    def dungeon(self, mock_static_cache, monster_factory):
+        monster = monster_factory(hp=80, attack=5)
+        monster.id = 1
+        mock_static_cache.monster_cache_by_id[1] = monster
+        mock_static_cache.spawn_info[1] = [SimpleNamespace(monster_id=1, prob=1.0)]
+        return 1
+
+    def test_report_is_reproducible(self, dungeon, test_user):
+        build = SimulationBuild.from_user(test_user)
+
+        first = run_batch(build, dungeon, fights=12, seed=7, workers=1)
+        second = run_batch(build, dungeon, fights=12, seed=7, workers=1)
+
+        assert first.fights == 12
+        assert sum(first.turn_distribution.values()) == 12
+        assert first == second
+        assert 0.0 <= first.win_rate <= 1.0
+        assert first.damage_per_round > 0
+
+    def test_does_not_reseed_global_random(self, dungeon, test_user):
+        """시뮬레이션 후 전역 난수 상태는 호출 전 그대로"""
+        build = SimulationBuild.from_user(test_user)
+        random.seed(123)
+        expected = random.Random(123).random()
+
+        run_batch(build, dungeon, fights=3, seed=7, workers=1)
+
+        assert random.random() == expected
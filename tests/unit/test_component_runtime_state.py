@@ -0,0 +1,76 @@
+"""
+스킬 컴포넌트 전투별 상태 유닛 테스트
+
+공유 컴포넌트의 가변 상태가 CombatContext별로 분리되는지 테스트합니다.
+"""
+import asyncio
+
+from service.dungeon.combat_context import (
+    CombatContext,
+    activate_combat_context,
+    deactivate_combat_context,
+    get_active_combat_context,
+)
+from service.dungeon.components.special_components import OnDeathReviveComponent
+
+
+def _revive_component() -> OnDeathReviveComponent:
+    comp = OnDeathReviveComponent()
+    comp.apply_config({"hp_percent": 0.5}, "부활")
+    return comp
+
+
+class TestComponentRuntimeState:
+    """컴포넌트 런타임 상태 분리 테스트"""
+
+    def test_state_scoped_to_active_context(self, test_user, test_monster):
+        comp = _revive_component()
+        first = CombatContext.from_single(test_monster)
+
+        token = activate_combat_context(first)
+        try:
+            test_user.now_hp = 0
+            assert comp.on_death(test_user, test_monster, first)
+            test_user.now_hp = 0
+            assert comp.on_death(test_user, test_monster, first) == ""
+        finally:
+            deactivate_combat_context(token)
+
+        assert get_active_combat_context() is None
+        assert id(test_user) in first.get_component_state(comp).applied_entities
+
+        # 새 전투에서는 리셋 없이 다시 발동
+        second = CombatContext.from_single(test_monster)
+        token = activate_combat_context(second)
+        try:
+            test_user.now_hp = 0
+            assert comp.on_death(test_user, test_monster, second)
+        finally:
+            deactivate_combat_context(token)
+
+    def test_concurrent_combats_do_not_share_state(self, user_factory, test_monster):
+        comp = _revive_component()
+
+        async def fight(user) -> list[str]:
+            context = CombatContext.from_single(test_monster)
+            token = activate_combat_context(context)
+            try:
+                logs = []
+                for _ in range(2):
+                    user.now_hp = 0
+                    logs.append(comp.on_death(user, test_monster, context))
+                    await asyncio.sleep(0)
+                return logs
+            finally:
+                deactivate_combat_context(token)
+
+        async def run():
+            return await asyncio.gather(
+                fight(user_factory(discord_id=1)),
+                fight(user_factory(discord_id=2)),
+            )
+
+        results = asyncio.run(run())
+        for logs in results:
+            assert logs[0]
+            assert logs[1] == ""
@@ -0,0 +1,134 @@
+"""
+재화 원장 유닛 테스트
+
+증감식 반영, 잔액 조건부 차감, 레벨업, 유저별 합산 flush를 테스트합니다.
+"""
+import pytest
+
+from exceptions import InsufficientGoldError, InsufficientStatPointsError
+from models.users import User
+from service.economy.currency_ledger import (
+    CurrencyLedger,
+    apply_currency_delta,
+    currency_ledger,
+    save_user_state,
+)
+from service.economy.reward_service import RewardService
+from service.event import EventBus, GameEventType
+
+
+@pytest.fixture
+def gold_events():
+    bus = EventBus()
+    bus.clear_all_subscribers()
+    received = []
+
+    async def on_gold_changed(event):
+        received.append((event.user_id, event.data["amount"], event.data["current_gold"]))
+
+    bus.subscribe(GameEventType.GOLD_CHANGED, on_gold_changed)
+    yield received
+    bus.clear_all_subscribers()
+
+
+class TestCurrencyLedger:
+    """재화 원장 테스트"""
+
+    async def test_increments_do_not_clobber_concurrent_writers(self, test_db, gold_events):
+        user = await User.create(discord_id=1, gold=100)
+        stale = await User.get(id=user.id)
+
+        # 다른 경로(경매 정산 등)에서 먼저 골드 지급
+        await apply_currency_delta(user.id, gold=50)
+        result = await apply_currency_delta(stale, gold=30)
+
+        assert result.gold == 180 and stale.gold == 180
+        assert gold_events == [(user.id, 50, 150), (user.id, 30, 180)]
+
+        # 오래 들고 있던 객체를 저장해도 골드는 덮어쓰지 않음
+        user.now_hp = 1
+        await save_user_state(user)
+        refreshed = await User.get(id=user.id)
+        assert (refreshed.gold, refreshed.now_hp) == (180, 1)
+
+    async def test_spend_requires_balance(self, test_db, gold_events):
+        user = await User.create(discord_id=1, gold=100)
+
+        with pytest.raises(InsufficientGoldError):
+            await apply_currency_delta(user, gold=-150)
+        assert (await User.get(id=user.id)).gold == 100
+        assert gold_events == []
+
+        await apply_currency_delta(user, gold=-100)
+        assert user.gold == 0
+
+    async def test_stat_point_spend_requires_balance(self, test_db, gold_events):
+        user = await User.create(discord_id=1, stat_points=3)
+        other_window = await User.get(id=user.id)
+
+        # 다른 창에서 먼저 포인트 사용
+        await apply_currency_delta(other_window, stat_points=-2)
+        with pytest.raises(InsufficientStatPointsError) as exc_info:
+            await apply_currency_delta(user, stat_points=-3)
+
+        assert (exc_info.value.required, exc_info.value.current) == (3, 1)
+        assert (await User.get(id=user.id)).stat_points == 1
+
+    async def test_exp_levels_up_in_same_write(self, test_db, gold_events):
+        user = await User.create(discord_id=1, level=1, exp=0, stat_points=0)
+
+        result = await apply_currency_delta(user, exp=10_000)
+
+        assert result.levels_gained > 0
+        assert user.level == result.level
+        assert user.stat_points == result.stat_points_gained
+
+    async def test_buffered_deltas_flush_once_per_user(self, test_db, gold_events):
+        leader = await User.create(discord_id=1, gold=0)
+        member = await User.create(discord_id=2, gold=0)
+        ledger = CurrencyLedger()
+
+        for _ in range(5):
+            ledger.add(leader, gold=10)
+            ledger.add(member, gold=3)
+        assert ledger.pending_count == 2 and leader.gold == 0
+
+        assert await ledger.flush([leader.id]) == 1
+        assert leader.gold == 50 and ledger.pending_count == 1
+        assert await ledger.flush() == 1
+        assert (await User.get(id=member.id)).gold == 15
+        assert gold_events == [(leader.id, 50, 50), (member.id, 15, 15)]
+
+    async def test_flush_publishes_level_up(self, test_db, gold_events):
+        user = await User.create(discord_id=1, level=1, exp=0)
+        ledger = CurrencyLedger()
+        progress = []
+
+        async def on_progress(event):
+            progress.append((event.type, event.user_id))
+
+        bus = EventBus()
+        bus.subscribe(GameEventType.EXP_OBTAINED, on_progress)
+        bus.subscribe(GameEventType.LEVEL_UP, on_progress)
+
+        ledger.add(user, exp=10_000)
+        await ledger.flush()
+
+        assert progress == [(GameEventType.EXP_OBTAINED, user.id), (GameEventType.LEVEL_UP, user.id)]
+
+    async def test_buffered_rewards_coalesce_per_run(self, test_db, gold_events):
+        user = await User.create(discord_id=1, level=1, exp=0, gold=0)
+
+        try:
+            first = RewardService.buffer_rewards(user, exp_gained=10, gold_gained=5)
+            second = RewardService.buffer_rewards(user, exp_gained=10_000, gold_gained=5)
+            assert first.level_up is None
+            assert second.level_up is not None and second.level > 1
+            assert (await User.get(id=user.id)).gold == 0
+
+            assert await currency_ledger.flush([user.id]) == 1
+            assert (user.gold, user.exp, user.level) == (10, 10_010, second.level)
+            assert gold_events == [(user.id, 10, 10)]
+        finally:
+            await currency_ledger.flush([user.id])
+
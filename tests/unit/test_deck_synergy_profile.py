@@ -0,0 +1,73 @@
+"""
+덱 시너지 프로필 유닛 테스트
+
+키워드 ID 기반 덱 시너지 사전 계산과 배율 조회를 테스트합니다.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from service.dungeon.skill import Skill
+from service.skill.deck_synergy_profile import (
+    find_keyword_id,
+    get_deck_synergy_profile,
+    invalidate_deck_synergy_profile,
+    keyword_names,
+)
+from service.skill.synergy_service import SynergyService
+
+
+def _skill(skill_id: int, keyword: str, tag: str = "attack") -> Skill:
+    model = SimpleNamespace(
+        id=skill_id, name=f"skill{skill_id}", attribute="무속성",
+        keyword=keyword, config={"components": [{"tag": tag}]},
+    )
+    return Skill(model, [])
+
+
+@pytest.fixture
+def synergy_skills(mock_static_cache):
+    invalidate_deck_synergy_profile()
+    mock_static_cache.skill_cache_by_id.update({
+        1: _skill(1, "화염/화상"),
+        2: _skill(2, "수속성", tag="heal"),
+        3: _skill(3, "흡혈"),
+    })
+    yield mock_static_cache
+    mock_static_cache.skill_cache_by_id.clear()
+    invalidate_deck_synergy_profile()
+
+
+class TestDeckSynergyProfile:
+    """덱 시너지 프로필 테스트"""
+
+    def test_attribute_tier_multiplier(self, synergy_skills):
+        """속성 밀도 시너지는 해당 속성 데미지에만 적용"""
+        deck = [1, 1, 1, 0, 0, 0, 0, 0, 0, 0]
+
+        assert SynergyService.calculate_damage_multiplier(deck, "화염") == pytest.approx(1.10)
+        assert SynergyService.calculate_damage_multiplier(deck, "냉기") == pytest.approx(1.0)
+        assert [s.name for s in SynergyService.get_active_synergies(deck)] == ["화염 ×3"]
+
+    def test_combo_and_heal_multipliers(self, synergy_skills):
+        """복합 시너지(공격 스킬 수 + 키워드)와 회복 시너지 배율"""
+        deck = [1, 1, 1, 1, 3, 2, 2, 2, 0, 0]
+        profile = get_deck_synergy_profile(deck)
+
+        assert [s.name for s in profile.active] == ["화염 ×3", "수속성 ×3", "버서커"]
+        assert profile.damage_multiplier("화염") == pytest.approx(1.10 * 1.15)
+        assert profile.damage_multiplier("무속성") == pytest.approx(1.15)
+        assert profile.heal_multiplier == pytest.approx(1.15)
+        assert profile.damage_taken_multiplier == pytest.approx(1.0)
+
+    def test_profile_cached_per_deck(self, synergy_skills):
+        """같은 덱은 같은 프로필 객체 재사용"""
+        assert get_deck_synergy_profile([1, 2, 3]) is get_deck_synergy_profile((1, 2, 3))
+
+    def test_keyword_names_round_trip(self, synergy_skills):
+        """키워드 ID는 표시용 이름으로 역조회, 모르는 키워드는 ID를 발급하지 않음"""
+        skill = synergy_skills.skill_cache_by_id[1]
+
+        assert keyword_names(skill.keyword_ids) == ["화염", "화상"]
+        assert find_keyword_id("화상") == skill.keyword_ids[1]
+        assert find_keyword_id("없는 키워드") is None
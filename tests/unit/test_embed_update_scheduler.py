@@ -0,0 +1,104 @@
+"""
+Embed 업데이트 스케줄러 유닛 테스트
+
+중간 프레임 병합, 동시 전송 한도, 삭제된 메시지 정리를 테스트합니다.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import discord
+
+from service.dungeon.embed_update_scheduler import EmbedUpdateScheduler
+
+
+class FakeMessage:
+    """edit 호출을 기록하는 가짜 메시지"""
+
+    def __init__(self, message_id: int, channel_id: int, delay: float = 0.0, gone: bool = False):
+        self.id = message_id
+        self.channel = SimpleNamespace(id=channel_id)
+        self.delay = delay
+        self.gone = gone
+        self.edits: list[discord.Embed] = []
+
+    async def edit(self, embed: discord.Embed) -> None:
+        await asyncio.sleep(self.delay)
+        if self.gone:
+            raise discord.NotFound(SimpleNamespace(status=404, reason="Not Found"), "Unknown Message")
+        self.edits.append(embed)
+
+
+class TestEmbedUpdateScheduler:
+    """Embed 업데이트 스케줄러 테스트"""
+
+    async def test_coalesces_to_latest_frame(self):
+        scheduler = EmbedUpdateScheduler(max_concurrent=5, route_interval=0.05)
+        message = FakeMessage(1, channel_id=10, delay=0.01)
+        frames = [discord.Embed(title=str(i)) for i in range(10)]
+
+        for embed in frames:
+            scheduler.submit(message, embed)
+            await asyncio.sleep(0)
+        await scheduler.flush()
+
+        assert message.edits[-1] is frames[-1]
+        assert len(message.edits) < len(frames)
+        assert scheduler.sent == len(message.edits)
+        assert scheduler.dropped > 0
+
+    async def test_fans_out_with_concurrency_limit(self):
+        scheduler = EmbedUpdateScheduler(max_concurrent=2, route_interval=0.0)
+        messages = [FakeMessage(i, channel_id=100 + i, delay=0.02) for i in range(6)]
+        running = 0
+        peak = 0
+
+        original_edits = {m.id: m.edit for m in messages}
+
+        def track(message):
+            async def edit(embed):
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                try:
+                    await original_edits[message.id](embed)
+                finally:
+                    running -= 1
+            return edit
+
+        for message in messages:
+            message.edit = track(message)
+            scheduler.submit(message, discord.Embed(title="frame"))
+        await scheduler.flush()
+
+        assert all(len(m.edits) == 1 for m in messages)
+        assert peak == 2
+
+    async def test_not_found_invokes_cleanup(self):
+        scheduler = EmbedUpdateScheduler(max_concurrent=1, route_interval=0.0)
+        message = FakeMessage(1, channel_id=10, gone=True)
+        cleaned = []
+
+        scheduler.submit(message, discord.Embed(), on_not_found=lambda: cleaned.append(message.id))
+        await scheduler.flush()
+
+        assert cleaned == [1]
+        assert message.edits == []
+
+    async def test_idle_buckets_are_removed_after_flush(self):
+        scheduler = EmbedUpdateScheduler(max_concurrent=5, route_interval=0.05)
+        messages = [FakeMessage(i, channel_id=100 + i) for i in range(3)]
+
+        for message in messages:
+            scheduler.submit(message, discord.Embed(title="first"))
+            scheduler.submit(message, discord.Embed(title="second"))
+        await scheduler.flush()
+
+        # 마지막 전송 직후에는 간격이 남아 있으므로 버킷 유지
+        assert len(scheduler._buckets) == 3
+        await asyncio.sleep(0.06)
+        assert scheduler._buckets == {}
+
+        # 같은 채널로 다시 제출하면 새 버킷으로 정상 전송
+        scheduler.submit(messages[0], discord.Embed(title="third"))
+        await scheduler.flush()
+        assert messages[0].edits[-1].title == "third"
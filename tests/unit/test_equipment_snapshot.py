@@ -0,0 +1,81 @@
+"""
+장비 스냅샷 유닛 테스트
+
+정적 캐시 기반 스탯/세트 효과 계산과 무효화를 테스트합니다.
+"""
+from models import Item
+from models.equipment_item import EquipmentItem
+from models.set_item import SetEffect, SetItem, SetItemMember
+from models.repos import static_cache
+from models.user_equipment import EquipmentSlot, UserEquipment
+from models.user_inventory import UserInventory
+from models.users import User
+from resources.item_emoji import ItemType
+from service.economy.shop_service import ShopService
+from service.item.equipment_service import EquipmentService
+from service.item.equipment_snapshot import (
+    get_equipment_snapshot,
+    invalidate_equipment_snapshot,
+)
+
+
+class TestEquipmentSnapshot:
+    """장비 스냅샷 테스트"""
+
+    async def test_stats_and_set_bonus_cached_until_invalidated(self, test_db, mock_static_cache):
+        user = await User.create(discord_id=1)
+        helmet_item = await Item.create(name="화염 투구", type=ItemType.EQUIP)
+        armor_item = await Item.create(name="화염 갑옷", type=ItemType.EQUIP)
+        helmet = await EquipmentItem.create(item=helmet_item, hp=100, ad_defense=10, equip_pos=1)
+        armor = await EquipmentItem.create(item=armor_item, hp=200, attack=20, equip_pos=2)
+        fire_set = await SetItem.create(name="화염")
+        await SetItemMember.create(set_item=fire_set, equipment_item=helmet)
+        await SetItemMember.create(set_item=fire_set, equipment_item=armor)
+        await SetEffect.create(
+            set_item=fire_set, pieces_required=2, effect_description="공격력 +10",
+            effect_config={"attack": 10},
+        )
+        await static_cache.load_static_data(groups=("equipment",))
+
+        helmet_inv = await UserInventory.create(user=user, item=helmet_item, enhancement_level=2)
+        armor_inv = await UserInventory.create(user=user, item=armor_item)
+        await UserEquipment.create(user=user, slot=EquipmentSlot.HELMET, inventory_item=helmet_inv)
+        await UserEquipment.create(user=user, slot=EquipmentSlot.ARMOR, inventory_item=armor_inv)
+
+        stats = await EquipmentService.calculate_equipment_stats(user)
+        assert stats["hp"] == 100 + 10 + 200
+        assert stats["ad_defense"] == 10 + 1
+        assert stats["attack"] == 20 + 10
+
+        # 무효화 전에는 DB 변경이 반영되지 않음 (캐시 적중)
+        helmet_inv.enhancement_level = 4
+        await helmet_inv.save()
+        assert (await get_equipment_snapshot(user)).stats["hp"] == 310
+
+        invalidate_equipment_snapshot(user.id)
+        snapshot = await get_equipment_snapshot(user)
+        assert snapshot.stats["hp"] == 100 + 20 + 200
+        assert snapshot.set_bonuses == {"attack": 10}
+
+        # 한 부위 해제 시 세트 효과 비활성
+        await UserEquipment.filter(user=user, slot=EquipmentSlot.ARMOR).delete()
+        invalidate_equipment_snapshot(user.id)
+        stats = await EquipmentService.calculate_equipment_stats(user)
+        assert stats["attack"] == 0
+
+    async def test_selling_equipped_item_invalidates(self, test_db, mock_static_cache):
+        user = await User.create(discord_id=2)
+        helmet_item = await Item.create(name="철 투구", type=ItemType.EQUIP, cost=100)
+        await EquipmentItem.create(item=helmet_item, hp=100, equip_pos=1)
+        await static_cache.load_static_data(groups=("equipment",))
+
+        helmet_inv = await UserInventory.create(user=user, item=helmet_item)
+        await UserEquipment.create(user=user, slot=EquipmentSlot.HELMET, inventory_item=helmet_inv)
+        assert (await get_equipment_snapshot(user)).item_ids == [helmet_item.id]
+
+        # 장착 중인 장비 판매 시 UserEquipment는 CASCADE 삭제, 스냅샷도 갱신
+        await ShopService.sell_item(user, helmet_inv.id)
+
+        snapshot = await get_equipment_snapshot(user)
+        assert snapshot.item_ids == []
+        assert snapshot.stats["hp"] == 0
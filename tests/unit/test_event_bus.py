@@ -0,0 +1,155 @@
+"""
+EventBus 유닛 테스트
+
+인라인/큐 디스패치, 유저별 순서 보장, 백프레셔, 종료 시 드레인을 테스트합니다.
+"""
+import asyncio
+
+import pytest
+
+from service.event import EventBus, GameEvent, GameEventType, BackpressurePolicy, DispatchMode, subscriber_name
+
+
+@pytest.fixture
+async def event_bus():
+    bus = EventBus()
+    bus.clear_all_subscribers()
+    yield bus
+    await bus.drain()
+    bus.clear_all_subscribers()
+
+
+def _event(user_id: int, seq: int) -> GameEvent:
+    return GameEvent(type=GameEventType.MONSTER_KILLED, user_id=user_id, data={"seq": seq})
+
+
+class TestInlineDispatch:
+    """인라인 디스패치 테스트"""
+
+    async def test_publish_awaits_callbacks(self, event_bus):
+        """INLINE 모드에서는 publish 반환 시 콜백이 완료됨"""
+        received = []
+
+        async def on_event(event):
+            received.append(event.data["seq"])
+
+        event_bus.subscribe(GameEventType.MONSTER_KILLED, on_event)
+        await event_bus.publish(_event(1, 1))
+
+        assert event_bus.mode == DispatchMode.INLINE
+        assert received == [1]
+
+    async def test_callback_error_isolated(self, event_bus):
+        """콜백 에러는 다른 구독자에게 영향 없음"""
+        received = []
+
+        async def failing(event):
+            raise RuntimeError("boom")
+
+        async def on_event(event):
+            received.append(event.user_id)
+
+        event_bus.subscribe(GameEventType.MONSTER_KILLED, failing)
+        event_bus.subscribe(GameEventType.MONSTER_KILLED, on_event)
+        await event_bus.publish(_event(1, 1))
+
+        assert received == [1]
+        assert event_bus.get_metrics()[subscriber_name(failing)].errors == 1
+
+    async def test_metrics_keyed_by_qualified_name(self, event_bus):
+        """이름이 같은 콜백도 구독자별로 지표가 분리됨"""
+        class AchievementHandler:
+            async def on_event(self, event):
+                pass
+
+        class QuestHandler:
+            async def on_event(self, event):
+                raise RuntimeError("boom")
+
+        achievement, quest = AchievementHandler(), QuestHandler()
+        event_bus.subscribe(GameEventType.MONSTER_KILLED, achievement.on_event)
+        event_bus.subscribe(GameEventType.MONSTER_KILLED, quest.on_event)
+        await event_bus.publish(_event(1, 1))
+
+        metrics = event_bus.get_metrics()
+        assert metrics[subscriber_name(achievement.on_event)].errors == 0
+        assert metrics[subscriber_name(quest.on_event)].errors == 1
+
+
+class TestQueuedDispatch:
+    """큐 디스패치 테스트"""
+
+    async def test_publish_does_not_wait_for_handler(self, event_bus):
+        """QUEUED 모드에서는 느린 핸들러를 기다리지 않음"""
+        release = asyncio.Event()
+        received = []
+
+        async def slow(event):
+            await release.wait()
+            received.append(event.data["seq"])
+
+        event_bus.subscribe(GameEventType.MONSTER_KILLED, slow)
+        event_bus.start_workers()
+        await event_bus.publish(_event(1, 1))
+
+        assert received == []
+        release.set()
+        assert await event_bus.drain() is True
+        assert received == [1]
+
+    async def test_order_preserved_per_user(self, event_bus):
+        """같은 유저의 이벤트는 발행 순서대로 처리"""
+        received: dict[int, list[int]] = {}
+
+        async def on_event(event):
+            await asyncio.sleep(0)
+            received.setdefault(event.user_id, []).append(event.data["seq"])
+
+        event_bus.subscribe(GameEventType.MONSTER_KILLED, on_event)
+        event_bus.start_workers(workers_per_subscriber=3)
+        for seq in range(20):
+            for user_id in (1, 2, 3, 4):
+                await event_bus.publish(_event(user_id, seq))
+        await event_bus.drain()
+
+        for user_id in (1, 2, 3, 4):
+            assert received[user_id] == list(range(20))
+
+    async def test_drop_newest_when_full(self, event_bus):
+        """DROP_NEWEST 정책은 큐가 가득 차면 새 이벤트를 버림"""
+        release = asyncio.Event()
+        received = []
+
+        async def blocked(event):
+            await release.wait()
+            received.append(event.data["seq"])
+
+        event_bus.subscribe(GameEventType.MONSTER_KILLED, blocked)
+        event_bus.start_workers(queue_size=1, workers_per_subscriber=1, policy=BackpressurePolicy.DROP_NEWEST)
+        await event_bus.publish(_event(1, 1))
+        await asyncio.sleep(0)  # 워커가 첫 이벤트를 꺼내 대기 상태로 진입
+        await event_bus.publish(_event(1, 2))
+        await event_bus.publish(_event(1, 3))
+
+        metrics = event_bus.get_metrics()[subscriber_name(blocked)]
+        assert metrics.dropped == 1
+        assert metrics.queue_depth == 1
+        release.set()
+        await event_bus.drain()
+        assert received == [1, 2]
+
+    async def test_clear_cancels_workers(self, event_bus):
+        """구독자 초기화 시 큐 워커 태스크도 취소됨"""
+        async def never(event):
+            await asyncio.Event().wait()
+
+        event_bus.subscribe(GameEventType.MONSTER_KILLED, never)
+        event_bus.start_workers(workers_per_subscriber=2)
+        await event_bus.publish(_event(1, 1))
+        workers = [w for channel in event_bus._channels.values() for w in channel.workers]
+
+        event_bus.clear_all_subscribers()
+        await asyncio.sleep(0)
+
+        assert len(workers) == 2
+        assert all(worker.cancelled() for worker in workers)
@@ -0,0 +1,62 @@
+"""
+훅 디스패치 테이블 유닛 테스트
+"""
+from service.dungeon.components.base import SkillComponent
+from service.dungeon.hook_dispatch import (
+    EMPTY_TABLE,
+    HookDispatchTable,
+    dispatch,
+    get_entity_hook_table,
+    get_hook_metrics,
+    reset_hook_metrics,
+)
+
+
+class _Thorns(SkillComponent):
+    def on_damaged(self, defender, attacker, damage):
+        return f"가시 {damage}"
+
+
+class _Regen(SkillComponent):
+    def on_turn_start(self, attacker, target):
+        return "재생"
+
+
+class _Plain(SkillComponent):
+    pass
+
+
+class TestHookDispatchTable:
+    """훅 디스패치 테이블 테스트"""
+
+    def test_only_implementing_components_are_dispatched(self):
+        thorns, regen, plain = _Thorns(), _Regen(), _Plain()
+        regen._tag = "regeneration"
+        table = HookDispatchTable([thorns, regen, plain])
+
+        # TurnConfig 기본 no-op(on_turn_start 등)은 제외
+        assert table.handlers("on_damaged") == (thorns.on_damaged,)
+        assert table.handlers("on_turn_start") == (regen.on_turn_start,)
+        assert table.handlers("on_attack") == ()
+        assert table.passives == (regen.on_turn_start,)
+
+        reset_hook_metrics()
+        assert dispatch("on_damaged", table.handlers("on_damaged"), None, None, 7) == ["가시 7"]
+        assert dispatch("on_attack", table.handlers("on_attack"), None, None, 7) == []
+        metrics = get_hook_metrics()
+        assert (metrics["on_damaged"].calls, metrics["on_damaged"].invocations) == (1, 1)
+        assert (metrics["on_attack"].calls, metrics["on_attack"].empty_calls) == (1, 1)
+
+    def test_entity_table_follows_component_cache(self):
+        class Entity:
+            pass
+
+        entity = Entity()
+        assert get_entity_hook_table(entity) is EMPTY_TABLE
+
+        entity._equipment_components_cache = [_Thorns()]
+        table = get_entity_hook_table(entity)
+        assert get_entity_hook_table(entity) is table
+
+        entity._equipment_components_cache = [_Regen()]
+        assert get_entity_hook_table(entity) is not table
@@ -0,0 +1,119 @@
+"""
+InventoryBatch 유닛 테스트
+
+스택/슬롯 계산과 전투당 일괄 반영을 테스트합니다.
+"""
+import pytest
+
+from config import INVENTORY
+from exceptions import InventoryFullError
+from models import Item
+from models.user_inventory import UserInventory
+from models.users import User
+from resources.item_emoji import ItemType
+from service.item.inventory_batch import InventoryBatch
+
+
+class TestInventoryBatch:
+    """인벤토리 일괄 지급 테스트"""
+
+    async def test_stacks_and_commits_once(self, test_db):
+        user = await User.create(discord_id=1)
+        material = await Item.create(name="슬라임 젤리", type=ItemType.ETC)
+        box = await Item.create(name="낡은 상자", type=ItemType.CONSUME)
+        sword = await Item.create(name="철검", type=ItemType.EQUIP)
+        await UserInventory.create(user=user, item=material, quantity=2)
+
+        batch = InventoryBatch(user)
+        await batch.add(material, 1)
+        await batch.add(material, 1)
+        await batch.add(box, 1, instance_grade=10)
+        await batch.add(box, 1, instance_grade=10)
+        await batch.add(box, 1, instance_grade=20)
+        await batch.add(sword, 1, instance_grade=3)
+        await batch.add(sword, 1, instance_grade=3)
+
+        # 커밋 전에는 DB에 반영되지 않음
+        assert await UserInventory.filter(user=user).count() == 1
+
+        assert await batch.commit() == 5
+        rows = await UserInventory.filter(user=user)
+        quantities = sorted((row.item_id, row.instance_grade, row.quantity) for row in rows)
+        assert quantities == [
+            (material.id, 0, 4),
+            (box.id, 10, 2),
+            (box.id, 20, 1),
+            (sword.id, 3, 1),
+            (sword.id, 3, 1),
+        ]
+        assert await batch.commit() == 0
+
+    async def test_full_inventory_still_stacks(self, test_db):
+        user = await User.create(discord_id=1)
+        material = await Item.create(name="슬라임 젤리", type=ItemType.ETC)
+        sword = await Item.create(name="철검", type=ItemType.EQUIP)
+        await UserInventory.create(user=user, item=material, quantity=1)
+        await UserInventory.bulk_create([
+            UserInventory(user=user, item=sword) for _ in range(INVENTORY.MAX_SLOTS - 1)
+        ])
+
+        batch = InventoryBatch(user)
+        with pytest.raises(InventoryFullError):
+            await batch.add(sword, 1)
+        await batch.add(material, 3)
+        await batch.commit()
+
+        row = await UserInventory.get(user=user, item=material)
+        assert row.quantity == 4
+        assert await UserInventory.filter(user=user).count() == INVENTORY.MAX_SLOTS
+
+    async def test_failed_commit_keeps_batch_for_retry(self, test_db, monkeypatch):
+        user = await User.create(discord_id=1)
+        material = await Item.create(name="슬라임 젤리", type=ItemType.ETC)
+        batch = InventoryBatch(user)
+        await batch.add(material, 2)
+
+        async def fail(*args, **kwargs):
+            raise ConnectionError("db down")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(UserInventory, "bulk_create", fail)
+            with pytest.raises(ConnectionError):
+                await batch.commit()
+
+        assert batch.pending_count == 1
+        assert await batch.commit() == 1
+        assert await UserInventory.filter(user=user).values_list("quantity", flat=True) == [2]
+
+    async def test_retry_does_not_overwrite_stack_changes(self, test_db, monkeypatch):
+        user = await User.create(discord_id=1)
+        jelly = await Item.create(name="슬라임 젤리", type=ItemType.ETC)
+        bone = await Item.create(name="해골 뼈", type=ItemType.ETC)
+        sword = await Item.create(name="철검", type=ItemType.EQUIP)
+        jelly_row = await UserInventory.create(user=user, item=jelly, quantity=5)
+        bone_row = await UserInventory.create(user=user, item=bone, quantity=1)
+
+        batch = InventoryBatch(user)
+        await batch.add(jelly, 2)
+        await batch.add(bone, 3)
+        await batch.add(sword, 1)
+
+        async def fail(*args, **kwargs):
+            raise ConnectionError("db down")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(UserInventory, "bulk_create", fail)
+            with pytest.raises(ConnectionError):
+                await batch.commit()
+
+        # 재시도 전에 스택을 사용/판매
+        jelly_row.quantity = 1
+        await jelly_row.save()
+        await bone_row.delete()
+
+        assert await batch.commit() == 3
+        rows = await UserInventory.filter(user=user)
+        assert sorted((row.item_id, row.quantity) for row in rows) == [
+            (jelly.id, 3), (bone.id, 3), (sword.id, 1),
+        ]
+
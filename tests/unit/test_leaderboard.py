@@ -0,0 +1,68 @@
+"""
+메모리 리더보드 유닛 테스트
+
+DB 기준 순위와의 일치, 이벤트 기반 증분 갱신, 재동기화를 테스트합니다.
+"""
+from models.repos.users_repo import get_user_rank_by_gold, get_user_rank_by_level
+from models.users import User
+from service.event import GameEvent, GameEventType
+from service.leaderboard import Leaderboard, LeaderboardStore
+
+
+class TestLeaderboard:
+    """정렬 리더보드 테스트"""
+
+    def test_ranks_share_ties_and_follow_updates(self):
+        board = Leaderboard("gold")
+        for user_id, gold in [(1, 500), (2, 900), (3, 500), (4, 100)]:
+            board.update(user_id, (gold,))
+
+        assert [user_id for user_id, _ in board.top(3)] == [2, 1, 3]
+        assert [board.rank_of(user_id) for user_id in (1, 2, 3, 4)] == [2, 1, 2, 4]
+
+        board.update(4, (1000,))
+        board.remove(2)
+        assert board.rank_of(4) == 1
+        assert board.rank_of(1) == 2
+        assert board.rank_of(2) == 0
+
+        tower = Leaderboard("tower", share_ties=False)
+        tower.update(7, (10,))
+        tower.update(5, (10,))
+        assert [tower.rank_of(5), tower.rank_of(7)] == [1, 2]
+
+
+class TestLeaderboardStore:
+    """리더보드 저장소 테스트"""
+
+    async def test_matches_db_ranks_and_applies_events(self, test_db):
+        users = [
+            await User.create(discord_id=i, username=f"유저{i}", level=level, exp=exp, gold=gold)
+            for i, (level, exp, gold) in enumerate([(10, 50, 300), (12, 0, 100), (10, 80, 300), (3, 0, 0)])
+        ]
+        store = LeaderboardStore()
+        await store.reconcile()
+
+        for user in users:
+            assert store.level.rank_of(user.id) == await get_user_rank_by_level(user.id)
+            assert store.gold.rank_of(user.id) == await get_user_rank_by_gold(user.id)
+
+        low = users[3]
+        await store.on_exp_changed(GameEvent(
+            type=GameEventType.LEVEL_UP, user_id=low.id, data={"new_level": 20, "total_exp": 5}
+        ))
+        await store.on_gold_changed(GameEvent(
+            type=GameEventType.GOLD_CHANGED, user_id=low.id, data={"current_gold": 1000}
+        ))
+        assert store.level.rank_of(low.id) == 1
+        assert store.gold.rank_of(low.id) == 1
+
+        # 이벤트 없이 바뀐 DB 값은 재동기화로 보정
+        await User.filter(id=low.id).update(level=20, exp=5, gold=1000)
+        await User.filter(id=users[1].id).update(gold=5000)
+        assert await store.reconcile() == 1
+        assert store.gold.rank_of(users[1].id) == 1
+
+        newcomer = await User.create(discord_id=99, username="신규", level=1, gold=0)
+        assert await store.ensure_user(newcomer.id)
+        assert store.level.rank_of(newcomer.id) == len(users) + 1
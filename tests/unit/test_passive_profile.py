@@ -0,0 +1,90 @@
+"""
+패시브 프로필 유닛 테스트
+
+덱별 패시브 효과 사전 계산과 LRU 캐시 무효화를 테스트합니다.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from service.dungeon import damage_pipeline
+from service.dungeon.passive_profile import (
+    get_passive_profile,
+    invalidate_passive_profile,
+)
+from service.dungeon.skill import Skill, get_passive_stat_bonuses
+
+
+def _component(tag: str, **attrs) -> SimpleNamespace:
+    return SimpleNamespace(_tag=tag, priority=0, **attrs)
+
+
+def _skill(skill_id: int, *components) -> Skill:
+    model = SimpleNamespace(id=skill_id, name=f"skill{skill_id}", attribute="무속성")
+    return Skill(model, list(components))
+
+
+@pytest.fixture
+def passive_skills(mock_static_cache):
+    invalidate_passive_profile()
+    mock_static_cache.skill_cache_by_id.update({
+        1: _skill(1, _component("passive_buff", attack_percent=0.1)),
+        2: _skill(2, _component("passive_element_immunity", immune_to=["화염"])),
+        3: _skill(3, _component("passive_element_resistance", resist_type="냉기", resist_percent=0.2)),
+        4: _skill(4, _component("passive_damage_reflection", reflect_percent=0.15)),
+        5: _skill(5, _component("passive_debuff_reduction", reduction_percent=0.6)),
+        6: _skill(6, _component("passive_status_immunity", immune_all=False, immune_types=["poison"])),
+    })
+    yield mock_static_cache
+    mock_static_cache.skill_cache_by_id.clear()
+    invalidate_passive_profile()
+
+
+class TestPassiveProfile:
+    """패시브 프로필 계산 테스트"""
+
+    def test_profile_aggregates_components(self, passive_skills):
+        """모든 패시브 효과가 프로필에 집계됨"""
+        profile = get_passive_profile([1, 2, 3, 4, 5, 6, 0, 0, 0, 0])
+
+        assert profile.stat_bonuses["attack_percent"] == pytest.approx(0.1)
+        assert profile.element_immunities == frozenset({"화염"})
+        assert profile.element_resistances["냉기"] == pytest.approx(0.2)
+        assert profile.reflection == pytest.approx(0.15)
+        assert profile.status_immune_types == frozenset({"poison"})
+        assert profile.status_immune_all is False
+
+    def test_stat_bonus_counted_once_per_skill(self, passive_skills):
+        """같은 스킬 중복 장착 시 스탯 보너스는 1회, 저항은 누적"""
+        profile = get_passive_profile([1, 1, 3, 3])
+
+        assert profile.stat_bonuses["attack_percent"] == pytest.approx(0.1)
+        assert profile.element_resistances["냉기"] == pytest.approx(0.4)
+
+    def test_debuff_reduction_capped(self, passive_skills):
+        """디버프 감소는 최대 90%"""
+        assert get_passive_profile([5, 5]).debuff_reduction == pytest.approx(0.9)
+
+    def test_profile_is_memoized(self, passive_skills):
+        """같은 덱은 같은 프로필 객체 반환"""
+        deck = [1, 2, 0]
+        assert get_passive_profile(deck) is get_passive_profile(list(deck))
+
+    def test_invalidate_recomputes(self, passive_skills):
+        """무효화 후에는 변경된 스킬 정의가 반영됨"""
+        deck = [1]
+        assert get_passive_profile(deck).stat_bonuses["attack_percent"] == pytest.approx(0.1)
+
+        passive_skills.skill_cache_by_id[1] = _skill(1, _component("passive_buff", attack_percent=0.3))
+        invalidate_passive_profile(deck)
+
+        assert get_passive_profile(deck).stat_bonuses["attack_percent"] == pytest.approx(0.3)
+
+    def test_pipeline_helpers_read_profile(self, passive_skills, test_user):
+        """damage_pipeline 헬퍼와 get_passive_stat_bonuses가 프로필 값을 반환"""
+        test_user.equipped_skill = [1, 2, 4, 6, 0, 0, 0, 0, 0, 0]
+
+        assert "화염" in damage_pipeline.get_passive_immunities(test_user)
+        assert damage_pipeline.get_passive_reflection(test_user) == pytest.approx(0.15)
+        assert damage_pipeline.get_status_immunities(test_user)["types"] == frozenset({"poison"})
+        assert get_passive_stat_bonuses(test_user.equipped_skill)["attack_percent"] == pytest.approx(0.1)
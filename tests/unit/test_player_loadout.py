@@ -0,0 +1,69 @@
+"""
+플레이어 로드아웃 유닛 테스트
+"""
+import pytest
+
+from models import Skill_Model
+from models.user_skill_deck import UserSkillDeck
+from models.users import SkillEquip, User
+from service.item.equipment_snapshot import invalidate_all_equipment_snapshots
+from service.player.player_loadout import (
+    clear_player_loadouts,
+    hydrate_user_loadout,
+    invalidate_player_loadout,
+    load_player_loadout,
+)
+
+
+@pytest.fixture
+def fresh_loadout_cache():
+    """테스트 전후 로드아웃/장비 스냅샷 캐시 초기화"""
+    clear_player_loadouts()
+    invalidate_all_equipment_snapshots()
+    yield
+    clear_player_loadouts()
+    invalidate_all_equipment_snapshots()
+
+
+class TestPlayerLoadout:
+    """로드아웃 로더 테스트"""
+
+    async def test_deck_cached_until_invalidated(self, test_db, fresh_loadout_cache):
+        user = await User.create(discord_id=10)
+        strike = await Skill_Model.create(name="강타", description="", config={})
+        guard = await Skill_Model.create(name="방어", description="", config={})
+        await UserSkillDeck.create(user=user, slot_index=0, skill=strike)
+
+        loadout = await load_player_loadout(10, apply_regen=False)
+        assert loadout.user.id == user.id
+        assert loadout.deck[0] == strike.id and set(loadout.deck[1:]) == {0}
+        assert loadout.user.equipped_skill == list(loadout.deck)
+        assert not any(loadout.user.equipment_stats.values())
+        assert loadout.set_summary == []
+
+        # 덱 변경이 무효화 없이 일어나면 TTL 동안 캐시된 덱 사용
+        await UserSkillDeck.create(user=user, slot_index=1, skill=guard)
+        assert (await load_player_loadout(10, apply_regen=False)).deck[1] == 0
+
+        invalidate_player_loadout(10)
+        assert (await load_player_loadout(10, apply_regen=False)).deck[1] == guard.id
+
+        hydrated = await hydrate_user_loadout(await User.get(id=user.id))
+        assert hydrated.user.equipped_skill[:2] == [strike.id, guard.id]
+
+    async def test_missing_account_returns_none(self, test_db, fresh_loadout_cache):
+        assert await load_player_loadout(999, apply_regen=False) is None
+
+    async def test_legacy_skill_equip_fallback(self, test_db, fresh_loadout_cache):
+        """UserSkillDeck 행이 없으면 기존 SkillEquip 행으로 덱 구성"""
+        user = await User.create(discord_id=11)
+        strike = await Skill_Model.create(name="강타", description="", config={})
+        await SkillEquip.create(user=user, skill=strike, pos=2)
+        await SkillEquip.create(user=user, skill=strike, pos=None)
+
+        loadout = await load_player_loadout(11, apply_regen=False)
+        assert loadout.deck[2] == strike.id and loadout.deck.count(0) == len(loadout.deck) - 1
+
+        hydrated = await hydrate_user_loadout(await User.get(id=user.id))
+        assert hydrated.deck == loadout.deck
+
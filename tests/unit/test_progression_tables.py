@@ -0,0 +1,45 @@
+"""
+성장 수치 테이블 유닛 테스트
+
+사전 계산 조회가 기존 반복 계산과 같은 결과를 내는지 테스트합니다.
+"""
+from config import LEVELING_EXP_DEFAULT, LEVELING_EXP_TABLE, LEVELING_MAX_LEVEL
+from service.economy.progression_tables import (
+    CUMULATIVE_EXP,
+    cumulative_exp_for_level,
+    enhancement_cost,
+    enhancement_success_rate,
+    grade_stat_multiplier,
+    level_from_exp,
+)
+
+
+def _multiplier(level: int) -> int:
+    for max_level, exp_required in LEVELING_EXP_TABLE:
+        if level <= max_level:
+            return exp_required
+    return LEVELING_EXP_DEFAULT
+
+
+class TestProgressionTables:
+    """성장 수치 테이블 테스트"""
+
+    def test_level_thresholds_match_iterative_sum(self):
+        for level in range(1, LEVELING_MAX_LEVEL + 5):
+            expected = sum(_multiplier(lv) * lv for lv in range(1, level))
+            assert cumulative_exp_for_level(level) == expected
+
+        assert level_from_exp(-10) == 1
+        for level in range(2, LEVELING_MAX_LEVEL + 1):
+            threshold = CUMULATIVE_EXP[level]
+            assert level_from_exp(threshold - 1) == level - 1
+            assert level_from_exp(threshold) == level
+        assert level_from_exp(CUMULATIVE_EXP[-1] * 10) == LEVELING_MAX_LEVEL
+
+    def test_enhancement_and_grade_lookups(self):
+        assert [enhancement_success_rate(lv) for lv in (-1, 0, 4, 9, 12, 15, 16)] == [
+            0.0, 1.0, 0.8, 0.6, 0.4, 0.2, 0.0,
+        ]
+        assert enhancement_cost(8, 10) == int(100 * 10.0 * (1.0 + 10 * 0.3))
+        assert enhancement_cost(99, 2) == int(100 * 1.0 * 1.6)
+        assert [grade_stat_multiplier(g) for g in (-1, 0, 1, 5, 8, 9)] == [1.0, 1.0, 1.0, 1.5, 3.0, 1.0]
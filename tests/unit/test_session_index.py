@@ -0,0 +1,67 @@
+"""
+세션 보조 인덱스 유닛 테스트
+
+음성 채널/위치 인덱스가 세션 상태 변경을 따라가는지 테스트합니다.
+"""
+from models import Dungeon
+from service.dungeon import social_encounter_checker
+from service.dungeon.social_encounter_checker import check_social_encounter
+from service.session import (
+    create_session,
+    end_session,
+    get_nearby_sessions,
+    get_sessions_in_voice_channel,
+    set_voice_channel,
+)
+
+
+class TestSessionIndex:
+    """세션 인덱스 테스트"""
+
+    async def test_indexes_follow_voice_dungeon_and_step_changes(self):
+        grassland, cave = Dungeon(id=1, name="초원"), Dungeon(id=2, name="동굴")
+        me, near, far, elsewhere = [await create_session(uid) for uid in (101, 102, 103, 104)]
+        try:
+            for session, dungeon, step in ((me, grassland, 4), (near, grassland, 6), (far, grassland, 20), (elsewhere, cave, 4)):
+                session.dungeon = dungeon
+                session.exploration_step = step
+                set_voice_channel(session.user_id, 900)
+
+            assert {s.user_id for s in get_sessions_in_voice_channel(900)} == {101, 102, 103, 104}
+            assert [s.user_id for s in get_nearby_sessions(me, 2)] == [102]
+
+            # 스텝 이동 / 채널 이탈이 인덱스에 반영됨
+            far.exploration_step = 5
+            assert {s.user_id for s in get_nearby_sessions(me, 2)} == {102, 103}
+            set_voice_channel(102, None)
+            assert [s.user_id for s in get_nearby_sessions(me, 2)] == [103]
+            assert 102 not in {s.user_id for s in get_sessions_in_voice_channel(900)}
+
+            await end_session(103)
+            assert get_nearby_sessions(me, 2) == []
+            assert {s.user_id for s in get_sessions_in_voice_channel(900)} == {101, 104}
+        finally:
+            for uid in (101, 102, 103, 104):
+                await end_session(uid)
+        assert get_sessions_in_voice_channel(900) == []
+
+    async def test_social_encounter_only_considers_indexed_neighbours(self, monkeypatch):
+        monkeypatch.setattr(social_encounter_checker.random, "random", lambda: 0.0)
+        grassland, cave = Dungeon(id=1, name="초원"), Dungeon(id=2, name="동굴")
+        me, partner, elsewhere = [await create_session(uid) for uid in (101, 102, 103)]
+        try:
+            for session, dungeon, step in ((me, grassland, 40), (partner, grassland, 41), (elsewhere, cave, 40)):
+                session.dungeon = dungeon
+                session.exploration_step = step
+                set_voice_channel(session.user_id, 900)
+
+            assert check_social_encounter(me) == "crossroads"
+            partner.exploration_step = 48
+            assert check_social_encounter(me) == "campfire"
+            # 캠프파이어 범위 밖 / 다른 던전 세션만 있으면 만남 없음
+            partner.exploration_step = 80
+            assert check_social_encounter(me) is None
+        finally:
+            for uid in (101, 102, 103):
+                await end_session(uid)
+
@@ -0,0 +1,120 @@
+"""
+세션 영속화 유닛 테스트
+
+HP/진행 상황 일괄 저장과 재시작 후 복구를 테스트합니다.
+"""
+from datetime import datetime, timedelta, timezone
+
+from tortoise import Tortoise
+
+from models import Dungeon, SessionCheckpoint
+from models.users import User
+from service.session import DungeonSession
+from service.session_persistence import SessionPersistence
+
+
+async def _start_session(discord_id: int, dungeon: Dungeon) -> DungeonSession:
+    session = DungeonSession(user_id=discord_id)
+    session.user = await User.create(discord_id=discord_id, now_hp=100)
+    session.dungeon = dungeon
+    return session
+
+
+class TestSessionPersistence:
+    """세션 체크포인트 테스트"""
+
+    async def test_checkpoint_batches_hp_and_progress(self, test_db):
+        dungeon = await Dungeon.create(name="초원", require_level=1, description="테스트")
+        session = await _start_session(1, dungeon)
+        partner = await User.create(discord_id=2, now_hp=100)
+        persistence = SessionPersistence()
+
+        session.user.now_hp, partner.now_hp = 40, 70
+        persistence.mark_hp_dirty(session.user, partner)
+        session.exploration_step, session.total_gold, session.items_found = 3, 50, [7]
+
+        report = await persistence.checkpoint([session])
+        assert (report.hp_rows, report.sessions) == (2, 1)
+        assert await User.filter(id__in=[session.user.id, partner.id]).order_by("id").values_list(
+            "now_hp", flat=True
+        ) == [40, 70]
+
+        # 변경 없으면 쓰지 않음, 진행되면 같은 행을 갱신
+        persistence.mark_hp_dirty(session.user)
+        assert (await persistence.checkpoint([session])).sessions == 0
+        session.exploration_step = 5
+        assert (await persistence.checkpoint([session])).sessions == 1
+        checkpoint = await SessionCheckpoint.get(user_id=session.user.id)
+        assert (checkpoint.exploration_step, checkpoint.total_gold, checkpoint.items_found) == (5, 50, [7])
+
+        await persistence.discard(session)
+        assert not await SessionCheckpoint.exists(user_id=session.user.id)
+
+    async def test_restores_progress_after_restart(self, test_db):
+        dungeon = await Dungeon.create(name="초원", require_level=1, description="테스트")
+        other = await Dungeon.create(name="동굴", require_level=5, description="테스트")
+        session = await _start_session(1, dungeon)
+        session.exploration_step, session.total_exp, session.monsters_defeated = 8, 300, 4
+        await SessionPersistence().checkpoint([session])
+
+        # 재시작 후 같은 던전 재입장 시 복구
+        restarted = SessionPersistence()
+        assert await restarted.load_recoverable() == 1
+        resumed = DungeonSession(user_id=1, user=session.user, dungeon=dungeon)
+        assert restarted.restore(resumed) is not None
+        assert (resumed.exploration_step, resumed.total_exp, resumed.monsters_defeated) == (8, 300, 4)
+
+        # 다른 던전이면 복구하지 않고, 세션 종료 시 남은 체크포인트 제거
+        restarted = SessionPersistence()
+        await restarted.load_recoverable()
+        elsewhere = DungeonSession(user_id=1, user=session.user, dungeon=other)
+        assert restarted.restore(elsewhere) is None
+        assert elsewhere.exploration_step == 0
+        await restarted.discard(elsewhere)
+        assert await SessionCheckpoint.all().count() == 0
+
+    async def test_missing_checkpoint_table_keeps_saving_hp(self, test_db):
+        dungeon = await Dungeon.create(name="초원", require_level=1, description="테스트")
+        session = await _start_session(1, dungeon)
+        await Tortoise.get_connection("default").execute_script("DROP TABLE session_checkpoint")
+
+        # 마이그레이션 전 배포: 시작이 실패하지 않고 HP만 저장
+        persistence = SessionPersistence()
+        assert await persistence.load_recoverable() == 0
+
+        session.user.now_hp = 30
+        persistence.mark_hp_dirty(session.user)
+        report = await persistence.checkpoint([session])
+        assert (report.hp_rows, report.sessions) == (1, 0)
+        assert (await User.get(id=session.user.id)).now_hp == 30
+
+    async def test_discard_settles_participants(self, test_db):
+        dungeon = await Dungeon.create(name="초원", require_level=1, description="테스트")
+        session = await _start_session(1, dungeon)
+        helper = await User.create(discord_id=2, now_hp=100)
+        session.participants[helper.discord_id] = helper
+        persistence = SessionPersistence()
+
+        helper.now_hp = 20
+        persistence.mark_hp_dirty(session.user, helper)
+        await persistence.discard(session)
+        assert (await User.get(id=helper.id)).now_hp == 20
+
+        # 세션 종료 후 회복한 HP를 다음 체크포인트가 덮어쓰지 않음
+        await User.filter(id=helper.id).update(now_hp=100)
+        assert (await persistence.checkpoint([])).hp_rows == 0
+        assert (await User.get(id=helper.id)).now_hp == 100
+
+    async def test_upsert_refreshes_updated_at(self, test_db):
+        dungeon = await Dungeon.create(name="초원", require_level=1, description="테스트")
+        session = await _start_session(1, dungeon)
+        persistence = SessionPersistence()
+
+        await persistence.checkpoint([session])
+        stale = datetime.now(timezone.utc) - timedelta(days=1)
+        await SessionCheckpoint.filter(user_id=session.user.id).update(updated_at=stale)
+
+        session.exploration_step = 2
+        assert (await persistence.checkpoint([session])).sessions == 1
+        checkpoint = await SessionCheckpoint.get(user_id=session.user.id)
+        assert checkpoint.updated_at > stale + timedelta(hours=1)
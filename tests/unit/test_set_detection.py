@@ -0,0 +1,41 @@
+"""
+세트 감지 유닛 테스트
+
+정적 세트 카탈로그 기반의 동기 세트 감지를 테스트합니다.
+"""
+from models.set_item import SetEffect, SetItem
+from service.item.set_detection_service import SetDetectionService
+
+
+class TestSetDetection:
+    """세트 감지 테스트"""
+
+    def test_detects_effects_from_item_ids(self, mock_static_cache):
+        mock_static_cache.set_item_cache.update({
+            1: SetItem(id=1, name="화염"),
+            2: SetItem(id=2, name="얼음"),
+        })
+        mock_static_cache.set_ids_by_item_id.update({10: [1], 11: [1], 12: [1], 20: [2]})
+        mock_static_cache.set_effects_by_set_id.update({
+            1: [
+                SetEffect(set_item_id=1, pieces_required=2, effect_description="공격력 +10",
+                          effect_config={"attack": 10}),
+                SetEffect(set_item_id=1, pieces_required=4, effect_description="체력 +100",
+                          effect_config={"hp": 100}),
+            ],
+            2: [
+                SetEffect(set_item_id=2, pieces_required=2, effect_description="속도 +5",
+                          effect_config={"speed": 5}),
+            ],
+        })
+
+        item_ids = [10, 11, 11, 20, 99]
+        assert SetDetectionService.count_set_pieces(item_ids) == {1: 2, 2: 1}
+        assert SetDetectionService.calculate_set_bonus_stats(item_ids) == {"attack": 10}
+        assert SetDetectionService.summarize_sets(item_ids) == [
+            ("화염", 2, ["2세트: 공격력 +10"]),
+            ("얼음", 1, []),
+        ]
+
+        assert SetDetectionService.calculate_set_bonus_stats([10, 11, 12, 20]) == {"attack": 10}
+        assert SetDetectionService.find_active_set_effects([]) == []
@@ -0,0 +1,61 @@
+"""
+스탯 캐시 유닛 테스트
+
+get_stat() 메모이제이션과 필드/버프 변경 시 무효화를 테스트합니다.
+"""
+from models.users import UserStatEnum
+from service.dungeon.passive_profile import invalidate_passive_profile
+from service.dungeon.status import AttackBuff
+
+
+class TestUserStatCache:
+    """User.get_stat() 캐시 테스트"""
+
+    def test_returns_cached_copy(self, test_user):
+        first = test_user.get_stat()
+        first[UserStatEnum.ATTACK] = 9999
+
+        second = test_user.get_stat()
+        assert second[UserStatEnum.ATTACK] != 9999
+        assert test_user.__dict__["_stat_cache"][1] is not second
+
+    def test_field_assignment_invalidates(self, test_user):
+        before = test_user.get_stat()[UserStatEnum.ATTACK]
+        test_user.equipment_stats = {"attack": 50}
+        assert test_user.get_stat()[UserStatEnum.ATTACK] == before + 50
+
+    def test_buff_append_and_stack_change_invalidate(self, test_user):
+        before = test_user.get_stat()[UserStatEnum.ATTACK]
+
+        buff = AttackBuff()
+        buff.amount = 7
+        test_user.status.append(buff)
+        assert test_user.get_stat()[UserStatEnum.ATTACK] == before + 7
+
+        buff.amount = 3
+        assert test_user.get_stat()[UserStatEnum.ATTACK] == before + 3
+
+        test_user.status.remove(buff)
+        assert test_user.get_stat()[UserStatEnum.ATTACK] == before
+
+    def test_in_place_mutation_requires_explicit_invalidation(self, test_user):
+        test_user.get_stat()
+        test_user.equipment_stats["attack"] = 100
+        test_user.invalidate_stat_cache()
+        assert test_user.get_stat()[UserStatEnum.ATTACK] >= 110
+
+    def test_global_invalidation_on_passive_reload(self, test_user):
+        test_user.get_stat()
+        cached = test_user.__dict__["_stat_cache"]
+        invalidate_passive_profile()
+        test_user.get_stat()
+        assert test_user.__dict__["_stat_cache"] is not cached
+
+
+class TestMonsterStatCache:
+    """Monster.get_stat() 캐시 테스트"""
+
+    def test_field_assignment_invalidates(self, test_monster):
+        assert test_monster.get_stat()[UserStatEnum.ATTACK] == 10
+        test_monster.attack = 25
+        assert test_monster.get_stat()[UserStatEnum.ATTACK] == 25
@@ -0,0 +1,75 @@
+"""
+스탯 시너지 프로필 유닛 테스트
+
+능력치 임계값 인덱스 조회가 조건 직접 평가와 같은 결과를 내는지, LRU 캐시 크기를 지키는지 테스트합니다.
+"""
+import itertools
+from types import SimpleNamespace
+
+from config.stat_synergies import ALL_SYNERGIES
+from service.player import stat_synergy_profile
+from service.player.stat_synergy_combat import (
+    get_drop_rate_multiplier,
+    get_extra_action_chance,
+    has_first_strike,
+)
+from service.player.stat_synergy_profile import (
+    EMPTY_STAT_SYNERGY_PROFILE,
+    get_stat_synergy_profile,
+)
+
+
+def _sample_values() -> list[int]:
+    """시너지 조건 임계값 전후 값"""
+    values = {0}
+    for synergy in ALL_SYNERGIES:
+        condition = synergy.condition
+        for minimum in (
+            condition.str_min, condition.int_min, condition.dex_min,
+            condition.vit_min, condition.luk_min, condition.all_min,
+        ):
+            if minimum > 0:
+                values.update((minimum - 1, minimum))
+    return sorted(values)
+
+
+class TestStatSynergyProfile:
+    """스탯 시너지 프로필 테스트"""
+
+    def test_matches_condition_evaluation(self):
+        """임계값 전후 조합에서 활성 시너지가 is_met 평가와 일치"""
+        values = _sample_values()
+        for stats in itertools.islice(itertools.product(values, repeat=5), 0, None, 7):
+            expected = tuple(s for s in ALL_SYNERGIES if s.condition.is_met(*stats))
+            assert get_stat_synergy_profile(*stats).active == expected, stats
+
+    def test_specials_aggregated(self):
+        """전투 특수효과 조회가 활성 시너지 special 합계를 반환"""
+        stats = (999, 999, 999, 999, 999)
+        user = SimpleNamespace(
+            bonus_str=999, bonus_int=999, bonus_dex=999, bonus_vit=999, bonus_luk=999,
+        )
+        specials = [s.effect.special for s in ALL_SYNERGIES if s.condition.is_met(*stats)]
+
+        extra = sum(sp.get("extra_action_pct", 0) for sp in specials) / 100.0
+        assert get_extra_action_chance(user) == extra
+        assert has_first_strike(user) == any(sp.get("first_strike") for sp in specials)
+
+    def test_entity_without_stats_has_no_synergy(self):
+        """능력치가 없는 엔티티는 빈 프로필"""
+        monster = SimpleNamespace(hp=100)
+
+        assert get_drop_rate_multiplier(monster) == 1.0
+        assert EMPTY_STAT_SYNERGY_PROFILE.active == ()
+
+    def test_cache_is_bounded(self, monkeypatch):
+        """캐시 크기를 넘으면 가장 오래된 조합부터 제거"""
+        monkeypatch.setattr(stat_synergy_profile, "_profile_cache", type(stat_synergy_profile._profile_cache)())
+        monkeypatch.setattr(stat_synergy_profile, "STAT_SYNERGY_CACHE_SIZE", 2)
+
+        first = get_stat_synergy_profile(1, 0, 0, 0, 0)
+        get_stat_synergy_profile(2, 0, 0, 0, 0)
+        assert get_stat_synergy_profile(1, 0, 0, 0, 0) is first
+        get_stat_synergy_profile(3, 0, 0, 0, 0)
+
+        assert list(stat_synergy_profile._profile_cache) == [(1, 0, 0, 0, 0), (3, 0, 0, 0, 0)]
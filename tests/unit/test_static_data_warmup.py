@@ -0,0 +1,102 @@
+"""
+정적 데이터 워밍업 유닛 테스트
+"""
+import asyncio
+import contextvars
+import logging
+
+from models import Dungeon, DungeonSpawn, Skill_Model
+from models.repos import static_cache
+from service.session import create_session, end_session
+
+
+class TestStaticDataWarmup:
+    """정적 데이터 워밍업 테스트"""
+
+    async def test_loads_all_phases_and_opens_gate(self, test_db, mock_static_cache, caplog):
+        skill = await Skill_Model.create(
+            name="테스트 베기",
+            description="테스트",
+            config={"components": [{"tag": "attack", "damage": 1.2}, {"tag": "unknown_tag"}]},
+        )
+
+        with caplog.at_level(logging.INFO, logger=static_cache.__name__):
+            timings = await static_cache.load_static_data()
+
+        assert set(timings) == {
+            "dungeons", "monsters", "spawns", "items", "skills", "equipment",
+            "grades", "box_drops", "droptable", "achievements", "samplers", "total",
+        }
+        assert static_cache.is_static_data_ready()
+        assert len(static_cache.skill_cache_by_id[skill.id].components) == 1
+
+        # 컴포넌트별 INFO 로그 없이 요약 로그만 남음
+        skill_logs = [r.getMessage() for r in caplog.records if "Skill" in r.getMessage() and r.levelno == logging.INFO]
+        assert skill_logs == []
+
+    async def test_indexes_obtainable_skills_by_source(self, test_db, mock_static_cache):
+        config = {"components": [{"tag": "attack", "damage": 1.0}]}
+        dropped = await Skill_Model.create(
+            name="초원 베기", description="테스트", config=config, acquisition_source="초원",
+        )
+        await Skill_Model.create(
+            name="몬스터 전용", description="테스트", config=config,
+            acquisition_source="초원", player_obtainable=False,
+        )
+
+        await static_cache.load_static_data()
+
+        assert [s.id for s in static_cache.get_obtainable_skills_by_source("초원")] == [dropped.id]
+        assert static_cache.get_obtainable_skills_by_source("없는 던전") == ()
+
+    async def test_reload_swaps_only_changed_groups(self, test_db, mock_static_cache):
+        dungeon = await Dungeon.create(name="초원", require_level=1, description="테스트")
+        await DungeonSpawn.create(monster_id=1, dungeon_id=dungeon.id, prob=1.0)
+
+        await static_cache.load_static_data()
+        loaded = static_cache.latest_snapshot()
+        box_pool_sizes = {key: len(pool) for key, pool in loaded.box_drop_table.items()}
+
+        # 변경이 없으면 스냅샷 유지 (스폰/상자 테이블이 중복 누적되지 않음)
+        await static_cache.load_static_data()
+        assert static_cache.latest_snapshot() is loaded
+        assert len(static_cache.spawn_info[dungeon.id]) == 1
+        assert {key: len(pool) for key, pool in static_cache.box_drop_table.items()} == box_pool_sizes
+
+        # 고정된 스냅샷은 재로드 후에도 이전 버전 유지
+        session_context = contextvars.copy_context()
+        session_context.run(static_cache.pin_static_snapshot)
+
+        dungeon.name = "불타는 초원"
+        await dungeon.save()
+        await static_cache.load_static_data(groups=("dungeons", "spawns"))
+
+        reloaded = static_cache.latest_snapshot()
+        assert reloaded.version == loaded.version + 1
+        assert reloaded.dungeon_cache[dungeon.id].name == "불타는 초원"
+        assert reloaded.spawn_info is loaded.spawn_info
+        assert session_context.run(static_cache.current_snapshot) is loaded
+        assert session_context.run(lambda: static_cache.dungeon_cache[dungeon.id].name) == "초원"
+
+    async def test_session_snapshot_survives_reload_in_other_tasks(self, test_db, mock_static_cache):
+        dungeon = await Dungeon.create(name="초원", require_level=1, description="테스트")
+        await static_cache.load_static_data()
+
+        # 세션은 명령어 태스크에서 생성, 이후 조회는 버튼 콜백처럼 별도 태스크에서 실행
+        session = await asyncio.create_task(create_session(201))
+        try:
+            dungeon.name = "불타는 초원"
+            await dungeon.save()
+            await static_cache.load_static_data(groups=("dungeons",))
+
+            async def read_in_callback(pinned: bool) -> str:
+                if not pinned:
+                    return static_cache.dungeon_cache[dungeon.id].name
+                with session.use_static_data():
+                    return static_cache.dungeon_cache[dungeon.id].name
+
+            assert await asyncio.create_task(read_in_callback(pinned=True)) == "초원"
+            assert await asyncio.create_task(read_in_callback(pinned=False)) == "불타는 초원"
+            assert static_cache.current_snapshot() is static_cache.latest_snapshot()
+        finally:
+            await end_session(201)
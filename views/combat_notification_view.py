@@ -68,12 +68,13 @@ class CombatNotificationView(discord.ui.View):
         try:
             from service.spectator.spectator_service import SpectatorService
 
-            # 관전 시작
-            await SpectatorService.start_spectating(
-                interaction.user,
-                self.session,
-                interaction
-            )
+            # 관전 시작 (대상 세션의 정적 데이터 버전 사용)
+            with self.session.use_static_data():
+                await SpectatorService.start_spectating(
+                    interaction.user,
+                    self.session,
+                    interaction
+                )
 
             await interaction.response.send_message(
                 f"👀 {self.session.user.get_name()}님의 전투를 관전합니다!\\n"
@@ -107,12 +108,13 @@ class CombatNotificationView(discord.ui.View):
         try:
             from service.intervention.intervention_service import InterventionService
 
-            # 난입 요청
-            await InterventionService.request_intervention(
-                interaction.user,
-                self.session,
-                interaction
-            )
+            # 난입 요청 (대상 세션의 정적 데이터 버전 사용)
+            with self.session.use_static_data():
+                await InterventionService.request_intervention(
+                    interaction.user,
+                    self.session,
+                    interaction
+                )
 
         except InterventionError as e:
             await interaction.response.send_message(
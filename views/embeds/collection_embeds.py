@@ -127,13 +127,10 @@ async def create_monster_embed(monster: Monster, is_collected: bool, user=None)
 
 def create_keyword_embed(keyword: str) -> Optional[discord.Embed]:
     """키워드 정보 Embed 생성"""
-    from service.skill.synergy_service import SynergyService
     from config import ATTRIBUTE_SYNERGIES
     from models.repos.static_cache import skill_cache_by_id
 
-    skills_with_keyword = _find_skills_with_keyword(
-        keyword, skill_cache_by_id, SynergyService
-    )
+    skills_with_keyword = _find_skills_with_keyword(keyword, skill_cache_by_id)
     if not skills_with_keyword:
         return None
 
@@ -217,11 +214,9 @@ def _add_skill_basic_info(embed: discord.Embed, skill) -> None:
         grade_name = grade_map.get(skill.skill_model.grade, "?")
         info_lines.append(f"**등급**: {grade_name}")
 
-    if hasattr(skill.skill_model, 'keyword') and skill.skill_model.keyword:
-        from service.skill.synergy_service import SynergyService
-        keywords = SynergyService.parse_keywords(skill.skill_model.keyword)
-        if keywords:
-            info_lines.append(f"**키워드**: {', '.join(keywords)}")
+    if skill.keyword_ids:
+        from service.skill.deck_synergy_profile import keyword_names
+        info_lines.append(f"**키워드**: {', '.join(keyword_names(skill.keyword_ids))}")
 
     acquisition = getattr(skill.skill_model, 'acquisition_source', None)
     if acquisition:
@@ -264,13 +259,13 @@ def _add_skill_components_info(embed: discord.Embed, skill) -> None:
 
 def _add_skill_synergy_info(embed: discord.Embed, skill) -> None:
     """스킬 시너지 정보 필드 추가"""
-    if not (hasattr(skill.skill_model, 'keyword') and skill.skill_model.keyword):
+    if not skill.keyword_ids:
         return
 
-    from service.skill.synergy_service import SynergyService
+    from service.skill.deck_synergy_profile import keyword_names
     from config import ATTRIBUTE_SYNERGIES, COMBO_SYNERGIES
 
-    keywords = SynergyService.parse_keywords(skill.skill_model.keyword)
+    keywords = keyword_names(skill.keyword_ids)
     related_synergies = []
 
     for keyword in keywords:
@@ -560,18 +555,17 @@ def _get_keyword_color(keyword: str) -> discord.Color:
     return keyword_colors.get(keyword, discord.Color.greyple())
 
 
-def _find_skills_with_keyword(keyword: str, skill_cache, synergy_service) -> list:
+def _find_skills_with_keyword(keyword: str, skill_cache) -> list:
     """특정 키워드를 가진 스킬 찾기 (플레이어 획득 가능 스킬만)"""
-    skills = []
-    for skill in skill_cache.values():
-        if not (hasattr(skill.skill_model, 'keyword') and skill.skill_model.keyword):
-            continue
-        if not getattr(skill.skill_model, 'player_obtainable', True):
-            continue
-        keywords = synergy_service.parse_keywords(skill.skill_model.keyword)
-        if keyword in keywords:
-            skills.append(skill)
-    return skills
+    from service.skill.deck_synergy_profile import find_keyword_id
+
+    kid = find_keyword_id(keyword)
+    if kid is None:
+        return []
+    return [
+        skill for skill in skill_cache.values()
+        if kid in skill.keyword_ids and getattr(skill.skill_model, 'player_obtainable', True)
+    ]
 
 
 def _try_create_attribute_synergy_embed(synergy_name: str, attribute_synergies) -> Optional[discord.Embed]:
@@ -10,7 +10,7 @@ from typing import Dict, List, TYPE_CHECKING
 import discord
 
 from config import SKILL_ID
-from models.repos.static_cache import skill_cache_by_id
+from models.repos import static_cache
 from models.user_deck_preset import UserDeckPreset
 from models.user_owned_skill import UserOwnedSkill
 
@@ -38,7 +38,7 @@ class CustomPresetDropdown(discord.ui.Select):
                 deck = preset.get_deck_list()
                 skill_names = []
                 for sid in deck[:3]:
-                    skill = skill_cache_by_id.get(sid)
+                    skill = static_cache.skill_cache_by_id.get(sid)
                     if skill:
                         skill_names.append(skill.name)
                 preview = ", ".join(skill_names) + "..." if skill_names else "덱 미리보기"
@@ -8,7 +8,7 @@ from typing import Dict, List, Optional, Set
 import discord
 
 from config import SKILL_DECK_SIZE, SKILL_ID, EmbedColor
-from models.repos.static_cache import skill_cache_by_id
+from models.repos import static_cache
 from models.user_deck_preset import UserDeckPreset
 from models.user_owned_skill import UserOwnedSkill
 from service.session import get_session
@@ -214,7 +214,7 @@ class SkillDeckView(discord.ui.View):
                 right_deck.append(line)
 
             if skill_id != 0:
-                skill = skill_cache_by_id.get(skill_id)
+                skill = static_cache.skill_cache_by_id.get(skill_id)
                 if skill and skill.is_passive:
                     continue
                 skill_counts[skill_name] = skill_counts.get(skill_name, 0) + 1
@@ -253,7 +253,7 @@ class SkillDeckView(discord.ui.View):
     def _get_skill_name(self, skill_id: int) -> str:
         if skill_id == 0:
             return "❌ 비어있음"
-        skill = skill_cache_by_id.get(skill_id)
+        skill = static_cache.skill_cache_by_id.get(skill_id)
         if skill:
             grade_id = skill.skill_model.grade
             return format_skill_name(skill.name, grade_id)
@@ -6,10 +6,13 @@
 """
 import discord
 from discord import ui
+from tortoise.transactions import in_transaction
 
 from config import STAT_CONVERSION as C, USER_STATS
+from exceptions import InsufficientStatPointsError
 from models import User
 from models.user_inventory import UserInventory
+from service.economy.currency_ledger import apply_currency_delta
 from service.player.stat_conversion import convert_abilities_to_combat_stats, calculate_hp_regen_rate
 
 
@@ -302,17 +305,30 @@ class StatDistributionView(ui.View):
             return
 
         # 능력치 적용 (1:1 직접 증가)
+        previous = {field: getattr(self.db_user, field) for field in ABILITY_DB_FIELDS.values()}
         for key, points in self.pending_stats.items():
             if points > 0:
                 field = ABILITY_DB_FIELDS[key]
                 current = getattr(self.db_user, field)
                 setattr(self.db_user, field, current + points)
 
-        # 포인트 차감
-        self.db_user.stat_points -= self.points_used
-
-        # DB 저장
-        await self.db_user.save()
+        # 포인트 차감은 원장 증감으로, 능력치는 해당 컬럼만 저장 (골드/경험치 덮어쓰기 방지)
+        try:
+            async with in_transaction() as conn:
+                await apply_currency_delta(self.db_user, stat_points=-self.points_used, using_db=conn)
+                await self.db_user.save(update_fields=list(ABILITY_DB_FIELDS.values()), using_db=conn)
+        except InsufficientStatPointsError as e:
+            # 다른 창에서 먼저 포인트를 사용한 경우: 능력치 되돌리고 남은 포인트로 다시 분배
+            for field, value in previous.items():
+                setattr(self.db_user, field, value)
+            self.db_user.stat_points = e.current
+            self.pending_stats = {"str": 0, "int": 0, "dex": 0, "vit": 0, "luk": 0}
+            self.points_used = 0
+            await interaction.response.send_message(
+                f"⚠️ 스탯 포인트가 부족합니다! (필요: {e.required}, 보유: {e.current})",
+                ephemeral=True
+            )
+            return
 
         # 결과 메시지
         embed = discord.Embed(
@@ -428,8 +444,9 @@ class StatResetConfirmView(ui.View):
         for key in ABILITY_DB_FIELDS:
             setattr(self.parent.db_user, ABILITY_DB_FIELDS[key], 0)
 
-        self.parent.db_user.stat_points += self.total_allocated
-        await self.parent.db_user.save()
+        async with in_transaction() as conn:
+            await apply_currency_delta(self.parent.db_user, stat_points=self.total_allocated, using_db=conn)
+            await self.parent.db_user.save(update_fields=list(ABILITY_DB_FIELDS.values()), using_db=conn)
 
         # 부모 뷰 대기 상태 초기화
         self.parent.pending_stats = {"str": 0, "int": 0, "dex": 0, "vit": 0, "luk": 0}
@@ -6,7 +6,7 @@ from __future__ import annotations
 import discord
 
 from config import EmbedColor, SKILL_ID
-from models.repos.static_cache import skill_cache_by_id, dungeon_cache
+from models.repos import static_cache
 from service.item.inventory_service import InventoryService
 from service.item.equipment_service import EquipmentService
 from service.skill.skill_deck_service import SkillDeckService
@@ -29,7 +29,7 @@ class TowerRestAreaView(discord.ui.View):
         cleared_floor = self.session.current_floor
         next_floor = cleared_floor + 1
         dungeon_id = get_dungeon_for_floor(next_floor)
-        dungeon = dungeon_cache.get(dungeon_id)
+        dungeon = static_cache.dungeon_cache.get(dungeon_id)
         dungeon_name = dungeon.name if dungeon else f"던전 {dungeon_id}"
 
         embed = discord.Embed(
@@ -54,11 +54,13 @@ class TowerRestAreaView(discord.ui.View):
 
     @discord.ui.button(label="스킬 변경", style=discord.ButtonStyle.primary, emoji="🧠")
     async def change_skills(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await self._open_skill_deck(interaction)
+        with self.session.use_static_data():
+            await self._open_skill_deck(interaction)
 
     @discord.ui.button(label="장비 변경", style=discord.ButtonStyle.primary, emoji="🛡️")
     async def change_equipment(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await self._open_inventory(interaction)
+        with self.session.use_static_data():
+            await self._open_inventory(interaction)
 
     @discord.ui.button(label="상점", style=discord.ButtonStyle.secondary, emoji="🛒")
     async def open_shop(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -86,16 +88,16 @@ class TowerRestAreaView(discord.ui.View):
 
         owned_skills = await SkillOwnershipService.get_all_owned_skills(self.db_user)
         available_skills = [
-            skill_cache_by_id[owned.skill_id]
+            static_cache.skill_cache_by_id[owned.skill_id]
             for owned in owned_skills
-            if owned.skill_id in skill_cache_by_id
+            if owned.skill_id in static_cache.skill_cache_by_id
         ]
 
         skill_quantities = {owned.skill_id: owned for owned in owned_skills}
 
         basic_skill_id = SKILL_ID.BASIC_ATTACK_ID
-        if basic_skill_id in skill_cache_by_id:
-            basic_skill = skill_cache_by_id[basic_skill_id]
+        if basic_skill_id in static_cache.skill_cache_by_id:
+            basic_skill = static_cache.skill_cache_by_id[basic_skill_id]
             if basic_skill not in available_skills:
                 available_skills.insert(0, basic_skill)
             if basic_skill_id not in skill_quantities:
@@ -76,7 +76,7 @@ class TowerFloorClearView(discord.ui.View):
                 f"💰 골드: +{reward_result.gold_gained:,}\n"
                 f"🪙 타워 코인: +{tower_coins}\n"
                 f"❤️ HP: {db_user.now_hp}/{db_user.hp}\n"
-                f"📈 Lv.{db_user.level}{boss_warning}"
+                f"📈 Lv.{reward_result.level or db_user.level}{boss_warning}"
             ),
             color=EmbedColor.DEFAULT
         )
@@ -9,7 +9,7 @@ from typing import Optional, List
 from models import User, UserStatEnum
 from models.user_equipment import UserEquipment, EquipmentSlot
 from models.user_skill_deck import UserSkillDeck
-from models.repos.static_cache import skill_cache_by_id, item_cache
+from models.repos import static_cache
 from service.economy.reward_service import RewardService
 from utils.grade_display import format_item_name, format_skill_name
 
@@ -269,8 +269,8 @@ class UserInfoView(discord.ui.View):
         skill_lines = []
         for i, skill_id in enumerate(self.skill_deck):
             slot_num = i + 1
-            if skill_id and skill_id in skill_cache_by_id:
-                skill = skill_cache_by_id[skill_id]
+            if skill_id and skill_id in static_cache.skill_cache_by_id:
+                skill = static_cache.skill_cache_by_id[skill_id]
                 # 등급별 색상 적용
                 grade_id = skill.skill_model.grade
                 formatted_name = format_skill_name(skill.name, grade_id)
@@ -302,7 +302,7 @@ class UserInfoView(discord.ui.View):
         for skill_id in self.skill_deck:
             if not skill_id:
                 continue
-            skill = skill_cache_by_id.get(skill_id)
+            skill = static_cache.skill_cache_by_id.get(skill_id)
             if skill and skill.is_passive:
                 continue
             skill_counts[skill_id] = skill_counts.get(skill_id, 0) + 1
@@ -311,8 +311,8 @@ class UserInfoView(discord.ui.View):
         if skill_counts:
             prob_lines = []
             for skill_id, count in sorted(skill_counts.items(), key=lambda x: -x[1]):
-                if skill_id in skill_cache_by_id:
-                    skill = skill_cache_by_id[skill_id]
+                if skill_id in static_cache.skill_cache_by_id:
+                    skill = static_cache.skill_cache_by_id[skill_id]
                     grade_id = skill.skill_model.grade
                     formatted_name = format_skill_name(skill.name, grade_id)
                     prob = (count / active_slot_count * 100) if active_slot_count > 0 else 0